@@ -3,6 +3,7 @@ API Configuration and Environment Variables
 """
 
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -41,3 +42,55 @@ SUPER_USER_EMAIL = os.getenv("SUPER_USER_EMAIL", "")
 
 # Anthropic Claude (for AI-powered market research)
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
+
+# Defaults cache: snapshots older than this are refreshed in the background
+DEFAULTS_CACHE_TTL_SECONDS = float(os.getenv("DEFAULTS_CACHE_TTL_SECONDS", "300"))
+
+# Defaults version file polled by every worker on this host; the admin routes
+# publish the new version there so all workers drop their caches within a poll
+DEFAULTS_VERSION_FILE = os.getenv(
+    "DEFAULTS_VERSION_FILE",
+    os.path.join(tempfile.gettempdir(), "parkview-cma-defaults.version"),
+)
+DEFAULTS_VERSION_POLL_SECONDS = float(os.getenv("DEFAULTS_VERSION_POLL_SECONDS", "0.5"))
+
+# Calculation result cache (in-process LRU + TTL)
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "256"))
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "600"))
+
+# Live /session engines: LRU-evicted beyond the cap, dropped after this long idle
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "64"))
+SESSION_IDLE_TTL_SECONDS = float(os.getenv("SESSION_IDLE_TTL_SECONDS", "1800"))
+
+# Compute executor for CPU-bound engine work
+# COMPUTE_EXECUTOR_KIND: "thread" (default) or "process"
+COMPUTE_EXECUTOR_KIND = os.getenv("COMPUTE_EXECUTOR_KIND", "thread").lower()
+COMPUTE_MAX_WORKERS = int(os.getenv("COMPUTE_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+COMPUTE_MAX_QUEUE = int(os.getenv("COMPUTE_MAX_QUEUE", "16"))
+COMPUTE_RETRY_AFTER_SECONDS = int(os.getenv("COMPUTE_RETRY_AFTER_SECONDS", "1"))
+
+# /compare fan-out: warm process pool, one task per scenario
+COMPARE_EXECUTOR_KIND = os.getenv("COMPARE_EXECUTOR_KIND", "process").lower()
+COMPARE_MAX_WORKERS = int(os.getenv("COMPARE_MAX_WORKERS", str(os.cpu_count() or 1)))
+COMPARE_MAX_QUEUE = int(os.getenv("COMPARE_MAX_QUEUE", "4"))
+COMPARE_MAX_SCENARIOS = int(os.getenv("COMPARE_MAX_SCENARIOS", "200"))
+COMPARE_SCENARIO_TIMEOUT_SECONDS = float(os.getenv("COMPARE_SCENARIO_TIMEOUT_SECONDS", "10"))
+
+# Streaming /batch endpoint: scenarios computed concurrently per request
+BATCH_MAX_IN_FLIGHT = int(os.getenv("BATCH_MAX_IN_FLIGHT", "4"))
+BATCH_MAX_LINE_BYTES = int(os.getenv("BATCH_MAX_LINE_BYTES", str(1024 * 1024)))
+# JSON-array bodies are read whole, so they are capped; NDJSON is streamed
+BATCH_MAX_ARRAY_BYTES = int(os.getenv("BATCH_MAX_ARRAY_BYTES", str(8 * 1024 * 1024)))
+# How long one batch line waits for a free compute worker before failing
+BATCH_CAPACITY_TIMEOUT_SECONDS = float(os.getenv("BATCH_CAPACITY_TIMEOUT_SECONDS", "30"))
+
+# Monte Carlo jobs (run in background threads, polled by job id)
+MONTE_CARLO_MAX_DRAWS = int(os.getenv("MONTE_CARLO_MAX_DRAWS", "5000000"))
+MONTE_CARLO_MAX_JOBS = int(os.getenv("MONTE_CARLO_MAX_JOBS", "2"))
+
+# 2-D parameter sweeps (grid points per request = x steps * y steps)
+SWEEP_MAX_POINTS = int(os.getenv("SWEEP_MAX_POINTS", "40000"))
+
+# Portfolio endpoints (frontier points and custom-universe size per request)
+PORTFOLIO_MAX_POINTS = int(os.getenv("PORTFOLIO_MAX_POINTS", "500"))
+PORTFOLIO_MAX_ASSETS = int(os.getenv("PORTFOLIO_MAX_ASSETS", "500"))
@@ -0,0 +1,81 @@
+"""
+Defaults version channel shared by the API workers on one host.
+
+Each uvicorn worker keeps its own defaults snapshot, engine snapshots and
+result cache. When the super user applies or reverts defaults, the worker
+serving that call writes the new ``default_assumptions.version`` to a small
+version file; every worker re-reads the file (a single ``stat`` unless it
+changed) at most once per poll interval on the request paths that depend on
+the defaults, and drops its caches when the version moves.
+
+Workers on other hosts do not see the file; they pick the new version up
+from Supabase on their next defaults refresh.
+"""
+
+import os
+import time
+import logging
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DefaultsVersionChannel:
+    """
+    File-backed publish/poll channel for the defaults version.
+
+    Parameters
+    ----------
+    path : str
+        Version file; must be shared by all workers on the host.
+    poll_seconds : float
+        Minimum interval between two reads of the file by one worker.
+    """
+
+    def __init__(self, path: str, poll_seconds: float = 0.5):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._polled_at = float("-inf")
+        self._signature: Optional[Tuple[int, int, int]] = None
+
+    def publish(self, version: int) -> None:
+        """Atomically replace the version file with ``version``."""
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".defaults-version-")
+            with os.fdopen(fd, "w") as f:
+                f.write(str(int(version)))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not publish defaults version %s to %s: %s", version, self.path, e)
+
+    def poll(self) -> Optional[int]:
+        """
+        Return the published version if the file changed since the last poll.
+
+        Returns None when the poll interval has not elapsed, the file is
+        unchanged, missing or unreadable.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._polled_at < self.poll_seconds:
+                return None
+            self._polled_at = now
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                return None
+            signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if signature == self._signature:
+                return None
+            self._signature = signature
+        try:
+            with open(self.path) as f:
+                return int(f.read().strip())
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read defaults version from %s: %s", self.path, e)
+            return None
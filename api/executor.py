@@ -0,0 +1,343 @@
+"""
+Bounded executor for CPU-bound engine work.
+
+Route handlers are ``async def``; running CMEEngine directly in them blocks
+the event loop for every other request on the worker. ``ComputeExecutor``
+moves that work onto a thread or process pool and caps how much can be in
+flight: at most ``max_workers`` running plus ``max_queue`` waiting. Anything
+beyond that is rejected immediately with 503 + Retry-After instead of
+queueing without bound.
+
+Work that mutates objects living in this process (the engines behind
+/session) passes ``in_process=True``: it runs on a thread even when the
+executor kind is 'process', under the same admission limits.
+
+Bulk work (the lines of a /batch stream) uses ``run_waiting`` instead: it
+waits, up to a deadline, for a free worker rather than failing, and never
+takes a queue slot, so the queue stays available to interactive requests.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from api.config import (
+    COMPUTE_EXECUTOR_KIND,
+    COMPUTE_MAX_WORKERS,
+    COMPUTE_MAX_QUEUE,
+    COMPUTE_RETRY_AFTER_SECONDS,
+    COMPARE_EXECUTOR_KIND,
+    COMPARE_MAX_WORKERS,
+    COMPARE_MAX_QUEUE,
+)
+
+EXECUTOR_KINDS = ('thread', 'process')
+
+
+def warm_engine_worker() -> None:
+    """
+    Pool initializer: import the engine and build the defaults snapshots.
+
+    Runs once per worker so the first scenario a worker sees doesn't pay for
+    module imports and defaults loading.
+    """
+    from ra_stress_tool.main import CMEEngine  # noqa: F401
+    from ra_stress_tool.inputs.defaults import get_defaults_snapshot
+
+    get_defaults_snapshot('ra')
+    get_defaults_snapshot('gk')
+
+
+def _noop() -> None:
+    return None
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ComputeExecutor:
+    """
+    Thread or process pool with a hard cap on pending work.
+
+    Parameters
+    ----------
+    kind : str
+        'thread' or 'process'. Functions submitted to a process pool must be
+        module-level and take/return picklable values.
+    max_workers : int
+        Number of pool workers (concurrency limit).
+    max_queue : int
+        Number of submissions allowed to wait for a free worker.
+    retry_after : int
+        Seconds advertised in the Retry-After header when saturated.
+    initializer : callable, optional
+        Run once in each worker when it starts (process pools only benefit).
+    """
+
+    def __init__(
+        self,
+        kind: str = 'thread',
+        max_workers: int = 4,
+        max_queue: int = 16,
+        retry_after: int = 1,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}'. Use one of {EXECUTOR_KINDS}")
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.retry_after = retry_after
+        self._initializer = initializer
+        self._pool: Optional[Executor] = None
+        self._thread_pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        # run_waiting callers blocked on a free worker: (loop, future)
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running plus queued submissions."""
+        return self.max_workers + self.max_queue
+
+    def _get_pool(self) -> Executor:
+        # Created lazily so importing the routes does not fork workers
+        if self._pool is None:
+            if self.kind == 'process':
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=self._initializer
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='cme-compute',
+                    initializer=self._initializer,
+                )
+        return self._pool
+
+    def _get_thread_pool(self) -> Executor:
+        """Pool for in-process work: the main pool, or a thread pool beside a process pool."""
+        if self.kind == 'thread':
+            return self._get_pool()
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='cme-compute-local',
+            )
+        return self._thread_pool
+
+    def warm(self) -> None:
+        """Start every worker now (and run the initializer) rather than on first use."""
+        pool = self._get_pool()
+        for future in [pool.submit(_noop) for _ in range(self.max_workers)]:
+            future.result()
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+            waiters, self._waiters = self._waiters, []
+        # Called from worker threads: wake waiters on their own loops
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # loop already closed
+
+    def _admit(self, in_process: bool = False) -> Executor:
+        """Reserve a slot or raise 503; returns the pool to submit to."""
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Calculation capacity exhausted, retry shortly",
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+            self._pending += 1
+            return self._get_thread_pool() if in_process else self._get_pool()
+
+    async def run(self, fn: Callable[..., Any], *args: Any, in_process: bool = False) -> Any:
+        """
+        Run ``fn(*args)`` in the pool and await its result.
+
+        Parameters
+        ----------
+        fn : callable
+            Function to run.
+        *args
+            Positional arguments for ``fn``.
+        in_process : bool, optional
+            Run on a thread of this process even for a process executor,
+            for work that must see and mutate in-process state.
+
+        Raises
+        ------
+        HTTPException
+            503 with a Retry-After header when the pool and queue are full.
+        """
+        pool = self._admit(in_process)
+        return await self._submit(pool, fn, args)
+
+    async def run_waiting(self, fn: Callable[..., Any], *args: Any, timeout: float) -> Any:
+        """
+        Run ``fn(*args)`` once a worker is free, waiting up to ``timeout`` seconds.
+
+        For bulk work that should yield to interactive requests: it only
+        starts while fewer than ``max_workers`` submissions are pending, so
+        it never occupies the queue, and it waits for a slot to be released
+        instead of failing with 503.
+
+        Raises
+        ------
+        TimeoutError
+            If no worker became free within ``timeout`` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._pending < self.max_workers:
+                    self._pending += 1
+                    pool = self._get_pool()
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.rejected += 1
+                    raise TimeoutError(f"No calculation capacity within {timeout:g}s")
+                entry = (loop, loop.create_future())
+                self._waiters.append(entry)
+            try:
+                await asyncio.wait_for(entry[1], remaining)
+            except asyncio.TimeoutError:
+                pass  # re-checked (and reported) at the top of the loop
+            finally:
+                with self._lock:
+                    if entry in self._waiters:
+                        self._waiters.remove(entry)
+        return await self._submit(pool, fn, args)
+
+    async def _submit(self, pool: Executor, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        """Submit to an admitted pool; the slot is released when the work finishes."""
+        try:
+            future = pool.submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+        # Release the slot when the work finishes, not when the awaiting
+        # request goes away, so cancelled requests still count until done
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    async def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Run ``fn(item)`` for every item in parallel; results keep input order.
+
+        The whole call takes a single admission slot, so one large request
+        counts once against the queue limit while its items spread across
+        all workers.
+
+        Parameters
+        ----------
+        fn : callable
+            Function applied to each item.
+        items : iterable
+            Inputs, one submission each.
+        timeout : float, optional
+            Seconds allowed per item, measured from submission. An item that
+            overruns yields a ``TimeoutError`` instance in its position (the
+            worker itself cannot be interrupted and finishes in the background).
+
+        Returns
+        -------
+        list
+            ``fn(item)`` results, or the exception raised for that item.
+        """
+        pool = self._admit()
+        try:
+            futures = [pool.submit(fn, item) for item in items]
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+        remaining = len(futures)
+        if remaining == 0:
+            self._release(None)
+            return []
+
+        lock = threading.Lock()
+
+        def _item_done(_future) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                last = remaining == 0
+            if last:
+                self._release(None)
+
+        for future in futures:
+            future.add_done_callback(_item_done)
+
+        async def _collect(future) -> Any:
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except asyncio.TimeoutError:
+                future.cancel()
+                return TimeoutError(f"Timed out after {timeout:g}s")
+            except Exception as e:
+                return e
+
+        return list(await asyncio.gather(*(_collect(f) for f in futures)))
+
+    def stats(self) -> Dict[str, Any]:
+        """Current load and lifetime counters."""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; a later ``run`` creates a fresh one."""
+        with self._lock:
+            pools = (self._pool, self._thread_pool)
+            self._pool = self._thread_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+
+
+compute_executor = ComputeExecutor(
+    kind=COMPUTE_EXECUTOR_KIND,
+    max_workers=COMPUTE_MAX_WORKERS,
+    max_queue=COMPUTE_MAX_QUEUE,
+    retry_after=COMPUTE_RETRY_AFTER_SECONDS,
+)
+
+# Dedicated warm pool for /compare fan-out; queue limit counts requests
+compare_executor = ComputeExecutor(
+    kind=COMPARE_EXECUTOR_KIND,
+    max_workers=COMPARE_MAX_WORKERS,
+    max_queue=COMPARE_MAX_QUEUE,
+    retry_after=COMPUTE_RETRY_AFTER_SECONDS,
+    initializer=warm_engine_worker,
+)
@@ -8,6 +8,7 @@ Run with: uvicorn api.main:app --reload --port 8000
 Or from api directory: uvicorn main:app --reload --port 8000
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import sys
@@ -18,8 +19,19 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from api.routes import calculate, defaults, admin
+from api.routes import calculate, defaults, admin, portfolio
 from api.config import CORS_ORIGINS, DEBUG
+from api.executor import compute_executor, compare_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Fork /compare workers up front so the first comparison isn't cold
+    compare_executor.warm()
+    yield
+    # Stop compute workers so reloads/shutdowns don't leave them running
+    compute_executor.shutdown(wait=False)
+    compare_executor.shutdown(wait=False)
 
 # Create FastAPI app
 app = FastAPI(
@@ -40,6 +52,7 @@ Admin endpoints require the super-user email header.
     version="1.0.0",
     docs_url="/docs" if DEBUG else None,  # Disable Swagger in production
     redoc_url="/redoc" if DEBUG else None,
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend access
@@ -67,6 +80,11 @@ app.include_router(
     prefix="/api/admin",
     tags=["Admin"]
 )
+app.include_router(
+    portfolio.router,
+    prefix="/api/portfolio",
+    tags=["Portfolio"]
+)
 
 
 @app.get("/", tags=["Health"])
@@ -1,7 +1,7 @@
 """Pydantic request models for API endpoints."""
 
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Literal, Optional
 
 
 class CalculateRequest(BaseModel):
@@ -40,6 +40,29 @@ class CalculateRequest(BaseModel):
         }
 
 
+class OverridePatchRequest(BaseModel):
+    """Request model for an incremental override update to a live session."""
+    overrides: Dict[str, Any] = Field(
+        description=(
+            "Override values to merge into the session's current overrides. "
+            "null removes an override (or a whole group, e.g. \"japan\": null), restoring the default."
+        )
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "overrides": {
+                    "macro": {
+                        "japan": {
+                            "my_ratio": 2.4
+                        }
+                    }
+                }
+            }
+        }
+
+
 class MacroPreviewRequest(BaseModel):
     """Request model for lightweight macro preview calculation."""
     region: str = Field(
@@ -66,3 +89,176 @@ class MacroPreviewRequest(BaseModel):
         }
 
 
+class InputDistributionRequest(BaseModel):
+    """Distribution for one sampled override path in a Monte Carlo run."""
+    path: str = Field(description="Dot-separated override path, e.g. 'macro.us.current_headline_inflation'")
+    dist: Literal["normal", "lognormal", "uniform"] = Field(default="normal")
+    mean: Optional[float] = Field(default=None, description="Mean of the input (normal, lognormal)")
+    std: Optional[float] = Field(default=None, description="Standard deviation of the input (normal, lognormal)")
+    low: Optional[float] = Field(default=None, description="Lower bound (uniform)")
+    high: Optional[float] = Field(default=None, description="Upper bound (uniform)")
+    lower: Optional[float] = Field(default=None, description="Optional clip floor for samples")
+    upper: Optional[float] = Field(default=None, description="Optional clip cap for samples")
+
+
+class MonteCarloRequest(BaseModel):
+    """Request model for an asynchronous Monte Carlo simulation."""
+    distributions: List[InputDistributionRequest] = Field(min_length=1)
+    correlation: Optional[List[List[float]]] = Field(
+        default=None,
+        description="Correlation matrix between distributions (Gaussian copula); identity if omitted"
+    )
+    n_draws: int = Field(default=100_000, ge=2)
+    seed: int = Field(default=0, description="Random seed; the same request always gives the same result")
+    quantiles: List[float] = Field(default=[0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99])
+    overrides: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Point overrides applied to every draw"
+    )
+    base_currency: str = Field(default="usd")
+    equity_model: str = Field(default="ra")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "distributions": [
+                    {"path": "macro.us.current_headline_inflation", "dist": "normal", "mean": 0.03, "std": 0.01},
+                    {"path": "equity_us.current_caey", "dist": "lognormal", "mean": 0.035, "std": 0.006}
+                ],
+                "correlation": [[1.0, -0.4], [-0.4, 1.0]],
+                "n_draws": 1000000,
+                "seed": 7
+            }
+        }
+
+
+class FreeInputRequest(BaseModel):
+    """Override path the reverse stress solver may move, with its bounds."""
+    path: str = Field(description="Dot-separated override path, e.g. 'equity_us.current_caey'")
+    lower: float
+    upper: float
+
+
+class SolveRequest(BaseModel):
+    """Request model for a reverse stress test (find inputs that hit a target return)."""
+    asset: str = Field(description="Asset class key, e.g. 'equity_us'")
+    target: float = Field(description="Target return (decimal)")
+    measure: Literal["nominal", "real"] = Field(default="nominal")
+    free_inputs: List[FreeInputRequest] = Field(
+        min_length=1,
+        description="Inputs to solve for; several inputs move together, each across its own bounds"
+    )
+    overrides: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Overrides held fixed during the search"
+    )
+    base_currency: str = Field(default="usd")
+    equity_model: str = Field(default="ra")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "asset": "equity_us",
+                "target": 0.03,
+                "free_inputs": [{"path": "equity_us.current_caey", "lower": 0.01, "upper": 0.10}]
+            }
+        }
+
+
+class SweepAxis(BaseModel):
+    """One axis of a 2-D parameter sweep."""
+    path: str = Field(description="Dot-separated override path, e.g. 'macro.us.current_tbill'")
+    start: float
+    stop: float
+    steps: int = Field(ge=2, description="Number of grid points, endpoints included")
+
+
+class SweepRequest(BaseModel):
+    """Request model for a 2-D parameter sweep (heatmap)."""
+    x: SweepAxis
+    y: SweepAxis
+    assets: Optional[List[str]] = Field(default=None, description="Asset classes to return (all when omitted)")
+    measure: Literal["nominal", "real"] = Field(default="nominal")
+    dtype: Literal["float32", "float64"] = Field(
+        default="float32",
+        description="Element type of the encoded grid"
+    )
+    overrides: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Overrides applied at every grid point"
+    )
+    base_currency: str = Field(default="usd")
+    equity_model: str = Field(default="ra")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "x": {"path": "macro.us.current_tbill", "start": 0.0, "stop": 0.08, "steps": 100},
+                "y": {"path": "bonds_global.current_yield", "start": 0.02, "stop": 0.07, "steps": 100},
+                "assets": ["bonds_global", "equity_us"]
+            }
+        }
+
+
+class PortfolioUniverse(BaseModel):
+    """Custom asset universe (e.g. sub-assets) with its own return and risk inputs."""
+    assets: List[str] = Field(min_length=1, description="Asset names")
+    expected_returns: List[float] = Field(description="Expected return per asset (decimal)")
+    volatilities: List[float] = Field(description="Annualized volatility per asset (decimal)")
+    correlation: List[List[float]] = Field(description="Full correlation matrix, rows in asset order")
+
+
+class FrontierRequest(BaseModel):
+    """Request model for the efficient frontier."""
+    overrides: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Scenario overrides; 'risk' overrides volatilities and correlations"
+    )
+    base_currency: str = Field(default="usd")
+    equity_model: str = Field(default="ra")
+    measure: Literal["nominal", "real"] = Field(default="nominal")
+    n_points: int = Field(default=100, ge=2, description="Number of frontier points")
+    min_weight: float = Field(default=0.0, description="Lower weight bound for every asset")
+    max_weight: float = Field(default=1.0, description="Upper weight bound for every asset")
+    bounds: Optional[Dict[str, List[float]]] = Field(
+        default=None,
+        description="Per-asset [lower, upper] weight bounds, overriding min_weight/max_weight"
+    )
+    universe: Optional[PortfolioUniverse] = Field(
+        default=None,
+        description="Custom universe; when given, the CME engine and overrides are not used"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "overrides": {
+                    "risk": {"correlation": {"equity_us": {"equity_europe": 0.9}}}
+                },
+                "n_points": 100,
+                "bounds": {"liquidity": [0.0, 0.1], "equity_em": [0.0, 0.15]}
+            }
+        }
+
+
+class PortfolioStatsRequest(BaseModel):
+    """Request model for expected return and volatility of given portfolios."""
+    portfolios: List[Dict[str, float]] = Field(
+        min_length=1,
+        description="Portfolios as {asset: weight}; unlisted assets have zero weight"
+    )
+    overrides: Optional[Dict[str, Any]] = Field(default=None)
+    base_currency: str = Field(default="usd")
+    equity_model: str = Field(default="ra")
+    measure: Literal["nominal", "real"] = Field(default="nominal")
+    universe: Optional[PortfolioUniverse] = Field(default=None)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "portfolios": [
+                    {"equity_us": 0.6, "bonds_global": 0.4},
+                    {"equity_us": 0.3, "equity_europe": 0.3, "bonds_global": 0.4}
+                ]
+            }
+        }
@@ -14,13 +14,19 @@ class MacroDependencyResponse(BaseModel):
 
 
 class AssetResult(BaseModel):
-    """Result for a single asset class."""
+    """
+    Result for a single asset class.
+
+    Sections left out by a sparse ``detail`` level are omitted from the
+    response ('headline': returns only; 'components': no inputs_used or
+    macro_dependencies).
+    """
     expected_return_nominal: float
     expected_return_real: float
-    components: Dict[str, float]
-    inputs_used: Dict[str, Any]
-    macro_dependencies: Dict[str, MacroDependencyResponse] = Field(
-        default_factory=dict,
+    components: Optional[Dict[str, float]] = None
+    inputs_used: Optional[Dict[str, Any]] = None
+    macro_dependencies: Optional[Dict[str, MacroDependencyResponse]] = Field(
+        default=None,
         description="Macro inputs that affect this asset's calculation"
     )
 
@@ -37,6 +43,41 @@ class CalculateResponse(BaseModel):
     )
 
 
+class FXMatrixResponse(BaseModel):
+    """Expected annual FX changes between every pair of currencies."""
+    currencies: List[str]
+    fx_change: List[List[float]] = Field(
+        description="[home][foreign] expected change (positive = home depreciation); antisymmetric"
+    )
+    carry_component: List[List[float]] = Field(description="[home][foreign] T-Bill differential")
+    ppp_component: List[List[float]] = Field(description="[home][foreign] inflation differential")
+
+
+class MultiCurrencyResponse(BaseModel):
+    """Full CME calculation in every base currency from one evaluation."""
+    scenario_name: str
+    results_by_currency: Dict[str, CalculateResponse] = Field(
+        description="Full calculation response by base currency"
+    )
+    fx_matrix: FXMatrixResponse
+
+
+class SessionResponse(CalculateResponse):
+    """Full calculation plus the id of the live session that holds it."""
+    session_id: str
+
+
+class OverridePatchResponse(BaseModel):
+    """Response model for an incremental override update."""
+    session_id: str
+    recomputed_assets: List[str] = Field(description="Asset classes rebuilt for this patch")
+    changed_assets: List[str] = Field(description="Asset classes whose results changed")
+    full_recompute: bool = Field(description="True when the patch could not be scoped to specific assets")
+    results: Dict[str, AssetResult] = Field(description="Updated results for the changed asset classes only")
+    macro_forecasts: Dict[str, Dict[str, float]]
+    fx_forecasts: Optional[Dict[str, Dict[str, float]]] = None
+
+
 class MacroPreviewResponse(BaseModel):
     """Response model for macro preview calculation."""
     rgdp_growth: float = Field(description="Computed GDP growth (decimal)")
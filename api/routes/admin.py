@@ -61,16 +61,9 @@ def _load_data_sources() -> Dict[str, Any]:
 
 
 def _get_supabase_client():
-    """Get a Supabase client."""
-    try:
-        from supabase import create_client
-        url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-        key = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-        if url and key:
-            return create_client(url, key)
-    except Exception as e:
-        logger.warning("Could not create Supabase client: %s", e)
-    return None
+    """Get the shared Supabase client (see api.routes.defaults)."""
+    from api.routes.defaults import _get_supabase_client as get_shared_client
+    return get_shared_client()
 
 
 def _verify_super_user(x_user_email: Optional[str]) -> str:
@@ -603,14 +596,13 @@ async def apply_defaults(
         _unflatten_key(change.key, change.new_value, new_defaults)
         applied.append({"key": change.key, "new_value": change.new_value})
 
-    # Upsert into default_assumptions table
+    # Save to default_assumptions; the function also bumps its version
     try:
-        supabase.table("default_assumptions").upsert({
-            "id": 1,
-            "defaults_json": new_defaults,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "updated_by": email,
+        result = supabase.rpc("save_default_assumptions", {
+            "p_defaults": new_defaults,
+            "p_updated_by": email,
         }).execute()
+        version = int(result.data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -631,14 +623,15 @@ async def apply_defaults(
     except Exception as e:
         logger.warning("Could not log application to Supabase: %s", e)
 
-    # Invalidate cache so next request picks up new defaults
-    invalidate_defaults_cache()
+    # Invalidate caches in every worker so the next request picks up new defaults
+    invalidate_defaults_cache(version)
 
     return {
         "success": True,
         "changes_applied": len(applied),
         "updated_at": datetime.now(timezone.utc).isoformat(),
         "is_test": request.is_test,
+        "version": version,
     }
 
 
@@ -648,7 +641,7 @@ async def revert_defaults(
 ):
     """
     Revert to the original hardcoded defaults.
-    Deletes the Supabase default_assumptions row.
+    Saves an empty default_assumptions row, so its version keeps increasing.
     """
     email = _verify_super_user(x_user_email)
 
@@ -657,16 +650,20 @@ async def revert_defaults(
         raise HTTPException(status_code=503, detail="Supabase not available")
 
     try:
-        supabase.table("default_assumptions").delete().eq("id", 1).execute()
+        result = supabase.rpc("save_default_assumptions", {
+            "p_defaults": {},
+            "p_updated_by": email,
+        }).execute()
+        version = int(result.data)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to revert defaults: {str(e)}"
         )
 
-    # Invalidate cache
+    # Invalidate caches in every worker
     from api.routes.defaults import invalidate_defaults_cache
-    invalidate_defaults_cache()
+    invalidate_defaults_cache(version)
 
     # Log the revert
     try:
@@ -684,6 +681,7 @@ async def revert_defaults(
     return {
         "success": True,
         "message": "Reverted to original hardcoded defaults",
+        "version": version,
     }
 
 
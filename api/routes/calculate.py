@@ -4,95 +4,625 @@ Calculation endpoints.
 Wraps the ra_stress_tool CMEEngine for API access.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Literal, Optional, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+import asyncio
+import base64
+import functools
+import hashlib
+import json
 import sys
 import os
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
 
 # Add parent directory to path to import ra_stress_tool
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.batch import ASSETS, sweep_grid
+from ra_stress_tool.montecarlo import MonteCarloEngine
+from ra_stress_tool.solver import solve_for_target
+from ra_stress_tool.inputs.defaults import defaults_version as engine_defaults_version
+from ra_stress_tool.inputs.overrides import validate_overrides
 from ra_stress_tool.utils.ewma import sigmoid_my_ratio
-from api.models.requests import CalculateRequest, MacroPreviewRequest
-from api.models.responses import CalculateResponse, MacroPreviewResponse, AssetResult, MacroDependencyResponse
+from api.config import (
+    RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL_SECONDS,
+    COMPARE_MAX_SCENARIOS, COMPARE_SCENARIO_TIMEOUT_SECONDS,
+    BATCH_MAX_IN_FLIGHT, BATCH_MAX_LINE_BYTES, BATCH_MAX_ARRAY_BYTES, BATCH_CAPACITY_TIMEOUT_SECONDS,
+    MONTE_CARLO_MAX_DRAWS, MONTE_CARLO_MAX_JOBS,
+    SWEEP_MAX_POINTS,
+    SESSION_MAX_ENTRIES, SESSION_IDLE_TTL_SECONDS,
+)
+from api.executor import compute_executor, compare_executor
+from api.routes.defaults import get_defaults_version, on_defaults_version_change
+from api.models.requests import (
+    CalculateRequest, MacroPreviewRequest, OverridePatchRequest, MonteCarloRequest,
+    SolveRequest, SweepRequest,
+)
+from api.models.responses import (
+    CalculateResponse, MacroPreviewResponse, AssetResult, MacroDependencyResponse,
+    SessionResponse, OverridePatchResponse, MultiCurrencyResponse,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+@dataclass
+class _Session:
+    """A live engine, the lock that serializes changes to it and its last use."""
+    engine: CMEEngine
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+# Live engines for incremental recalculation, keyed by session id (LRU
+# order, capped at SESSION_MAX_ENTRIES, idle ones expire). Per process: with
+# several API workers, session requests need sticky routing (or one worker)
+_sessions: "OrderedDict[str, _Session]" = OrderedDict()
+
+# Monte Carlo jobs (in-memory, polled by id)
+_monte_carlo_jobs: Dict[str, Dict[str, Any]] = {}
+
+# Longest horizon served by /term-structure (years)
+TERM_STRUCTURE_MAX_HORIZON = 50
+
+# Filter out 'global' from macro_forecasts (it only has rgdp_growth, no inflation/tbill)
+MACRO_REGIONS = ['us', 'eurozone', 'japan', 'em']
+
+
+class ResultCache:
+    """
+    In-process LRU + TTL cache of serialized calculation responses.
+
+    Entries are keyed by scenario_key(); the key embeds the defaults
+    version, so an admin apply/revert of defaults makes old entries
+    unreachable; the cache is also cleared when the version moves.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store a payload, evicting least recently used entries past capacity."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_result_cache = ResultCache(RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL_SECONDS)
+on_defaults_version_change(lambda version: _result_cache.clear())
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calculations on this worker.
+
+    The first request for a key (the leader) starts the computation; requests
+    for the same key that arrive while it is running await the same task and
+    share its result (or its exception). The task is shielded, so a leader
+    whose client disconnects does not cancel the work for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run ``compute()`` once for all concurrent callers with the same key.
+
+        Parameters
+        ----------
+        key : str
+            Canonical key of the computation (e.g. scenario_key()).
+        compute : callable
+            Zero-argument coroutine function producing the result.
+
+        Returns
+        -------
+        tuple
+            (result, coalesced) where coalesced is True for callers that
+            joined a computation already in flight.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        self.leaders += 1
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved: followers may all have gone away
+
+    def stats(self) -> Dict[str, Any]:
+        """Leader/coalesced counters and the number of computations in flight."""
+        requests = self.leaders + self.coalesced
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / requests if requests else 0.0,
+        }
+
+
+_single_flight = SingleFlight()
+
+
+def _normalize_overrides(value: Any) -> Any:
+    """
+    Canonicalize overrides for hashing.
+
+    Empty sub-dicts are dropped (they override nothing) and ints are
+    widened to floats so 7 and 7.0 hash the same.
+    """
+    if isinstance(value, dict):
+        normalized = {}
+        for key, child in value.items():
+            child = _normalize_overrides(child)
+            if child == {}:
+                continue
+            normalized[str(key)] = child
+        return normalized
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def scenario_key(overrides: Optional[Dict[str, Any]], base_currency: str, equity_model: str) -> str:
+    """
+    Canonical hash of everything that determines a calculation result.
+
+    Parameters
+    ----------
+    overrides : dict, optional
+        Request overrides.
+    base_currency : str
+        Base currency ('usd' or 'eur').
+    equity_model : str
+        Equity model ('ra' or 'gk').
+
+    Returns
+    -------
+    str
+        Hex SHA-256 digest.
+    """
+    canonical = json.dumps(
+        {
+            "overrides": _normalize_overrides(overrides or {}),
+            "base_currency": base_currency.lower(),
+            "equity_model": equity_model.lower(),
+            "defaults_version": [get_defaults_version(), engine_defaults_version()],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _convert_macro_deps(deps) -> Dict[str, MacroDependencyResponse]:
+    """Convert MacroDependency objects to response format."""
+    if not deps:
+        return {}
+    return {
+        key: MacroDependencyResponse(
+            macro_input=dep.macro_input,
+            value_used=dep.value_used,
+            source=dep.source,
+            affects=dep.affects,
+            impact_description=dep.impact_description
+        )
+        for key, dep in deps.items()
+    }
+
+
+def _convert_asset_result(r, detail: str = "full") -> AssetResult:
+    """
+    Convert an AssetClassResult to response format.
+
+    Sections below ``detail`` are left unset so ``exclude_unset`` dumps
+    omit them.
+    """
+    if detail == "headline":
+        return AssetResult(
+            expected_return_nominal=r.expected_return_nominal,
+            expected_return_real=r.expected_return_real,
+        )
+    if detail == "components":
+        return AssetResult(
+            expected_return_nominal=r.expected_return_nominal,
+            expected_return_real=r.expected_return_real,
+            components=r.components,
+        )
+    return AssetResult(
+        expected_return_nominal=r.expected_return_nominal,
+        expected_return_real=r.expected_return_real,
+        components=r.components,
+        inputs_used=r.inputs_used,
+        macro_dependencies=_convert_macro_deps(r.macro_dependencies)
+    )
+
+
+def _macro_forecasts_payload(macro: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Regional macro forecasts for the response (excluding 'global')."""
+    return {
+        region: {
+            "rgdp_growth": macro[region].get("rgdp_growth", 0),
+            "inflation": macro[region].get("inflation", 0),
+            "tbill_rate": macro[region].get("tbill_rate", 0),
+        }
+        for region in MACRO_REGIONS
+        if region in macro
+    }
+
+
+def _expire_sessions() -> None:
+    """Drop sessions idle for longer than SESSION_IDLE_TTL_SECONDS."""
+    cutoff = time.monotonic() - SESSION_IDLE_TTL_SECONDS
+    # LRU order: the least recently used session is first
+    while _sessions:
+        session_id, session = next(iter(_sessions.items()))
+        if session.last_used >= cutoff:
+            break
+        del _sessions[session_id]
+
+
+def _get_session(session_id: str) -> _Session:
+    """Look up a live session and mark it as recently used."""
+    _expire_sessions()
+    session = _sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found or expired")
+    _sessions.move_to_end(session_id)
+    session.last_used = time.monotonic()
+    return session
+
+
 @router.post("/full", response_model=CalculateResponse)
-async def calculate_full(request: CalculateRequest):
+async def calculate_full(
+    request: CalculateRequest,
+    detail: Literal["headline", "components", "full"] = Query(
+        "full", description="'headline' returns only, 'components' adds return components, 'full' adds inputs and macro dependencies"
+    ),
+):
     """
     Run full CME calculation with optional overrides.
 
     This is the main calculation endpoint that computes expected returns
     for all asset classes based on the provided overrides and base currency.
+    Sparse ``detail`` levels skip building the omitted sections in the
+    engine and leave them out of the response. Concurrent requests for the
+    same scenario share one computation (X-Cache: COALESCED).
 
     Returns:
         Complete results including expected returns, components, and macro forecasts.
     """
+    key = scenario_key(request.overrides, request.base_currency, request.equity_model)
+    if detail != "full":
+        key = f"{key}:{detail}"
+    cached = _result_cache.get(key)
+    if cached is not None:
+        # Scenario name is not part of the key; patch it on the cached copy
+        return JSONResponse({**cached, "scenario_name": request.scenario_name}, headers={"X-Cache": "HIT"})
+
+    async def compute() -> Dict[str, Any]:
+        payload = await compute_executor.run(_compute_full_payload, request, detail)
+        _result_cache.put(key, payload)
+        return payload
+
+    # Identical requests arriving while this scenario is computing share it
     try:
-        engine = CMEEngine(
-            overrides=request.overrides,
-            base_currency=request.base_currency.lower(),
-            equity_model_type=request.equity_model,
-        )
-        results = engine.compute_all_returns(request.scenario_name)
+        payload, coalesced = await _single_flight.do(key, compute)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        # Get macro forecasts
-        macro = engine.compute_macro_forecasts()
+    return JSONResponse(
+        {**payload, "scenario_name": request.scenario_name},
+        headers={"X-Cache": "COALESCED" if coalesced else "MISS"},
+    )
 
-        # Helper to convert MacroDependency to response format
-        def convert_macro_deps(deps):
-            if not deps:
-                return {}
-            return {
-                key: MacroDependencyResponse(
-                    macro_input=dep.macro_input,
-                    value_used=dep.value_used,
-                    source=dep.source,
-                    affects=dep.affects,
-                    impact_description=dep.impact_description
-                )
-                for key, dep in deps.items()
-            }
 
-        # Convert to JSON-serializable format
-        # Filter out 'global' from macro_forecasts (it only has rgdp_growth, no inflation/tbill)
-        macro_regions = ['us', 'eurozone', 'japan', 'em']
-
-        # Build FX forecasts if available (non-empty when base currency is EUR)
-        fx_forecasts = None
-        if results.fx_forecasts:
-            fx_forecasts = results.fx_forecasts
-
-        return CalculateResponse(
-            scenario_name=results.scenario_name,
-            base_currency=results.base_currency,
-            results={
-                key: AssetResult(
-                    expected_return_nominal=r.expected_return_nominal,
-                    expected_return_real=r.expected_return_real,
-                    components=r.components,
-                    inputs_used=r.inputs_used,
-                    macro_dependencies=convert_macro_deps(r.macro_dependencies)
-                )
-                for key, r in results.results.items()
-            },
-            macro_forecasts={
-                region: {
-                    "rgdp_growth": macro[region].get("rgdp_growth", 0),
-                    "inflation": macro[region].get("inflation", 0),
-                    "tbill_rate": macro[region].get("tbill_rate", 0),
-                }
-                for region in macro_regions
-                if region in macro
-            },
-            fx_forecasts=fx_forecasts,
-        )
+@router.get("/cache-stats")
+async def cache_stats():
+    """Result cache counters (hits, misses, evictions, expirations, size)."""
+    return _result_cache.stats()
+
+
+@router.get("/coalesce-stats")
+async def coalesce_stats():
+    """Request coalescing counters (leaders, coalesced followers, in flight)."""
+    return _single_flight.stats()
+
+
+@router.get("/executor-stats")
+async def executor_stats():
+    """Compute executor load (pending work, completions, rejections)."""
+    return {
+        "compute": compute_executor.stats(),
+        "compare": compare_executor.stats(),
+    }
+
+
+def _compute_full_payload(request: CalculateRequest, detail: str = "full") -> Dict[str, Any]:
+    """Run a full calculation and return the JSON-ready CalculateResponse."""
+    engine = CMEEngine(
+        overrides=request.overrides,
+        base_currency=request.base_currency.lower(),
+        equity_model_type=request.equity_model,
+        detail=detail,
+    )
+    response = CalculateResponse(**_full_response_fields(engine, request.scenario_name, detail))
+    return response.model_dump(mode="json", exclude_unset=True)
+
+
+def _full_response_fields(
+    engine: CMEEngine, scenario_name: str, detail: str = "full", results=None,
+) -> Dict[str, Any]:
+    """Compute all returns (unless given) and build the CalculateResponse fields."""
+    if results is None:
+        results = engine.compute_all_returns(scenario_name)
+
+    # Get macro forecasts
+    macro = engine.compute_macro_forecasts()
+
+    # Build FX forecasts if available (non-empty when base currency is EUR)
+    fx_forecasts = None
+    if results.fx_forecasts:
+        fx_forecasts = results.fx_forecasts
+
+    return {
+        "scenario_name": results.scenario_name,
+        "base_currency": results.base_currency,
+        "results": {
+            key: _convert_asset_result(r, detail)
+            for key, r in results.results.items()
+        },
+        "macro_forecasts": _macro_forecasts_payload(macro),
+        "fx_forecasts": fx_forecasts,
+    }
+
+
+@router.post("/all-currencies", response_model=MultiCurrencyResponse)
+async def calculate_all_currencies(
+    request: CalculateRequest,
+    detail: Literal["headline", "components", "full"] = Query(
+        "full", description="'headline' returns only, 'components' adds return components, 'full' adds inputs and macro dependencies"
+    ),
+):
+    """
+    Run the full CME calculation in every base currency at once.
+
+    Local-currency bond and equity returns are computed once and translated
+    into each base currency with one FX matrix covering every currency
+    pair, at about the cost of a single /full calculation. The request's
+    base_currency is ignored.
+
+    Returns:
+        {scenario_name, results_by_currency: {usd: ..., eur: ...}, fx_matrix}
+        where each entry of results_by_currency matches the /full response.
+    """
+    key = scenario_key(request.overrides, "all", request.equity_model)
+    key = f"{key}:all-currencies:{detail}"
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return JSONResponse(_with_scenario_name(cached, request.scenario_name), headers={"X-Cache": "HIT"})
+
+    async def compute() -> Dict[str, Any]:
+        payload = await compute_executor.run(_all_currencies_payload, request, detail)
+        _result_cache.put(key, payload)
+        return payload
+
+    try:
+        payload, coalesced = await _single_flight.do(key, compute)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return JSONResponse(
+        _with_scenario_name(payload, request.scenario_name),
+        headers={"X-Cache": "COALESCED" if coalesced else "MISS"},
+    )
+
+
+def _with_scenario_name(payload: Dict[str, Any], scenario_name: str) -> Dict[str, Any]:
+    """Copy of an all-currencies payload with the scenario name patched in."""
+    return {
+        **payload,
+        "scenario_name": scenario_name,
+        "results_by_currency": {
+            ccy: {**fields, "scenario_name": scenario_name}
+            for ccy, fields in payload["results_by_currency"].items()
+        },
+    }
+
+
+def _all_currencies_payload(request: CalculateRequest, detail: str = "full") -> Dict[str, Any]:
+    """Run one calculation in every base currency and return the JSON-ready MultiCurrencyResponse."""
+    engine = CMEEngine(
+        overrides=request.overrides,
+        equity_model_type=request.equity_model,
+        detail=detail,
+    )
+    by_currency = engine.compute_all_base_currencies(request.scenario_name)
+    response = MultiCurrencyResponse(
+        scenario_name=request.scenario_name,
+        results_by_currency={
+            ccy: CalculateResponse(**_full_response_fields(engine, request.scenario_name, detail, results))
+            for ccy, results in by_currency.items()
+        },
+        fx_matrix=engine.compute_fx_matrix().to_dict(),
+    )
+    return response.model_dump(mode="json", exclude_unset=True)
+
+
+@router.post("/session", response_model=SessionResponse)
+async def create_session(request: CalculateRequest):
+    """
+    Run a full calculation and keep the engine alive for incremental updates.
+
+    Follow up with PATCH /session/{session_id} to apply override changes;
+    only the asset classes that depend on the patched inputs are recomputed.
+    Sessions live in the memory of the worker process that created them, so
+    behind several workers the follow-up requests must be routed to the same
+    one (sticky sessions) or the API run with a single worker; otherwise
+    they get 404.
+    """
+    try:
+        engine, fields = await compute_executor.run(_new_session, request, in_process=True)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    _expire_sessions()
+    session_id = str(uuid.uuid4())
+    _sessions[session_id] = _Session(engine)
+    while len(_sessions) > SESSION_MAX_ENTRIES:
+        _sessions.popitem(last=False)
+
+    return SessionResponse(session_id=session_id, **fields)
+
+
+@router.patch("/session/{session_id}", response_model=OverridePatchResponse)
+async def patch_session(session_id: str, request: OverridePatchRequest):
+    """
+    Merge an override patch into a live session and recompute affected assets.
+
+    Returns which asset classes were recomputed and which changed, with full
+    results for the changed ones only. A null value removes that override
+    (e.g. {"macro": {"japan": {"my_ratio": null}}}) and restores its default.
+    A patch with an unknown path or a non-numeric value is rejected with 400
+    and leaves the session as it was.
+    """
+    session = _get_session(session_id)
+    # Reject bad patches before they reach (and half-update) the engine
+    try:
+        validate_overrides(request.overrides, session.engine.equity_model_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def locked():
+        async with session.lock:
+            return await compute_executor.run(_patch_session, session.engine, request.overrides, in_process=True)
+
+    try:
+        # Shielded so a disconnecting client cannot release the lock while
+        # the worker is still changing the engine
+        report, results, macro = await asyncio.shield(asyncio.ensure_future(locked()))
+    except HTTPException:
+        raise
     except Exception as e:
+        # The engine may be half-updated; drop it so the client starts over
+        _sessions.pop(session_id, None)
         raise HTTPException(status_code=400, detail=str(e))
 
+    return OverridePatchResponse(
+        session_id=session_id,
+        recomputed_assets=report.recomputed_assets,
+        changed_assets=report.changed_assets,
+        full_recompute=report.full_recompute,
+        results={
+            key: _convert_asset_result(results.results[key])
+            for key in report.changed_assets
+        },
+        macro_forecasts=_macro_forecasts_payload(macro),
+        fx_forecasts=results.fx_forecasts or None,
+    )
+
+
+def _new_session(request: CalculateRequest) -> Tuple[CMEEngine, Dict[str, Any]]:
+    """Build a session engine and its initial CalculateResponse fields."""
+    engine = CMEEngine(
+        overrides=request.overrides,
+        base_currency=request.base_currency.lower(),
+        equity_model_type=request.equity_model,
+    )
+    return engine, _full_response_fields(engine, request.scenario_name)
+
+
+def _patch_session(engine: CMEEngine, overrides: Dict[str, Any]):
+    """Apply an override patch to a session engine; returns (report, results, macro)."""
+    report = engine.apply_override_patch(overrides)
+    return report, engine.compute_all_returns(), engine.compute_macro_forecasts()
+
+
+@router.delete("/session/{session_id}")
+async def delete_session(session_id: str):
+    """Release a live calculation session."""
+    if _sessions.pop(session_id, None) is None:
+        raise HTTPException(status_code=404, detail=f"Session '{session_id}' not found or expired")
+    return {"deleted": session_id}
+
 
 @router.post("/macro-preview", response_model=MacroPreviewResponse)
 async def calculate_macro_preview(request: MacroPreviewRequest):
@@ -107,6 +637,11 @@ async def calculate_macro_preview(request: MacroPreviewRequest):
     - Inflation: 30% Current Headline + 70% Long-Term Target
     - T-Bill: 30% Current + 70% Long-Term (GDP + Inflation + Country Factor)
     """
+    return await compute_executor.run(_macro_preview, request)
+
+
+def _macro_preview(request: MacroPreviewRequest) -> MacroPreviewResponse:
+    """Building-block macro forecast for a single region."""
     region = request.region.lower()
     bb = request.building_blocks
 
@@ -158,40 +693,438 @@ async def calculate_macro_preview(request: MacroPreviewRequest):
 
 
 @router.post("/compare")
-async def compare_scenarios(scenarios: list[CalculateRequest]):
+async def compare_scenarios(
+    scenarios: list[CalculateRequest],
+    detail: Literal["headline", "components", "full"] = Query(
+        "headline", description="'headline' returns only, 'components' adds return components, 'full' adds inputs and macro dependencies"
+    ),
+):
     """
     Calculate and compare multiple scenarios side by side.
 
-    Useful for scenario analysis and sensitivity testing.
+    Useful for scenario analysis and sensitivity testing. Scenarios are
+    spread across a warm worker pool; results come back in request order,
+    and a scenario that fails or exceeds its timeout is reported inline.
+    Each asset carries the sections selected by ``detail`` (headline
+    returns by default).
     """
-    if len(scenarios) > 5:
-        raise HTTPException(status_code=400, detail="Maximum 5 scenarios for comparison")
+    if len(scenarios) > COMPARE_MAX_SCENARIOS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Maximum {COMPARE_MAX_SCENARIOS} scenarios for comparison",
+        )
 
-    results = []
-    for scenario in scenarios:
-        try:
-            engine = CMEEngine(
-                overrides=scenario.overrides,
-                base_currency=scenario.base_currency.lower(),
-                equity_model_type=scenario.equity_model,
-            )
-            calc_results = engine.compute_all_returns(scenario.scenario_name)
+    outcomes = await compare_executor.map(
+        functools.partial(_compare_one, detail=detail), scenarios, timeout=COMPARE_SCENARIO_TIMEOUT_SECONDS
+    )
 
+    results = []
+    for scenario, outcome in zip(scenarios, outcomes):
+        if isinstance(outcome, BaseException):
             results.append({
                 "scenario_name": scenario.scenario_name,
-                "base_currency": scenario.base_currency,
-                "results": {
-                    key: {
-                        "expected_return_nominal": r.expected_return_nominal,
-                        "expected_return_real": r.expected_return_real,
-                    }
-                    for key, r in calc_results.results.items()
-                }
-            })
-        except Exception as e:
-            results.append({
-                "scenario_name": scenario.scenario_name,
-                "error": str(e)
+                "error": str(outcome)
             })
+        else:
+            results.append(outcome)
 
     return {"scenarios": results}
+
+
+def _compare_one(scenario: CalculateRequest, detail: str = "headline") -> Dict[str, Any]:
+    """Returns at the requested detail for one scenario (runs in a compare worker)."""
+    engine = CMEEngine(
+        overrides=scenario.overrides,
+        base_currency=scenario.base_currency.lower(),
+        equity_model_type=scenario.equity_model,
+        detail=detail,
+    )
+    calc_results = engine.compute_all_returns(scenario.scenario_name)
+
+    if detail == "headline":
+        results = {
+            key: {
+                "expected_return_nominal": r.expected_return_nominal,
+                "expected_return_real": r.expected_return_real,
+            }
+            for key, r in calc_results.results.items()
+        }
+    else:
+        results = {
+            key: _convert_asset_result(r, detail).model_dump(mode="json", exclude_unset=True)
+            for key, r in calc_results.results.items()
+        }
+
+    return {
+        "scenario_name": scenario.scenario_name,
+        "base_currency": scenario.base_currency,
+        "results": results,
+    }
+
+
+async def _iter_batch_requests(http_request: Request) -> AsyncIterator[Any]:
+    """
+    Yield CalculateRequest bodies (or the error parsing one) from the request.
+
+    ``application/x-ndjson`` bodies are parsed line by line as they arrive,
+    so only one line is buffered at a time. Anything else is read whole as
+    a JSON array of at most BATCH_MAX_ARRAY_BYTES.
+    """
+    content_type = http_request.headers.get("content-type", "")
+    if "ndjson" not in content_type:
+        too_large = ValueError(
+            f"JSON array bodies are limited to {BATCH_MAX_ARRAY_BYTES} bytes; "
+            "send application/x-ndjson for larger batches"
+        )
+        declared = http_request.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > BATCH_MAX_ARRAY_BYTES:
+            yield too_large
+            return
+        body = bytearray()
+        async for chunk in http_request.stream():
+            body += chunk
+            if len(body) > BATCH_MAX_ARRAY_BYTES:
+                yield too_large
+                return
+        try:
+            items = json.loads(bytes(body) or b"[]")
+        except ValueError as e:
+            yield ValueError(f"Invalid JSON body: {e}")
+            return
+        if not isinstance(items, list):
+            yield ValueError("Body must be a JSON array of calculation requests")
+            return
+        for item in items:
+            try:
+                yield CalculateRequest.model_validate(item)
+            except ValidationError as e:
+                yield e
+        return
+
+    buffer = b""
+    async for chunk in http_request.stream():
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                try:
+                    yield CalculateRequest.model_validate_json(line)
+                except ValidationError as e:
+                    yield e
+        if len(buffer) > BATCH_MAX_LINE_BYTES:
+            yield ValueError(f"Request line exceeds {BATCH_MAX_LINE_BYTES} bytes")
+            return
+    if buffer.strip():
+        try:
+            yield CalculateRequest.model_validate_json(buffer)
+        except ValidationError as e:
+            yield e
+
+
+async def _batch_line(index: int, item: Any, output: str) -> bytes:
+    """Compute one batch item and encode it as an NDJSON line."""
+    if isinstance(item, Exception):
+        return _ndjson({"index": index, "error": str(item)})
+
+    fn = _compute_full_payload if output == "full" else _compare_one
+    try:
+        # Waits for a free worker (up to the deadline) without taking queue
+        # slots, so batch lines yield to interactive requests
+        payload = await compute_executor.run_waiting(fn, item, timeout=BATCH_CAPACITY_TIMEOUT_SECONDS)
+    except HTTPException as e:
+        return _ndjson({"index": index, "scenario_name": item.scenario_name, "error": str(e.detail)})
+    except Exception as e:
+        return _ndjson({"index": index, "scenario_name": item.scenario_name, "error": str(e)})
+    return _ndjson({"index": index, **payload})
+
+
+def _ndjson(obj: Dict[str, Any]) -> bytes:
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body iterator may keep reading the request.
+
+    On ASGI servers older than spec 2.4 Starlette runs a task that consumes
+    ``receive()`` to watch for disconnects, which would steal request body
+    chunks from the NDJSON reader. Here disconnects surface through ``send``
+    failing instead, as Starlette already does on spec 2.4 servers.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
+
+
+@router.post("/batch")
+async def calculate_batch(
+    http_request: Request,
+    output: Literal["headline", "full"] = Query("headline", description="'headline' returns or 'full' components"),
+):
+    """
+    Stream one NDJSON line per scenario as each is computed.
+
+    The body is either ``application/x-ndjson`` (one CalculateRequest per
+    line, consumed incrementally) or a JSON array of CalculateRequest. A
+    JSON array is read whole and limited to BATCH_MAX_ARRAY_BYTES (8 MiB by
+    default); use NDJSON for larger batches. Each
+    output line carries the scenario's ``index`` in the input; lines are
+    emitted in input order. Invalid or failing scenarios produce a line with
+    an ``error`` field instead of aborting the stream.
+
+    At most BATCH_MAX_IN_FLIGHT scenarios are being computed or awaiting
+    delivery at once, and no new input is read until the client has taken
+    the oldest result, so with NDJSON server memory stays flat however long
+    the batch. Lines only start on a free compute worker, leaving the
+    executor queue to interactive requests; a line that finds no worker
+    within BATCH_CAPACITY_TIMEOUT_SECONDS gets an ``error`` field.
+    """
+    async def stream() -> AsyncIterator[bytes]:
+        in_flight: "deque[asyncio.Task]" = deque()
+        index = 0
+        try:
+            async for item in _iter_batch_requests(http_request):
+                in_flight.append(asyncio.ensure_future(_batch_line(index, item, output)))
+                index += 1
+                if len(in_flight) >= BATCH_MAX_IN_FLIGHT:
+                    yield await in_flight.popleft()
+            while in_flight:
+                yield await in_flight.popleft()
+        finally:
+            # Client went away mid-stream: drop work nobody will read
+            for task in in_flight:
+                task.cancel()
+
+    return _DuplexStreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.post("/solve")
+async def solve_target(request: SolveRequest):
+    """
+    Reverse stress test: find the free input values that make an asset's
+    nominal or real return hit the target.
+
+    Returns the solving values, the achieved return and whether the target
+    was attainable within the bounds (if not, the closest values are given).
+    """
+    try:
+        result = await compute_executor.run(_solve, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return result.to_dict()
+
+
+def _solve(request: SolveRequest):
+    """Run the grid-then-refine solver for one request."""
+    return solve_for_target(
+        request.asset,
+        request.target,
+        [f.model_dump() for f in request.free_inputs],
+        measure=request.measure,
+        base_overrides=request.overrides,
+        base_currency=request.base_currency.lower(),
+        equity_model_type=request.equity_model,
+    )
+
+
+@router.post("/term-structure")
+async def term_structure(
+    request: CalculateRequest,
+    max_horizon: int = Query(30, ge=1, le=TERM_STRUCTURE_MAX_HORIZON),
+):
+    """
+    Expected returns for every forecast horizon from 1 to max_horizon years.
+
+    All horizons are evaluated in a single vectorized pass, at about the cost
+    of one /full calculation. Returns {horizons, nominal: {asset: [...]},
+    real: {asset: [...]}}.
+    """
+    key = scenario_key(request.overrides, request.base_currency, request.equity_model)
+    try:
+        payload, _ = await _single_flight.do(
+            f"{key}:term-structure:{max_horizon}",
+            lambda: compute_executor.run(_term_structure_payload, request, max_horizon),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {**payload, "scenario_name": request.scenario_name}
+
+
+def _term_structure_payload(request: CalculateRequest, max_horizon: int) -> Dict[str, Any]:
+    """Compute the 1..max_horizon term structure for one scenario."""
+    engine = CMEEngine(
+        overrides=request.overrides,
+        base_currency=request.base_currency.lower(),
+        equity_model_type=request.equity_model,
+    )
+    payload = engine.compute_term_structure(range(1, max_horizon + 1)).to_dict()
+    payload["scenario_name"] = request.scenario_name
+    return payload
+
+
+@router.post("/sweep")
+async def sweep(request: SweepRequest):
+    """
+    2-D parameter sweep: expected returns over a grid of two override paths.
+
+    The whole grid is evaluated as batched array computations. The result
+    is returned as a typed array: ``data`` is the base64 of a little-endian
+    ``dtype`` buffer of shape ``[assets, y.steps, x.steps]`` (row-major), so
+    the frontend can wrap it in a Float32Array/Float64Array directly.
+    """
+    points = request.x.steps * request.y.steps
+    if points > SWEEP_MAX_POINTS:
+        raise HTTPException(status_code=400, detail=f"Maximum {SWEEP_MAX_POINTS} grid points")
+
+    try:
+        return await compute_executor.run(_sweep_payload, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _sweep_payload(request: SweepRequest) -> Dict[str, Any]:
+    """Evaluate the sweep grid and encode it for the response."""
+    assets = request.assets or list(ASSETS)
+    x = np.linspace(request.x.start, request.x.stop, request.x.steps)
+    y = np.linspace(request.y.start, request.y.stop, request.y.steps)
+    grid = sweep_grid(
+        request.x.path, x,
+        request.y.path, y,
+        assets=assets,
+        component=f"expected_return_{request.measure}",
+        base_overrides=request.overrides,
+        base_currency=request.base_currency.lower(),
+        equity_model_type=request.equity_model,
+    )
+    data = np.ascontiguousarray(grid, dtype=np.dtype(request.dtype).newbyteorder('<'))
+    return {
+        "x": {"path": request.x.path, "values": x.tolist()},
+        "y": {"path": request.y.path, "values": y.tolist()},
+        "assets": assets,
+        "measure": request.measure,
+        "shape": list(data.shape),
+        "dtype": request.dtype,
+        "data": base64.b64encode(data.tobytes()).decode("ascii"),
+    }
+
+
+def _cleanup_old_monte_carlo_jobs():
+    """Remove jobs older than 1 hour to prevent memory leaks."""
+    now = datetime.now(timezone.utc)
+    expired = [
+        jid for jid, job in _monte_carlo_jobs.items()
+        if (now - datetime.fromisoformat(job["started_at"])).total_seconds() > 3600
+    ]
+    for jid in expired:
+        del _monte_carlo_jobs[jid]
+
+
+def _run_monte_carlo_job(job_id: str, engine: MonteCarloEngine, request: MonteCarloRequest):
+    """Background thread: run the simulation and store the summary on the job."""
+    job = _monte_carlo_jobs[job_id]
+
+    def progress(done: int, total: int):
+        job["progress"] = {"draws_done": done, "draws_total": total}
+
+    try:
+        results = engine.run(request.n_draws, progress=progress)
+        job["result"] = results.to_dict(request.quantiles)
+        job["status"] = "completed"
+    except Exception as e:
+        logger.exception("Monte Carlo job %s failed", job_id[:8])
+        job["error"] = str(e)
+        job["status"] = "failed"
+
+
+@router.post("/monte-carlo")
+async def start_monte_carlo(request: MonteCarloRequest):
+    """
+    Start a Monte Carlo simulation in the background.
+
+    Sampled inputs are evaluated in vectorized chunks and each asset's return
+    distribution is kept in a streaming quantile sketch, so memory does not
+    grow with n_draws. Poll GET /monte-carlo/{job_id} for progress and the
+    result. Runs are reproducible: the same request and seed give the same
+    summary.
+    """
+    if request.n_draws > MONTE_CARLO_MAX_DRAWS:
+        raise HTTPException(status_code=400, detail=f"Maximum {MONTE_CARLO_MAX_DRAWS} draws")
+    if any(not 0 <= q <= 1 for q in request.quantiles):
+        raise HTTPException(status_code=400, detail="Quantiles must be between 0 and 1")
+
+    _cleanup_old_monte_carlo_jobs()
+    running = sum(1 for job in _monte_carlo_jobs.values() if job["status"] == "running")
+    if running >= MONTE_CARLO_MAX_JOBS:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many Monte Carlo jobs running, retry shortly",
+            headers={"Retry-After": "5"},
+        )
+
+    # Validate the spec up front so bad input is a 400, not a failed job
+    try:
+        engine = MonteCarloEngine(
+            [d.model_dump() for d in request.distributions],
+            correlation=request.correlation,
+            base_overrides=request.overrides,
+            base_currency=request.base_currency.lower(),
+            equity_model_type=request.equity_model,
+            seed=request.seed,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    job_id = str(uuid.uuid4())
+    _monte_carlo_jobs[job_id] = {
+        "status": "running",
+        "progress": {"draws_done": 0, "draws_total": request.n_draws},
+        "result": None,
+        "error": None,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    thread = threading.Thread(
+        target=_run_monte_carlo_job,
+        args=(job_id, engine, request),
+        daemon=True,
+    )
+    thread.start()
+
+    logger.info("Started Monte Carlo job %s (%d draws)", job_id[:8], request.n_draws)
+
+    return {"job_id": job_id}
+
+
+@router.get("/monte-carlo/{job_id}")
+async def monte_carlo_status(job_id: str):
+    """
+    Poll a Monte Carlo job.
+    Returns status, progress, and (when complete) the distribution summary.
+    """
+    job = _monte_carlo_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Monte Carlo job not found")
+
+    response: Dict[str, Any] = {
+        "status": job["status"],
+        "progress": job["progress"],
+        "started_at": job["started_at"],
+    }
+
+    if job["status"] == "completed":
+        response["result"] = job["result"]
+    elif job["status"] == "failed":
+        response["error"] = job["error"]
+
+    return response
@@ -9,9 +9,18 @@ import os
 import time
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from fastapi import APIRouter
 
+from api.config import (
+    DEFAULTS_CACHE_TTL_SECONDS,
+    DEFAULTS_VERSION_FILE,
+    DEFAULTS_VERSION_POLL_SECONDS,
+)
+from api.defaults_sync import DefaultsVersionChannel
+from ra_stress_tool.inputs.defaults import invalidate_defaults_snapshot
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -198,9 +207,19 @@ INPUT_DEFAULTS_GK_EQUITY = {
 }
 
 # ---- In-memory cache for Supabase defaults ----
-_cached_defaults: Optional[Dict[str, Any]] = None
-_cache_timestamp: float = 0.0
-_CACHE_TTL_SECONDS = 300  # 5 minutes
+
+# Latest default_assumptions.version seen by this worker (from Supabase or
+# the version channel). Caches keyed on it (e.g. calculation results) stop
+# matching when it moves; it never goes backwards.
+_defaults_version: int = 0
+_defaults_version_lock = threading.Lock()
+_version_listeners: List[Callable[[int], None]] = []
+_version_channel = DefaultsVersionChannel(DEFAULTS_VERSION_FILE, DEFAULTS_VERSION_POLL_SECONDS)
+
+# One Supabase client per process; it keeps its HTTP connection pool
+_supabase_client: Any = None
+_supabase_client_ready = False
+_supabase_client_lock = threading.Lock()
 
 
 def _deep_merge(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -215,61 +234,254 @@ def _deep_merge(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]
 
 
 def _get_supabase_client():
-    """Get a Supabase client for fetching defaults."""
-    try:
-        from supabase import create_client
-        url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
-        key = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-        if url and key:
-            return create_client(url, key)
-    except Exception as e:
-        logger.warning("Could not create Supabase client: %s", e)
-    return None
+    """
+    Get the shared Supabase client for fetching defaults.
 
+    The client is created once and reused, so requests share its connection
+    pool. Returns None when Supabase is not configured or unavailable.
+    """
+    global _supabase_client, _supabase_client_ready
+    if _supabase_client_ready:
+        return _supabase_client
+    with _supabase_client_lock:
+        if not _supabase_client_ready:
+            try:
+                from supabase import create_client
+                url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+                key = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
+                if url and key:
+                    _supabase_client = create_client(url, key)
+            except Exception as e:
+                logger.warning("Could not create Supabase client: %s", e)
+            _supabase_client_ready = True
+    return _supabase_client
+
+
+def _load_defaults() -> Tuple[Dict[str, Any], str]:
+    """
+    Fetch the defaults from Supabase, merged onto the hardcoded ones.
 
-def invalidate_defaults_cache():
-    """Invalidate the in-memory cache so next request fetches fresh data."""
-    global _cached_defaults, _cache_timestamp
-    _cached_defaults = None
-    _cache_timestamp = 0.0
+    Returns (defaults, source) with source 'supabase' or 'hardcoded' (no
+    client, no row, or an empty row left by a revert). Raises if the
+    Supabase query fails. A newer row version is recorded as the worker's
+    defaults version (see _advance_defaults_version).
+    """
+    client = _get_supabase_client()
+    if client:
+        result = client.table("default_assumptions").select("defaults_json, version").eq("id", 1).execute()
+        if result.data and len(result.data) > 0:
+            row = result.data[0]
+            # This snapshot is already current, so only the dependent caches
+            # are dropped when the version moved
+            _advance_defaults_version(int(row.get("version") or 0), reload_defaults=False)
+            db_defaults = row["defaults_json"]
+            if isinstance(db_defaults, str):
+                db_defaults = json.loads(db_defaults)
+            if not db_defaults:
+                return INPUT_DEFAULTS, "hardcoded"
+            # Merge DB defaults onto hardcoded defaults so newly added keys
+            # are always available even before DB schema/default refresh.
+            return _deep_merge(INPUT_DEFAULTS, db_defaults), "supabase"
+    return INPUT_DEFAULTS, "hardcoded"
+
+
+class DefaultsCache:
+    """
+    Stale-while-revalidate cache of the current defaults.
+
+    A fresh snapshot is served as is. A stale one (older than the TTL) is
+    still served immediately while a single background thread refetches it.
+    Only an empty cache, at startup or after an invalidation, makes callers
+    wait, and concurrent callers then share one fetch. A failed refresh keeps
+    the last good snapshot and retries after another TTL.
+
+    Parameters
+    ----------
+    loader : callable
+        Returns (defaults, source); may raise.
+    ttl_seconds : float
+        Age after which a snapshot is refreshed in the background.
+    """
+
+    def __init__(self, loader: Callable[[], Tuple[Dict[str, Any], str]], ttl_seconds: float = 300.0):
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._source = "none"
+        self._fetched_at = 0.0   # when the snapshot was loaded
+        self._checked_at = 0.0   # last load attempt (success or failure)
+        self._generation = 0     # bumped by invalidate(); stale loads are dropped
+        self._refreshing = False
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.stale_serves = 0
+        self.last_refresh_seconds: Optional[float] = None
+
+    def get(self) -> Dict[str, Any]:
+        """Current defaults; never blocks on a refresh once a snapshot exists."""
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                if time.monotonic() - self._checked_at >= self.ttl_seconds:
+                    self.stale_serves += 1
+                    if not self._refreshing:
+                        self._refreshing = True
+                        threading.Thread(
+                            target=self._refresh, args=(self._generation,),
+                            name="defaults-refresh", daemon=True,
+                        ).start()
+                return snapshot
+
+        # Empty cache: one caller loads, the others wait for it
+        with self._load_lock:
+            with self._lock:
+                if self._snapshot is not None:
+                    return self._snapshot
+                generation = self._generation
+            self._load(generation)
+            with self._lock:
+                return self._snapshot if self._snapshot is not None else INPUT_DEFAULTS
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next get() loads fresh data."""
+        with self._lock:
+            self._snapshot = None
+            self._source = "none"
+            self._generation += 1
+
+    def _refresh(self, generation: int) -> None:
+        try:
+            self._load(generation)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _load(self, generation: int) -> None:
+        started = time.monotonic()
+        try:
+            defaults, source = self.loader()
+        except Exception as e:
+            logger.warning("Could not load defaults from Supabase: %s", e)
+            with self._lock:
+                self.refresh_failures += 1
+                self._checked_at = time.monotonic()
+                if self._snapshot is None and generation == self._generation:
+                    # Nothing to serve yet: fall back to the hardcoded defaults
+                    self._snapshot, self._source = INPUT_DEFAULTS, "hardcoded"
+                    self._fetched_at = self._checked_at
+            return
+
+        finished = time.monotonic()
+        with self._lock:
+            self.refreshes += 1
+            self.last_refresh_seconds = finished - started
+            if generation != self._generation:
+                return  # invalidated while loading; the result may predate the change
+            self._snapshot, self._source = defaults, source
+            self._fetched_at = self._checked_at = finished
+        if source == "supabase":
+            logger.info("Loaded defaults from Supabase in %.0f ms", (finished - started) * 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        """Freshness and refresh metrics."""
+        with self._lock:
+            now = time.monotonic()
+            has_snapshot = self._snapshot is not None
+            return {
+                "source": self._source,
+                "age_seconds": now - self._fetched_at if has_snapshot else None,
+                "ttl_seconds": self.ttl_seconds,
+                "stale": has_snapshot and now - self._checked_at >= self.ttl_seconds,
+                "refreshing": self._refreshing,
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "stale_serves": self.stale_serves,
+                "last_refresh_ms": (
+                    self.last_refresh_seconds * 1000 if self.last_refresh_seconds is not None else None
+                ),
+            }
+
+
+_defaults_cache = DefaultsCache(_load_defaults, DEFAULTS_CACHE_TTL_SECONDS)
+
+
+def on_defaults_version_change(callback: Callable[[int], None]) -> None:
+    """Register ``callback(version)`` to run whenever the defaults version moves."""
+    _version_listeners.append(callback)
+
+
+def _advance_defaults_version(version: int, reload_defaults: bool = True) -> bool:
+    """
+    Record a newer defaults version and drop every cache built on the old one.
+
+    Clears the engine default snapshots, runs the registered listeners (the
+    calculation result cache) and, unless ``reload_defaults`` is False,
+    the defaults snapshot. Versions not newer than the current one are
+    ignored. Returns True if the version moved.
+    """
+    global _defaults_version
+    with _defaults_version_lock:
+        if version <= _defaults_version:
+            return False
+        previous, _defaults_version = _defaults_version, version
+    if reload_defaults:
+        _defaults_cache.invalidate()
+    invalidate_defaults_snapshot()
+    for callback in _version_listeners:
+        callback(version)
+    logger.info("Defaults version %d -> %d; caches invalidated", previous, version)
+    return True
+
+
+def _sync_defaults_version() -> int:
+    """Apply a version published by another worker, if any (cheap, rate-limited)."""
+    published = _version_channel.poll()
+    if published is not None:
+        _advance_defaults_version(published)
+    return _defaults_version
+
+
+def invalidate_defaults_cache(version: int):
+    """
+    Switch to a new defaults version after an admin write.
+
+    Invalidates this worker's caches immediately and publishes ``version``
+    so the other workers on the host follow within a poll interval.
+
+    Parameters
+    ----------
+    version : int
+        The default_assumptions.version returned by the write.
+    """
+    if not _advance_defaults_version(version):
+        # Another path already recorded this version; still reload defaults
+        _defaults_cache.invalidate()
+    _version_channel.publish(version)
+
+
+def get_defaults_version() -> int:
+    """Version of the active defaults (default_assumptions.version)."""
+    return _sync_defaults_version()
 
 
 def get_current_defaults() -> Dict[str, Any]:
     """
     Get the current defaults, loading from Supabase if available.
     Falls back to hardcoded INPUT_DEFAULTS.
-    Results are cached in memory with a 5-minute TTL.
+    Results are cached in memory; once loaded, an expired snapshot is served
+    while a background refresh fetches the new one (see DefaultsCache).
+    A version published by another worker invalidates the cache first.
     """
-    global _cached_defaults, _cache_timestamp
-
-    now = time.time()
-
-    # Return cached if still valid
-    if _cached_defaults is not None and (now - _cache_timestamp) < _CACHE_TTL_SECONDS:
-        return _cached_defaults
-
-    # Try loading from Supabase
-    try:
-        client = _get_supabase_client()
-        if client:
-            result = client.table("default_assumptions").select("defaults_json").eq("id", 1).execute()
-            if result.data and len(result.data) > 0:
-                db_defaults = result.data[0]["defaults_json"]
-                if isinstance(db_defaults, str):
-                    db_defaults = json.loads(db_defaults)
-                # Merge DB defaults onto hardcoded defaults so newly added keys
-                # are always available even before DB schema/default refresh.
-                _cached_defaults = _deep_merge(INPUT_DEFAULTS, db_defaults)
-                _cache_timestamp = now
-                logger.info("Loaded defaults from Supabase")
-                return _cached_defaults
-    except Exception as e:
-        logger.warning("Could not load from Supabase, using hardcoded: %s", e)
-
-    # Fallback to hardcoded
-    _cached_defaults = INPUT_DEFAULTS
-    _cache_timestamp = now
-    return _cached_defaults
+    _sync_defaults_version()
+    return _defaults_cache.get()
+
+
+@router.get("/cache-stats")
+async def defaults_cache_stats():
+    """Defaults cache freshness (age, staleness), refresh latency and version."""
+    return {**_defaults_cache.stats(), "version": get_defaults_version()}
 
 
 @router.get("/all")
@@ -0,0 +1,132 @@
+"""
+Portfolio endpoints.
+
+Aggregates asset class expected returns from CMEEngine with the risk model
+in ra_stress_tool.portfolio: portfolio return/volatility and the efficient
+frontier.
+"""
+
+from fastapi import APIRouter, HTTPException
+from typing import Dict, Tuple
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path to import ra_stress_tool
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.portfolio import RiskModel, efficient_frontier, portfolio_stats
+from api.config import PORTFOLIO_MAX_POINTS, PORTFOLIO_MAX_ASSETS
+from api.executor import compute_executor
+from api.models.requests import FrontierRequest, PortfolioStatsRequest
+
+router = APIRouter()
+
+MEASURE_FIELDS = {
+    "nominal": "expected_return_nominal",
+    "real": "expected_return_real",
+}
+
+
+def _risk_inputs(request) -> Tuple[Tuple[str, ...], np.ndarray, np.ndarray]:
+    """Asset names, expected returns and covariance for a request."""
+    universe = request.universe
+    if universe is not None:
+        n = len(universe.assets)
+        if n > PORTFOLIO_MAX_ASSETS:
+            raise ValueError(f"At most {PORTFOLIO_MAX_ASSETS} assets per universe")
+        if len(set(universe.assets)) != n:
+            raise ValueError("Asset names must be unique")
+        if len(universe.expected_returns) != n:
+            raise ValueError(f"Expected {n} expected returns")
+        risk = RiskModel(universe.assets, universe.volatilities, universe.correlation)
+        return risk.assets, np.asarray(universe.expected_returns, dtype=float), risk.covariance
+
+    risk = RiskModel.from_config(request.overrides)
+    engine = CMEEngine(
+        request.overrides,
+        request.base_currency.lower(),
+        request.equity_model,
+        tracking=False,
+    )
+    results = engine.compute_all_returns().results
+    field = MEASURE_FIELDS[request.measure]
+    mu = np.array([getattr(results[asset], field) for asset in risk.assets])
+    return risk.assets, mu, risk.covariance
+
+
+def _frontier(request: FrontierRequest) -> Dict:
+    assets, mu, cov = _risk_inputs(request)
+    lower = np.full(len(assets), request.min_weight)
+    upper = np.full(len(assets), request.max_weight)
+    index = {asset: i for i, asset in enumerate(assets)}
+    for asset, bound in (request.bounds or {}).items():
+        if asset not in index:
+            raise ValueError(f"Unknown asset in bounds: {asset!r}")
+        if len(bound) != 2:
+            raise ValueError(f"Bounds for {asset!r} must be [lower, upper]")
+        lower[index[asset]], upper[index[asset]] = bound
+    frontier = efficient_frontier(mu, cov, request.n_points, lower, upper, assets=assets)
+    payload = frontier.to_dict()
+    payload["expected_returns"] = dict(zip(assets, mu.tolist()))
+    payload["volatilities_by_asset"] = dict(zip(assets, np.sqrt(np.diag(cov)).tolist()))
+    payload["measure"] = request.measure
+    return payload
+
+
+def _stats(request: PortfolioStatsRequest) -> Dict:
+    assets, mu, cov = _risk_inputs(request)
+    index = {asset: i for i, asset in enumerate(assets)}
+    weights = np.zeros((len(request.portfolios), len(assets)))
+    for k, portfolio in enumerate(request.portfolios):
+        for asset, weight in portfolio.items():
+            if asset not in index:
+                raise ValueError(f"Unknown asset in portfolio {k}: {asset!r}")
+            weights[k, index[asset]] = weight
+    returns, volatilities = portfolio_stats(weights, mu, cov)
+    return {
+        "assets": list(assets),
+        "returns": returns.tolist(),
+        "volatilities": volatilities.tolist(),
+        "total_weights": weights.sum(axis=1).tolist(),
+        "measure": request.measure,
+    }
+
+
+@router.post("/frontier")
+async def frontier(request: FrontierRequest):
+    """
+    Efficient frontier of fully invested portfolios within weight bounds.
+
+    Expected returns come from the CME engine for the scenario (or from a
+    custom universe); volatilities and correlations from the config, with
+    'risk' overrides. Returns n_points portfolios evenly spaced in expected
+    return from the minimum-variance portfolio to the highest-return one:
+    {assets, returns, volatilities, weights, ...}.
+    """
+    if request.n_points > PORTFOLIO_MAX_POINTS:
+        raise HTTPException(status_code=400, detail=f"At most {PORTFOLIO_MAX_POINTS} frontier points")
+    try:
+        return await compute_executor.run(_frontier, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/stats")
+async def stats(request: PortfolioStatsRequest):
+    """
+    Expected return and volatility for each given portfolio.
+
+    Weights are used as given (they need not sum to 1; the sums are
+    reported as total_weights).
+    """
+    try:
+        return await compute_executor.run(_stats, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
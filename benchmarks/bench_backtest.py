@@ -0,0 +1,124 @@
+"""
+Benchmark: vectorized backtest vs. one CMEEngine per date.
+
+Builds a 30-year month-end panel (360 dates) of synthetic histories for a
+set of override paths. Some histories start late, so those dates fall
+back to defaults. It runs BacktestRunner and writes the forecast panel
+and error stats to a temporary directory. It then checks sampled dates
+against a CMEEngine built from the same panel row, and times the backtest
+against the per-date engine loop.
+
+Run from the repository root:
+
+    python benchmarks/bench_backtest.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.backtest import BacktestRunner, forward_annualized_returns, month_range
+from ra_stress_tool.batch import ASSETS
+from ra_stress_tool.main import CMEEngine
+
+
+TOLERANCE = 1e-12
+CHECKED_DATES = 24
+
+# Panel columns: (path, starting level, monthly volatility, first month with data)
+HISTORIES = [
+    ('macro.us.current_tbill', 0.05, 0.002, 0),
+    ('macro.us.current_headline_inflation', 0.03, 0.002, 0),
+    ('macro.eurozone.current_tbill', 0.03, 0.002, 48),
+    ('macro.eurozone.current_headline_inflation', 0.02, 0.002, 48),
+    ('macro.japan.current_tbill', 0.005, 0.001, 0),
+    ('macro.em.current_headline_inflation', 0.06, 0.003, 0),
+    ('bonds_global.current_yield', 0.05, 0.002, 0),
+    ('bonds_global.current_term_premium', 0.01, 0.001, 0),
+    ('bonds_hy.current_yield', 0.08, 0.004, 0),
+    ('bonds_hy.credit_spread', 0.045, 0.003, 0),
+    ('bonds_em.current_yield', 0.07, 0.003, 36),
+    ('equity_us.dividend_yield', 0.02, 0.0005, 0),
+    ('equity_us.current_caey', 0.045, 0.002, 0),
+    ('equity_europe.current_caey', 0.06, 0.002, 0),
+    ('equity_japan.current_caey', 0.04, 0.002, 0),
+    ('equity_em.current_caey', 0.07, 0.003, 60),
+    ('inflation_linked.usd.current_real_yield', 0.02, 0.001, 120),
+]
+
+
+def synthetic_panel(rng, n):
+    panel = np.empty((n, len(HISTORIES)))
+    for j, (_, level, vol, first) in enumerate(HISTORIES):
+        panel[:, j] = level + np.cumsum(vol * rng.standard_normal(n))
+        panel[:first, j] = np.nan
+    return panel
+
+
+def engine_overrides(paths, row):
+    overrides = {}
+    for path, value in zip(paths, row):
+        if np.isnan(value):
+            continue
+        *parents, key = path.split('.')
+        node = overrides
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[key] = float(value)
+    return overrides
+
+
+def main():
+    rng = np.random.default_rng(3)
+    dates = month_range('1995-01', '2024-12')
+    paths = [h[0] for h in HISTORIES]
+    panel = synthetic_panel(rng, len(dates))
+    # Realized 10-year returns from synthetic total return indices (+10 years of future data)
+    realized = {
+        asset: forward_annualized_returns(
+            np.exp(np.cumsum(0.005 + 0.03 * rng.standard_normal(len(dates) + 120)))
+        )[:len(dates)]
+        for asset in ASSETS
+    }
+    ok = True
+
+    for base_currency, model in (('usd', 'ra'), ('eur', 'gk')):
+        runner = BacktestRunner(base_currency=base_currency, equity_model_type=model)
+        t0 = time.perf_counter()
+        results = runner.run(dates, paths, panel, realized=realized)
+        with tempfile.TemporaryDirectory() as out:
+            written = results.save(out)
+            elapsed = time.perf_counter() - t0
+            sizes = {kind: os.path.getsize(p) for kind, p in written.items()}
+
+        checked = rng.choice(len(dates), CHECKED_DATES, replace=False)
+        err = 0.0
+        t1 = time.perf_counter()
+        for i in checked:
+            engine = CMEEngine(engine_overrides(paths, panel[i]), base_currency, model, tracking=False)
+            scalar = engine.compute_all_returns().results
+            for a, asset in enumerate(ASSETS):
+                err = max(err, abs(scalar[asset].expected_return_nominal - results.forecast[i, a]))
+        loop_estimate = (time.perf_counter() - t1) / CHECKED_DATES * len(dates)
+
+        good = err < TOLERANCE and elapsed < 1.0
+        ok &= good
+        stats = results.error_stats()['equity_us']
+        print(
+            f"{base_currency}/{model}: {len(dates)} dates x {len(ASSETS)} assets in {elapsed * 1e3:.1f} ms "
+            f"(run + save; per-date CMEEngine loop ~{loop_estimate * 1e3:.0f} ms), "
+            f"max err vs. CMEEngine {err:.1e} {'ok' if good else 'FAIL'}"
+        )
+        print(f"  equity_us: n={stats['n']} bias={stats['bias']:+.4f} rmse={stats['rmse']:.4f}; files {sizes}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark: BatchCMEEngine vs. a loop of CMEEngine instances.
+
+Checks that the vectorized engine reproduces the scalar engine for every
+asset class and component (USD/EUR base, RA/GK equity models, including
+presence-sensitive overrides), then times a 10,000-scenario sweep.
+
+Run from the repository root:
+
+    python benchmarks/bench_batch_engine.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.batch import BatchCMEEngine, compute_scenarios
+
+
+TOLERANCE = 1e-12
+
+# Override paths swept in the benchmark, with (low, high) sampling bounds
+SWEEP = {
+    'macro.us.current_tbill': (0.0, 0.06),
+    'macro.us.current_headline_inflation': (0.0, 0.08),
+    'macro.us.my_ratio': (1.0, 3.0),
+    'macro.eurozone.current_tbill': (-0.005, 0.04),
+    'macro.eurozone.population_growth': (-0.005, 0.01),
+    'macro.japan.productivity_growth': (0.0, 0.02),
+    'macro.em.current_headline_inflation': (0.01, 0.08),
+    'bonds_global.current_term_premium': (-0.01, 0.03),
+    'bonds_hy.default_rate': (0.01, 0.10),
+    'bonds_hy.credit_spread': (0.02, 0.08),
+    'bonds_em.current_yield': (0.04, 0.09),
+    'equity_us.current_caey': (0.02, 0.06),
+    'equity_europe.current_caey': (0.03, 0.08),
+    'equity_japan.current_pe': (10.0, 25.0),
+    'equity_em.dividend_yield': (0.01, 0.05),
+    'absolute_return.trading_alpha': (0.0, 0.02),
+    'inflation_linked.usd.current_real_yield': (0.0, 0.03),
+    'inflation_linked.eur.current_real_yield': (-0.01, 0.02),
+}
+
+# Scenarios that switch model branches rather than values
+PRESENCE_SCENARIOS = [
+    {},
+    {'macro': {'us': {'rgdp_growth': 0.01, 'inflation_forecast': 0.05}}},
+    {'macro': {'eurozone': {'tbill_forecast': -0.002}, 'japan': {'long_term_inflation': 0.01}}},
+    {'bonds_global': {'current_yield': 0.055}},
+    {'bonds_em': {'current_yield': 0.08, 'current_term_premium': 0.01}},
+    {'equity_us': {'revenue_growth': 0.07, 'current_caey': -0.01}},
+    {'macro': {'em': {'country_factor': 0.01, 'rgdp_adjustment': 0.002}}},
+]
+
+
+def _nest(path, value):
+    out = value
+    for part in reversed(path.split('.')):
+        out = {part: out}
+    return out
+
+
+def _merge(base, update):
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _scalar_row(overrides, base_currency, equity_model_type):
+    engine = CMEEngine(overrides, base_currency=base_currency, equity_model_type=equity_model_type)
+    return engine.compute_all_returns()
+
+
+def _max_error(batch, row, scalar):
+    worst = 0.0
+    for asset, result in scalar.results.items():
+        expected = dict(result.components)
+        expected['expected_return_nominal'] = result.expected_return_nominal
+        expected['expected_return_real'] = result.expected_return_real
+        got = batch.scenario(row)[asset]
+        assert set(expected) <= set(got), (asset, set(expected) - set(got))
+        for component, value in expected.items():
+            worst = max(worst, abs(got[component] - value))
+    return worst
+
+
+def check_equivalence(n_random=40, seed=7):
+    rng = np.random.default_rng(seed)
+    paths = list(SWEEP)
+    low = np.array([SWEEP[p][0] for p in paths])
+    high = np.array([SWEEP[p][1] for p in paths])
+    values = rng.uniform(low, high, size=(n_random, len(paths)))
+
+    worst = 0.0
+    for base_currency in ('usd', 'eur'):
+        for model in ('ra', 'gk'):
+            batch = BatchCMEEngine(paths, base_currency=base_currency, equity_model_type=model).compute(values)
+            for i in range(n_random):
+                overrides = {}
+                for path, value in zip(paths, values[i]):
+                    _merge(overrides, _nest(path, float(value)))
+                worst = max(worst, _max_error(batch, i, _scalar_row(overrides, base_currency, model)))
+
+            grouped = compute_scenarios(PRESENCE_SCENARIOS, base_currency=base_currency, equity_model_type=model)
+            for i, overrides in enumerate(PRESENCE_SCENARIOS):
+                worst = max(worst, _max_error(grouped, i, _scalar_row(overrides, base_currency, model)))
+
+    print(f"Equivalence: max abs error {worst:.3e} (tolerance {TOLERANCE:.0e})")
+    assert worst <= TOLERANCE
+    return worst
+
+
+def bench(n_scenarios=10_000, n_scalar=200, seed=11):
+    rng = np.random.default_rng(seed)
+    paths = list(SWEEP)
+    low = np.array([SWEEP[p][0] for p in paths])
+    high = np.array([SWEEP[p][1] for p in paths])
+    values = rng.uniform(low, high, size=(n_scenarios, len(paths)))
+
+    start = time.perf_counter()
+    for i in range(n_scalar):
+        overrides = {}
+        for path, value in zip(paths, values[i]):
+            _merge(overrides, _nest(path, float(value)))
+        _scalar_row(overrides, 'usd', 'ra')
+    scalar_per_scenario = (time.perf_counter() - start) / n_scalar
+
+    engine = BatchCMEEngine(paths)
+    engine.compute(values[:10])  # warm up
+    start = time.perf_counter()
+    engine.compute(values)
+    batch_elapsed = time.perf_counter() - start
+
+    scalar_estimate = scalar_per_scenario * n_scenarios
+    print(f"Scalar engine: {scalar_per_scenario * 1e3:.3f} ms/scenario "
+          f"(~{scalar_estimate:.1f} s for {n_scenarios:,})")
+    print(f"Batch engine:  {batch_elapsed * 1e3:.1f} ms for {n_scenarios:,} "
+          f"({n_scenarios / batch_elapsed:,.0f} scenarios/s)")
+    print(f"Speedup:       {scalar_estimate / batch_elapsed:,.0f}x")
+
+
+if __name__ == '__main__':
+    check_equivalence()
+    bench()
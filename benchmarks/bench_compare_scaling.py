@@ -0,0 +1,80 @@
+"""
+Benchmark: /compare fan-out scaling with process-pool workers.
+
+Builds a committee-pack sized set of scenarios, runs them through a warm
+ComputeExecutor process pool at increasing worker counts, and reports
+throughput and speedup against the serial loop. Results are checked to come
+back in input order and to match the serial computation.
+
+Run from the repository root:
+
+    python benchmarks/bench_compare_scaling.py [n_scenarios]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.executor import ComputeExecutor, warm_engine_worker
+from api.models.requests import CalculateRequest
+from api.routes.calculate import _compare_one
+
+
+def build_scenarios(n):
+    scenarios = []
+    for i in range(n):
+        shock = (i % 21 - 10) * 0.001
+        scenarios.append(CalculateRequest(
+            scenario_name=f"scenario_{i}",
+            base_currency='eur' if i % 4 == 3 else 'usd',
+            equity_model='gk' if i % 2 else 'ra',
+            overrides={
+                'macro': {'us': {'inflation_forecast': 0.025 + shock}},
+                'equity_us': {'current_caey': 0.035 + shock / 2},
+            },
+        ))
+    return scenarios
+
+
+def run_pool(scenarios, workers, repeats=3):
+    executor = ComputeExecutor(
+        kind='process', max_workers=workers, max_queue=1,
+        initializer=warm_engine_worker,
+    )
+    executor.warm()
+    best = float('inf')
+    outcomes = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        outcomes = asyncio.run(executor.map(_compare_one, scenarios))
+        best = min(best, time.perf_counter() - start)
+    executor.shutdown()
+    return best, outcomes
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    scenarios = build_scenarios(n)
+    cpus = os.cpu_count() or 1
+
+    warm_engine_worker()
+    start = time.perf_counter()
+    serial = [_compare_one(s) for s in scenarios]
+    serial_time = time.perf_counter() - start
+
+    print(f"{n} scenarios, {cpus} CPU(s)")
+    print(f"{'workers':>8} {'time (s)':>10} {'scen/s':>10} {'speedup':>8}")
+    print(f"{'serial':>8} {serial_time:>10.3f} {n / serial_time:>10.1f} {1.0:>8.2f}")
+
+    counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1))) or [1]
+    for workers in counts:
+        elapsed, outcomes = run_pool(scenarios, workers)
+        assert outcomes == serial, "parallel results differ from serial or are out of order"
+        print(f"{workers:>8} {elapsed:>10.3f} {n / elapsed:>10.1f} {serial_time / elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: engine construction time and allocations.
+
+Compares building engines on the shared DefaultsSnapshot against forcing a
+fresh snapshot per engine (invalidate_defaults_snapshot() before each
+construction), which reproduces the previous per-engine deepcopy of every
+default table.
+
+Run from the repository root:
+
+    python benchmarks/bench_engine_construction.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.inputs.overrides import OverrideManager
+from ra_stress_tool.inputs.defaults import invalidate_defaults_snapshot
+
+
+def _per_engine_copy(factory):
+    def build():
+        invalidate_defaults_snapshot()
+        return factory()
+    return build
+
+
+def measure(build, n_timed=2000, n_alloc=200):
+    """Return (seconds per construction, bytes retained per live instance)."""
+    for _ in range(50):
+        build()
+
+    start = time.perf_counter()
+    for _ in range(n_timed):
+        build()
+    elapsed = (time.perf_counter() - start) / n_timed
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [build() for _ in range(n_alloc)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename')) / n_alloc
+    del instances
+    return elapsed, retained
+
+
+def main():
+    factories = {
+        'OverrideManager': lambda: OverrideManager({}),
+        'CMEEngine (ra)': lambda: CMEEngine({}),
+        'CMEEngine (gk)': lambda: CMEEngine({}, equity_model_type='gk'),
+    }
+
+    print(f"{'':<18} {'mode':<16} {'time':>10} {'retained':>10}")
+    for name, factory in factories.items():
+        for mode, build in (('per-engine copy', _per_engine_copy(factory)), ('shared snapshot', factory)):
+            elapsed, retained = measure(build)
+            print(f"{name:<18} {mode:<16} {elapsed * 1e6:>8.1f}us {retained / 1024:>7.1f}KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark: O(n) rolling EWMA and trend kernels vs. the per-prefix loops.
+
+ewma_from_series used to call ewma(data[:i]) for every prefix, rebuilding
+the weights each time (O(n^2)); trend growth was a pure-Python regression.
+This script checks the recursive/vectorized versions in
+ra_stress_tool.utils.ewma against those reference loops on random series
+(with and without a window, monthly and annual), checks the streaming
+RollingEWMA, then times the kernels on 10k to 1M point series.
+
+Run from the repository root:
+
+    python benchmarks/bench_ewma.py
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.utils.ewma import (
+    RollingEWMA,
+    compute_trend_growth,
+    ewma_from_series,
+    rolling_trend_growth,
+)
+
+
+TOLERANCE = 1e-10
+SIZES = [10_000, 100_000, 1_000_000]
+REFERENCE_SIZE = 2_000
+
+
+# ---- Reference loops (the code the kernels replaced) ----
+
+def loop_ewma(data, half_life_years, window_years=None, frequency='monthly'):
+    periods_per_year = {'monthly': 12, 'quarterly': 4, 'annual': 1}.get(frequency, 12)
+    lambda_decay = 0.5 ** (1 / (half_life_years * periods_per_year))
+    if window_years is not None:
+        window_periods = window_years * periods_per_year
+        data = data[-window_periods:] if len(data) > window_periods else data
+    n = len(data)
+    weights = [lambda_decay ** (n - 1 - i) for i in range(n)]
+    total_weight = sum(weights)
+    return sum(d * w / total_weight for d, w in zip(data, weights))
+
+
+def loop_ewma_from_series(data, half_life_years, window_years=None, frequency='monthly'):
+    return [loop_ewma(data[:i], half_life_years, window_years, frequency) for i in range(1, len(data) + 1)]
+
+
+def loop_trend_growth(data, window_years=50, frequency='annual'):
+    periods_per_year = {'monthly': 12, 'quarterly': 4, 'annual': 1}.get(frequency, 1)
+    window_periods = window_years * periods_per_year
+    data = data[-window_periods:] if len(data) > window_periods else data
+    log_data = [math.log(d) for d in data if d > 0]
+    n = len(log_data)
+    x_mean = (n - 1) / 2
+    y_mean = sum(log_data) / n
+    numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(log_data))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator * periods_per_year
+
+
+def random_levels(rng, n):
+    """Monthly index levels: 0.05%/month drift plus noise (no overflow at 1M points)."""
+    return 100 * np.exp(np.cumsum(0.0005 + 0.01 * rng.standard_normal(n)))
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = np.random.default_rng(7)
+    ok = True
+
+    print(f"Equivalence vs. per-prefix loops ({REFERENCE_SIZE} points, tolerance {TOLERANCE:g})")
+    series = 0.02 + 0.01 * rng.standard_normal(REFERENCE_SIZE)
+    cases = [
+        (20, 50, 'monthly'),
+        (5, 10, 'monthly'),
+        (2, None, 'monthly'),
+        (0.1, 1, 'monthly'),
+        (5, 10, 'annual'),
+    ]
+    for half_life, window, frequency in cases:
+        expected = np.array(loop_ewma_from_series(list(series), half_life, window, frequency))
+        fast = ewma_from_series(series, half_life, window, frequency)
+        rolling = RollingEWMA(half_life, window, frequency).extend(series)
+        err_fast = np.max(np.abs(fast - expected))
+        err_rolling = np.max(np.abs(rolling - expected))
+        good = err_fast < TOLERANCE and err_rolling < TOLERANCE
+        ok &= good
+        print(
+            f"  ewma half-life {half_life:>4} y, window {str(window):>4}, {frequency:<8}"
+            f" max err {err_fast:.1e} (streaming {err_rolling:.1e}) {'ok' if good else 'FAIL'}"
+        )
+
+    levels = random_levels(rng, REFERENCE_SIZE)
+    for window, frequency in [(50, 'monthly'), (10, 'annual')]:
+        fast = rolling_trend_growth(levels, window, frequency)
+        expected = np.array([np.nan] + [
+            loop_trend_growth(list(levels[:i]), window, frequency) for i in range(2, REFERENCE_SIZE + 1)
+        ])
+        err = np.nanmax(np.abs(fast - expected))
+        scalar_err = abs(compute_trend_growth(levels, window, frequency) - expected[-1])
+        good = err < TOLERANCE and scalar_err < TOLERANCE and np.isnan(fast[0])
+        ok &= good
+        print(
+            f"  trend window {window:>3} y, {frequency:<8} max err {err:.1e}"
+            f" (scalar {scalar_err:.1e}) {'ok' if good else 'FAIL'}"
+        )
+
+    print("\nLatency (half-life 20 y, window 50 y, monthly)")
+    small = 0.02 + 0.01 * rng.standard_normal(SIZES[0])
+    _, loop_time = timed(loop_ewma_from_series, list(small), 20, 50)
+    print(f"  per-prefix loop, {SIZES[0]:>9,} points: {loop_time * 1e3:9.1f} ms")
+    for n in SIZES:
+        series = 0.02 + 0.01 * rng.standard_normal(n)
+        levels = random_levels(rng, n)
+        _, t_fast = timed(ewma_from_series, series, 20, 50)
+        _, t_stream = timed(RollingEWMA(20, 50).extend, series)
+        _, t_trend = timed(rolling_trend_growth, levels, 50, 'monthly')
+        _, t_scalar = timed(compute_trend_growth, levels, 50, 'monthly')
+        print(
+            f"  {n:>9,} points: ewma_from_series {t_fast * 1e3:7.2f} ms   "
+            f"RollingEWMA {t_stream * 1e3:8.1f} ms   "
+            f"rolling_trend_growth {t_trend * 1e3:7.2f} ms   "
+            f"compute_trend_growth {t_scalar * 1e3:5.2f} ms"
+        )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: all base currencies from one evaluation vs. one CMEEngine per base.
+
+Checks that the FX matrix is antisymmetric and agrees with the pairwise
+FXModel.forecast_fx_change, and that CMEEngine.compute_all_base_currencies
+returns exactly the results of a separate CMEEngine per base currency, for
+every detail level, both equity models and a few override scenarios. It
+then times the two approaches.
+
+Run from the repository root:
+
+    python benchmarks/bench_fx.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.config import BaseCurrency, CURRENCY_TO_MACRO_REGION
+from ra_stress_tool.main import CMEEngine, DETAIL_LEVELS
+
+
+REPEATS = 200
+
+SCENARIOS = [
+    {},
+    {'macro': {'japan': {'current_tbill': 0.02}, 'eurozone': {'inflation_forecast': 0.03}}},
+    {'macro': {'em': {'current_headline_inflation': 0.08}}, 'equity_us': {'current_caey': 0.05}},
+]
+
+
+def check_matrix(engine):
+    """Worst antisymmetry error and worst difference from the pairwise model."""
+    matrix = engine.compute_fx_matrix()
+    macro = engine.compute_macro_forecasts()
+    antisymmetry = max(
+        np.abs(m + m.T).max() for m in (matrix.fx_change, matrix.carry, matrix.ppp)
+    )
+    pairwise = 0.0
+    for home in matrix.currencies:
+        for foreign in matrix.currencies:
+            expected = engine.fx_model.forecast_fx_change(
+                CURRENCY_TO_MACRO_REGION[home], CURRENCY_TO_MACRO_REGION[foreign], macro,
+            )
+            got = matrix.pair(home, foreign)
+            pairwise = max(pairwise, max(abs(got[k] - expected[k]) for k in expected))
+    return antisymmetry, pairwise
+
+
+def timed(fn, repeats):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats
+
+
+def main():
+    ok = True
+    bases = [base.value for base in BaseCurrency]
+
+    for i, overrides in enumerate(SCENARIOS):
+        antisymmetry, pairwise = check_matrix(CMEEngine(overrides))
+        good = antisymmetry == 0.0 and pairwise == 0.0
+        ok &= good
+        mismatches = []
+        for model in ('ra', 'gk'):
+            for detail in DETAIL_LEVELS:
+                combined = CMEEngine(overrides, equity_model_type=model, detail=detail).compute_all_base_currencies()
+                for base in bases:
+                    separate = CMEEngine(overrides, base, model, detail=detail).compute_all_returns()
+                    if combined[base] != separate:
+                        mismatches.append(f"{model}/{detail}/{base}")
+        ok &= not mismatches
+        print(
+            f"scenario {i}: FX matrix antisymmetry {antisymmetry:.1e}, vs. pairwise {pairwise:.1e}; "
+            f"all-bases vs. separate engines: {', '.join(mismatches) or 'identical'} "
+            f"{'ok' if good and not mismatches else 'FAIL'}"
+        )
+
+    overrides = SCENARIOS[1]
+    print(f"\nTiming ({len(bases)} base currencies)")
+    for detail in ('headline', 'full'):
+        combined = timed(
+            lambda: CMEEngine(overrides, detail=detail).compute_all_base_currencies(), REPEATS,
+        )
+        separate = timed(
+            lambda: [CMEEngine(overrides, base, detail=detail).compute_all_returns() for base in bases], REPEATS,
+        )
+        print(
+            f"  {detail:<9} one engine per base {separate * 1e3:6.3f} ms   "
+            f"compute_all_base_currencies {combined * 1e3:6.3f} ms ({separate / combined:.2f}x)"
+        )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: incremental fair-value updates from the time-series store.
+
+Writes 50 years of synthetic monthly histories for every FAIR_VALUE_SPECS
+series into a temporary TimeSeriesStore, builds the fair values, then
+appends one quarter at a time. Each incremental result is checked against
+a from-scratch ewma() over the full stored history, and the incremental
+update is timed against a full rebuild. Finally the fair values are fed
+to CMEEngine as overrides.
+
+Run from the repository root:
+
+    python benchmarks/bench_history.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.config import EWMA_PARAMS
+from ra_stress_tool.history import FAIR_VALUE_SPECS, FairValuePipeline, TimeSeriesStore
+from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.utils.ewma import ewma
+
+
+TOLERANCE = 1e-12
+YEARS = 50
+QUARTERS = 8
+
+
+def synthetic(rng, n, level, vol):
+    """Mean-reverting monthly series around ``level``."""
+    x = np.empty(n)
+    x[0] = level
+    for i in range(1, n):
+        x[i] = x[i - 1] + 0.05 * (level - x[i - 1]) + vol * rng.standard_normal()
+    return x
+
+
+def expected_values(store):
+    out = {}
+    for spec in FAIR_VALUE_SPECS:
+        params = EWMA_PARAMS[spec.ewma_param]
+        out[spec.target] = ewma(store.read(spec.series), params.half_life_years, params.window_years)
+    return out
+
+
+def main():
+    rng = np.random.default_rng(11)
+    ok = True
+    with tempfile.TemporaryDirectory() as root:
+        store = TimeSeriesStore(root)
+        for spec in FAIR_VALUE_SPECS:
+            store.write(spec.series, synthetic(rng, YEARS * 12, 0.03, 0.002), start='1975-01')
+        pipeline = FairValuePipeline(store)
+
+        t0 = time.perf_counter()
+        pipeline.rebuild()
+        t_build = time.perf_counter() - t0
+        print(f"Initial build ({len(FAIR_VALUE_SPECS)} fair values, {YEARS} y monthly): {t_build * 1e3:.2f} ms")
+
+        print(f"\nAppending {QUARTERS} quarters")
+        incremental, full = [], []
+        for quarter in range(QUARTERS):
+            for spec in FAIR_VALUE_SPECS:
+                store.append(spec.series, synthetic(rng, 3, 0.03, 0.002))
+            t0 = time.perf_counter()
+            values = pipeline.update()
+            incremental.append(time.perf_counter() - t0)
+            fed = set(pipeline.last_update_points.values())
+            err = max(abs(values[k] - v) for k, v in expected_values(store).items())
+            good = err < TOLERANCE and fed == {3}
+            ok &= good
+            print(f"  quarter {quarter + 1}: points fed per EWMA {sorted(fed)}, max err vs. full ewma {err:.1e} "
+                  f"{'ok' if good else 'FAIL'}")
+            t0 = time.perf_counter()
+            pipeline.rebuild()
+            full.append(time.perf_counter() - t0)
+
+        print(f"\nIncremental update {np.median(incremental) * 1e3:.2f} ms vs. rebuild {np.median(full) * 1e3:.2f} ms (median)")
+
+        overrides = pipeline.fair_values()
+        results = CMEEngine(overrides).compute_all_returns()
+        caey = results.results['equity_us'].inputs_used['valuation_fair_caey']
+        good = abs(caey['value'] - overrides['equity_us']['fair_caey']) < TOLERANCE and caey['source'] == 'override'
+        ok &= good
+        print(f"\nCMEEngine with derived fair values: equity_us fair_caey {caey['value']:.4f} "
+              f"({caey['source']}) {'ok' if good else 'FAIL'}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: incremental recomputation after single-input override edits.
+
+For a set of typical slider edits, applies the edit to a live CMEEngine via
+apply_override_patch, checks the result against a freshly built engine, and
+reports how many asset classes were recomputed and the time per edit.
+
+Run from the repository root:
+
+    python benchmarks/bench_incremental.py
+"""
+
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.main import CMEEngine
+
+
+EDITS = [
+    {'equity_us': {'current_caey': 0.045}},
+    {'equity_japan': {'dividend_yield': 0.025}},
+    {'bonds_hy': {'default_rate': 0.06}},
+    {'bonds_global': {'current_yield': 0.045}},
+    {'inflation_linked': {'usd': {'current_real_yield': 0.02}}},
+    {'absolute_return': {'trading_alpha': 0.012}},
+    {'macro': {'eurozone': {'inflation_forecast': 0.03}}},
+    {'macro': {'em': {'current_headline_inflation': 0.05}}},
+    {'macro': {'us': {'current_tbill': 0.045}}},
+    {'macro': {'japan': {'my_ratio': 2.4}}},
+]
+
+
+def _merge(base, update):
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _perturb(edit, step):
+    """Nudge every leaf value so each repeat is a genuine change."""
+    return {
+        key: _perturb(value, step) if isinstance(value, dict) else value * (1 + 1e-4 * step)
+        for key, value in edit.items()
+    }
+
+
+def main(repeats=200):
+    print(f"{'edit':<48} {'recomputed':>10} {'incremental':>12} {'full':>10}")
+    for base_currency in ('usd', 'eur'):
+        for edit in EDITS:
+            engine = CMEEngine({}, base_currency=base_currency)
+            engine.compute_all_returns()
+            report = engine.apply_override_patch(copy.deepcopy(edit))
+
+            expected = CMEEngine(copy.deepcopy(edit), base_currency=base_currency).compute_all_returns()
+            assert engine.compute_all_returns().results == expected.results
+
+            start = time.perf_counter()
+            for step in range(1, repeats + 1):
+                engine.apply_override_patch(_perturb(edit, step))
+                engine.compute_all_returns()
+            incremental = (time.perf_counter() - start) / repeats
+
+            overrides = {}
+            start = time.perf_counter()
+            for step in range(1, repeats + 1):
+                _merge(overrides, _perturb(edit, step))
+                CMEEngine(copy.deepcopy(overrides), base_currency=base_currency).compute_all_returns()
+            full = (time.perf_counter() - start) / repeats
+
+            label = f"{base_currency}: {edit}"
+            print(f"{label[:48]:<48} {len(report.recomputed_assets):>10} "
+                  f"{incremental * 1e3:>10.2f}ms {full * 1e3:>8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark: closed-form valuation kernels vs. the year-by-year loops.
+
+Checks that every kernel in ra_stress_tool.utils.kernels reproduces the
+loop it replaced for random scalar inputs, for NumPy arrays (including an
+array of horizons) and for Dual numbers, then times loop vs. kernel.
+
+Run from the repository root:
+
+    python benchmarks/bench_kernels.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.utils import kernels
+from ra_stress_tool.utils.dual import Dual
+
+
+TOLERANCE = 1e-12
+HORIZONS = np.arange(1, 31)
+
+
+# ---- Reference loops (the code the kernels replaced) ----
+
+def loop_average_mean_reverting_value(current, fair, speed, years):
+    total = 0.0
+    value = current
+    for _ in range(years):
+        total += value
+        value = value + speed * (fair - value)
+    return total / years
+
+
+def loop_reversion_fraction(horizon):
+    return min(1 - (1 - 0.03) ** (horizon * 12), 1.0)
+
+
+def loop_caey_valuation(current_caey, fair_caey, speed, full_years, horizon):
+    change = (fair_caey / current_caey) ** (speed / full_years) - 1
+    cumulative = 0.0
+    caey = current_caey
+    for _ in range(horizon):
+        caey_next = caey * (1 + change)
+        cumulative += caey / caey_next - 1
+        caey = caey_next
+    return cumulative / horizon
+
+
+def check(name, got, expected):
+    err = float(np.max(np.abs(np.asarray(got, dtype=float) - np.asarray(expected, dtype=float))))
+    status = "ok" if err <= TOLERANCE else "FAIL"
+    print(f"  {name:<42} max |diff| = {err:.2e}  {status}")
+    return err <= TOLERANCE
+
+
+def main():
+    rng = np.random.default_rng(0)
+    n = 2000
+    current = rng.uniform(-0.01, 0.04, n)
+    fair = rng.uniform(0.0, 0.03, n)
+    speed = rng.choice([0.0, 0.015, 0.05, 0.3, 1.0], n)
+    horizon = rng.integers(1, 31, n)
+    caey = rng.uniform(0.015, 0.08, n)
+    fair_caey = rng.uniform(0.03, 0.07, n)
+    lam = rng.uniform(0.1, 1.0, n)
+
+    ok = True
+    print("Equivalence (scalar inputs)")
+    ok &= check("average_mean_reverting_value", [
+        kernels.average_mean_reverting_value(c, f, s, int(h))
+        for c, f, s, h in zip(current, fair, speed, horizon)
+    ], [
+        loop_average_mean_reverting_value(c, f, s, int(h))
+        for c, f, s, h in zip(current, fair, speed, horizon)
+    ])
+    ok &= check("reversion_fraction", [kernels.reversion_fraction(int(h)) for h in HORIZONS],
+                [loop_reversion_fraction(int(h)) for h in HORIZONS])
+    ok &= check("caey_average_valuation", [
+        kernels.caey_average_valuation(kernels.caey_annual_change(c, f, l, 20))
+        for c, f, l in zip(caey, fair_caey, lam)
+    ], [
+        loop_caey_valuation(c, f, l, 20, int(h))
+        for c, f, l, h in zip(caey, fair_caey, lam, horizon)
+    ])
+
+    print("Equivalence (array inputs)")
+    ok &= check("average_mean_reverting_value (arrays)",
+                kernels.average_mean_reverting_value(current, fair, speed, horizon),
+                [loop_average_mean_reverting_value(c, f, s, int(h))
+                 for c, f, s, h in zip(current, fair, speed, horizon)])
+    ok &= check("average_mean_reverting_value (horizons)",
+                kernels.average_mean_reverting_value(0.01, 0.015, 0.05, HORIZONS),
+                [loop_average_mean_reverting_value(0.01, 0.015, 0.05, int(h)) for h in HORIZONS])
+    ok &= check("reversion_fraction (horizons)", kernels.reversion_fraction(HORIZONS),
+                [loop_reversion_fraction(int(h)) for h in HORIZONS])
+    ok &= check("pe_valuation_change (horizons)",
+                kernels.pe_valuation_change(25.0, 20.0, HORIZONS),
+                [(20.0 / 25.0) ** (1.0 / h) - 1 for h in HORIZONS])
+
+    print("Equivalence (Dual inputs)")
+    d = kernels.average_mean_reverting_value(Dual.seed(0.01, 'current'), 0.015, 0.05, 10)
+    # The average is linear in current: d/dcurrent = (1 - (1 - s)^n) / (s * n)
+    exact = (1 - (1 - 0.05) ** 10) / (0.05 * 10)
+    ok &= check("average_mean_reverting_value (primal)", d.primal,
+                loop_average_mean_reverting_value(0.01, 0.015, 0.05, 10))
+    ok &= check("average_mean_reverting_value (d/dcurrent)", d.grad['current'], exact)
+
+    print("\nTiming (2,000 evaluations at random horizons)")
+    t0 = time.perf_counter()
+    for c, f, s, h in zip(current, fair, speed, horizon):
+        loop_average_mean_reverting_value(c, f, s, int(h))
+    for c, f, l, h in zip(caey, fair_caey, lam, horizon):
+        loop_caey_valuation(c, f, l, 20, int(h))
+    loop_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    kernels.average_mean_reverting_value(current, fair, speed, horizon)
+    kernels.caey_average_valuation(kernels.caey_annual_change(caey, fair_caey, lam, 20))
+    kernel_time = time.perf_counter() - t0
+
+    print(f"  Python loops:        {loop_time * 1e3:8.2f} ms")
+    print(f"  Vectorized kernels:  {kernel_time * 1e3:8.2f} ms  ({loop_time / kernel_time:.0f}x)")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark: efficient frontier for the asset classes and for sub-asset universes.
+
+Builds the 100-point long-only frontier of the ten asset classes from the
+default CME returns and the config risk model, with and without weight
+bounds, and times it against the 50 ms budget of /api/portfolio/frontier.
+It then builds frontiers for random factor-model universes of tens to
+hundreds of sub-assets. Every point is checked for feasibility and for the
+KKT optimality conditions: a multiplier pair (budget, return) must exist
+that zeroes the gradient on the free assets and has the right sign on the
+assets at a bound.
+
+Run from the repository root:
+
+    python benchmarks/bench_portfolio.py
+"""
+
+import os
+import sys
+import time
+from itertools import combinations
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.portfolio import RiskModel, efficient_frontier
+
+
+TOLERANCE = 1e-9
+BUDGET_MS = 50.0
+N_POINTS = 100
+REPEATS = 20
+
+# Sub-asset universes: (assets, upper weight bound)
+UNIVERSES = [(50, 0.2), (100, 0.1), (200, 0.05), (400, 0.02)]
+
+
+def kkt_violation(w, mu, cov, lower, upper, tol=1e-9):
+    """
+    Smallest worst-case KKT violation of w over the multipliers (a, b).
+
+    The multipliers of the budget and return constraints are unique when
+    two or more assets are free; at corners with fewer free assets the
+    feasible multipliers form a region in the plane, whose vertices are
+    searched.
+    """
+    g = cov @ w
+    A = np.column_stack([np.ones_like(mu), mu])
+    free = (w > lower + tol) & (w < upper - tol)
+    at_lower = ~free & (w <= lower + tol)
+    at_upper = ~free & ~at_lower
+    eq_A, eq_b = A[free], -g[free]
+    # ineq_A c >= ineq_b: gradient >= 0 at a lower bound, <= 0 at an upper bound
+    ineq_A = np.vstack([A[at_lower], -A[at_upper]])
+    ineq_b = np.concatenate([-g[at_lower], g[at_upper]])
+
+    def violation(c):
+        v = np.abs(eq_A @ c - eq_b).max(initial=0.0)
+        return max(v, np.maximum(ineq_b - ineq_A @ c, 0.0).max(initial=0.0))
+
+    candidates = [np.zeros(2)]
+    if eq_A.shape[0]:
+        candidates.append(np.linalg.lstsq(eq_A, eq_b, rcond=None)[0])
+        if np.linalg.matrix_rank(eq_A) >= 2:
+            return violation(candidates[-1])
+    lines = list(zip(eq_A, eq_b)) + list(zip(ineq_A, ineq_b))
+    for (r1, s1), (r2, s2) in combinations(lines, 2):
+        M = np.array([r1, r2])
+        if abs(np.linalg.det(M)) > 1e-14:
+            candidates.append(np.linalg.solve(M, [s1, s2]))
+    return min(violation(c) for c in candidates)
+
+
+def check(frontier, mu, cov, lower, upper, every=1):
+    """Worst feasibility error and scaled KKT violation over the frontier."""
+    w = frontier.weights
+    feasibility = max(
+        np.abs(w.sum(axis=1) - 1).max(),
+        (lower - w).max(),
+        (w - upper).max(),
+    )
+    optimality = max(
+        kkt_violation(wi, mu, cov, lower, upper) for wi in w[::every]
+    ) / np.abs(cov).max()
+    return feasibility, optimality
+
+
+def timed(fn, repeats):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        out = fn()
+    return out, (time.perf_counter() - t0) / repeats
+
+
+def factor_universe(rng, n):
+    """Random sub-asset universe with a 5-factor correlation structure."""
+    loadings = rng.standard_normal((n, 5))
+    corr = loadings @ loadings.T + np.diag(rng.uniform(0.5, 2.0, n))
+    scale = 1 / np.sqrt(np.diag(corr))
+    corr *= np.outer(scale, scale)
+    vol = rng.uniform(0.02, 0.3, n)
+    mu = 0.01 + 0.3 * vol + 0.01 * rng.standard_normal(n)
+    return mu, corr * np.outer(vol, vol)
+
+
+def main():
+    ok = True
+    risk = RiskModel.from_config()
+    results = CMEEngine(tracking=False).compute_all_returns().results
+    mu = np.array([results[a].expected_return_nominal for a in risk.assets])
+    cov = risk.covariance
+    n = len(mu)
+
+    upper_bounded = np.ones(n)
+    upper_bounded[risk.assets.index('liquidity')] = 0.1
+    upper_bounded[risk.assets.index('equity_em')] = 0.15
+    cases = [
+        ('long-only', np.zeros(n), np.ones(n)),
+        ('bounded', np.full(n, 0.02), upper_bounded),
+    ]
+    print(f"Asset classes ({n}), {N_POINTS} points")
+    for name, lower, upper in cases:
+        frontier, elapsed = timed(
+            lambda: efficient_frontier(mu, cov, N_POINTS, lower, upper, assets=risk.assets), REPEATS,
+        )
+        feasibility, optimality = check(frontier, mu, cov, lower, upper)
+        good = feasibility < TOLERANCE and optimality < TOLERANCE and elapsed * 1e3 < BUDGET_MS
+        ok &= good
+        print(
+            f"  {name:<10} {elapsed * 1e3:6.2f} ms ({frontier.corners} corners), "
+            f"vol {frontier.volatilities[0]:.4f}..{frontier.volatilities[-1]:.4f}, "
+            f"feasibility {feasibility:.1e}, KKT {optimality:.1e} {'ok' if good else 'FAIL'}"
+        )
+
+    rng = np.random.default_rng(7)
+    print(f"\nSub-asset universes, {N_POINTS} points")
+    for size, cap in UNIVERSES:
+        mu_s, cov_s = factor_universe(rng, size)
+        lower, upper = np.zeros(size), np.full(size, cap)
+        frontier, elapsed = timed(lambda: efficient_frontier(mu_s, cov_s, N_POINTS, lower, upper), 1)
+        feasibility, optimality = check(frontier, mu_s, cov_s, lower, upper, every=10)
+        good = feasibility < TOLERANCE and optimality < TOLERANCE
+        ok &= good
+        print(
+            f"  {size:4d} assets, max weight {cap:.2f}: {elapsed * 1e3:7.1f} ms ({frontier.corners} corners), "
+            f"feasibility {feasibility:.1e}, KKT {optimality:.1e} {'ok' if good else 'FAIL'}"
+        )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
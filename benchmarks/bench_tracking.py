@@ -0,0 +1,85 @@
+"""
+Benchmark: per-scenario latency of tracked vs. untracked CMEEngine runs.
+
+An untracked engine (``CMEEngine(..., tracking=False)``) skips building the
+components, sources, inputs_used and macro_dependencies breakdowns and only
+produces headline returns. This script checks that the headline returns are
+identical to a tracked run for several scenarios, base currencies and
+equity models, then times a full compute_all_returns per scenario
+(engine construction included) in both modes.
+
+Run from the repository root:
+
+    python benchmarks/bench_tracking.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ra_stress_tool.main import CMEEngine
+
+
+RUNS = 300
+
+SCENARIOS = [
+    {},
+    {'macro': {'us': {'inflation_forecast': 0.04, 'current_tbill': 0.05}}},
+    {'equity_us': {'current_caey': 0.03}, 'bonds_hy': {'default_rate': 0.06}},
+    {'macro': {'eurozone': {'my_ratio': 2.4}}, 'absolute_return': {'trading_alpha': 0.02}},
+]
+
+
+def headlines(results):
+    return {
+        key: (r.expected_return_nominal, r.expected_return_real)
+        for key, r in results.results.items()
+    }
+
+
+def time_per_scenario(tracking, base_currency, equity_model_type):
+    t0 = time.perf_counter()
+    for i in range(RUNS):
+        engine = CMEEngine(
+            SCENARIOS[i % len(SCENARIOS)],
+            base_currency=base_currency,
+            equity_model_type=equity_model_type,
+            tracking=tracking,
+        )
+        engine.compute_all_returns()
+    return (time.perf_counter() - t0) / RUNS
+
+
+def main():
+    ok = True
+    print("Equivalence (headline returns, tracked vs. untracked)")
+    for base_currency in ('usd', 'eur'):
+        for model in ('ra', 'gk'):
+            mismatches = 0
+            for overrides in SCENARIOS:
+                tracked = CMEEngine(overrides, base_currency, model).compute_all_returns()
+                untracked = CMEEngine(overrides, base_currency, model, tracking=False).compute_all_returns()
+                mismatches += headlines(tracked) != headlines(untracked)
+            status = "ok" if mismatches == 0 else f"FAIL ({mismatches} scenarios differ)"
+            print(f"  {base_currency}/{model}: {status}")
+            ok &= mismatches == 0
+
+    print(f"\nLatency per scenario ({RUNS} runs, engine construction included)")
+    for base_currency in ('usd', 'eur'):
+        for model in ('ra', 'gk'):
+            tracked = time_per_scenario(True, base_currency, model)
+            untracked = time_per_scenario(False, base_currency, model)
+            print(
+                f"  {base_currency}/{model}:  tracked {tracked * 1e3:6.3f} ms   "
+                f"untracked {untracked * 1e3:6.3f} ms   "
+                f"saving {(1 - untracked / tracked):5.1%}"
+            )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
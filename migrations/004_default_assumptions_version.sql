@@ -0,0 +1,29 @@
+-- ============================================================================
+-- Versioned Default Assumptions - Supabase Migration
+-- ============================================================================
+
+-- 1. Monotonically increasing version of the default_assumptions row.
+-- Every API worker compares it with the version its caches were built from.
+ALTER TABLE default_assumptions
+    ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 1;
+
+-- 2. save_default_assumptions - write the defaults and bump the version in
+-- one statement, so concurrent writers never reuse a version. Reverting to
+-- the hardcoded defaults saves an empty object instead of deleting the row,
+-- which keeps the version increasing across reverts.
+CREATE OR REPLACE FUNCTION save_default_assumptions(p_defaults JSONB, p_updated_by TEXT)
+RETURNS BIGINT
+LANGUAGE sql
+AS $$
+    INSERT INTO default_assumptions (id, defaults_json, updated_at, updated_by, version)
+    VALUES (1, p_defaults, NOW(), p_updated_by, 1)
+    ON CONFLICT (id) DO UPDATE
+        SET defaults_json = EXCLUDED.defaults_json,
+            updated_at = EXCLUDED.updated_at,
+            updated_by = EXCLUDED.updated_by,
+            version = default_assumptions.version + 1
+    RETURNING version;
+$$;
+
+-- Writable only via service role (the API backend)
+REVOKE ALL ON FUNCTION save_default_assumptions(JSONB, TEXT) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,365 @@
+"""
+Historical backtest of the CME building blocks.
+
+BacktestRunner evaluates the engine at every date of a historical input
+panel (dates x override paths) in array form: each date is one row of a
+BatchCMEEngine evaluation, so hundreds of month-ends cost a few batch
+calls rather than one CMEEngine per date. The forecasts are compared with
+realized forward returns and the forecast panel plus error statistics can
+be written to disk.
+
+Panel cells that are NaN (a history that starts later, a missing month)
+fall back to the base overrides and then to the defaults, exactly as if
+the path were not overridden for that date. Rows are grouped by which
+paths are present, and each group is one batch evaluation.
+
+Example
+-------
+>>> runner = BacktestRunner()
+>>> dates = month_range('1995-01', '2024-12')
+>>> values = panel_from_store(store, {'equity_us.current_caey': 'equity_us.caey'}, dates)
+>>> results = runner.run(dates, ['equity_us.current_caey'], values, realized={'equity_us': realized_us})
+>>> results.error_stats()['equity_us']['rmse']
+>>> results.save('out/backtest')
+"""
+
+import csv
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .batch import ASSETS, COMPONENTS, FORECAST_HORIZON, BatchCMEEngine, BatchResults
+from .config import BaseCurrency
+from .inputs.overrides import validate_override_paths
+from .history import TimeSeriesStore
+from .utils.ewma import PERIODS_PER_YEAR
+
+
+MEASURES = {
+    'nominal': 'expected_return_nominal',
+    'real': 'expected_return_real',
+}
+
+
+def month_range(start: str, end: str) -> np.ndarray:
+    """
+    Month-end dates from ``start`` to ``end`` inclusive.
+
+    Parameters
+    ----------
+    start, end : str
+        First and last month, 'YYYY-MM'.
+
+    Returns
+    -------
+    np.ndarray
+        datetime64[M] array.
+    """
+    return np.arange(np.datetime64(start, 'M'), np.datetime64(end, 'M') + 1)
+
+
+def forward_annualized_returns(levels: Sequence[float], horizon_years: int = FORECAST_HORIZON,
+                               periods_per_year: int = 12) -> np.ndarray:
+    """
+    Realized annualized return over the next ``horizon_years`` at each date.
+
+    Parameters
+    ----------
+    levels : sequence of float
+        Total return index levels, oldest to newest.
+    horizon_years : int
+        Holding period in years.
+    periods_per_year : int
+        Observations per year (12 for month-ends).
+
+    Returns
+    -------
+    np.ndarray
+        (level[t + h] / level[t]) ** (1 / horizon_years) - 1, NaN for the
+        last h dates whose horizon has not been realized yet.
+    """
+    levels = np.asarray(levels, dtype=float)
+    h = horizon_years * periods_per_year
+    out = np.full(len(levels), np.nan)
+    if len(levels) > h:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[:-h] = (levels[h:] / levels[:-h]) ** (1.0 / horizon_years) - 1
+    return out
+
+
+def panel_from_store(store: TimeSeriesStore, series_by_path: Mapping[str, str], dates) -> np.ndarray:
+    """
+    Align stored histories on backtest dates.
+
+    Each date takes the latest observation of the series at or before it
+    (quarterly and annual series are carried forward); dates before a
+    series starts or after it ends are NaN.
+
+    Parameters
+    ----------
+    store : TimeSeriesStore
+        Source of the histories.
+    series_by_path : mapping
+        Override path -> stored series name. Column order follows it.
+    dates : array-like
+        Backtest dates (anything np.datetime64 accepts, e.g. 'YYYY-MM').
+
+    Returns
+    -------
+    np.ndarray
+        Panel of shape (len(dates), len(series_by_path)).
+    """
+    months = np.asarray(dates, dtype='datetime64[M]').astype(np.int64)
+    panel = np.full((len(months), len(series_by_path)), np.nan)
+    for j, name in enumerate(series_by_path.values()):
+        info = store.info(name)
+        step = 12 // PERIODS_PER_YEAR[info.frequency]
+        start = np.datetime64(info.start, 'M').astype(np.int64)
+        index = np.floor_divide(months - start, step)
+        valid = (index >= 0) & (index < info.length)
+        panel[valid, j] = store.read(info)[index[valid]]
+    return panel
+
+
+@dataclass
+class BacktestResults:
+    """
+    Forecast panel of a backtest and its realized counterpart.
+
+    ``forecasts`` has one row per date; ``realized`` is (date, asset) with
+    NaN where no realized return is available.
+    """
+    dates: np.ndarray
+    forecasts: BatchResults
+    realized: np.ndarray
+    measure: str = 'nominal'
+    horizon: int = FORECAST_HORIZON
+
+    @property
+    def forecast(self) -> np.ndarray:
+        """Forecast returns for the measure, shape (date, asset)."""
+        c = self.forecasts.components.index(MEASURES[self.measure])
+        return self.forecasts.values[:, :, c]
+
+    @property
+    def errors(self) -> np.ndarray:
+        """Realized minus forecast, shape (date, asset)."""
+        return self.realized - self.forecast
+
+    def error_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Realized-vs-forecast statistics per asset.
+
+        Returns
+        -------
+        dict
+            {asset: {'n', 'bias', 'mae', 'rmse', 'correlation'}} over the
+            dates with a realized return; statistics are None when n == 0
+            (correlation needs n >= 2).
+        """
+        forecast, errors = self.forecast, self.errors
+        stats = {}
+        for a, asset in enumerate(self.forecasts.assets):
+            mask = ~np.isnan(errors[:, a])
+            n = int(mask.sum())
+            e = errors[mask, a]
+            correlation = None
+            if n >= 2:
+                f, r = forecast[mask, a], self.realized[mask, a]
+                if f.std() > 0 and r.std() > 0:
+                    correlation = float(np.corrcoef(f, r)[0, 1])
+            stats[asset] = {
+                'n': n,
+                'bias': float(e.mean()) if n else None,
+                'mae': float(np.abs(e).mean()) if n else None,
+                'rmse': float(np.sqrt((e * e).mean())) if n else None,
+                'correlation': correlation,
+            }
+        return stats
+
+    def save(self, directory: str) -> Dict[str, str]:
+        """
+        Write the backtest to ``directory``.
+
+        Files: ``forecasts.csv`` (date x asset, the measure),
+        ``forecasts.npz`` (dates, assets, components, full forecast cube,
+        realized panel) and ``error_stats.json``.
+
+        Returns
+        -------
+        dict
+            Written file paths by kind.
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = {
+            'csv': os.path.join(directory, 'forecasts.csv'),
+            'npz': os.path.join(directory, 'forecasts.npz'),
+            'stats': os.path.join(directory, 'error_stats.json'),
+        }
+        dates = [str(d) for d in self.dates]
+        with open(paths['csv'], 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['date'] + list(self.forecasts.assets))
+            for date, row in zip(dates, self.forecast):
+                writer.writerow([date] + [repr(float(v)) for v in row])
+        np.savez_compressed(
+            paths['npz'],
+            dates=np.asarray(dates),
+            assets=np.asarray(self.forecasts.assets),
+            components=np.asarray(self.forecasts.components),
+            forecasts=self.forecasts.values,
+            realized=self.realized,
+        )
+        with open(paths['stats'], 'w') as f:
+            json.dump({
+                'measure': self.measure,
+                'horizon': self.horizon,
+                'start': dates[0] if dates else None,
+                'end': dates[-1] if dates else None,
+                'assets': self.error_stats(),
+            }, f, indent=2)
+        return paths
+
+
+class BacktestRunner:
+    """
+    Runs the CME methodology over a panel of historical inputs.
+
+    Parameters
+    ----------
+    base_overrides : dict, optional
+        Overrides shared by every date (panel values take precedence).
+    base_currency : str, optional
+        Base currency ('usd' or 'eur').
+    equity_model_type : str, optional
+        Equity model ('ra' or 'gk').
+    horizon : int, optional
+        Forecast horizon in years (default 10).
+    """
+
+    def __init__(
+        self,
+        base_overrides: Optional[Dict[str, Any]] = None,
+        base_currency: str = 'usd',
+        equity_model_type: str = 'ra',
+        horizon: int = FORECAST_HORIZON,
+    ):
+        self.base_overrides = base_overrides
+        self.base_currency = base_currency
+        self.equity_model_type = equity_model_type
+        self.horizon = horizon
+        self._engines: Dict[tuple, BatchCMEEngine] = {}
+
+    def _engine(self, paths: tuple) -> BatchCMEEngine:
+        if paths not in self._engines:
+            self._engines[paths] = BatchCMEEngine(
+                paths, self.base_overrides, self.base_currency, self.equity_model_type,
+            )
+        return self._engines[paths]
+
+    def forecast(self, paths: Sequence[str], values) -> BatchResults:
+        """
+        Forecasts for every row of a (date x path) panel.
+
+        Parameters
+        ----------
+        paths : sequence of str
+            Override path of each panel column.
+        values : array-like
+            Panel of shape (n_dates, len(paths)); NaN cells are not overridden.
+
+        Returns
+        -------
+        BatchResults
+            One row per date.
+        """
+        paths = tuple(paths)
+        # Checked up front: a column with no data never reaches an engine
+        validate_override_paths(paths, self.equity_model_type)
+        values = np.asarray(values, dtype=float).reshape(-1, len(paths))
+        n = values.shape[0]
+        present = ~np.isnan(values)
+
+        # One batch evaluation per distinct set of available paths
+        patterns, group_of_row = np.unique(present, axis=0, return_inverse=True)
+        group_of_row = group_of_row.ravel()
+        out = np.full((n, len(ASSETS), len(COMPONENTS)), np.nan)
+        macro: Dict[str, Dict[str, np.ndarray]] = {}
+        for g, pattern in enumerate(patterns):
+            rows = np.flatnonzero(group_of_row == g)
+            columns = np.flatnonzero(pattern)
+            engine = self._engine(tuple(paths[j] for j in columns))
+            group = engine.compute(values[np.ix_(rows, columns)], horizon=self.horizon)
+            out[rows] = group.values
+            for region, data in group.macro.items():
+                region_out = macro.setdefault(region, {})
+                for key, col in data.items():
+                    region_out.setdefault(key, np.full(n, np.nan))[rows] = col
+
+        return BatchResults(
+            assets=ASSETS,
+            components=COMPONENTS,
+            values=out,
+            macro=macro,
+            base_currency=BaseCurrency(self.base_currency.lower()).value,
+        )
+
+    def run(
+        self,
+        dates,
+        paths: Sequence[str],
+        values,
+        realized: Optional[Union[Mapping[str, Sequence[float]], np.ndarray]] = None,
+        measure: str = 'nominal',
+    ) -> BacktestResults:
+        """
+        Forecast every date and line the forecasts up with realized returns.
+
+        Parameters
+        ----------
+        dates : array-like
+            Forecast dates, one per panel row.
+        paths : sequence of str
+            Override path of each panel column.
+        values : array-like
+            Panel of shape (len(dates), len(paths)); NaN cells are not overridden.
+        realized : mapping or array, optional
+            Realized annualized returns over the horizon following each
+            date: {asset: series aligned with dates} or an array of shape
+            (len(dates), len(ASSETS)). Missing assets/dates are NaN
+            (see forward_annualized_returns).
+        measure : str
+            'nominal' or 'real' — which forecast is compared.
+
+        Returns
+        -------
+        BacktestResults
+        """
+        if measure not in MEASURES:
+            raise ValueError(f"Unknown measure {measure!r}; expected one of {sorted(MEASURES)}")
+        dates = np.asarray(dates, dtype='datetime64[M]')
+        values = np.asarray(values, dtype=float).reshape(-1, len(paths))
+        if values.shape[0] != len(dates):
+            raise ValueError(f"Panel has {values.shape[0]} rows for {len(dates)} dates")
+
+        forecasts = self.forecast(paths, values)
+
+        realized_panel = np.full((len(dates), len(ASSETS)), np.nan)
+        if isinstance(realized, Mapping):
+            for asset, series in realized.items():
+                if asset not in ASSETS:
+                    raise ValueError(f"Unknown asset class: {asset!r}")
+                realized_panel[:, ASSETS.index(asset)] = np.asarray(series, dtype=float)
+        elif realized is not None:
+            realized_panel[:] = np.asarray(realized, dtype=float)
+
+        return BacktestResults(
+            dates=dates,
+            forecasts=forecasts,
+            realized=realized_panel,
+            measure=measure,
+            horizon=self.horizon,
+        )
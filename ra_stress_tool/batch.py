@@ -0,0 +1,907 @@
+"""
+Vectorized multi-scenario engine for the RA CME Stress Testing Tool.
+
+BatchCMEEngine evaluates many override scenarios in one pass by running the
+same building-block formulas as CMEEngine over NumPy arrays. Scenarios are
+rows of a value matrix whose columns are dot-separated override paths
+(e.g. 'macro.us.current_tbill', 'equity_us.current_caey'); every input that
+is not a column falls back to the base overrides and then to the defaults,
+exactly as OverrideManager resolves it for a single engine.
+
+Only headline returns and the building-block components are produced. Use
+CMEEngine when input tracking and macro dependency details are needed.
+"""
+
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+from .inputs.defaults import DefaultInputs
+from .inputs.overrides import OverrideManager, TrackedValue, InputSource, validate_override_paths
+from .models.macro import (
+    MACRO_INPUT_FALLBACKS,
+    RGDP_ADJUSTMENT_DEFAULTS,
+    RGDP_ADJUSTMENT_FALLBACK,
+    LONG_TERM_INFLATION_DEFAULTS,
+    LONG_TERM_INFLATION_FALLBACK,
+    COUNTRY_FACTOR_DEFAULTS,
+    GLOBAL_GDP_WEIGHTS,
+)
+from .models.bonds import (
+    BOND_INPUT_FALLBACKS,
+    HY_SPREAD_INPUT_FALLBACKS,
+    INFLATION_LINKED_INPUT_FALLBACKS,
+    HighYieldBondModel,
+    EMBondModel,
+    term_premium_reversion_speed,
+)
+from .models.equities import EquityRegion, EQUITY_INPUT_FALLBACKS
+from .models.alternatives import HedgeFundModel
+from .models.currency import FXModel
+from .utils import kernels
+from .utils.ewma import sigmoid_my_ratio
+from .config import (
+    AssetClass,
+    BaseCurrency,
+    ASSET_LOCAL_CURRENCY,
+    CURRENCY_TO_MACRO_REGION,
+    CREDIT_PARAMS,
+    EQUITY_PARAMS,
+    HEDGE_FUND_PARAMS,
+)
+
+
+MACRO_REGIONS = ('us', 'eurozone', 'japan', 'em')
+
+# Forecast horizon used by the scalar models (years)
+FORECAST_HORIZON = 10
+
+# Horizons reported by term_structure (years)
+TERM_STRUCTURE_HORIZONS = tuple(range(1, 31))
+
+# Result axes
+ASSETS = tuple(ac.value for ac in AssetClass)
+HEADLINE = ('expected_return_nominal', 'expected_return_real')
+COMPONENTS = HEADLINE + (
+    # Liquidity
+    'tbill_rate',
+    # Bonds
+    'yield', 'roll_return', 'valuation', 'credit_loss',
+    # Inflation linked
+    'real_yield_carry', 'real_roll_return', 'real_valuation_return',
+    'inflation_indexation', 'index_lag_drag', 'liquidity_technical',
+    # Equities (RA + GK)
+    'dividend_yield', 'real_eps_growth', 'net_buyback_yield',
+    'revenue_growth', 'margin_change', 'valuation_change',
+    # Absolute return
+    'tbill', 'factor_return', 'trading_alpha',
+    # Currency translation
+    'fx_return',
+)
+
+EQUITY_TO_MACRO_REGION = {
+    EquityRegion.US: 'us',
+    EquityRegion.EUROPE: 'eurozone',
+    EquityRegion.JAPAN: 'japan',
+    EquityRegion.EM: 'em',
+}
+
+EQUITY_TO_ASSET = {
+    EquityRegion.US: AssetClass.EQUITY_US,
+    EquityRegion.EUROPE: AssetClass.EQUITY_EUROPE,
+    EquityRegion.JAPAN: AssetClass.EQUITY_JAPAN,
+    EquityRegion.EM: AssetClass.EQUITY_EM,
+}
+
+
+@dataclass
+class BatchResults:
+    """
+    Columnar results for a batch of scenarios.
+
+    ``values`` has shape (scenario, asset, component). Components that do
+    not apply to an asset (e.g. 'dividend_yield' for bonds) are NaN.
+    """
+    assets: Tuple[str, ...]
+    components: Tuple[str, ...]
+    values: np.ndarray
+    macro: Dict[str, Dict[str, np.ndarray]]
+    base_currency: str = 'usd'
+
+    @property
+    def n_scenarios(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def nominal(self) -> np.ndarray:
+        """Nominal expected returns, shape (scenario, asset)."""
+        return self.values[:, :, 0]
+
+    @property
+    def real(self) -> np.ndarray:
+        """Real expected returns, shape (scenario, asset)."""
+        return self.values[:, :, 1]
+
+    def get(self, asset: str, component: str = 'expected_return_nominal') -> np.ndarray:
+        """Get one asset/component column across all scenarios."""
+        return self.values[:, self.assets.index(asset), self.components.index(component)]
+
+    def scenario(self, index: int) -> Dict[str, Dict[str, float]]:
+        """
+        Get one scenario as nested dicts of applicable components.
+
+        Parameters
+        ----------
+        index : int
+            Row of the batch.
+
+        Returns
+        -------
+        dict
+            {asset: {component: value}} with NaN components dropped.
+        """
+        row = self.values[index]
+        return {
+            asset: {
+                comp: float(row[a, c])
+                for c, comp in enumerate(self.components)
+                if not np.isnan(row[a, c])
+            }
+            for a, asset in enumerate(self.assets)
+        }
+
+
+@dataclass
+class TermStructure:
+    """
+    Expected returns by forecast horizon.
+
+    ``nominal`` / ``real`` map each asset to a list aligned with ``horizons``.
+    """
+    horizons: Tuple[int, ...]
+    nominal: Dict[str, List[float]]
+    real: Dict[str, List[float]]
+    base_currency: str = 'usd'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'horizons': list(self.horizons),
+            'base_currency': self.base_currency,
+            'nominal': self.nominal,
+            'real': self.real,
+        }
+
+
+class _BatchInputs:
+    """
+    Resolves model inputs as arrays (columns) or scalars (base values).
+
+    Mirrors OverrideManager semantics: asset overrides only apply to keys
+    that exist in the asset defaults, macro building blocks come from the
+    market data defaults, and the remaining macro keys fall back to the
+    model's regional constants. Fallbacks for missing inputs are the
+    models' own *_INPUT_FALLBACKS tables.
+    """
+
+    def __init__(self, paths: Sequence[str], values: np.ndarray, override_manager: OverrideManager):
+        self._columns = {path: values[:, j] for j, path in enumerate(paths)}
+        self._om = override_manager
+        self._macro_inputs: Dict[str, Dict[str, TrackedValue]] = {}
+        self._asset_inputs: Dict[AssetClass, Dict[str, TrackedValue]] = {}
+
+    def _tracked_asset(self, asset_class: AssetClass) -> Dict[str, TrackedValue]:
+        if asset_class not in self._asset_inputs:
+            self._asset_inputs[asset_class] = self._om.get_asset_inputs(asset_class)
+        return self._asset_inputs[asset_class]
+
+    def macro(self, region: str, key: str, fallback: Optional[float] = None):
+        if fallback is None:
+            fallback = MACRO_INPUT_FALLBACKS[key]
+        path = f"macro.{region}.{key}"
+        if path in self._columns:
+            return self._columns[path]
+        if region not in self._macro_inputs:
+            self._macro_inputs[region] = self._om.get_macro_inputs(region)
+        tracked = self._macro_inputs[region]
+        if key in tracked:
+            return tracked[key].value
+        return self._om.get_value('macro', region, key, default=fallback).value
+
+    def macro_overridden(self, region: str, key: str) -> bool:
+        path = f"macro.{region}.{key}"
+        return path in self._columns or self._om.has_override(path)
+
+    def asset(self, asset_class: AssetClass, key: str, fallback: float):
+        tracked = self._tracked_asset(asset_class)
+        if key not in tracked:
+            return fallback
+        path = f"{asset_class.value}.{key}"
+        if path in self._columns:
+            return self._columns[path]
+        return tracked[key].value
+
+    def asset_overridden(self, asset_class: AssetClass, key: str) -> bool:
+        tracked = self._tracked_asset(asset_class)
+        if key not in tracked:
+            return False
+        path = f"{asset_class.value}.{key}"
+        return path in self._columns or tracked[key].source == InputSource.OVERRIDE
+
+    def regime(self, regime: str, regime_defaults: Dict[str, Any], key: str, fallback: float):
+        if key not in regime_defaults:
+            return fallback
+        path = f"inflation_linked.{regime}.{key}"
+        if path in self._columns:
+            return self._columns[path]
+        return self._om.get_value(
+            'inflation_linked', regime, key, default=regime_defaults[key]
+        ).value
+
+
+class BatchCMEEngine:
+    """
+    Vectorized Capital Market Expectations engine.
+
+    Evaluates a matrix of scenarios (rows) x override paths (columns) with
+    the same formulas as CMEEngine, returning a columnar BatchResults.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        base_overrides: Optional[Dict[str, Any]] = None,
+        base_currency: str = 'usd',
+        equity_model_type: str = 'ra',
+    ):
+        """
+        Initialize the batch engine.
+
+        Parameters
+        ----------
+        paths : sequence of str
+            Dot-separated override paths, one per value column.
+        base_overrides : dict, optional
+            Overrides shared by every scenario. Columns take precedence.
+        base_currency : str, optional
+            Base currency for return calculations ('usd' or 'eur').
+        equity_model_type : str, optional
+            Equity model to use: 'ra' or 'gk'.
+
+        Raises
+        ------
+        ValueError
+            If a path is repeated or is not an input the engine reads
+            (see known_override_paths); such a column would be ignored.
+        """
+        self.paths = tuple(paths)
+        validate_override_paths(self.paths, equity_model_type)
+        if len(set(self.paths)) != len(self.paths):
+            raise ValueError("Override paths must be unique")
+
+        self.override_manager = OverrideManager(base_overrides, equity_model_type=equity_model_type)
+        self.base_currency = BaseCurrency(base_currency.lower())
+        self.equity_model_type = equity_model_type
+
+        self._tbill_params = self.override_manager.get_tbill_params()
+        self._inflation_params = self.override_manager.get_inflation_params()
+        self._bond_params = self.override_manager.get_bond_params()
+        self._tp_reversion_speed = term_premium_reversion_speed(self.override_manager)
+
+    # ------------------------------------------------------------------
+    # Macro
+    # ------------------------------------------------------------------
+
+    def _compute_macro(self, inp: _BatchInputs) -> Dict[str, Dict[str, Any]]:
+        """Vectorized MacroModel.compute_full_forecast for every region."""
+        macro = {}
+        for region in MACRO_REGIONS:
+            # Real GDP growth
+            if inp.macro_overridden(region, 'rgdp_growth'):
+                rgdp = inp.macro(region, 'rgdp_growth', 0.0)
+            else:
+                population = inp.macro(region, 'population_growth')
+                productivity = inp.macro(region, 'productivity_growth')
+                my_ratio = inp.macro(region, 'my_ratio')
+                adjustment = inp.macro(
+                    region, 'rgdp_adjustment',
+                    RGDP_ADJUSTMENT_DEFAULTS.get(region, RGDP_ADJUSTMENT_FALLBACK),
+                )
+                output_per_capita = productivity + sigmoid_my_ratio(my_ratio) + adjustment
+                rgdp = output_per_capita + population
+
+            # Inflation
+            if inp.macro_overridden(region, 'inflation_forecast'):
+                inflation = inp.macro(region, 'inflation_forecast', 0.0)
+            else:
+                current_headline = inp.macro(region, 'current_headline_inflation')
+                long_term = inp.macro(
+                    region, 'long_term_inflation',
+                    LONG_TERM_INFLATION_DEFAULTS.get(region, LONG_TERM_INFLATION_FALLBACK),
+                )
+                adjustment = inp.macro(region, 'inflation_adjustment', 0.0)
+                inflation = kernels.weighted_blend(
+                    current_headline, long_term,
+                    self._inflation_params['current_weight'], self._inflation_params['long_term_weight'],
+                ) + adjustment
+
+            # T-Bill
+            if inp.macro_overridden(region, 'tbill_forecast'):
+                tbill = inp.macro(region, 'tbill_forecast', 0.0)
+            else:
+                current_tbill = inp.macro(region, 'current_tbill')
+                country_factor = inp.macro(
+                    region, 'country_factor', COUNTRY_FACTOR_DEFAULTS.get(region, 0.0)
+                )
+                long_term_tbill = np.maximum(
+                    self._tbill_params['rate_floor'],
+                    country_factor + rgdp + inflation,
+                )
+                tbill = kernels.weighted_blend(
+                    current_tbill, long_term_tbill,
+                    self._tbill_params['current_weight'], self._tbill_params['long_term_weight'],
+                )
+
+            macro[region] = {
+                'rgdp_growth': rgdp,
+                'inflation': inflation,
+                'tbill_rate': tbill,
+            }
+
+        total_weight = sum(GLOBAL_GDP_WEIGHTS.values())
+        global_rgdp = 0.0
+        for region, weight in GLOBAL_GDP_WEIGHTS.items():
+            global_rgdp = global_rgdp + (weight / total_weight) * macro[region]['rgdp_growth']
+        macro['global'] = {'rgdp_growth': global_rgdp}
+
+        return macro
+
+    # ------------------------------------------------------------------
+    # Bonds
+    # ------------------------------------------------------------------
+
+    def _average_mean_reverting_value(self, current, fair, years):
+        """Vectorized BondModel._average_mean_reverting_value (``years`` may be an array)."""
+        return kernels.average_mean_reverting_value(current, fair, self._tp_reversion_speed, years)
+
+    @staticmethod
+    def _reversion_fraction(horizon):
+        return kernels.reversion_fraction(horizon)
+
+    def _compute_bond(self, inp: _BatchInputs, asset_class: AssetClass, tbill, inflation, horizon,
+                      credit_profile: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Vectorized BondModel.compute_return (yield + roll + valuation - credit).
+
+        ``credit_profile`` is the model's CREDIT_PROFILE (None for
+        default-free bonds).
+        """
+        def bond_input(key):
+            return inp.asset(asset_class, key, BOND_INPUT_FALLBACKS[key])
+
+        current_yield = bond_input('current_yield')
+        duration = bond_input('duration')
+
+        # Implied term premium when the yield is overridden but the TP is not
+        if (inp.asset_overridden(asset_class, 'current_yield')
+                and not inp.asset_overridden(asset_class, 'current_term_premium')):
+            current_tp = current_yield - tbill
+        else:
+            current_tp = bond_input('current_term_premium')
+        fair_tp = bond_input('fair_term_premium')
+
+        avg_tp = self._average_mean_reverting_value(current_tp, fair_tp, horizon)
+        avg_yield = tbill + avg_tp
+
+        roll_return = kernels.roll_return(current_tp, duration, self._bond_params['roll_maturity_years'])
+
+        expected_tp_change = kernels.reversion_change(current_tp, fair_tp, self._reversion_fraction(horizon))
+        valuation_return = kernels.valuation_return(duration, expected_tp_change, horizon)
+
+        if credit_profile is None:
+            credit_loss = 0.0
+        else:
+            fallback = CREDIT_PARAMS[credit_profile]
+            default_rate = inp.asset(asset_class, 'default_rate', fallback['default_rate'])
+            recovery_rate = inp.asset(asset_class, 'recovery_rate', fallback['recovery_rate'])
+            credit_loss = kernels.credit_loss(default_rate, recovery_rate)
+
+        nominal = avg_yield + roll_return + valuation_return - credit_loss
+        return {
+            'expected_return_nominal': nominal,
+            'expected_return_real': nominal - inflation,
+            'yield': avg_yield,
+            'roll_return': roll_return,
+            'valuation': valuation_return,
+            'credit_loss': credit_loss,
+        }
+
+    def _compute_bonds_hy(self, inp: _BatchInputs, tbill, inflation, horizon) -> Dict[str, Any]:
+        """Vectorized HighYieldBondModel.compute_return."""
+        asset_class = AssetClass.BONDS_HY
+        result = self._compute_bond(
+            inp, asset_class, tbill, inflation, horizon, credit_profile=HighYieldBondModel.CREDIT_PROFILE,
+        )
+
+        def spread_input(key):
+            return inp.asset(asset_class, key, HY_SPREAD_INPUT_FALLBACKS[key])
+
+        spread_change = kernels.reversion_change(
+            spread_input('credit_spread'), spread_input('fair_credit_spread'),
+            self._bond_params['credit_spread_reversion'],
+        )
+        spread_valuation = kernels.valuation_return(spread_input('duration'), spread_change, horizon)
+
+        nominal = result['expected_return_nominal'] + spread_valuation
+        result['expected_return_nominal'] = nominal
+        result['expected_return_real'] = nominal - inflation
+        result['valuation'] = result['valuation'] + spread_valuation
+        return result
+
+    def _compute_inflation_linked(self, inp: _BatchInputs, inflation, horizon) -> Dict[str, Any]:
+        """Vectorized InflationLinkedBondModel.compute_return for the base regime."""
+        regime = 'eur' if self.base_currency == BaseCurrency.EUR else 'usd'
+        regime_defaults = DefaultInputs().get_asset_inputs(AssetClass.INFLATION_LINKED).get(regime, {})
+
+        def regime_input(key):
+            return inp.regime(regime, regime_defaults, key, INFLATION_LINKED_INPUT_FALLBACKS[key])
+
+        real_carry = regime_input('current_real_yield')
+        duration = regime_input('duration')
+        current_rtp = regime_input('current_real_term_premium')
+        fair_rtp = regime_input('fair_real_term_premium')
+        inflation_beta = regime_input('inflation_beta')
+        index_lag_drag = regime_input('index_lag_drag')
+        liquidity_technical = regime_input('liquidity_technical')
+
+        real_roll_return = kernels.roll_return(current_rtp, duration, self._bond_params['roll_maturity_years'])
+        expected_tp_change = kernels.reversion_change(current_rtp, fair_rtp, self._reversion_fraction(horizon))
+        real_valuation_return = kernels.valuation_return(duration, expected_tp_change, horizon)
+
+        inflation_indexation = inflation * inflation_beta
+        real = real_carry + real_roll_return + real_valuation_return + liquidity_technical
+        nominal = real + inflation_indexation - index_lag_drag
+
+        return {
+            'expected_return_nominal': nominal,
+            'expected_return_real': real,
+            'real_yield_carry': real_carry,
+            'real_roll_return': real_roll_return,
+            'real_valuation_return': real_valuation_return,
+            'inflation_indexation': inflation_indexation,
+            'index_lag_drag': -np.abs(index_lag_drag),
+            'liquidity_technical': liquidity_technical,
+            'credit_loss': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Equities
+    # ------------------------------------------------------------------
+
+    def _compute_equity_ra(self, inp: _BatchInputs, region: EquityRegion, inflation, global_rgdp) -> Dict[str, Any]:
+        """Vectorized EquityModel.compute_return."""
+        asset_class = EQUITY_TO_ASSET[region]
+
+        def equity_input(key):
+            return inp.asset(asset_class, key, EQUITY_INPUT_FALLBACKS[key])
+
+        dividend_yield = equity_input('dividend_yield')
+
+        blended_eps = kernels.weighted_blend(
+            equity_input('real_eps_growth'), equity_input('regional_eps_growth'),
+            EQUITY_PARAMS.get('country_weight', 0.5), EQUITY_PARAMS.get('regional_weight', 0.5),
+        )
+        real_eps_growth = np.minimum(blended_eps, global_rgdp)
+
+        current_caey = np.asarray(equity_input('current_caey'), dtype=float)
+        fair_caey = equity_input('fair_caey')
+        reversion_speed = np.asarray(equity_input('reversion_speed'), dtype=float)
+        full_reversion_years = EQUITY_PARAMS.get('valuation_reversion_years', 20)
+
+        active = (current_caey > 0) & (reversion_speed > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            caey = np.where(active, current_caey, 1.0)
+            caey_annual_change = kernels.caey_annual_change(
+                caey, fair_caey, reversion_speed, full_reversion_years
+            )
+            annual_valuation = kernels.caey_average_valuation(caey_annual_change)
+        valuation_change = np.where(active, annual_valuation, 0.0)
+
+        real = dividend_yield + real_eps_growth + valuation_change
+        return {
+            'expected_return_nominal': real + inflation,
+            'expected_return_real': real,
+            'dividend_yield': dividend_yield,
+            'real_eps_growth': real_eps_growth,
+            'valuation_change': valuation_change,
+        }
+
+    def _compute_equity_gk(self, inp: _BatchInputs, region: EquityRegion, inflation, rgdp, horizon) -> Dict[str, Any]:
+        """Vectorized EquityModelGK.compute_return."""
+        asset_class = EQUITY_TO_ASSET[region]
+
+        def equity_input(key):
+            return inp.asset(asset_class, key, EQUITY_INPUT_FALLBACKS[key])
+
+        dividend_yield = equity_input('dividend_yield')
+        net_buyback_yield = equity_input('net_buyback_yield')
+        wedge = equity_input('revenue_gdp_wedge')
+
+        if inp.asset_overridden(asset_class, 'revenue_growth'):
+            revenue_growth = inp.asset(asset_class, 'revenue_growth', 0.0)
+        else:
+            revenue_growth = inflation + rgdp + wedge
+
+        margin_change = equity_input('margin_change')
+
+        current_pe = np.asarray(equity_input('current_pe'), dtype=float)
+        target_pe = np.asarray(equity_input('target_pe'), dtype=float)
+        active = (current_pe > 0) & (target_pe > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            safe_current = np.where(active, current_pe, 1.0)
+            safe_target = np.where(active, target_pe, 1.0)
+            valuation_change = np.where(
+                active, kernels.pe_valuation_change(safe_current, safe_target, horizon), 0.0
+            )
+
+        nominal = dividend_yield + net_buyback_yield + revenue_growth + margin_change + valuation_change
+        return {
+            'expected_return_nominal': nominal,
+            'expected_return_real': nominal - inflation,
+            'dividend_yield': dividend_yield,
+            'net_buyback_yield': net_buyback_yield,
+            'revenue_growth': revenue_growth,
+            'margin_change': margin_change,
+            'valuation_change': valuation_change,
+        }
+
+    # ------------------------------------------------------------------
+    # Alternatives
+    # ------------------------------------------------------------------
+
+    def _compute_absolute_return(self, inp: _BatchInputs, tbill, inflation, equity_return) -> Dict[str, Any]:
+        """Vectorized HedgeFundModel.compute_return."""
+        asset_class = AssetClass.ABSOLUTE_RETURN
+        default_betas = HEDGE_FUND_PARAMS.get('factor_exposures', {})
+        historical = HEDGE_FUND_PARAMS.get('historical_factor_premia', {})
+        discount = HEDGE_FUND_PARAMS.get('historical_discount', 0.5)
+
+        factor_return = 0.0
+        for factor in HedgeFundModel.FACTORS:
+            beta = inp.asset(asset_class, f'beta_{factor}', default_betas.get(factor, 0.0))
+            if factor == 'market':
+                premium = equity_return - tbill
+            else:
+                premium = historical.get(factor, HEDGE_FUND_PARAMS['default_factor_premium']) * discount
+            factor_return = factor_return + beta * premium
+
+        trading_alpha = inp.asset(
+            asset_class, 'trading_alpha', discount * HEDGE_FUND_PARAMS['historical_trading_alpha'],
+        )
+
+        nominal = tbill + factor_return + trading_alpha
+        return {
+            'expected_return_nominal': nominal,
+            'expected_return_real': nominal - inflation,
+            'tbill': tbill,
+            'factor_return': factor_return,
+            'trading_alpha': trading_alpha,
+        }
+
+    # ------------------------------------------------------------------
+    # FX
+    # ------------------------------------------------------------------
+
+    def _fx_return(self, macro: Dict[str, Dict[str, Any]], asset_class: AssetClass):
+        """
+        Vectorized FX translation (carry + PPP) into the base currency.
+
+        Returns None when the asset is already in the base currency.
+        """
+        local_currency = ASSET_LOCAL_CURRENCY.get(asset_class, 'usd')
+        base_ccy = self.base_currency.value
+        if local_currency in ('base', base_ccy):
+            return None
+
+        home = macro[CURRENCY_TO_MACRO_REGION[base_ccy]]
+        foreign = macro[CURRENCY_TO_MACRO_REGION.get(local_currency, 'us')]
+        return kernels.weighted_blend(
+            home['tbill_rate'] - foreign['tbill_rate'],
+            home['inflation'] - foreign['inflation'],
+            FXModel.CARRY_WEIGHT, FXModel.PPP_WEIGHT,
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def compute(self, values, horizon=FORECAST_HORIZON) -> BatchResults:
+        """
+        Compute expected returns for every scenario row.
+
+        Parameters
+        ----------
+        values : array-like
+            Matrix of shape (n_scenarios, len(paths)). A 1-D array is
+            treated as a single scenario.
+        horizon : int or array-like, optional
+            Forecast horizon in years, either one for all rows or one per
+            row (shape (n_scenarios,)).
+
+        Returns
+        -------
+        BatchResults
+            Columnar results (scenario x asset x component).
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        if values.ndim != 2 or values.shape[1] != len(self.paths):
+            raise ValueError(
+                f"Expected values of shape (n_scenarios, {len(self.paths)}), got {values.shape}"
+            )
+        n = values.shape[0]
+        horizon = np.asarray(horizon, dtype=float)
+        if horizon.ndim > 1 or (horizon.ndim == 1 and horizon.shape[0] != n):
+            raise ValueError(f"Expected a scalar horizon or one per scenario ({n}), got shape {horizon.shape}")
+        if np.any(horizon < 1):
+            raise ValueError("Forecast horizon must be at least 1 year")
+        if np.any(horizon != np.round(horizon)):
+            raise ValueError("Forecast horizon must be a whole number of years")
+        # A single horizon stays a plain int, as in the scalar models
+        horizon = int(horizon) if horizon.ndim == 0 else horizon.astype(int)
+        inp = _BatchInputs(self.paths, values, self.override_manager)
+
+        macro = self._compute_macro(inp)
+        base_region = CURRENCY_TO_MACRO_REGION[self.base_currency.value]
+        base_macro = macro[base_region]
+        us_macro = macro['us']
+
+        asset_results: Dict[AssetClass, Dict[str, Any]] = {}
+
+        asset_results[AssetClass.LIQUIDITY] = {
+            'expected_return_nominal': base_macro['tbill_rate'],
+            'expected_return_real': base_macro['tbill_rate'] - base_macro['inflation'],
+            'tbill_rate': base_macro['tbill_rate'],
+        }
+
+        asset_results[AssetClass.BONDS_GLOBAL] = self._compute_bond(
+            inp, AssetClass.BONDS_GLOBAL, us_macro['tbill_rate'], us_macro['inflation'], horizon,
+        )
+        asset_results[AssetClass.BONDS_HY] = self._compute_bonds_hy(
+            inp, us_macro['tbill_rate'], us_macro['inflation'], horizon,
+        )
+        # Hard currency EM bonds: US T-Bill + EM spread, US inflation
+        asset_results[AssetClass.BONDS_EM] = self._compute_bond(
+            inp, AssetClass.BONDS_EM,
+            us_macro['tbill_rate'] + self._bond_params['em_hard_currency_spread'], us_macro['inflation'], horizon,
+            credit_profile=EMBondModel.CREDIT_PROFILE,
+        )
+        asset_results[AssetClass.INFLATION_LINKED] = self._compute_inflation_linked(
+            inp, base_macro['inflation'], horizon,
+        )
+
+        for region in EquityRegion:
+            region_macro = macro[EQUITY_TO_MACRO_REGION[region]]
+            if self.equity_model_type == 'gk':
+                result = self._compute_equity_gk(
+                    inp, region, region_macro['inflation'], region_macro['rgdp_growth'], horizon,
+                )
+            else:
+                result = self._compute_equity_ra(
+                    inp, region, region_macro['inflation'], macro['global']['rgdp_growth'],
+                )
+            asset_results[EQUITY_TO_ASSET[region]] = result
+
+        asset_results[AssetClass.ABSOLUTE_RETURN] = self._compute_absolute_return(
+            inp, base_macro['tbill_rate'], base_macro['inflation'],
+            asset_results[AssetClass.EQUITY_US]['expected_return_nominal'],
+        )
+
+        # Translate local-currency returns into the base currency
+        for asset_class, result in asset_results.items():
+            fx_return = self._fx_return(macro, asset_class)
+            if fx_return is None:
+                continue
+            result['expected_return_nominal'] = result['expected_return_nominal'] + fx_return
+            result['expected_return_real'] = result['expected_return_real'] + fx_return
+            result['fx_return'] = fx_return
+
+        out = np.full((n, len(ASSETS), len(COMPONENTS)), np.nan)
+        for asset_class, result in asset_results.items():
+            a = ASSETS.index(asset_class.value)
+            for component, value in result.items():
+                out[:, a, COMPONENTS.index(component)] = value
+
+        macro_out = {
+            region: {key: np.broadcast_to(np.asarray(val, dtype=float), (n,)).copy()
+                     for key, val in data.items()}
+            for region, data in macro.items()
+        }
+
+        return BatchResults(
+            assets=ASSETS,
+            components=COMPONENTS,
+            values=out,
+            macro=macro_out,
+            base_currency=self.base_currency.value,
+        )
+
+    def term_structure(self, horizons: Sequence[int] = TERM_STRUCTURE_HORIZONS, values=None) -> TermStructure:
+        """
+        Expected returns at every horizon in one batched evaluation.
+
+        Parameters
+        ----------
+        horizons : sequence of int, optional
+            Forecast horizons in years (default 1-30).
+        values : array-like, optional
+            One scenario row (len(paths)); may be omitted when the engine
+            has no paths.
+
+        Returns
+        -------
+        TermStructure
+            Nominal and real returns per asset, aligned with ``horizons``.
+        """
+        horizons = tuple(int(h) for h in horizons)
+        if not horizons:
+            raise ValueError("At least one horizon is required")
+        row = np.zeros(len(self.paths)) if values is None else np.asarray(values, dtype=float).ravel()
+        results = self.compute(np.tile(row, (len(horizons), 1)), horizon=np.array(horizons))
+        return TermStructure(
+            horizons=horizons,
+            nominal={asset: results.nominal[:, a].tolist() for a, asset in enumerate(ASSETS)},
+            real={asset: results.real[:, a].tolist() for a, asset in enumerate(ASSETS)},
+            base_currency=results.base_currency,
+        )
+
+
+def flatten_overrides(overrides: Optional[Dict[str, Any]], prefix: str = '') -> Dict[str, Any]:
+    """
+    Flatten a nested override dictionary into dot-separated leaf paths.
+
+    Parameters
+    ----------
+    overrides : dict, optional
+        Nested override dictionary.
+    prefix : str
+        Path prefix (used for recursion).
+
+    Returns
+    -------
+    dict
+        {path: value} for every non-dict leaf.
+    """
+    flat = {}
+    for key, value in (overrides or {}).items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten_overrides(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def compute_scenarios(
+    scenarios: List[Optional[Dict[str, Any]]],
+    base_currency: str = 'usd',
+    equity_model_type: str = 'ra',
+) -> BatchResults:
+    """
+    Evaluate a list of nested override dictionaries in batch.
+
+    Scenarios are grouped by the set of paths they override (override
+    presence changes model branches, e.g. a direct rgdp_growth override),
+    each group is evaluated with one BatchCMEEngine and the rows are
+    reassembled in input order.
+
+    Parameters
+    ----------
+    scenarios : list of dict
+        Override dictionaries (None for RA defaults).
+    base_currency : str
+        Base currency ('usd' or 'eur').
+    equity_model_type : str
+        Equity model ('ra' or 'gk').
+
+    Returns
+    -------
+    BatchResults
+        Results with one row per input scenario.
+    """
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    flat_scenarios = [flatten_overrides(s) for s in scenarios]
+    for i, flat in enumerate(flat_scenarios):
+        groups.setdefault(tuple(sorted(flat)), []).append(i)
+
+    n = len(scenarios)
+    values = np.full((n, len(ASSETS), len(COMPONENTS)), np.nan)
+    macro: Dict[str, Dict[str, np.ndarray]] = {}
+
+    for paths, rows in groups.items():
+        matrix = np.array([[flat_scenarios[i][p] for p in paths] for i in rows], dtype=float)
+        matrix = matrix.reshape(len(rows), len(paths))
+        engine = BatchCMEEngine(paths, base_currency=base_currency, equity_model_type=equity_model_type)
+        group_results = engine.compute(matrix)
+        values[rows] = group_results.values
+        for region, data in group_results.macro.items():
+            region_out = macro.setdefault(region, {})
+            for key, col in data.items():
+                region_out.setdefault(key, np.full(n, np.nan))[rows] = col
+
+    return BatchResults(
+        assets=ASSETS,
+        components=COMPONENTS,
+        values=values,
+        macro=macro,
+        base_currency=BaseCurrency(base_currency.lower()).value,
+    )
+
+
+def sweep_grid(
+    x_path: str,
+    x_values: Sequence[float],
+    y_path: str,
+    y_values: Sequence[float],
+    assets: Optional[Sequence[str]] = None,
+    component: str = 'expected_return_nominal',
+    base_overrides: Optional[Dict[str, Any]] = None,
+    base_currency: str = 'usd',
+    equity_model_type: str = 'ra',
+    chunk_size: int = 10_000,
+) -> np.ndarray:
+    """
+    Evaluate a dense 2-D grid of two override paths.
+
+    Parameters
+    ----------
+    x_path, y_path : str
+        Dot-separated override paths swept along the columns / rows.
+    x_values, y_values : sequence of float
+        Grid coordinates.
+    assets : sequence of str, optional
+        Asset classes to return (all when omitted).
+    component : str
+        Component to return, e.g. 'expected_return_real'.
+    base_overrides : dict, optional
+        Overrides shared by every grid point.
+    base_currency : str
+        Base currency ('usd' or 'eur').
+    equity_model_type : str
+        Equity model ('ra' or 'gk').
+    chunk_size : int
+        Grid points per BatchCMEEngine.compute call (bounds peak memory).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(assets), len(y_values), len(x_values)).
+    """
+    assets = tuple(assets) if assets else ASSETS
+    unknown = [a for a in assets if a not in ASSETS]
+    if unknown:
+        raise ValueError(f"Unknown asset classes: {unknown}")
+    if component not in COMPONENTS:
+        raise ValueError(f"Unknown component '{component}'")
+    asset_idx = [ASSETS.index(a) for a in assets]
+    c = COMPONENTS.index(component)
+
+    x = np.asarray(x_values, dtype=float)
+    y = np.asarray(y_values, dtype=float)
+    yy, xx = np.meshgrid(y, x, indexing='ij')
+    matrix = np.column_stack([xx.ravel(), yy.ravel()])
+
+    engine = BatchCMEEngine(
+        (x_path, y_path),
+        base_overrides=base_overrides,
+        base_currency=base_currency,
+        equity_model_type=equity_model_type,
+    )
+    out = np.empty((len(assets), matrix.shape[0]))
+    for start in range(0, matrix.shape[0], chunk_size):
+        block = engine.compute(matrix[start:start + chunk_size])
+        out[:, start:start + chunk_size] = block.values[:, asset_idx, c].T
+
+    return out.reshape(len(assets), y.size, x.size)
@@ -5,6 +5,8 @@ Usage:
     python -m ra_stress_tool.cli [options]
     python -m ra_stress_tool.cli --scenario inflation_shock
     python -m ra_stress_tool.cli --override "macro.us.inflation_forecast=0.04"
+    python -m ra_stress_tool.cli --monte-carlo mc_spec.json --draws 1000000
+    python -m ra_stress_tool.cli --solve equity_us=0.03 --free equity_us.current_caey=0.01:0.10
 """
 
 import argparse
@@ -13,7 +15,9 @@ import sys
 from typing import Dict, Any, Optional
 
 from .main import CMEEngine, run_stress_test, quick_cme
-from .output import format_results_table, format_comparison_table, results_to_json
+from .output import (
+    format_results_table, format_comparison_table, results_to_json, format_monte_carlo_table,
+)
 
 
 # Predefined stress scenarios
@@ -132,6 +136,39 @@ def merge_dicts(base: Dict, updates: Dict) -> Dict:
     return result
 
 
+def load_monte_carlo_spec(spec: str) -> Dict[str, Any]:
+    """
+    Load a Monte Carlo spec from a JSON file path or an inline JSON string.
+
+    The spec has a ``distributions`` list (see montecarlo.InputDistribution)
+    and an optional ``correlation`` matrix.
+    """
+    if spec.lstrip().startswith('{'):
+        data = json.loads(spec)
+    else:
+        with open(spec) as f:
+            data = json.load(f)
+    if not isinstance(data.get('distributions'), list):
+        raise ValueError("Monte Carlo spec needs a 'distributions' list")
+    return data
+
+
+def parse_free_input(free_str: str) -> tuple:
+    """
+    Parse a solver free input like 'equity_us.current_caey=0.01:0.10'.
+
+    Returns
+    -------
+    tuple
+        (path, lower, upper)
+    """
+    if '=' not in free_str or ':' not in free_str:
+        raise ValueError(f"Invalid free input: {free_str}. Expected 'path=lower:upper'.")
+    path, bounds = free_str.split('=', 1)
+    lower, upper = bounds.split(':', 1)
+    return path, float(lower), float(upper)
+
+
 def list_scenarios():
     """Print available stress scenarios."""
     print("\nAvailable Stress Scenarios:")
@@ -166,6 +203,18 @@ Examples:
 
   # List available scenarios
   python -m ra_stress_tool.cli --list-scenarios
+
+  # Sensitivities of every return to every input (JSON)
+  python -m ra_stress_tool.cli --sensitivities --json
+
+  # Monte Carlo over sampled inputs (spec file or inline JSON)
+  python -m ra_stress_tool.cli --monte-carlo mc_spec.json --draws 1000000 --seed 7
+
+  # Reverse stress test: what US CAEY makes US equity return 3%?
+  python -m ra_stress_tool.cli --solve equity_us=0.03 --free equity_us.current_caey=0.01:0.10
+
+  # What EM default rate zeroes the EM bond real return?
+  python -m ra_stress_tool.cli --solve bonds_em=0 --measure real --free bonds_em.default_rate=0:0.3
         """
     )
 
@@ -211,6 +260,52 @@ Examples:
         help='Custom name for the scenario',
     )
 
+    parser.add_argument(
+        '--sensitivities',
+        action='store_true',
+        help='Include d(return)/d(input) for every asset in JSON output',
+    )
+
+    parser.add_argument(
+        '--monte-carlo', '--mc',
+        metavar='SPEC',
+        help='Run a Monte Carlo simulation from a JSON spec (file path or inline JSON)',
+    )
+
+    parser.add_argument(
+        '--draws',
+        type=int,
+        default=100_000,
+        help='Number of Monte Carlo draws (default: 100000)',
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed for Monte Carlo draws (default: 0)',
+    )
+
+    parser.add_argument(
+        '--solve',
+        metavar='ASSET=TARGET',
+        help='Reverse stress test: find the --free input values that make ASSET return TARGET',
+    )
+
+    parser.add_argument(
+        '--free',
+        action='append',
+        metavar='PATH=LOWER:UPPER',
+        help='Free input for --solve with its search bounds. Can be used multiple times.',
+    )
+
+    parser.add_argument(
+        '--measure',
+        choices=['nominal', 'real'],
+        default='nominal',
+        help='Return measure targeted by --solve (default: nominal)',
+    )
+
     args = parser.parse_args()
 
     # List scenarios if requested
@@ -240,7 +335,55 @@ Examples:
                 return 1
 
     # Run calculation
-    if args.compare:
+    if args.solve:
+        from .solver import solve_for_target
+
+        try:
+            asset, target = parse_override_string(args.solve).popitem()
+            if not args.free:
+                raise ValueError("--solve needs at least one --free input")
+            result = solve_for_target(
+                asset,
+                float(target),
+                [parse_free_input(f) for f in args.free],
+                measure=args.measure,
+                base_overrides=overrides if overrides else None,
+            )
+        except (ValueError, TypeError) as e:
+            print(f"Error in solve: {e}", file=sys.stderr)
+            return 1
+
+        if args.json:
+            print(json.dumps(result.to_dict(), indent=2))
+        else:
+            status = "Solved" if result.converged else "No solution"
+            print(f"{status}: {result.asset} {result.measure} return target {result.target:.2%}")
+            for path, value in result.values.items():
+                print(f"  {path} = {value:.6f}")
+            print(f"  achieved {result.achieved:.4%} ({result.evaluations} evaluations)")
+            if result.message:
+                print(f"  {result.message}")
+    elif args.monte_carlo:
+        from .montecarlo import MonteCarloEngine
+
+        try:
+            spec = load_monte_carlo_spec(args.monte_carlo)
+            engine = MonteCarloEngine(
+                spec['distributions'],
+                correlation=spec.get('correlation'),
+                base_overrides=overrides if overrides else None,
+                seed=args.seed,
+            )
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error in Monte Carlo spec: {e}", file=sys.stderr)
+            return 1
+        mc_results = engine.run(args.draws)
+
+        if args.json:
+            print(json.dumps(mc_results.to_dict(), indent=2))
+        else:
+            print(format_monte_carlo_table(mc_results))
+    elif args.compare:
         # Compare base vs stressed
         base_results, stress_results, comparison = run_stress_test(
             base_overrides=None,
@@ -268,7 +411,7 @@ Examples:
     else:
         # Single scenario
         engine = CMEEngine(overrides if overrides else None)
-        results = engine.compute_all_returns(scenario_name)
+        results = engine.compute_all_returns(scenario_name, with_sensitivities=args.sensitivities)
 
         if args.json:
             print(results_to_json(results))
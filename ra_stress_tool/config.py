@@ -131,6 +131,9 @@ TBILL_PARAMS = {
 BOND_PARAMS = {
     'term_premium_reversion_speed': -0.05,  # Default mean reversion speed
     'yield_floor': 0.0,                      # Minimum yield
+    'roll_maturity_years': 10.0,             # Average index maturity for roll-down
+    'credit_spread_reversion': 0.50,         # Share of HY spread gap closed over the horizon
+    'em_hard_currency_spread': 0.02,         # EM hard currency spread over US T-Bill
 }
 
 
@@ -162,6 +165,8 @@ EQUITY_PARAMS_GK = {
 
 HEDGE_FUND_PARAMS = {
     'historical_discount': 0.50,          # Use 50% of historical for some factors
+    'historical_trading_alpha': 0.02,     # 2% historical alpha (discounted like the premia)
+    'default_factor_premium': 0.02,       # Historical premium for factors not listed below
     'factor_exposures': {
         # Default factor betas (from typical diversified HF)
         'market': 0.30,
@@ -435,6 +440,9 @@ CURRENCY_TO_MACRO_REGION = {
     'em': 'em',
 }
 
+# Currencies covered by the FX matrix (rows/columns in this order)
+FX_CURRENCIES = tuple(CURRENCY_TO_MACRO_REGION)
+
 
 # =============================================================================
 # Expected Volatility (Long-term historical estimates)
@@ -454,6 +462,50 @@ EXPECTED_VOLATILITY = {
 }
 
 
+# =============================================================================
+# Expected Correlations (Long-term estimates, used for portfolio volatility)
+# =============================================================================
+
+# Pairwise correlations of asset class returns; unlisted pairs are 0.
+# Overridable per request through the 'risk' overrides (see portfolio.py).
+EXPECTED_CORRELATION = {
+    (AssetClass.LIQUIDITY, AssetClass.BONDS_GLOBAL):         0.10,
+    (AssetClass.LIQUIDITY, AssetClass.INFLATION_LINKED):     0.10,
+    (AssetClass.LIQUIDITY, AssetClass.ABSOLUTE_RETURN):      0.10,
+    (AssetClass.BONDS_GLOBAL, AssetClass.BONDS_HY):          0.20,
+    (AssetClass.BONDS_GLOBAL, AssetClass.BONDS_EM):          0.40,
+    (AssetClass.BONDS_GLOBAL, AssetClass.INFLATION_LINKED):  0.70,
+    (AssetClass.BONDS_GLOBAL, AssetClass.EQUITY_US):        -0.10,
+    (AssetClass.BONDS_GLOBAL, AssetClass.EQUITY_EUROPE):    -0.10,
+    (AssetClass.BONDS_GLOBAL, AssetClass.EQUITY_JAPAN):     -0.10,
+    (AssetClass.BONDS_HY, AssetClass.BONDS_EM):              0.60,
+    (AssetClass.BONDS_HY, AssetClass.INFLATION_LINKED):      0.30,
+    (AssetClass.BONDS_HY, AssetClass.EQUITY_US):             0.65,
+    (AssetClass.BONDS_HY, AssetClass.EQUITY_EUROPE):         0.65,
+    (AssetClass.BONDS_HY, AssetClass.EQUITY_JAPAN):          0.50,
+    (AssetClass.BONDS_HY, AssetClass.EQUITY_EM):             0.60,
+    (AssetClass.BONDS_HY, AssetClass.ABSOLUTE_RETURN):       0.55,
+    (AssetClass.BONDS_EM, AssetClass.INFLATION_LINKED):      0.40,
+    (AssetClass.BONDS_EM, AssetClass.EQUITY_US):             0.50,
+    (AssetClass.BONDS_EM, AssetClass.EQUITY_EUROPE):         0.50,
+    (AssetClass.BONDS_EM, AssetClass.EQUITY_JAPAN):          0.40,
+    (AssetClass.BONDS_EM, AssetClass.EQUITY_EM):             0.70,
+    (AssetClass.BONDS_EM, AssetClass.ABSOLUTE_RETURN):       0.45,
+    (AssetClass.INFLATION_LINKED, AssetClass.EQUITY_EM):     0.10,
+    (AssetClass.INFLATION_LINKED, AssetClass.ABSOLUTE_RETURN): 0.10,
+    (AssetClass.EQUITY_US, AssetClass.EQUITY_EUROPE):        0.85,
+    (AssetClass.EQUITY_US, AssetClass.EQUITY_JAPAN):         0.65,
+    (AssetClass.EQUITY_US, AssetClass.EQUITY_EM):            0.70,
+    (AssetClass.EQUITY_US, AssetClass.ABSOLUTE_RETURN):      0.70,
+    (AssetClass.EQUITY_EUROPE, AssetClass.EQUITY_JAPAN):     0.70,
+    (AssetClass.EQUITY_EUROPE, AssetClass.EQUITY_EM):        0.75,
+    (AssetClass.EQUITY_EUROPE, AssetClass.ABSOLUTE_RETURN):  0.65,
+    (AssetClass.EQUITY_JAPAN, AssetClass.EQUITY_EM):         0.65,
+    (AssetClass.EQUITY_JAPAN, AssetClass.ABSOLUTE_RETURN):   0.50,
+    (AssetClass.EQUITY_EM, AssetClass.ABSOLUTE_RETURN):      0.60,
+}
+
+
 def get_config_value(config_dict: Dict[str, Any], *keys, default=None):
     """
     Safely get a nested configuration value.
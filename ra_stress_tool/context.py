@@ -0,0 +1,84 @@
+"""
+Evaluation context shared by CMEEngine and its models.
+
+The asset classes of one CMEEngine evaluation share intermediates: the
+macro override sources, each asset's resolved inputs (read several times
+per forecast by the model sub-components), the US equity forecast that
+also feeds the hedge fund market factor, the FX matrix and the
+local-currency bond and equity results that every base currency
+translates. EvaluationContext memoizes these
+nodes and counts hits and misses per node, so duplicated work is both
+avoided and observable.
+
+Memoized values are only valid for the overrides they were computed
+under; the engine clears the context whenever its overrides change.
+
+Example
+-------
+>>> engine = CMEEngine()
+>>> engine.compute_all_returns()
+>>> engine.context.stats()['macro_sources']
+{'hits': 9, 'misses': 1}
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class EvaluationContext:
+    """
+    Memo table of shared intermediates with per-node hit counters.
+
+    Parameters
+    ----------
+    memoize : bool, optional
+        If False, every lookup recomputes (and counts as a miss). Models
+        built without an engine use this so they never serve stale values.
+    """
+
+    def __init__(self, memoize: bool = True):
+        self.memoize = memoize
+        self._values: Dict[Tuple[str, Hashable], Any] = {}
+        self._hits: Dict[str, int] = defaultdict(int)
+        self._misses: Dict[str, int] = defaultdict(int)
+
+    def get(self, node: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the memoized value of ``node`` for ``key``, computing it on a miss.
+
+        Parameters
+        ----------
+        node : str
+            Name of the intermediate, e.g. 'asset_inputs'.
+        key : hashable
+            Distinguishes instances of the node (asset class, region, ...).
+        compute : callable
+            Zero-argument function producing the value.
+
+        Returns
+        -------
+        Any
+            The (possibly shared) value. Callers must not mutate it.
+        """
+        entry = (node, key)
+        if self.memoize and entry in self._values:
+            self._hits[node] += 1
+            return self._values[entry]
+        self._misses[node] += 1
+        value = compute()
+        if self.memoize:
+            self._values[entry] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop all memoized values and reset the counters."""
+        self._values.clear()
+        self._hits.clear()
+        self._misses.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hits and misses per node since the last clear."""
+        return {
+            node: {'hits': self._hits.get(node, 0), 'misses': self._misses.get(node, 0)}
+            for node in sorted(set(self._hits) | set(self._misses))
+        }
@@ -0,0 +1,348 @@
+"""
+Historical time-series store and the EWMA fair-value pipeline.
+
+The fair values in DEFAULT_ASSET_DATA / DEFAULT_MARKET_DATA (fair term
+premium, fair CAEY, productivity growth, ...) are long-window EWMAs of
+monthly histories, with windows and half-lives from EWMA_PARAMS.
+TimeSeriesStore keeps those raw histories on disk as one memory-mapped
+float64 column per series; FairValuePipeline derives the fair values from
+them with utils.ewma.RollingEWMA and saves each EWMA's state next to the
+store, so appending a quarter only feeds the three new points through the
+recursion instead of rescanning 50 years.
+
+The derived values use the CMEEngine override paths, so they can be used
+directly as (or merged into) engine overrides.
+
+Example
+-------
+>>> store = TimeSeriesStore('data/history')
+>>> store.write('equity_us.caey', caey_history, start='1975-01')
+>>> pipeline = FairValuePipeline(store)
+>>> pipeline.update()
+{'equity_us.fair_caey': 0.0431}
+>>> store.append('equity_us.caey', [0.025, 0.026, 0.024])
+>>> engine = CMEEngine(overrides=pipeline.fair_values())
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .config import EWMA_PARAMS, EWMAParams
+from .utils.ewma import RollingEWMA, PERIODS_PER_YEAR
+
+
+MANIFEST_FILE = 'manifest.json'
+STATE_FILE = 'fair_values.json'
+DTYPE = '<f8'
+
+
+def _parse_month(month: str) -> int:
+    """'YYYY-MM' -> months since year 0."""
+    year, mon = month.split('-')
+    if not 1 <= int(mon) <= 12:
+        raise ValueError(f"Invalid month: {month!r}")
+    return int(year) * 12 + int(mon) - 1
+
+
+def _format_month(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write JSON atomically (temp file + rename)."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+@dataclass(frozen=True)
+class SeriesInfo:
+    """Manifest entry of a stored series."""
+    name: str
+    start: str              # first observation, 'YYYY-MM'
+    length: int
+    frequency: str = 'monthly'
+    revision: int = 0       # bumped by write(); appends keep it
+
+    @property
+    def end(self) -> Optional[str]:
+        """Last observation, 'YYYY-MM' (None when empty)."""
+        if self.length == 0:
+            return None
+        step = 12 // PERIODS_PER_YEAR[self.frequency]
+        return _format_month(_parse_month(self.start) + (self.length - 1) * step)
+
+
+class TimeSeriesStore:
+    """
+    Columnar store of raw histories, one memory-mapped float64 file per series.
+
+    Series are named by dot paths (e.g. 'equity_us.caey') and hold evenly
+    spaced observations from a start month. ``manifest.json`` records each
+    series' start, frequency, length and revision; its length is
+    authoritative, so bytes from an interrupted append are ignored and
+    overwritten by the next one. Single writer; any number of readers.
+
+    Parameters
+    ----------
+    root : str
+        Directory holding the series files (created if missing).
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._manifest_path = os.path.join(root, MANIFEST_FILE)
+
+    def _manifest(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self._manifest_path):
+            return {}
+        with open(self._manifest_path) as f:
+            return json.load(f)
+
+    def _data_path(self, name: str) -> str:
+        return os.path.join(self.root, f"{name}.f8")
+
+    def names(self) -> List[str]:
+        """Names of all stored series."""
+        return sorted(self._manifest())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._manifest()
+
+    def info(self, name: str) -> SeriesInfo:
+        """Manifest entry of a series; KeyError if it is not stored."""
+        entry = self._manifest().get(name)
+        if entry is None:
+            raise KeyError(f"Unknown series: {name}")
+        return SeriesInfo(name=name, **entry)
+
+    def infos(self) -> Dict[str, SeriesInfo]:
+        """Manifest entries of all series, from a single manifest read."""
+        return {name: SeriesInfo(name=name, **entry) for name, entry in self._manifest().items()}
+
+    def read(self, series: Union[str, SeriesInfo]) -> np.ndarray:
+        """
+        The whole series as a read-only memory map (oldest to newest).
+
+        Pass a SeriesInfo from info()/infos() to read exactly that many
+        observations without re-reading the manifest.
+        """
+        info = series if isinstance(series, SeriesInfo) else self.info(series)
+        if info.length == 0:
+            return np.empty(0)
+        return np.memmap(self._data_path(info.name), dtype=DTYPE, mode='r', shape=(info.length,))
+
+    def write(self, name: str, values: Sequence[float], start: str, frequency: str = 'monthly') -> SeriesInfo:
+        """
+        Create or replace a series.
+
+        Parameters
+        ----------
+        name : str
+            Series name (dot path, no path separators).
+        values : sequence of float
+            Observations, oldest to newest.
+        start : str
+            Month of the first observation, 'YYYY-MM'.
+        frequency : str
+            'monthly', 'quarterly' or 'annual'.
+
+        Returns
+        -------
+        SeriesInfo
+            The new manifest entry (revision bumped).
+        """
+        if os.sep in name or name.startswith('.'):
+            raise ValueError(f"Invalid series name: {name!r}")
+        if frequency not in PERIODS_PER_YEAR:
+            raise ValueError(f"Unknown frequency: {frequency!r}")
+        _parse_month(start)
+        data = np.asarray(values, dtype=DTYPE)
+        with open(self._data_path(name), 'wb') as f:
+            f.write(data.tobytes())
+        manifest = self._manifest()
+        revision = manifest.get(name, {}).get('revision', -1) + 1
+        manifest[name] = {'start': start, 'length': len(data), 'frequency': frequency, 'revision': revision}
+        _write_json(self._manifest_path, manifest)
+        return SeriesInfo(name=name, **manifest[name])
+
+    def append(self, name: str, values: Sequence[float]) -> SeriesInfo:
+        """
+        Append observations to the end of a stored series.
+
+        Returns
+        -------
+        SeriesInfo
+            The updated manifest entry.
+        """
+        manifest = self._manifest()
+        if name not in manifest:
+            raise KeyError(f"Unknown series: {name}")
+        data = np.asarray(values, dtype=DTYPE)
+        entry = manifest[name]
+        with open(self._data_path(name), 'r+b') as f:
+            f.seek(entry['length'] * data.itemsize)
+            f.write(data.tobytes())
+            f.truncate()
+        entry['length'] += len(data)
+        _write_json(self._manifest_path, manifest)
+        return SeriesInfo(name=name, **entry)
+
+
+@dataclass(frozen=True)
+class FairValueSpec:
+    """A fair value derived as the EWMA of one stored series."""
+    target: str         # override path of the derived value
+    series: str         # stored history it is computed from
+    ewma_param: str     # key into EWMA_PARAMS
+
+
+FAIR_VALUE_SPECS: Tuple[FairValueSpec, ...] = (
+    FairValueSpec('bonds_global.fair_term_premium', 'bonds_global.term_premium', 'bond_term_premium'),
+    FairValueSpec('bonds_em.fair_term_premium', 'bonds_em.term_premium', 'bond_term_premium'),
+    FairValueSpec('bonds_hy.fair_credit_spread', 'bonds_hy.credit_spread', 'credit_spread'),
+    *(
+        FairValueSpec(f'{asset}.fair_caey', f'{asset}.caey', 'caey_fair_value')
+        for asset in ('equity_us', 'equity_europe', 'equity_japan', 'equity_em')
+    ),
+    *(
+        FairValueSpec(f'macro.{region}.productivity_growth', f'macro.{region}.productivity_growth', 'productivity_growth')
+        for region in ('us', 'eurozone', 'japan', 'em')
+    ),
+    *(
+        FairValueSpec(
+            f'macro.{region}.long_term_inflation', f'macro.{region}.headline_inflation',
+            'inflation_em' if region == 'em' else 'inflation_dm',
+        )
+        for region in ('us', 'eurozone', 'japan', 'em')
+    ),
+)
+
+
+class FairValuePipeline:
+    """
+    Derives fair values from a TimeSeriesStore with incremental EWMAs.
+
+    Each spec's RollingEWMA state (without its window buffer, which is
+    re-read from the store), the number of observations it has consumed
+    and the series revision are saved in ``fair_values.json`` in the store
+    directory. ``update()`` feeds only the observations appended since the
+    last run; a rewritten series or changed EWMA parameters trigger a
+    rebuild of that spec from the last window of its history.
+
+    Parameters
+    ----------
+    store : TimeSeriesStore
+        Source of the raw histories.
+    specs : sequence of FairValueSpec, optional
+        Fair values to derive (default FAIR_VALUE_SPECS). Specs whose
+        series is not in the store are skipped.
+    ewma_params : mapping, optional
+        EWMA parameters by name (default config.EWMA_PARAMS).
+    """
+
+    def __init__(
+        self,
+        store: TimeSeriesStore,
+        specs: Sequence[FairValueSpec] = FAIR_VALUE_SPECS,
+        ewma_params: Optional[Mapping[str, EWMAParams]] = None,
+    ):
+        self.store = store
+        self.specs = tuple(specs)
+        self.ewma_params = ewma_params if ewma_params is not None else EWMA_PARAMS
+        self._state_path = os.path.join(store.root, STATE_FILE)
+        self.last_update_points: Dict[str, int] = {}
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self._state_path):
+            return {}
+        with open(self._state_path) as f:
+            return json.load(f)
+
+    def _rebuild(self, history: np.ndarray, info: SeriesInfo, params: EWMAParams) -> Tuple[RollingEWMA, int]:
+        rolling = RollingEWMA(params.half_life_years, params.window_years, info.frequency)
+        # Only the last window can carry weight in a windowed EWMA
+        first = 0 if rolling.window is None else max(0, info.length - rolling.window)
+        for value in history[first:].tolist():
+            rolling.update(value)
+        return rolling, info.length - first
+
+    def update(self) -> Dict[str, float]:
+        """
+        Bring every fair value up to date with the store and save the state.
+
+        Returns
+        -------
+        dict
+            Fair value by override path (specs with a non-empty series only).
+        """
+        state = self._load_state()
+        infos = self.store.infos()
+        values: Dict[str, float] = {}
+        self.last_update_points = {}
+        for spec in self.specs:
+            info = infos.get(spec.series)
+            if info is None:
+                continue
+            history = self.store.read(info)
+            params = self.ewma_params[spec.ewma_param]
+            saved = state.get(spec.target)
+            settings = [spec.series, info.revision, params.window_years, params.half_life_years, info.frequency]
+            if saved is not None and saved['settings'] == settings and saved['consumed'] <= info.length:
+                consumed, ewma_state = saved['consumed'], saved['ewma']
+                # The window buffer is not saved; it is the stored tail
+                buffer = []
+                if params.window_years is not None:
+                    in_window = min(ewma_state['count'], params.window_years * PERIODS_PER_YEAR[info.frequency])
+                    buffer = history[consumed - in_window:consumed].tolist()
+                rolling = RollingEWMA.from_state({**ewma_state, 'buffer': buffer})
+                for value in history[consumed:].tolist():
+                    rolling.update(value)
+                fed = info.length - consumed
+            else:
+                rolling, fed = self._rebuild(history, info, params)
+            self.last_update_points[spec.target] = fed
+            if rolling.count == 0:
+                state.pop(spec.target, None)
+                continue
+            values[spec.target] = rolling.value
+            state[spec.target] = {
+                'settings': settings,
+                'consumed': info.length,
+                'as_of': info.end,
+                'ewma': {k: v for k, v in rolling.to_state().items() if k != 'buffer'},
+                'value': rolling.value,
+            }
+        _write_json(self._state_path, state)
+        return values
+
+    def rebuild(self) -> Dict[str, float]:
+        """Discard the saved EWMA states and recompute every fair value."""
+        if os.path.exists(self._state_path):
+            os.remove(self._state_path)
+        return self.update()
+
+    def fair_values(self) -> Dict[str, Any]:
+        """
+        Up-to-date fair values as a nested CMEEngine overrides dict.
+
+        Returns
+        -------
+        dict
+            e.g. {'equity_us': {'fair_caey': 0.043}, 'macro': {'us': {...}}}.
+        """
+        overrides: Dict[str, Any] = {}
+        for path, value in self.update().items():
+            *parents, key = path.split('.')
+            node = overrides
+            for part in parents:
+                node = node.setdefault(part, {})
+            node[key] = value
+        return overrides
@@ -2,7 +2,16 @@
 Inputs package for managing default assumptions and user overrides.
 """
 
-from .defaults import DefaultInputs
-from .overrides import OverrideManager
+from .defaults import DefaultInputs, DefaultsSnapshot, get_defaults_snapshot, invalidate_defaults_snapshot
+from .overrides import OverrideManager, known_override_paths, validate_override_paths, validate_overrides
 
-__all__ = ['DefaultInputs', 'OverrideManager']
+__all__ = [
+    'DefaultInputs',
+    'DefaultsSnapshot',
+    'get_defaults_snapshot',
+    'invalidate_defaults_snapshot',
+    'OverrideManager',
+    'known_override_paths',
+    'validate_override_paths',
+    'validate_overrides',
+]
@@ -2,10 +2,16 @@
 Default input values based on Research Affiliates methodology.
 
 This module provides the default assumptions used when no override is specified.
+The config tables are frozen into a versioned DefaultsSnapshot that is built
+once per (defaults version, equity model) and shared read-only by every
+DefaultInputs / OverrideManager / engine instance.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Mapping, Tuple
 from copy import deepcopy
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+import threading
 
 from ..config import (
     DEFAULT_MARKET_DATA,
@@ -24,12 +30,146 @@ from ..config import (
 )
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy read-only mappings back into plain dicts."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    return deepcopy(value)
+
+
+@dataclass(frozen=True)
+class DefaultsSnapshot:
+    """
+    Immutable view of all default tables for one defaults version.
+
+    Tables are MappingProxyType objects (nested all the way down), so a
+    snapshot can be shared across engines and threads without copying.
+    Use thaw() to get a mutable copy.
+    """
+    version: int
+    equity_model_type: str
+    macro_data: Mapping[str, Mapping[str, Any]]
+    asset_data: Mapping[AssetClass, Mapping[str, Any]]
+    credit_params: Mapping[str, Mapping[str, float]]
+    ewma_params: Mapping[str, Any]
+    mean_reversion: Mapping[str, Any]
+    inflation_params: Mapping[str, float]
+    tbill_params: Mapping[str, Any]
+    bond_params: Mapping[str, Any]
+    equity_params: Mapping[str, Any]
+    hedge_fund_params: Mapping[str, Any]
+
+    @classmethod
+    def build(cls, equity_model_type: str = 'ra', version: int = 0) -> "DefaultsSnapshot":
+        """
+        Build a snapshot from the config tables.
+
+        Parameters
+        ----------
+        equity_model_type : str
+            'ra' for Research Affiliates defaults, 'gk' for Grinold-Kroner.
+            When 'gk', equity asset classes use DEFAULT_ASSET_DATA_GK overlays.
+        version : int
+            Defaults version this snapshot represents.
+
+        Returns
+        -------
+        DefaultsSnapshot
+            Frozen defaults.
+        """
+        asset_data = deepcopy(DEFAULT_ASSET_DATA)
+        # Overlay GK-specific equity defaults when using GK model
+        if equity_model_type == 'gk':
+            for asset_class, gk_defaults in DEFAULT_ASSET_DATA_GK.items():
+                if asset_class in asset_data:
+                    asset_data[asset_class].update(deepcopy(gk_defaults))
+
+        return cls(
+            version=version,
+            equity_model_type=equity_model_type,
+            macro_data=_freeze(deepcopy(DEFAULT_MARKET_DATA)),
+            asset_data=_freeze(asset_data),
+            credit_params=_freeze(deepcopy(CREDIT_PARAMS)),
+            ewma_params=MappingProxyType({k: replace(v) for k, v in EWMA_PARAMS.items()}),
+            mean_reversion=_freeze(deepcopy(MEAN_REVERSION_PARAMS)),
+            inflation_params=_freeze(deepcopy(INFLATION_PARAMS)),
+            tbill_params=_freeze(deepcopy(TBILL_PARAMS)),
+            bond_params=_freeze(deepcopy(BOND_PARAMS)),
+            equity_params=_freeze(deepcopy(EQUITY_PARAMS)),
+            hedge_fund_params=_freeze(deepcopy(HEDGE_FUND_PARAMS)),
+        )
+
+
+_snapshot_lock = threading.Lock()
+_snapshot_version = 0
+_snapshots: Dict[Tuple[int, str], DefaultsSnapshot] = {}
+
+
+def defaults_version() -> int:
+    """Current defaults version (bumped by invalidate_defaults_snapshot)."""
+    return _snapshot_version
+
+
+def get_defaults_snapshot(equity_model_type: str = 'ra') -> DefaultsSnapshot:
+    """
+    Get the shared snapshot for the current defaults version.
+
+    Parameters
+    ----------
+    equity_model_type : str
+        'ra' or 'gk'.
+
+    Returns
+    -------
+    DefaultsSnapshot
+        Shared, read-only defaults.
+    """
+    model_key = 'gk' if equity_model_type == 'gk' else 'ra'
+    key = (_snapshot_version, model_key)
+    snapshot = _snapshots.get(key)
+    if snapshot is None:
+        with _snapshot_lock:
+            key = (_snapshot_version, model_key)
+            snapshot = _snapshots.get(key)
+            if snapshot is None:
+                snapshot = DefaultsSnapshot.build(model_key, version=_snapshot_version)
+                _snapshots[key] = snapshot
+    return snapshot
+
+
+def invalidate_defaults_snapshot() -> int:
+    """
+    Bump the defaults version so the next engine rebuilds its snapshot.
+
+    Call after mutating the config default tables at runtime. Engines that
+    already hold the previous snapshot keep using it.
+
+    Returns
+    -------
+    int
+        The new defaults version.
+    """
+    global _snapshot_version
+    with _snapshot_lock:
+        _snapshot_version += 1
+        _snapshots.clear()
+        return _snapshot_version
+
+
 class DefaultInputs:
     """
     Manages default input values for all models.
 
     This class provides a centralized way to access default assumptions
-    based on the Research Affiliates methodology.
+    based on the Research Affiliates methodology. Getters return read-only
+    views of the shared DefaultsSnapshot; use thaw() for a mutable copy.
     """
 
     @classmethod
@@ -70,23 +210,20 @@ class DefaultInputs:
             'ra' for Research Affiliates defaults, 'gk' for Grinold-Kroner.
             When 'gk', equity asset classes use DEFAULT_ASSET_DATA_GK overlays.
         """
-        self._macro_data = deepcopy(DEFAULT_MARKET_DATA)
-        self._asset_data = deepcopy(DEFAULT_ASSET_DATA)
-        # Overlay GK-specific equity defaults when using GK model
-        if equity_model_type == 'gk':
-            for asset_class, gk_defaults in DEFAULT_ASSET_DATA_GK.items():
-                if asset_class in self._asset_data:
-                    self._asset_data[asset_class].update(deepcopy(gk_defaults))
-        self._credit_params = deepcopy(CREDIT_PARAMS)
-        self._ewma_params = deepcopy(EWMA_PARAMS)
-        self._mean_reversion = deepcopy(MEAN_REVERSION_PARAMS)
-        self._inflation_params = deepcopy(INFLATION_PARAMS)
-        self._tbill_params = deepcopy(TBILL_PARAMS)
-        self._bond_params = deepcopy(BOND_PARAMS)
-        self._equity_params = deepcopy(EQUITY_PARAMS)
-        self._hedge_fund_params = deepcopy(HEDGE_FUND_PARAMS)
-
-    def get_macro_inputs(self, region: str) -> Dict[str, Any]:
+        snapshot = get_defaults_snapshot(equity_model_type)
+        self.snapshot = snapshot
+        self._macro_data = snapshot.macro_data
+        self._asset_data = snapshot.asset_data
+        self._credit_params = snapshot.credit_params
+        self._ewma_params = snapshot.ewma_params
+        self._mean_reversion = snapshot.mean_reversion
+        self._inflation_params = snapshot.inflation_params
+        self._tbill_params = snapshot.tbill_params
+        self._bond_params = snapshot.bond_params
+        self._equity_params = snapshot.equity_params
+        self._hedge_fund_params = snapshot.hedge_fund_params
+
+    def get_macro_inputs(self, region: str) -> Mapping[str, Any]:
         """
         Get macroeconomic inputs for a region.
 
@@ -98,14 +235,14 @@ class DefaultInputs:
         Returns
         -------
         dict
-            Macro inputs for the region.
+            Read-only macro inputs for the region.
         """
         region_key = region.lower()
         if region_key not in self._macro_data:
             raise ValueError(f"Unknown region: {region}. Valid: {list(self._macro_data.keys())}")
-        return deepcopy(self._macro_data[region_key])
+        return self._macro_data[region_key]
 
-    def get_asset_inputs(self, asset_class: AssetClass) -> Dict[str, Any]:
+    def get_asset_inputs(self, asset_class: AssetClass) -> Mapping[str, Any]:
         """
         Get default inputs for an asset class.
 
@@ -117,13 +254,13 @@ class DefaultInputs:
         Returns
         -------
         dict
-            Default inputs for the asset class.
+            Read-only default inputs for the asset class.
         """
         if asset_class not in self._asset_data:
             raise ValueError(f"Unknown asset class: {asset_class}")
-        return deepcopy(self._asset_data[asset_class])
+        return self._asset_data[asset_class]
 
-    def get_credit_params(self, credit_type: str) -> Dict[str, float]:
+    def get_credit_params(self, credit_type: str) -> Mapping[str, float]:
         """
         Get credit parameters for a credit type.
 
@@ -139,7 +276,7 @@ class DefaultInputs:
         """
         if credit_type not in self._credit_params:
             raise ValueError(f"Unknown credit type: {credit_type}")
-        return deepcopy(self._credit_params[credit_type])
+        return self._credit_params[credit_type]
 
     def get_ewma_params(self, param_type: str) -> Dict[str, Any]:
         """
@@ -163,29 +300,29 @@ class DefaultInputs:
             'half_life_years': params.half_life_years,
         }
 
-    def get_mean_reversion_params(self) -> Dict[str, Any]:
+    def get_mean_reversion_params(self) -> Mapping[str, Any]:
         """Get mean reversion parameters."""
-        return deepcopy(self._mean_reversion)
+        return self._mean_reversion
 
-    def get_inflation_params(self) -> Dict[str, float]:
+    def get_inflation_params(self) -> Mapping[str, float]:
         """Get inflation model parameters."""
-        return deepcopy(self._inflation_params)
+        return self._inflation_params
 
-    def get_tbill_params(self) -> Dict[str, Any]:
+    def get_tbill_params(self) -> Mapping[str, Any]:
         """Get T-Bill model parameters."""
-        return deepcopy(self._tbill_params)
+        return self._tbill_params
 
-    def get_bond_params(self) -> Dict[str, Any]:
+    def get_bond_params(self) -> Mapping[str, Any]:
         """Get bond model parameters."""
-        return deepcopy(self._bond_params)
+        return self._bond_params
 
-    def get_equity_params(self) -> Dict[str, Any]:
+    def get_equity_params(self) -> Mapping[str, Any]:
         """Get equity model parameters."""
-        return deepcopy(self._equity_params)
+        return self._equity_params
 
-    def get_hedge_fund_params(self) -> Dict[str, Any]:
+    def get_hedge_fund_params(self) -> Mapping[str, Any]:
         """Get hedge fund model parameters."""
-        return deepcopy(self._hedge_fund_params)
+        return self._hedge_fund_params
 
     def get_all_defaults(self) -> Dict[str, Any]:
         """
@@ -197,15 +334,15 @@ class DefaultInputs:
             Complete default configuration.
         """
         return {
-            'macro': deepcopy(self._macro_data),
-            'assets': {k.value: v for k, v in self._asset_data.items()},
-            'credit': deepcopy(self._credit_params),
+            'macro': thaw(self._macro_data),
+            'assets': {k.value: thaw(v) for k, v in self._asset_data.items()},
+            'credit': thaw(self._credit_params),
             'ewma': {k: {'window_years': v.window_years, 'half_life_years': v.half_life_years}
                      for k, v in self._ewma_params.items()},
-            'mean_reversion': deepcopy(self._mean_reversion),
-            'inflation': deepcopy(self._inflation_params),
-            'tbill': deepcopy(self._tbill_params),
-            'bond': deepcopy(self._bond_params),
-            'equity': deepcopy(self._equity_params),
-            'hedge_fund': deepcopy(self._hedge_fund_params),
+            'mean_reversion': thaw(self._mean_reversion),
+            'inflation': thaw(self._inflation_params),
+            'tbill': thaw(self._tbill_params),
+            'bond': thaw(self._bond_params),
+            'equity': thaw(self._equity_params),
+            'hedge_fund': thaw(self._hedge_fund_params),
         }
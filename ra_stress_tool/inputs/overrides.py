@@ -5,13 +5,25 @@ This module handles the merging of user overrides with default values,
 tracking which values come from defaults vs overrides.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Tuple, Mapping
 from copy import deepcopy
 from dataclasses import dataclass
 from enum import Enum
 
-from .defaults import DefaultInputs
+from .defaults import DefaultInputs, get_defaults_snapshot, thaw
 from ..config import AssetClass
+from ..utils.dual import Dual
+
+
+# Macro inputs without a default value: the macro model reads them only as
+# overrides (direct forecasts, long-run anchors and adjustments)
+MACRO_OVERRIDE_KEYS = (
+    'rgdp_growth', 'rgdp_adjustment',
+    'inflation_forecast', 'long_term_inflation', 'inflation_adjustment',
+    'tbill_forecast', 'country_factor',
+)
+
+_known_paths: Dict[Tuple[int, str], FrozenSet[str]] = {}
 
 
 class InputSource(Enum):
@@ -45,7 +57,13 @@ class OverrideManager:
     defaults or user overrides.
     """
 
-    def __init__(self, overrides: Optional[Dict[str, Any]] = None, equity_model_type: str = 'ra'):
+    def __init__(
+        self,
+        overrides: Optional[Dict[str, Any]] = None,
+        equity_model_type: str = 'ra',
+        track_derivatives: bool = False,
+        tracking: bool = True,
+    ):
         """
         Initialize the override manager.
 
@@ -66,10 +84,23 @@ class OverrideManager:
         equity_model_type : str, optional
             Equity model type ('ra' or 'gk'). Passed to DefaultInputs to
             select the correct equity defaults.
+        track_derivatives : bool, optional
+            If True, every numeric input handed out is a Dual seeded with
+            its own override path, so model outputs carry d(output)/d(input).
+        tracking : bool, optional
+            If False, the models skip building their ``components`` and
+            ``sources`` breakdowns and only produce headline numbers.
         """
         self._defaults = DefaultInputs(equity_model_type=equity_model_type)
         self._overrides = overrides or {}
-        self._value_cache: Dict[str, TrackedValue] = {}
+        self.track_derivatives = track_derivatives
+        self.tracking = tracking
+
+        # Flat index of every override node keyed by its path tuple, e.g.
+        # ('macro', 'us', 'inflation_forecast') -> 0.025 and ('macro', 'us') -> {...}.
+        # Kept in sync by set_override/set_overrides; mutate overrides through those.
+        self._index: Dict[Tuple[str, ...], Any] = {}
+        self._index_subtree((), self._overrides)
 
     def set_override(self, path: str, value: Any) -> None:
         """
@@ -84,15 +115,21 @@ class OverrideManager:
         """
         parts = path.split('.')
         current = self._overrides
+        prefix: Tuple[str, ...] = ()
 
         for part in parts[:-1]:
+            prefix += (part,)
             if part not in current:
                 current[part] = {}
+                self._index[prefix] = current[part]
             current = current[part]
 
+        # Re-index only the replaced subtree
+        key = tuple(parts)
+        if parts[-1] in current:
+            self._unindex_subtree(key, current[parts[-1]])
         current[parts[-1]] = value
-        # Invalidate cache
-        self._value_cache.clear()
+        self._index_subtree(key, value)
 
     def set_overrides(self, overrides: Dict[str, Any]) -> None:
         """
@@ -101,15 +138,55 @@ class OverrideManager:
         Parameters
         ----------
         overrides : dict
-            Override dictionary to merge in.
+            Override dictionary to merge in. A None value removes the
+            override at its path, restoring the default.
         """
-        self._merge_dict(self._overrides, overrides)
-        self._value_cache.clear()
+        self._merge_overrides(self._overrides, overrides, ())
 
     def clear_overrides(self) -> None:
         """Clear all overrides."""
         self._overrides = {}
-        self._value_cache.clear()
+        self._index = {(): self._overrides}
+
+    def _index_subtree(self, prefix: Tuple[str, ...], value: Any) -> None:
+        """Add a node and all of its descendants to the flat index."""
+        self._index[prefix] = value
+        if isinstance(value, dict):
+            for key, child in value.items():
+                self._index_subtree(prefix + (key,), child)
+
+    def _unindex_subtree(self, prefix: Tuple[str, ...], value: Any) -> None:
+        """Remove a node and all of its descendants from the flat index."""
+        self._index.pop(prefix, None)
+        if isinstance(value, dict):
+            for key, child in value.items():
+                self._unindex_subtree(prefix + (key,), child)
+
+    def _merge_overrides(self, base: Dict, updates: Dict, prefix: Tuple[str, ...]) -> None:
+        """
+        Recursively merge updates into the overrides, re-indexing replaced nodes.
+
+        A None value removes the override at its path (with everything below
+        it); dictionaries emptied by removals are removed as well.
+        """
+        for key, value in updates.items():
+            path = prefix + (key,)
+            if value is None:
+                if key in base:
+                    self._unindex_subtree(path, base.pop(key))
+            elif isinstance(value, dict):
+                if not isinstance(base.get(key), dict):
+                    if key in base:
+                        self._unindex_subtree(path, base[key])
+                    base[key] = self._index[path] = {}
+                self._merge_overrides(base[key], value, path)
+                if value and not base[key]:
+                    self._unindex_subtree(path, base.pop(key))
+            else:
+                if key in base:
+                    self._unindex_subtree(path, base[key])
+                base[key] = value
+                self._index_subtree(path, value)
 
     def _merge_dict(self, base: Dict, updates: Dict) -> None:
         """Recursively merge updates into base dictionary."""
@@ -128,13 +205,33 @@ class OverrideManager:
         tuple
             (value, found) where found is True if override exists.
         """
-        current = self._overrides
-        for part in path_parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None, False
-        return current, True
+        try:
+            return self._index[path_parts], True
+        except KeyError:
+            return None, False
+
+    def track(self, value: Any, *path_parts: str) -> Any:
+        """
+        Seed a numeric input for derivative tracking.
+
+        Returns ``value`` unchanged unless track_derivatives is on, in which
+        case numbers become Dual(value, {path: 1}) and mappings are seeded
+        leaf by leaf.
+
+        Parameters
+        ----------
+        value : Any
+            Input value.
+        *path_parts : str
+            Override path of the value, e.g. ('macro', 'us', 'current_tbill').
+        """
+        if not self.track_derivatives:
+            return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return Dual.seed(value, '.'.join(path_parts))
+        if isinstance(value, Mapping):
+            return {k: self.track(v, *path_parts, k) for k, v in value.items()}
+        return value
 
     def has_override(self, path: str) -> bool:
         """
@@ -150,9 +247,7 @@ class OverrideManager:
         bool
             True if an override exists at this path.
         """
-        parts = path.split('.')
-        _, found = self._get_override_value(*parts)
-        return found
+        return tuple(path.split('.')) in self._index
 
     def get_macro_inputs(self, region: str) -> Dict[str, TrackedValue]:
         """
@@ -170,13 +265,14 @@ class OverrideManager:
         """
         defaults = self._defaults.get_macro_inputs(region)
         result = {}
+        region = region.lower()
 
         for key, default_value in defaults.items():
-            override_value, found = self._get_override_value('macro', region.lower(), key)
+            override_value, found = self._get_override_value('macro', region, key)
             if found:
-                result[key] = TrackedValue(override_value, InputSource.OVERRIDE)
+                result[key] = TrackedValue(self.track(override_value, 'macro', region, key), InputSource.OVERRIDE)
             else:
-                result[key] = TrackedValue(default_value, InputSource.DEFAULT)
+                result[key] = TrackedValue(self.track(default_value, 'macro', region, key), InputSource.DEFAULT)
 
         return result
 
@@ -202,15 +298,16 @@ class OverrideManager:
         for key, default_value in defaults.items():
             override_value, found = self._get_override_value(asset_key, key)
             if found:
-                if isinstance(default_value, dict) and isinstance(override_value, dict):
-                    # Merge nested overrides with nested defaults (used by regime-based assets)
-                    merged = deepcopy(default_value)
+                if isinstance(default_value, Mapping) and isinstance(override_value, dict):
+                    # Merge nested overrides with nested defaults (used by regime-based assets);
+                    # the shared read-only defaults are copied only here
+                    merged = thaw(default_value)
                     self._merge_dict(merged, override_value)
-                    result[key] = TrackedValue(merged, InputSource.OVERRIDE)
+                    result[key] = TrackedValue(self.track(merged, asset_key, key), InputSource.OVERRIDE)
                 else:
-                    result[key] = TrackedValue(override_value, InputSource.OVERRIDE)
+                    result[key] = TrackedValue(self.track(override_value, asset_key, key), InputSource.OVERRIDE)
             else:
-                result[key] = TrackedValue(default_value, InputSource.DEFAULT)
+                result[key] = TrackedValue(self.track(default_value, asset_key, key), InputSource.DEFAULT)
 
         return result
 
@@ -234,9 +331,9 @@ class OverrideManager:
         for key, default_value in defaults.items():
             override_value, found = self._get_override_value('credit', credit_type, key)
             if found:
-                result[key] = TrackedValue(override_value, InputSource.OVERRIDE)
+                result[key] = TrackedValue(self.track(override_value, 'credit', credit_type, key), InputSource.OVERRIDE)
             else:
-                result[key] = TrackedValue(default_value, InputSource.DEFAULT)
+                result[key] = TrackedValue(self.track(default_value, 'credit', credit_type, key), InputSource.DEFAULT)
 
         return result
 
@@ -276,36 +373,36 @@ class OverrideManager:
         # Check override
         override_value, found = self._get_override_value(*path_parts)
         if found:
-            return TrackedValue(override_value, InputSource.OVERRIDE)
+            return TrackedValue(self.track(override_value, *path_parts), InputSource.OVERRIDE)
 
         # Return default
-        return TrackedValue(default, InputSource.DEFAULT)
+        return TrackedValue(self.track(default, *path_parts), InputSource.DEFAULT)
 
     def get_ewma_params(self, param_type: str) -> Dict[str, Any]:
         """Get EWMA parameters (rarely overridden)."""
         return self._defaults.get_ewma_params(param_type)
 
-    def get_mean_reversion_params(self) -> Dict[str, Any]:
+    def get_mean_reversion_params(self) -> Mapping[str, Any]:
         """Get mean reversion parameters."""
         return self._defaults.get_mean_reversion_params()
 
-    def get_inflation_params(self) -> Dict[str, float]:
+    def get_inflation_params(self) -> Mapping[str, float]:
         """Get inflation model parameters."""
         return self._defaults.get_inflation_params()
 
-    def get_tbill_params(self) -> Dict[str, Any]:
+    def get_tbill_params(self) -> Mapping[str, Any]:
         """Get T-Bill model parameters."""
         return self._defaults.get_tbill_params()
 
-    def get_bond_params(self) -> Dict[str, Any]:
+    def get_bond_params(self) -> Mapping[str, Any]:
         """Get bond model parameters."""
         return self._defaults.get_bond_params()
 
-    def get_equity_params(self) -> Dict[str, Any]:
+    def get_equity_params(self) -> Mapping[str, Any]:
         """Get equity model parameters."""
         return self._defaults.get_equity_params()
 
-    def get_hedge_fund_params(self) -> Dict[str, Any]:
+    def get_hedge_fund_params(self) -> Mapping[str, Any]:
         """Get hedge fund model parameters."""
         return self._defaults.get_hedge_fund_params()
 
@@ -381,3 +478,124 @@ def extract_sources(tracked_dict: Dict[str, TrackedValue]) -> Dict[str, str]:
         Dictionary mapping keys to source strings.
     """
     return {key: tv.source.value for key, tv in tracked_dict.items()}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def known_override_paths(equity_model_type: str = 'ra') -> FrozenSet[str]:
+    """
+    Every numeric input path the engine reads from the overrides.
+
+    Covers the macro inputs of each region (defaults plus
+    MACRO_OVERRIDE_KEYS) and the numeric asset class inputs, including the
+    per-regime inflation-linked inputs, e.g. 'macro.us.current_tbill',
+    'equity_us.current_caey', 'inflation_linked.usd.current_real_yield'.
+
+    Parameters
+    ----------
+    equity_model_type : str
+        'ra' or 'gk'.
+
+    Returns
+    -------
+    frozenset of str
+        Dot-separated override paths.
+    """
+    snapshot = get_defaults_snapshot(equity_model_type)
+    key = (snapshot.version, snapshot.equity_model_type)
+    paths = _known_paths.get(key)
+    if paths is None:
+        found = set()
+        for region, inputs in snapshot.macro_data.items():
+            found.update(f"macro.{region}.{k}" for k, v in inputs.items() if _is_number(v))
+            found.update(f"macro.{region}.{k}" for k in MACRO_OVERRIDE_KEYS)
+        for asset_class, inputs in snapshot.asset_data.items():
+            for k, v in inputs.items():
+                if _is_number(v):
+                    found.add(f"{asset_class.value}.{k}")
+                elif isinstance(v, Mapping):
+                    found.update(
+                        f"{asset_class.value}.{k}.{leaf}" for leaf, x in v.items() if _is_number(x)
+                    )
+        paths = _known_paths[key] = frozenset(found)
+    return paths
+
+
+def override_leaf_paths(overrides: Mapping[str, Any], prefix: str = '') -> List[Tuple[str, Any]]:
+    """
+    Flatten a nested override dictionary into (dot path, leaf value) pairs.
+
+    Parameters
+    ----------
+    overrides : dict
+        Nested override dictionary.
+    prefix : str, optional
+        Path of ``overrides`` itself.
+
+    Returns
+    -------
+    list of tuple
+        (path, value) for every non-dict value.
+    """
+    leaves = []
+    for key, value in (overrides or {}).items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, Mapping):
+            leaves.extend(override_leaf_paths(value, path))
+        else:
+            leaves.append((path, value))
+    return leaves
+
+
+def validate_override_paths(paths: Iterable[str], equity_model_type: str = 'ra') -> None:
+    """
+    Check that every path is an input the engine reads.
+
+    Parameters
+    ----------
+    paths : iterable of str
+        Dot-separated override paths.
+    equity_model_type : str
+        'ra' or 'gk'.
+
+    Raises
+    ------
+    ValueError
+        Naming the unknown paths.
+    """
+    known = known_override_paths(equity_model_type)
+    unknown = [path for path in paths if path not in known]
+    if unknown:
+        raise ValueError(f"Unknown override path(s): {', '.join(repr(p) for p in unknown)}")
+
+
+def validate_overrides(overrides: Mapping[str, Any], equity_model_type: str = 'ra') -> None:
+    """
+    Check a nested override dictionary: known paths with numeric values.
+
+    None removes an override (see OverrideManager.set_overrides); it is
+    accepted on a known path or on a parent of one, e.g. 'macro.japan'.
+
+    Parameters
+    ----------
+    overrides : dict
+        Nested override dictionary.
+    equity_model_type : str
+        'ra' or 'gk'.
+
+    Raises
+    ------
+    ValueError
+        On an unknown path or a non-numeric value.
+    """
+    leaves = override_leaf_paths(overrides)
+    validate_override_paths((path for path, value in leaves if value is not None), equity_model_type)
+    known = known_override_paths(equity_model_type)
+    for path, value in leaves:
+        if value is None:
+            if path not in known and not any(k.startswith(path + '.') for k in known):
+                raise ValueError(f"Unknown override path(s): {path!r}")
+        elif not _is_number(value):
+            raise ValueError(f"Override {path!r} must be a number, got {value!r}")
@@ -5,17 +5,25 @@ This module provides the primary interface for computing capital market
 expectations across all asset classes, with support for user overrides.
 """
 
-from typing import Dict, Any, Optional
+import copy
+from typing import Dict, Any, Optional, List, Sequence, Set, Tuple
 from dataclasses import dataclass
 
 from .inputs.overrides import OverrideManager
-from .models.macro import MacroModel, compute_global_rgdp_growth
+from .context import EvaluationContext
+from .utils.dual import gradient, strip_duals
+from .models.macro import MacroModel, weighted_global_rgdp_growth
 from .models.bonds import GovernmentBondModel, HighYieldBondModel, EMBondModel, InflationLinkedBondModel
 from .models.equities import EquityModel, EquityModelGK, EquityRegion
 from .models.alternatives import HedgeFundModel
-from .models.currency import FXModel
-from .output import CMEResults, AssetClassResult, MacroDependency, format_results_table, format_comparison_table
+from .models.currency import FXModel, FXMatrix
+from .output import CMEResults, AssetClassResult, MacroDependency, RecomputeReport, format_results_table, format_comparison_table
 from .config import AssetClass, BaseCurrency, ASSET_LOCAL_CURRENCY, CURRENCY_TO_MACRO_REGION
+from .batch import BatchCMEEngine, TermStructure, TERM_STRUCTURE_HORIZONS
+
+
+# Result detail levels, from cheapest to most complete (see CMEEngine)
+DETAIL_LEVELS = ('headline', 'components', 'full')
 
 
 class CMEEngine:
@@ -41,11 +49,31 @@ class CMEEngine:
         AssetClass.ABSOLUTE_RETURN: "Absolute Return (HF)",
     }
 
+    MACRO_REGIONS = ['us', 'eurozone', 'japan', 'em']
+
+    # Top-level override keys that feed asset results directly (besides macro).
+    # Equity US also drives the hedge fund market factor premium.
+    OVERRIDE_DEPENDENTS = {
+        'liquidity': [AssetClass.LIQUIDITY],
+        'bonds_global': [AssetClass.BONDS_GLOBAL],
+        'bonds_hy': [AssetClass.BONDS_HY],
+        'bonds_em': [AssetClass.BONDS_EM],
+        'inflation_linked': [AssetClass.INFLATION_LINKED],
+        'equity_us': [AssetClass.EQUITY_US, AssetClass.ABSOLUTE_RETURN],
+        'equity_europe': [AssetClass.EQUITY_EUROPE],
+        'equity_japan': [AssetClass.EQUITY_JAPAN],
+        'equity_em': [AssetClass.EQUITY_EM],
+        'absolute_return': [AssetClass.ABSOLUTE_RETURN],
+    }
+
     def __init__(
         self,
         overrides: Optional[Dict[str, Any]] = None,
         base_currency: str = 'usd',
         equity_model_type: str = 'ra',
+        track_derivatives: bool = False,
+        tracking: bool = True,
+        detail: str = 'full',
     ):
         """
         Initialize the CME engine.
@@ -58,47 +86,234 @@ class CMEEngine:
             Base currency for return calculations ('usd' or 'eur'). Default is 'usd'.
         equity_model_type : str, optional
             Equity model to use: 'ra' (Research Affiliates) or 'gk' (Grinold-Kroner).
+        track_derivatives : bool, optional
+            Carry dual numbers through the models so results can report
+            sensitivities. Usually left False; compute_all_returns builds a
+            tracking engine on demand when with_sensitivities=True.
+        tracking : bool, optional
+            Build the components, inputs_used and macro_dependencies
+            breakdowns for each asset class. Pass False when only headline
+            returns are needed (comparisons, stress tests); results then
+            carry empty breakdowns. Same as detail='headline'.
+        detail : str, optional
+            How much of each result to build: 'headline' (returns only),
+            'components' (returns and return components) or 'full' (also
+            inputs_used and macro_dependencies). Default is 'full'.
         """
-        self.override_manager = OverrideManager(overrides, equity_model_type=equity_model_type)
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"detail must be one of {list(DETAIL_LEVELS)}")
+        if not tracking:
+            detail = 'headline'
+        self.detail = detail
+        self.tracking = detail != 'headline'
+        self.override_manager = OverrideManager(
+            overrides,
+            equity_model_type=equity_model_type,
+            track_derivatives=track_derivatives,
+            tracking=self.tracking,
+        )
         self.base_currency = BaseCurrency(base_currency.lower())
         self.equity_model_type = equity_model_type
 
+        # Shared intermediates (macro sources, resolved inputs, equity
+        # forecasts), valid until the overrides change
+        self.context = EvaluationContext()
+
         # Initialize models
-        self.macro_model = MacroModel(self.override_manager)
-        self.equity_model = EquityModel(self.override_manager)
-        self.equity_model_gk = EquityModelGK(self.override_manager) if equity_model_type == 'gk' else None
-        self.gov_bond_model = GovernmentBondModel(self.override_manager)
-        self.hy_bond_model = HighYieldBondModel(self.override_manager)
-        self.em_bond_model = EMBondModel(self.override_manager)
-        self.inflation_linked_model = InflationLinkedBondModel(self.override_manager)
-        self.hf_model = HedgeFundModel(self.override_manager)
-        self.fx_model = FXModel(self.override_manager)
+        om, ctx = self.override_manager, self.context
+        self.macro_model = MacroModel(om, ctx)
+        self.equity_model = EquityModel(om, ctx)
+        self.equity_model_gk = EquityModelGK(om, ctx) if equity_model_type == 'gk' else None
+        self.gov_bond_model = GovernmentBondModel(om, ctx)
+        self.hy_bond_model = HighYieldBondModel(om, ctx)
+        self.em_bond_model = EMBondModel(om, ctx)
+        self.inflation_linked_model = InflationLinkedBondModel(om, ctx)
+        self.hf_model = HedgeFundModel(om, ctx)
+        self.fx_model = FXModel(om)
 
         # Cache for computed macro values
         self._macro_cache: Dict[str, Any] = {}
 
+        # Cache for FX-adjusted asset class results
+        self._result_cache: Dict[AssetClass, AssetClassResult] = {}
+
     def set_overrides(self, overrides: Dict[str, Any]) -> None:
         """
         Set or update overrides.
 
+        Only the macro regions and asset classes that depend on the patched
+        paths are invalidated; see apply_override_patch.
+
         Parameters
         ----------
         overrides : dict
             Override dictionary to apply.
         """
-        self.override_manager.set_overrides(overrides)
-        self._macro_cache.clear()
+        self.apply_override_patch(overrides, recompute=False)
 
     def clear_overrides(self) -> None:
         """Clear all overrides and reset to defaults."""
         self.override_manager.clear_overrides()
+        self.context.clear()
         self._macro_cache.clear()
+        self._result_cache.clear()
+
+    def apply_override_patch(self, patch: Dict[str, Any], recompute: bool = True) -> RecomputeReport:
+        """
+        Merge an override patch and recompute only the affected results.
+
+        Patched macro regions are re-forecast; an asset class is rebuilt
+        when its own overrides were patched or when a macro signal it
+        consumes (regional T-Bill, inflation, RGDP, global RGDP or an FX
+        leg) changed in value or override source. Patches touching
+        anything else (e.g. model parameters) fall back to a full
+        recompute.
+
+        Parameters
+        ----------
+        patch : dict
+            Nested override dictionary, merged like set_overrides (None
+            removes an override).
+        recompute : bool
+            If True, rebuild the invalidated results immediately so the
+            report can say which ones changed. If False, they are rebuilt
+            lazily by compute_all_returns.
+
+        Returns
+        -------
+        RecomputeReport
+            Recomputed and changed asset keys.
+        """
+        plan = self._plan_override_patch(patch)
+
+        if plan is None or not self._macro_cache:
+            self.override_manager.set_overrides(patch)
+            self.context.clear()
+            self._macro_cache.clear()
+            old_results = self._result_cache
+            self._result_cache = {}
+            regions = list(self.MACRO_REGIONS)
+            affected = set(AssetClass)
+            full_recompute = True
+        else:
+            regions, affected = plan
+            old_signals = self._macro_signals()
+            self.override_manager.set_overrides(patch)
+            self.context.clear()
+            if regions:
+                self._refresh_macro_regions(regions)
+                new_signals = self._macro_signals()
+                changed = {key for key, value in new_signals.items() if old_signals.get(key) != value}
+                affected |= {
+                    asset_class for asset_class in AssetClass
+                    if self._asset_macro_signals(asset_class) & changed
+                }
+            old_results = {ac: self._result_cache.pop(ac) for ac in affected if ac in self._result_cache}
+            full_recompute = False
+
+        recomputed = [ac for ac in AssetClass if ac in affected]
+        changed_assets = []
+        if recompute:
+            for asset_class in recomputed:
+                if self._get_asset_result(asset_class) != old_results.get(asset_class):
+                    changed_assets.append(asset_class.value)
+
+        return RecomputeReport(
+            recomputed_assets=[ac.value for ac in recomputed],
+            changed_assets=changed_assets,
+            macro_regions=[r for r in self.MACRO_REGIONS if r in regions],
+            full_recompute=full_recompute,
+        )
+
+    def _plan_override_patch(self, patch: Dict[str, Any]) -> Optional[Tuple[List[str], Set[AssetClass]]]:
+        """Map a patch to (macro regions, directly affected assets), or None if unscoped."""
+        regions = []
+        assets = set()
+        for key, value in (patch or {}).items():
+            if key == 'macro':
+                if not isinstance(value, dict):
+                    return None
+                for region in value:
+                    if region not in self.MACRO_REGIONS:
+                        return None
+                    if region not in regions:
+                        regions.append(region)
+            elif key in self.OVERRIDE_DEPENDENTS:
+                assets.update(self.OVERRIDE_DEPENDENTS[key])
+            else:
+                return None
+        return regions, assets
+
+    def _macro_signals(self) -> Dict[Tuple[str, str], Tuple]:
+        """
+        Snapshot the macro values and override sources that asset results read.
+
+        Keys are (region, output); two snapshots differing on a key means
+        every asset consuming that output must be rebuilt.
+        """
+        macro = self.compute_macro_forecasts()
+        sources = self._get_macro_sources()
+
+        signals = {}
+        for region in self.MACRO_REGIONS:
+            region_macro = macro[region]
+            signals[(region, 'rgdp_growth')] = (
+                region_macro['rgdp_growth'],
+                sources[f"{region}.rgdp_growth"],
+            )
+            signals[(region, 'inflation')] = (
+                region_macro['inflation'],
+                sources[f"{region}.inflation_forecast"],
+            )
+            signals[(region, 'tbill_rate')] = (
+                region_macro['tbill_rate'],
+                sources[f"{region}.tbill_forecast"],
+                sources[f"{region}.rgdp_growth"],
+                sources[f"{region}.inflation_forecast"],
+                region_macro['components'].get('tbill', {}),
+            )
+        signals[('global', 'rgdp_growth')] = (
+            macro['global']['rgdp_growth'],
+            sources['global.rgdp_growth'],
+        )
+        return signals
+
+    def _asset_macro_signals(self, asset_class: AssetClass) -> Set[Tuple[str, str]]:
+        """Macro signals consumed by an asset class result (including FX)."""
+        base_region = self._get_base_currency_region()
+        gk = self.equity_model_type == 'gk' and self.equity_model_gk is not None
+
+        if asset_class == AssetClass.LIQUIDITY:
+            deps = {(base_region, 'tbill_rate'), (base_region, 'inflation')}
+        elif asset_class in (AssetClass.BONDS_GLOBAL, AssetClass.BONDS_HY, AssetClass.BONDS_EM):
+            deps = {('us', 'tbill_rate'), ('us', 'inflation')}
+        elif asset_class == AssetClass.INFLATION_LINKED:
+            deps = {(base_region, 'inflation')}
+        elif asset_class == AssetClass.ABSOLUTE_RETURN:
+            # Global GDP source is reported on the US equity dependency for both models
+            deps = {(base_region, 'tbill_rate'), (base_region, 'inflation'), ('us', 'inflation'),
+                    ('global', 'rgdp_growth')}
+            if gk:
+                deps.add(('us', 'rgdp_growth'))
+        else:
+            region = next(r for r, ac in self.EQUITY_TO_ASSET.items() if ac == asset_class)
+            macro_region = self.EQUITY_TO_MACRO_REGION[region]
+            deps = {(macro_region, 'inflation')}
+            deps.add((macro_region, 'rgdp_growth') if gk else ('global', 'rgdp_growth'))
+
+        local_currency = ASSET_LOCAL_CURRENCY.get(asset_class, 'usd')
+        base_ccy = self.base_currency.value
+        if local_currency not in ('base', base_ccy):
+            foreign_region = CURRENCY_TO_MACRO_REGION.get(local_currency, 'us')
+            for region in (base_region, foreign_region):
+                deps.add((region, 'tbill_rate'))
+                deps.add((region, 'inflation'))
+
+        return deps
 
     def _get_base_currency_region(self) -> str:
         """Get the macro region for the base currency."""
-        if self.base_currency == BaseCurrency.EUR:
-            return 'eurozone'
-        return 'us'
+        return CURRENCY_TO_MACRO_REGION[self.base_currency.value]
 
     def _get_fx_adjustment(self, asset_class: AssetClass) -> Dict[str, Any]:
         """
@@ -121,27 +336,18 @@ class CMEEngine:
         if local_currency == 'base':
             return {'fx_return': 0.0, 'components': {}, 'needs_adjustment': False}
 
-        # Determine base currency string
-        base_ccy = 'eur' if self.base_currency == BaseCurrency.EUR else 'usd'
-
         # No adjustment if asset is already in base currency
+        base_ccy = self.base_currency.value
         if local_currency == base_ccy:
             return {'fx_return': 0.0, 'components': {}, 'needs_adjustment': False}
 
-        # Get macro forecasts for FX calculation
-        macro = self.compute_macro_forecasts()
-
-        # Calculate FX adjustment using the FX model
-        fx_result = self.fx_model.get_fx_adjustment_for_asset(
-            home_currency=base_ccy,
-            asset_local_currency=local_currency,
-            macro_forecasts=macro
-        )
+        # Read the pair off the FX matrix shared by all asset classes
+        fx_forecast = self.compute_fx_matrix().pair(base_ccy, local_currency)
 
         return {
-            'fx_return': fx_result['fx_return'],
-            'components': fx_result.get('components', {}),
-            'needs_adjustment': fx_result['needs_adjustment']
+            'fx_return': fx_forecast['fx_change'],
+            'components': fx_forecast,
+            'needs_adjustment': True,
         }
 
     def _apply_fx_to_result(
@@ -173,10 +379,16 @@ class CMEEngine:
         new_nominal = result.expected_return_nominal + fx_adj['fx_return']
         new_real = result.expected_return_real + fx_adj['fx_return']
 
+        if not self.tracking:
+            return self._summary_result(result.asset_class, new_nominal, new_real)
+
         # Add FX to components
         new_components = dict(result.components)
         new_components['fx_return'] = fx_adj['fx_return']
 
+        if self.detail == 'components':
+            return self._summary_result(result.asset_class, new_nominal, new_real, new_components)
+
         # Add FX inputs to tracking
         new_inputs = dict(result.inputs_used)
         fx_comps = fx_adj.get('components', {})
@@ -197,6 +409,23 @@ class CMEEngine:
             macro_dependencies=result.macro_dependencies,
         )
 
+    def compute_fx_matrix(self) -> FXMatrix:
+        """
+        Compute expected FX changes between every pair of currencies.
+
+        Computed once per override state from the macro forecasts and
+        shared by every asset class and base currency.
+
+        Returns
+        -------
+        FXMatrix
+            Antisymmetric FX change, carry and PPP matrices.
+        """
+        return self.context.get(
+            'fx_matrix', None,
+            lambda: self.fx_model.forecast_fx_matrix(self.compute_macro_forecasts()),
+        )
+
     def compute_fx_forecasts(self) -> Dict[str, Dict[str, float]]:
         """
         Compute FX forecasts for all major currency pairs relative to base currency.
@@ -209,21 +438,17 @@ class CMEEngine:
         if self.base_currency == BaseCurrency.USD:
             return {}  # No FX forecasts needed for USD base
 
-        macro = self.compute_macro_forecasts()
-        base_ccy = 'eur' if self.base_currency == BaseCurrency.EUR else 'usd'
+        matrix = self.compute_fx_matrix()
+        base_ccy = self.base_currency.value
 
         fx_forecasts = {}
-        for foreign_ccy in ['usd', 'jpy', 'em']:
+        for foreign_ccy in matrix.currencies:
             if foreign_ccy != base_ccy:
-                fx_result = self.fx_model.get_fx_adjustment_for_asset(
-                    home_currency=base_ccy,
-                    asset_local_currency=foreign_ccy,
-                    macro_forecasts=macro
-                )
+                fx_result = matrix.pair(base_ccy, foreign_ccy)
                 fx_forecasts[foreign_ccy] = {
-                    'fx_change': fx_result['fx_return'],
-                    'carry_component': fx_result['components'].get('carry_component', 0),
-                    'ppp_component': fx_result['components'].get('ppp_component', 0),
+                    'fx_change': fx_result['fx_change'],
+                    'carry_component': fx_result['carry_component'],
+                    'ppp_component': fx_result['ppp_component'],
                 }
 
         return fx_forecasts
@@ -240,12 +465,14 @@ class CMEEngine:
         if self._macro_cache:
             return self._macro_cache
 
-        regions = ['us', 'eurozone', 'japan', 'em']
-        forecasts = {}
+        self._refresh_macro_regions(self.MACRO_REGIONS)
+        return self._macro_cache
 
+    def _refresh_macro_regions(self, regions: List[str]) -> None:
+        """Re-forecast the given regions in the macro cache and update global GDP."""
         for region in regions:
             forecast = self.macro_model.compute_full_forecast(region)
-            forecasts[region] = {
+            self._macro_cache[region] = {
                 'rgdp_growth': forecast.rgdp_growth,
                 'inflation': forecast.inflation,
                 'tbill_rate': forecast.tbill_rate,
@@ -253,22 +480,28 @@ class CMEEngine:
                 'components': forecast.components,
             }
 
-        # Compute global GDP growth
-        global_rgdp = compute_global_rgdp_growth(self.macro_model)
-        forecasts['global'] = {'rgdp_growth': global_rgdp}
-
-        self._macro_cache = forecasts
-        return forecasts
+        # Global GDP growth from the cached regional forecasts
+        global_rgdp = weighted_global_rgdp_growth({
+            region: self._macro_cache[region]['rgdp_growth']
+            for region in self.MACRO_REGIONS
+        })
+        self._macro_cache['global'] = {'rgdp_growth': global_rgdp}
 
     def _get_macro_sources(self) -> Dict[str, str]:
         """
         Get the source (default/override) for each macro input.
-        
+
+        Computed once per override state and shared by every asset class.
+
         Returns
         -------
         dict
             Mapping of macro input keys to their sources.
         """
+        return self.context.get('macro_sources', None, self._compute_macro_sources)
+
+    def _compute_macro_sources(self) -> Dict[str, str]:
+        """Walk the overrides for every macro input's source (see _get_macro_sources)."""
         sources = {}
         
         # Check direct forecast overrides
@@ -403,6 +636,23 @@ class CMEEngine:
         
         return deps
 
+    @staticmethod
+    def _summary_result(
+        asset_class: str,
+        nominal: float,
+        real: float,
+        components: Optional[Dict[str, float]] = None,
+    ) -> AssetClassResult:
+        """Result without input or macro dependency breakdowns (detail below 'full')."""
+        return AssetClassResult(
+            asset_class=asset_class,
+            expected_return_nominal=nominal,
+            expected_return_real=real,
+            components=components or {},
+            inputs_used={},
+            macro_dependencies={},
+        )
+
     def compute_liquidity_return(self) -> AssetClassResult:
         """
         Compute expected return for liquidity (cash/T-Bills).
@@ -415,7 +665,6 @@ class CMEEngine:
             Liquidity return result.
         """
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
 
         # Use base currency region
         base_region = self._get_base_currency_region()
@@ -424,6 +673,26 @@ class CMEEngine:
         nominal_return = region_macro['tbill_rate']
         real_return = nominal_return - region_macro['inflation']
 
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.LIQUIDITY],
+                nominal_return,
+                real_return,
+            )
+
+        components = {
+            'tbill_rate': nominal_return,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.LIQUIDITY],
+                nominal_return,
+                real_return,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
+
         # Build macro dependencies
         macro_deps = self._build_macro_dependencies(
             asset_type='liquidity',
@@ -453,9 +722,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[AssetClass.LIQUIDITY],
             expected_return_nominal=nominal_return,
             expected_return_real=real_return,
-            components={
-                'tbill_rate': nominal_return,
-            },
+            components=components,
             inputs_used=inputs_used,
             macro_dependencies=macro_deps,
         )
@@ -470,7 +737,6 @@ class CMEEngine:
             Government bond return result.
         """
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
 
         # Use weighted average of DM T-Bill and inflation
         # Simplified: use US as proxy for global DM
@@ -481,6 +747,29 @@ class CMEEngine:
             inflation_forecast=us_macro['inflation'],
         )
 
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.BONDS_GLOBAL],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'yield': forecast.yield_component,
+            'roll_return': forecast.roll_return,
+            'valuation': forecast.valuation_return,
+            'credit_loss': forecast.credit_loss,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.BONDS_GLOBAL],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
+
         # Build macro dependencies
         macro_deps = self._build_macro_dependencies(
             asset_type='bond',
@@ -496,12 +785,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[AssetClass.BONDS_GLOBAL],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'yield': forecast.yield_component,
-                'roll_return': forecast.roll_return,
-                'valuation': forecast.valuation_return,
-                'credit_loss': forecast.credit_loss,
-            },
+            components=components,
             inputs_used=self._extract_bond_inputs(forecast),
             macro_dependencies=macro_deps,
         )
@@ -516,7 +800,6 @@ class CMEEngine:
             High yield bond return result.
         """
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
         us_macro = macro['us']
 
         forecast = self.hy_bond_model.compute_return(
@@ -524,6 +807,29 @@ class CMEEngine:
             inflation_forecast=us_macro['inflation'],
         )
 
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.BONDS_HY],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'yield': forecast.yield_component,
+            'roll_return': forecast.roll_return,
+            'valuation': forecast.valuation_return,
+            'credit_loss': forecast.credit_loss,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.BONDS_HY],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
+
         # Build macro dependencies
         macro_deps = self._build_macro_dependencies(
             asset_type='bond',
@@ -539,12 +845,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[AssetClass.BONDS_HY],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'yield': forecast.yield_component,
-                'roll_return': forecast.roll_return,
-                'valuation': forecast.valuation_return,
-                'credit_loss': forecast.credit_loss,
-            },
+            components=components,
             inputs_used=self._extract_bond_inputs(forecast),
             macro_dependencies=macro_deps,
         )
@@ -563,12 +864,12 @@ class CMEEngine:
             EM bond return result.
         """
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
         us_macro = macro['us']
 
         # For hard currency (USD-denominated) bonds:
         # - Use US T-Bill as base rate (bonds priced off US Treasury curve)
-        # - Model adds EM credit spread (~2%) when em_tbill_forecast is None
+        # - Model adds the EM spread (BOND_PARAMS 'em_hard_currency_spread')
+        #   when em_tbill_forecast is None
         # - Use US inflation for real return (investor receives USD)
         forecast = self.em_bond_model.compute_return(
             tbill_forecast=us_macro['tbill_rate'],  # US T-Bill as base
@@ -577,6 +878,29 @@ class CMEEngine:
             hard_currency=True,  # USD-denominated bonds
         )
 
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.BONDS_EM],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'yield': forecast.yield_component,
+            'roll_return': forecast.roll_return,
+            'valuation': forecast.valuation_return,
+            'credit_loss': forecast.credit_loss,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.BONDS_EM],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
+
         # Build macro dependencies (uses US macro for hard currency bonds)
         macro_deps = self._build_macro_dependencies(
             asset_type='bond',
@@ -592,12 +916,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[AssetClass.BONDS_EM],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'yield': forecast.yield_component,
-                'roll_return': forecast.roll_return,
-                'valuation': forecast.valuation_return,
-                'credit_loss': forecast.credit_loss,
-            },
+            components=components,
             inputs_used=self._extract_bond_inputs(forecast),
             macro_dependencies=macro_deps,
         )
@@ -622,7 +941,10 @@ class CMEEngine:
                     default=default_val
                 )
             else:
-                tracked[key] = TrackedValue(default_val, InputSource.DEFAULT)
+                tracked[key] = TrackedValue(
+                    self.override_manager.track(default_val, 'inflation_linked', regime, key),
+                    InputSource.DEFAULT,
+                )
 
         return tracked
 
@@ -634,7 +956,6 @@ class CMEEngine:
         sovereign assumptions for EUR base currency.
         """
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
 
         if self.base_currency == BaseCurrency.EUR:
             regime = 'eur'
@@ -651,6 +972,32 @@ class CMEEngine:
             regime_inputs=regime_inputs,
         )
 
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.INFLATION_LINKED],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'real_yield_carry': forecast.components['real']['real_yield_carry'],
+            'real_roll_return': forecast.components['real']['real_roll_return'],
+            'real_valuation_return': forecast.components['real']['real_valuation_return'],
+            'inflation_indexation': forecast.components['inflation']['inflation_indexation'],
+            'index_lag_drag': -abs(forecast.components['inflation']['index_lag_drag']),
+            'liquidity_technical': forecast.components['real']['liquidity_technical'],
+            'credit_loss': 0.0,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.INFLATION_LINKED],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
+
         macro_deps = self._build_macro_dependencies(
             asset_type='bond',
             macro_region=macro_region,
@@ -665,15 +1012,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[AssetClass.INFLATION_LINKED],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'real_yield_carry': forecast.components['real']['real_yield_carry'],
-                'real_roll_return': forecast.components['real']['real_roll_return'],
-                'real_valuation_return': forecast.components['real']['real_valuation_return'],
-                'inflation_indexation': forecast.components['inflation']['inflation_indexation'],
-                'index_lag_drag': -abs(forecast.components['inflation']['index_lag_drag']),
-                'liquidity_technical': forecast.components['real']['liquidity_technical'],
-                'credit_loss': 0.0,
-            },
+            components=components,
             inputs_used=self._extract_bond_inputs(forecast),
             macro_dependencies=macro_deps,
         )
@@ -702,20 +1041,61 @@ class CMEEngine:
             return self._compute_equity_return_gk(region)
         return self._compute_equity_return_ra(region)
 
+    def _equity_forecast(self, region: EquityRegion):
+        """
+        Active equity model's forecast for a region.
+
+        Shared through the evaluation context: the US forecast also drives
+        the hedge fund market factor premium.
+        """
+        macro = self.compute_macro_forecasts()
+        region_macro = macro[self.EQUITY_TO_MACRO_REGION[region]]
+
+        if self.equity_model_type == 'gk' and self.equity_model_gk is not None:
+            def compute():
+                return self.equity_model_gk.compute_return(
+                    region=region,
+                    macro_inflation=region_macro['inflation'],
+                    macro_rgdp=region_macro['rgdp_growth'],
+                )
+        else:
+            def compute():
+                return self.equity_model.compute_return(
+                    region=region,
+                    inflation_forecast=region_macro['inflation'],
+                    global_rgdp_growth=macro['global']['rgdp_growth'],
+                )
+
+        return self.context.get('equity_forecast', region, compute)
+
     def _compute_equity_return_ra(self, region: EquityRegion) -> AssetClassResult:
         """Compute equity return using the RA (Research Affiliates) model."""
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
 
         macro_region = self.EQUITY_TO_MACRO_REGION[region]
-        region_macro = macro[macro_region]
-        global_rgdp = macro['global']['rgdp_growth']
+        forecast = self._equity_forecast(region)
 
-        forecast = self.equity_model.compute_return(
-            region=region,
-            inflation_forecast=region_macro['inflation'],
-            global_rgdp_growth=global_rgdp,
-        )
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[self.EQUITY_TO_ASSET[region]],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'dividend_yield': forecast.dividend_yield,
+            'real_eps_growth': forecast.real_eps_growth,
+            'valuation_change': forecast.valuation_change,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[self.EQUITY_TO_ASSET[region]],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
 
         macro_deps = self._build_macro_dependencies(
             asset_type='equity',
@@ -731,11 +1111,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[self.EQUITY_TO_ASSET[region]],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'dividend_yield': forecast.dividend_yield,
-                'real_eps_growth': forecast.real_eps_growth,
-                'valuation_change': forecast.valuation_change,
-            },
+            components=components,
             inputs_used=self._extract_equity_inputs(forecast),
             macro_dependencies=macro_deps,
         )
@@ -746,7 +1122,6 @@ class CMEEngine:
         from .output import MacroDependency
 
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
 
         macro_region = self.EQUITY_TO_MACRO_REGION[region]
         region_macro = macro[macro_region]
@@ -755,11 +1130,31 @@ class CMEEngine:
         macro_inflation = region_macro['inflation']
         macro_rgdp = region_macro['rgdp_growth']
 
-        forecast = self.equity_model_gk.compute_return(
-            region=region,
-            macro_inflation=macro_inflation,
-            macro_rgdp=macro_rgdp,
-        )
+        forecast = self._equity_forecast(region)
+
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[self.EQUITY_TO_ASSET[region]],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'dividend_yield': forecast.dividend_yield,
+            'net_buyback_yield': forecast.net_buyback_yield,
+            'revenue_growth': forecast.revenue_growth,
+            'margin_change': forecast.margin_change,
+            'valuation_change': forecast.valuation_change,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[self.EQUITY_TO_ASSET[region]],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
 
         # Build GK-specific macro dependencies
         # In GK, inflation and GDP flow through revenue growth (not as separate add-ons)
@@ -798,13 +1193,7 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[self.EQUITY_TO_ASSET[region]],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'dividend_yield': forecast.dividend_yield,
-                'net_buyback_yield': forecast.net_buyback_yield,
-                'revenue_growth': forecast.revenue_growth,
-                'margin_change': forecast.margin_change,
-                'valuation_change': forecast.valuation_change,
-            },
+            components=components,
             inputs_used=self._extract_equity_inputs(forecast),
             macro_dependencies=macro_deps,
         )
@@ -821,26 +1210,14 @@ class CMEEngine:
             Hedge fund return result.
         """
         macro = self.compute_macro_forecasts()
-        macro_sources = self._get_macro_sources()
 
         # Use base currency region for T-Bill and inflation
         base_region = self._get_base_currency_region()
         base_macro = macro[base_region]
 
         # Use the active equity model for market premium calculation
-        us_macro = macro['us']
-        if self.equity_model_type == 'gk' and self.equity_model_gk is not None:
-            equity_forecast = self.equity_model_gk.compute_return(
-                region=EquityRegion.US,
-                macro_inflation=us_macro['inflation'],
-                macro_rgdp=us_macro['rgdp_growth'],
-            )
-        else:
-            equity_forecast = self.equity_model.compute_return(
-                region=EquityRegion.US,
-                inflation_forecast=us_macro['inflation'],
-                global_rgdp_growth=macro['global']['rgdp_growth'],
-            )
+        # (shared with the US equity result)
+        equity_forecast = self._equity_forecast(EquityRegion.US)
 
         forecast = self.hf_model.compute_return(
             tbill_forecast=base_macro['tbill_rate'],
@@ -848,6 +1225,28 @@ class CMEEngine:
             equity_return=equity_forecast.expected_return_nominal,
         )
 
+        if not self.tracking:
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.ABSOLUTE_RETURN],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+            )
+
+        components = {
+            'tbill': forecast.tbill_component,
+            'factor_return': forecast.factor_return,
+            'trading_alpha': forecast.trading_alpha,
+        }
+        if self.detail == 'components':
+            return self._summary_result(
+                self.ASSET_NAMES[AssetClass.ABSOLUTE_RETURN],
+                forecast.expected_return_nominal,
+                forecast.expected_return_real,
+                components,
+            )
+
+        macro_sources = self._get_macro_sources()
+
         inputs_used = self._extract_hf_inputs(forecast)
         inputs_used['base_currency'] = {'value': self.base_currency.value, 'source': 'computed'}
 
@@ -879,16 +1278,16 @@ class CMEEngine:
             asset_class=self.ASSET_NAMES[AssetClass.ABSOLUTE_RETURN],
             expected_return_nominal=forecast.expected_return_nominal,
             expected_return_real=forecast.expected_return_real,
-            components={
-                'tbill': forecast.tbill_component,
-                'factor_return': forecast.factor_return,
-                'trading_alpha': forecast.trading_alpha,
-            },
+            components=components,
             inputs_used=inputs_used,
             macro_dependencies=macro_deps,
         )
 
-    def compute_all_returns(self, scenario_name: str = "Base Case") -> CMEResults:
+    def compute_all_returns(
+        self,
+        scenario_name: str = "Base Case",
+        with_sensitivities: bool = False,
+    ) -> CMEResults:
         """
         Compute expected returns for all asset classes.
 
@@ -896,54 +1295,34 @@ class CMEEngine:
         ----------
         scenario_name : str
             Name for this scenario.
+        with_sensitivities : bool
+            Also return d(return)/d(input) for every asset and every input
+            path it uses, from a single forward-mode (dual number) pass.
+            Derivatives are taken on the branch the current inputs select:
+            at a floor/cap, or where overriding an input switches model
+            logic, they describe the current branch only.
 
         Returns
         -------
         CMEResults
             Complete CME results.
         """
-        results = {}
-
-        # Liquidity (already uses base currency, no FX adjustment needed)
-        results[AssetClass.LIQUIDITY.value] = self.compute_liquidity_return()
-
-        # Bonds - apply FX adjustments
-        bonds_global = self.compute_bonds_global_return()
-        results[AssetClass.BONDS_GLOBAL.value] = self._apply_fx_to_result(
-            bonds_global, AssetClass.BONDS_GLOBAL
-        )
-
-        bonds_hy = self.compute_bonds_hy_return()
-        results[AssetClass.BONDS_HY.value] = self._apply_fx_to_result(
-            bonds_hy, AssetClass.BONDS_HY
-        )
-
-        bonds_em = self.compute_bonds_em_return()
-        results[AssetClass.BONDS_EM.value] = self._apply_fx_to_result(
-            bonds_em, AssetClass.BONDS_EM
-        )
-
-        inflation_linked = self.compute_inflation_linked_return()
-        results[AssetClass.INFLATION_LINKED.value] = self._apply_fx_to_result(
-            inflation_linked, AssetClass.INFLATION_LINKED
-        )
-
-        # Equities - apply FX adjustments
-        region_to_asset = {
-            EquityRegion.US: AssetClass.EQUITY_US,
-            EquityRegion.EUROPE: AssetClass.EQUITY_EUROPE,
-            EquityRegion.JAPAN: AssetClass.EQUITY_JAPAN,
-            EquityRegion.EM: AssetClass.EQUITY_EM,
-        }
-        for region in EquityRegion:
-            asset_class = region_to_asset[region]
-            equity_result = self.compute_equity_return(region)
-            results[asset_class.value] = self._apply_fx_to_result(
-                equity_result, asset_class
+        if with_sensitivities and not self.override_manager.track_derivatives:
+            tracking_engine = CMEEngine(
+                overrides=self.override_manager.get_overrides_summary(),
+                base_currency=self.base_currency.value,
+                equity_model_type=self.equity_model_type,
+                track_derivatives=True,
+                detail=self.detail,
             )
+            return tracking_engine.compute_all_returns(scenario_name, with_sensitivities=True)
 
-        # Alternatives (already uses base currency, no FX adjustment needed)
-        results[AssetClass.ABSOLUTE_RETURN.value] = self.compute_absolute_return()
+        # Results are cached per asset class; override patches invalidate
+        # only the entries that depend on them (see apply_override_patch)
+        results = {
+            asset_class.value: self._get_asset_result(asset_class)
+            for asset_class in AssetClass
+        }
 
         # Get macro assumptions
         macro = self.compute_macro_forecasts()
@@ -960,7 +1339,7 @@ class CMEEngine:
         # Add FX forecasts if EUR base
         fx_forecasts = self.compute_fx_forecasts()
 
-        return CMEResults(
+        cme_results = CMEResults(
             scenario_name=scenario_name,
             results=results,
             macro_assumptions=macro_summary,
@@ -969,6 +1348,128 @@ class CMEEngine:
             fx_forecasts=fx_forecasts,
         )
 
+        if not self.override_manager.track_derivatives:
+            return cme_results
+
+        # Tracking engine: read gradients off the dual results, return floats
+        sensitivities = None
+        if with_sensitivities:
+            sensitivities = {
+                key: {
+                    'expected_return_nominal': gradient(r.expected_return_nominal),
+                    'expected_return_real': gradient(r.expected_return_real),
+                }
+                for key, r in results.items()
+            }
+        cme_results = strip_duals(cme_results)
+        cme_results.sensitivities = sensitivities
+        return cme_results
+
+    def compute_all_base_currencies(self, scenario_name: str = "Base Case") -> Dict[str, CMEResults]:
+        """
+        Compute expected returns in every base currency from one evaluation.
+
+        Bond and equity results are computed once in their local currency
+        and translated with the shared FX matrix; only the base-currency
+        dependent assets (liquidity, inflation-linked, absolute return) are
+        computed per base currency. Results equal those of a separate
+        CMEEngine per base currency.
+
+        Parameters
+        ----------
+        scenario_name : str
+            Name for this scenario.
+
+        Returns
+        -------
+        dict
+            CMEResults by base currency ('usd', 'eur').
+        """
+        return {
+            base.value: self._for_base_currency(base).compute_all_returns(scenario_name)
+            for base in BaseCurrency
+        }
+
+    def _for_base_currency(self, base_currency: BaseCurrency) -> 'CMEEngine':
+        """
+        View of this engine in another base currency.
+
+        The view shares the overrides, models, macro cache and evaluation
+        context (so local-currency results and the FX matrix are reused)
+        and keeps its own FX-adjusted result cache. Views are not kept in
+        sync with later override changes, so do not hold on to them.
+        """
+        if base_currency == self.base_currency:
+            return self
+        view = copy.copy(self)
+        view.base_currency = base_currency
+        view._result_cache = {}
+        return view
+
+    def compute_term_structure(self, horizons: Sequence[int] = TERM_STRUCTURE_HORIZONS) -> TermStructure:
+        """
+        Compute expected returns for every forecast horizon in one call.
+
+        The horizon-dependent pieces (term premium path, bond valuation
+        reversion, GK valuation change) are closed-form in the horizon, so
+        all horizons are evaluated as one vectorized BatchCMEEngine pass.
+        Macro forecasts are horizon-independent.
+
+        Parameters
+        ----------
+        horizons : sequence of int, optional
+            Horizons in years (default 1 to 30).
+
+        Returns
+        -------
+        TermStructure
+            Nominal and real returns per asset, one entry per horizon.
+        """
+        engine = BatchCMEEngine(
+            (),
+            base_overrides=self.override_manager.get_overrides_summary(),
+            base_currency=self.base_currency.value,
+            equity_model_type=self.equity_model_type,
+        )
+        return engine.term_structure(horizons)
+
+    def _get_asset_result(self, asset_class: AssetClass) -> AssetClassResult:
+        """Get an FX-adjusted asset class result, computing it if not cached."""
+        if asset_class not in self._result_cache:
+            self._result_cache[asset_class] = self._compute_asset_result(asset_class)
+        return self._result_cache[asset_class]
+
+    def _compute_asset_result(self, asset_class: AssetClass) -> AssetClassResult:
+        """Compute one asset class result in base currency terms."""
+        # Liquidity and alternatives already use the base currency
+        if asset_class == AssetClass.LIQUIDITY:
+            return self.compute_liquidity_return()
+        if asset_class == AssetClass.ABSOLUTE_RETURN:
+            return self.compute_absolute_return()
+
+        # Inflation-linked depends on the base currency; everything else is
+        # computed in a fixed local currency, shared by all base currencies
+        if asset_class == AssetClass.INFLATION_LINKED:
+            result = self.compute_inflation_linked_return()
+        else:
+            result = self.context.get(
+                'local_result', asset_class,
+                lambda: self._compute_local_result(asset_class),
+            )
+
+        return self._apply_fx_to_result(result, asset_class)
+
+    def _compute_local_result(self, asset_class: AssetClass) -> AssetClassResult:
+        """Compute a bond or equity result in its local currency (before FX)."""
+        if asset_class == AssetClass.BONDS_GLOBAL:
+            return self.compute_bonds_global_return()
+        if asset_class == AssetClass.BONDS_HY:
+            return self.compute_bonds_hy_return()
+        if asset_class == AssetClass.BONDS_EM:
+            return self.compute_bonds_em_return()
+        region = next(r for r, ac in self.EQUITY_TO_ASSET.items() if ac == asset_class)
+        return self.compute_equity_return(region)
+
     def _extract_bond_inputs(self, forecast) -> Dict[str, Dict[str, Any]]:
         """Extract input tracking from bond forecast."""
         inputs = {}
@@ -1010,7 +1511,8 @@ def run_stress_test(
     stress_overrides: Optional[Dict[str, Any]] = None,
     base_name: str = "RA Defaults",
     stress_name: str = "Stress Scenario",
-    base_currency: str = 'usd'
+    base_currency: str = 'usd',
+    tracking: bool = False,
 ) -> tuple:
     """
     Run a stress test comparing base case to stressed scenario.
@@ -1027,6 +1529,9 @@ def run_stress_test(
         Name for stress scenario.
     base_currency : str, optional
         Base currency for return calculations ('usd' or 'eur'). Default is 'usd'.
+    tracking : bool, optional
+        Build per-asset components and input breakdowns. The comparison
+        only needs headline returns, so this defaults to False.
 
     Returns
     -------
@@ -1034,11 +1539,11 @@ def run_stress_test(
         (base_results, stress_results, comparison_text)
     """
     # Base case
-    base_engine = CMEEngine(base_overrides, base_currency=base_currency)
+    base_engine = CMEEngine(base_overrides, base_currency=base_currency, tracking=tracking)
     base_results = base_engine.compute_all_returns(base_name)
 
     # Stress case
-    stress_engine = CMEEngine(stress_overrides, base_currency=base_currency)
+    stress_engine = CMEEngine(stress_overrides, base_currency=base_currency, tracking=tracking)
     stress_results = stress_engine.compute_all_returns(stress_name)
 
     # Comparison
@@ -6,7 +6,7 @@ from .macro import MacroModel
 from .bonds import BondModel, GovernmentBondModel, HighYieldBondModel, EMBondModel
 from .equities import EquityModel
 from .alternatives import HedgeFundModel
-from .currency import FXModel
+from .currency import FXModel, FXMatrix
 
 __all__ = [
     'MacroModel',
@@ -17,4 +17,5 @@ __all__ = [
     'EquityModel',
     'HedgeFundModel',
     'FXModel',
+    'FXMatrix',
 ]
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 from ..inputs.overrides import OverrideManager, TrackedValue, InputSource, extract_values
 from ..config import AssetClass, HEDGE_FUND_PARAMS
+from ..context import EvaluationContext
 
 
 @dataclass
@@ -51,7 +52,7 @@ class HedgeFundModel:
     # Factor names
     FACTORS = ['market', 'size', 'value', 'profitability', 'investment', 'momentum']
 
-    def __init__(self, override_manager: OverrideManager):
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
         """
         Initialize hedge fund model.
 
@@ -59,13 +60,20 @@ class HedgeFundModel:
         ----------
         override_manager : OverrideManager
             Manager for handling input overrides.
+        context : EvaluationContext, optional
+            Shared memo for resolved inputs. Without one, inputs are
+            resolved on every call.
         """
         self.overrides = override_manager
+        self.context = context if context is not None else EvaluationContext(memoize=False)
         self._params = HEDGE_FUND_PARAMS.copy()
 
     def get_inputs(self) -> Dict[str, TrackedValue]:
         """Get inputs for hedge fund model."""
-        return self.overrides.get_asset_inputs(AssetClass.ABSOLUTE_RETURN)
+        return self.context.get(
+            'asset_inputs', AssetClass.ABSOLUTE_RETURN,
+            lambda: self.overrides.get_asset_inputs(AssetClass.ABSOLUTE_RETURN),
+        )
 
     def get_factor_betas(self) -> Dict[str, TrackedValue]:
         """
@@ -121,7 +129,7 @@ class HedgeFundModel:
 
         # Other factors: use discounted historical
         for factor in self.FACTORS[1:]:  # Skip market
-            hist_premium = historical.get(factor, 0.02)
+            hist_premium = historical.get(factor, self._params['default_factor_premium'])
             # Apply discount to historical for forward-looking estimate
             expected_premium = hist_premium * discount
             premia[factor] = TrackedValue(expected_premium, InputSource.DEFAULT)
@@ -141,7 +149,10 @@ class HedgeFundModel:
             Expected trading alpha.
         """
         inputs = self.get_inputs()
-        default_alpha = self._params.get('historical_discount', 0.5) * 0.02  # 50% of 2%
+        default_alpha = (
+            self._params.get('historical_discount', 0.5) *
+            self._params['historical_trading_alpha']
+        )
 
         return inputs.get('trading_alpha', TrackedValue(default_alpha, InputSource.DEFAULT))
 
@@ -224,6 +235,25 @@ class HedgeFundModel:
         expected_return_nominal = tbill_forecast + factor_return + alpha.value
         expected_return_real = expected_return_nominal - inflation_forecast
 
+        # Factor contributions for summary
+        factor_contributions = {
+            f: factor_result['contributions'][f]['contribution']
+            for f in self.FACTORS
+        }
+
+        if not self.overrides.tracking:
+            return HedgeFundForecast(
+                expected_return_nominal=expected_return_nominal,
+                expected_return_real=expected_return_real,
+                tbill_component=tbill_forecast,
+                factor_return=factor_return,
+                trading_alpha=alpha.value,
+                factor_contributions=factor_contributions,
+                inflation=inflation_forecast,
+                components={},
+                sources={},
+            )
+
         # Component details
         components = {
             'tbill': {
@@ -247,12 +277,6 @@ class HedgeFundModel:
             sources[f'beta_{factor}'] = betas[factor].source.value
             sources[f'premium_{factor}'] = premia[factor].source.value
 
-        # Factor contributions for summary
-        factor_contributions = {
-            f: factor_result['contributions'][f]['contribution']
-            for f in self.FACTORS
-        }
-
         return HedgeFundForecast(
             expected_return_nominal=expected_return_nominal,
             expected_return_real=expected_return_real,
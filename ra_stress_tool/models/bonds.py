@@ -9,7 +9,46 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 from ..inputs.overrides import OverrideManager, TrackedValue, InputSource, extract_values
-from ..config import AssetClass
+from ..config import AssetClass, CREDIT_PARAMS
+from ..utils import kernels
+from ..context import EvaluationContext
+
+
+# Fallbacks for inputs missing from the asset data, shared with the batch
+# engine so both resolve the same values
+BOND_INPUT_FALLBACKS = {
+    'current_yield': 0.04,
+    'duration': 7.0,
+    'current_term_premium': 0.015,
+    'fair_term_premium': 0.015,
+}
+
+HY_SPREAD_INPUT_FALLBACKS = {
+    'credit_spread': 0.0271,
+    'fair_credit_spread': 0.04,
+    'duration': 4.0,
+}
+
+INFLATION_LINKED_INPUT_FALLBACKS = {
+    'current_real_yield': 0.01,
+    'duration': 7.0,
+    'current_real_term_premium': 0.002,
+    'fair_real_term_premium': 0.002,
+    'inflation_beta': 1.0,
+    'index_lag_drag': 0.001,
+    'liquidity_technical': 0.0,
+}
+
+
+def _input(inputs: Dict[str, TrackedValue], key: str, fallbacks: Dict[str, float]) -> TrackedValue:
+    """Resolved input, or its value from one of the fallback tables above."""
+    return inputs.get(key, TrackedValue(fallbacks[key], InputSource.DEFAULT))
+
+
+def term_premium_reversion_speed(override_manager: OverrideManager) -> float:
+    """Annual term premium reversion speed (lower 'bond_term_premium_bounds')."""
+    mean_reversion = override_manager.get_mean_reversion_params()
+    return abs(mean_reversion.get('bond_term_premium_bounds', (-0.05, -0.015))[0])
 
 
 @dataclass
@@ -40,7 +79,12 @@ class BondModel(ABC):
     Return = Yield + Roll Return + Valuation Return - Credit Losses
     """
 
-    def __init__(self, override_manager: OverrideManager, asset_class: AssetClass):
+    def __init__(
+        self,
+        override_manager: OverrideManager,
+        asset_class: AssetClass,
+        context: Optional[EvaluationContext] = None,
+    ):
         """
         Initialize bond model.
 
@@ -50,13 +94,20 @@ class BondModel(ABC):
             Manager for handling input overrides.
         asset_class : AssetClass
             The specific asset class for this bond model.
+        context : EvaluationContext, optional
+            Shared memo for resolved inputs. Without one, inputs are
+            resolved on every call.
         """
         self.overrides = override_manager
         self.asset_class = asset_class
+        self.context = context if context is not None else EvaluationContext(memoize=False)
 
     def get_inputs(self) -> Dict[str, TrackedValue]:
         """Get inputs for this bond model."""
-        return self.overrides.get_asset_inputs(self.asset_class)
+        return self.context.get(
+            'asset_inputs', self.asset_class,
+            lambda: self.overrides.get_asset_inputs(self.asset_class),
+        )
 
     @abstractmethod
     def compute_credit_loss(self, inputs: Dict[str, TrackedValue]) -> Dict[str, TrackedValue]:
@@ -100,8 +151,7 @@ class BondModel(ABC):
         inputs = self.get_inputs()
 
         # Get current term premium from inputs
-        base_term_premium = inputs.get('current_term_premium',
-                                       TrackedValue(0.015, InputSource.DEFAULT))
+        base_term_premium = _input(inputs, 'current_term_premium', BOND_INPUT_FALLBACKS)
 
         # If yield was overridden but TP was NOT directly overridden,
         # derive implied TP from the overridden yield: TP = yield - T-Bill
@@ -114,13 +164,11 @@ class BondModel(ABC):
             current_term_premium = base_term_premium
 
         # Fair term premium (long-term average)
-        fair_term_premium = inputs.get('fair_term_premium',
-                                       TrackedValue(0.015, InputSource.DEFAULT))
+        fair_term_premium = _input(inputs, 'fair_term_premium', BOND_INPUT_FALLBACKS)
 
         # Term premium mean reversion
         # Use exponential decay toward fair value
-        mean_reversion = self.overrides.get_mean_reversion_params()
-        reversion_speed = abs(mean_reversion.get('bond_term_premium_bounds', (-0.05, -0.015))[0])
+        reversion_speed = term_premium_reversion_speed(self.overrides)
 
         # Average term premium over horizon (decaying from current toward fair)
         avg_term_premium = self._average_mean_reverting_value(
@@ -146,7 +194,7 @@ class BondModel(ABC):
         self,
         duration: float,
         term_premium: float,
-        maturity_years: float = 10.0,
+        maturity_years: Optional[float] = None,
         duration_source: InputSource = InputSource.DEFAULT
     ) -> Dict[str, TrackedValue]:
         """
@@ -161,8 +209,9 @@ class BondModel(ABC):
             Modified duration.
         term_premium : float
             Current term premium.
-        maturity_years : float
-            Average maturity of the index.
+        maturity_years : float, optional
+            Average maturity of the index (default: the
+            'roll_maturity_years' bond parameter).
         duration_source : InputSource
             Source of the duration value (DEFAULT or OVERRIDE).
 
@@ -174,8 +223,10 @@ class BondModel(ABC):
         # Simplified roll return calculation
         # Assumes constant yield curve slope
         # Roll return ≈ (slope) × (duration / maturity)
+        if maturity_years is None:
+            maturity_years = self.overrides.get_bond_params()['roll_maturity_years']
         slope = term_premium / maturity_years
-        roll_return = slope * duration
+        roll_return = kernels.roll_return(term_premium, duration, maturity_years)
 
         return {
             'roll_return': TrackedValue(roll_return, InputSource.COMPUTED),
@@ -215,18 +266,15 @@ class BondModel(ABC):
         dict
             Valuation return components.
         """
-        mean_reversion = self.overrides.get_mean_reversion_params()
-
         # Change in term premium over horizon
-        # Using partial mean reversion
-        reversion_fraction = 1 - (1 - 0.03) ** (forecast_horizon * 12)  # Monthly reversion
-        reversion_fraction = min(reversion_fraction, 1.0)
+        # Using partial (monthly) mean reversion
+        reversion_fraction = kernels.reversion_fraction(forecast_horizon)
 
-        expected_tp_change = (fair_term_premium - current_term_premium) * reversion_fraction
+        expected_tp_change = kernels.reversion_change(current_term_premium, fair_term_premium, reversion_fraction)
 
         # Valuation return = -duration × yield change
         # If term premium rises (yields rise), prices fall
-        valuation_return = -duration * expected_tp_change / forecast_horizon
+        valuation_return = kernels.valuation_return(duration, expected_tp_change, forecast_horizon)
 
         return {
             'valuation_return': TrackedValue(valuation_return, InputSource.COMPUTED),
@@ -261,14 +309,7 @@ class BondModel(ABC):
         float
             Average value over the period.
         """
-        total = 0.0
-        value = current
-
-        for _ in range(years):
-            total += value
-            value = value + reversion_speed * (fair - value)
-
-        return total / years
+        return kernels.average_mean_reverting_value(current, fair, reversion_speed, years)
 
     def compute_return(
         self,
@@ -296,10 +337,10 @@ class BondModel(ABC):
         inputs = self.get_inputs()
 
         # Extract key inputs with source tracking
-        current_yield_tv = inputs.get('current_yield', TrackedValue(0.04, InputSource.DEFAULT))
+        current_yield_tv = _input(inputs, 'current_yield', BOND_INPUT_FALLBACKS)
         current_yield = current_yield_tv.value
         current_yield_source = current_yield_tv.source
-        duration_tv = inputs.get('duration', TrackedValue(7.0, InputSource.DEFAULT))
+        duration_tv = _input(inputs, 'duration', BOND_INPUT_FALLBACKS)
         duration = duration_tv.value
         duration_source = duration_tv.source
 
@@ -327,6 +368,19 @@ class BondModel(ABC):
         expected_return_nominal = avg_yield + roll_return + valuation_return - credit_loss
         expected_return_real = expected_return_nominal - inflation_forecast
 
+        if not self.overrides.tracking:
+            return BondForecast(
+                expected_return_nominal=expected_return_nominal,
+                expected_return_real=expected_return_real,
+                yield_component=avg_yield,
+                roll_return=roll_return,
+                valuation_return=valuation_return,
+                credit_loss=credit_loss,
+                inflation=inflation_forecast,
+                components={},
+                sources={},
+            )
+
         # Combine components
         components = {
             'yield': extract_values(yield_result),
@@ -362,8 +416,8 @@ class GovernmentBondModel(BondModel):
     Assumes zero credit losses for sovereign developed market bonds.
     """
 
-    def __init__(self, override_manager: OverrideManager):
-        super().__init__(override_manager, AssetClass.BONDS_GLOBAL)
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
+        super().__init__(override_manager, AssetClass.BONDS_GLOBAL, context)
 
     def compute_credit_loss(self, inputs: Dict[str, TrackedValue]) -> Dict[str, TrackedValue]:
         """Government bonds have zero credit losses."""
@@ -382,8 +436,11 @@ class HighYieldBondModel(BondModel):
     Credit Loss = Default Rate × (1 - Recovery Rate)
     """
 
-    def __init__(self, override_manager: OverrideManager):
-        super().__init__(override_manager, AssetClass.BONDS_HY)
+    # CREDIT_PARAMS entry used when default/recovery rates are missing
+    CREDIT_PROFILE = 'high_yield'
+
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
+        super().__init__(override_manager, AssetClass.BONDS_HY, context)
 
     def compute_credit_loss(self, inputs: Dict[str, TrackedValue]) -> Dict[str, TrackedValue]:
         """
@@ -395,11 +452,12 @@ class HighYieldBondModel(BondModel):
             Credit loss components.
         """
         # Get credit parameters
-        default_rate = inputs.get('default_rate', TrackedValue(0.055, InputSource.DEFAULT))
-        recovery_rate = inputs.get('recovery_rate', TrackedValue(0.40, InputSource.DEFAULT))
+        fallback = CREDIT_PARAMS[self.CREDIT_PROFILE]
+        default_rate = inputs.get('default_rate', TrackedValue(fallback['default_rate'], InputSource.DEFAULT))
+        recovery_rate = inputs.get('recovery_rate', TrackedValue(fallback['recovery_rate'], InputSource.DEFAULT))
 
         # Annual credit loss
-        credit_loss = default_rate.value * (1 - recovery_rate.value)
+        credit_loss = kernels.credit_loss(default_rate.value, recovery_rate.value)
 
         return {
             'credit_loss': TrackedValue(credit_loss, InputSource.COMPUTED),
@@ -421,8 +479,8 @@ class HighYieldBondModel(BondModel):
         inputs = self.get_inputs()
 
         # Get credit spread inputs with source tracking
-        credit_spread_tv = inputs.get('credit_spread', TrackedValue(0.0271, InputSource.DEFAULT))
-        fair_credit_spread_tv = inputs.get('fair_credit_spread', TrackedValue(0.04, InputSource.DEFAULT))
+        credit_spread_tv = _input(inputs, 'credit_spread', HY_SPREAD_INPUT_FALLBACKS)
+        fair_credit_spread_tv = _input(inputs, 'fair_credit_spread', HY_SPREAD_INPUT_FALLBACKS)
         credit_spread = credit_spread_tv.value
         fair_credit_spread = fair_credit_spread_tv.value
 
@@ -430,30 +488,31 @@ class HighYieldBondModel(BondModel):
         forecast = super().compute_return(tbill_forecast, inflation_forecast, forecast_horizon)
 
         # Add credit spread valuation effect
-        duration = inputs.get('duration', TrackedValue(4.0, InputSource.DEFAULT)).value
+        duration = _input(inputs, 'duration', HY_SPREAD_INPUT_FALLBACKS).value
 
-        # Credit spread mean reversion
-        reversion_fraction = 0.5  # 50% reversion over 10 years
-        spread_change = (fair_credit_spread - credit_spread) * reversion_fraction
+        # Credit spread mean reversion (share of the gap closed over the horizon)
+        reversion_fraction = self.overrides.get_bond_params()['credit_spread_reversion']
+        spread_change = kernels.reversion_change(credit_spread, fair_credit_spread, reversion_fraction)
 
         # Spread widening = price decline (negative valuation)
-        spread_valuation = -duration * spread_change / forecast_horizon
+        spread_valuation = kernels.valuation_return(duration, spread_change, forecast_horizon)
 
         # Adjust return
         adjusted_return = forecast.expected_return_nominal + spread_valuation
         adjusted_real = adjusted_return - inflation_forecast
 
-        # Update components
-        forecast.components['credit_spread'] = {
-            'current_spread': credit_spread,
-            'fair_spread': fair_credit_spread,
-            'spread_valuation': spread_valuation,
-        }
+        if self.overrides.tracking:
+            # Update components
+            forecast.components['credit_spread'] = {
+                'current_spread': credit_spread,
+                'fair_spread': fair_credit_spread,
+                'spread_valuation': spread_valuation,
+            }
 
-        # Track credit spread sources
-        forecast.sources['credit_spread.current_spread'] = credit_spread_tv.source.value
-        forecast.sources['credit_spread.fair_spread'] = fair_credit_spread_tv.source.value
-        forecast.sources['credit_spread.spread_valuation'] = 'computed'
+            # Track credit spread sources
+            forecast.sources['credit_spread.current_spread'] = credit_spread_tv.source.value
+            forecast.sources['credit_spread.fair_spread'] = fair_credit_spread_tv.source.value
+            forecast.sources['credit_spread.spread_valuation'] = 'computed'
 
         return BondForecast(
             expected_return_nominal=adjusted_return,
@@ -475,8 +534,11 @@ class EMBondModel(BondModel):
     Uses EM-specific default rates and T-Bill forecasts.
     """
 
-    def __init__(self, override_manager: OverrideManager):
-        super().__init__(override_manager, AssetClass.BONDS_EM)
+    # CREDIT_PARAMS entry used when default/recovery rates are missing
+    CREDIT_PROFILE = 'em_local_currency'
+
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
+        super().__init__(override_manager, AssetClass.BONDS_EM, context)
 
     def compute_credit_loss(self, inputs: Dict[str, TrackedValue]) -> Dict[str, TrackedValue]:
         """
@@ -484,10 +546,11 @@ class EMBondModel(BondModel):
 
         EM local currency has relatively low default rates (sovereign in own currency).
         """
-        default_rate = inputs.get('default_rate', TrackedValue(0.0018, InputSource.DEFAULT))
-        recovery_rate = inputs.get('recovery_rate', TrackedValue(0.40, InputSource.DEFAULT))
+        fallback = CREDIT_PARAMS[self.CREDIT_PROFILE]
+        default_rate = inputs.get('default_rate', TrackedValue(fallback['default_rate'], InputSource.DEFAULT))
+        recovery_rate = inputs.get('recovery_rate', TrackedValue(fallback['recovery_rate'], InputSource.DEFAULT))
 
-        credit_loss = default_rate.value * (1 - recovery_rate.value)
+        credit_loss = kernels.credit_loss(default_rate.value, recovery_rate.value)
 
         return {
             'credit_loss': TrackedValue(credit_loss, InputSource.COMPUTED),
@@ -517,7 +580,8 @@ class EMBondModel(BondModel):
         forecast_horizon : int
             Years for forecast.
         em_tbill_forecast : float, optional
-            EM-specific T-Bill forecast. If None, uses US + spread.
+            EM-specific T-Bill forecast. If None, uses US + the
+            'em_hard_currency_spread' bond parameter.
         hard_currency : bool, optional
             If True, treats as USD-denominated hard currency bonds.
             Uses passed inflation directly without EM premium adjustment.
@@ -531,7 +595,7 @@ class EMBondModel(BondModel):
 
         # Use EM T-Bill if provided, otherwise estimate from US + spread
         if em_tbill_forecast is None:
-            em_spread = 0.02  # Default 2% spread over US
+            em_spread = self.overrides.get_bond_params()['em_hard_currency_spread']
             em_tbill_forecast = tbill_forecast + em_spread
 
         # For hard currency bonds (USD-denominated), use the passed inflation directly
@@ -557,8 +621,8 @@ class InflationLinkedBondModel(BondModel):
     Nominal Return = Real Return + (Inflation * Inflation Beta) - Index Lag Drag
     """
 
-    def __init__(self, override_manager: OverrideManager):
-        super().__init__(override_manager, AssetClass.INFLATION_LINKED)
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
+        super().__init__(override_manager, AssetClass.INFLATION_LINKED, context)
 
     def compute_credit_loss(self, inputs: Dict[str, TrackedValue]) -> Dict[str, TrackedValue]:
         """DM sovereign inflation-linked bonds are treated as default-free."""
@@ -586,13 +650,13 @@ class InflationLinkedBondModel(BondModel):
         forecast_horizon : int
             Forecast horizon in years.
         """
-        current_real_yield_tv = regime_inputs.get('current_real_yield', TrackedValue(0.01, InputSource.DEFAULT))
-        duration_tv = regime_inputs.get('duration', TrackedValue(7.0, InputSource.DEFAULT))
-        current_rtp_tv = regime_inputs.get('current_real_term_premium', TrackedValue(0.002, InputSource.DEFAULT))
-        fair_rtp_tv = regime_inputs.get('fair_real_term_premium', TrackedValue(0.002, InputSource.DEFAULT))
-        inflation_beta_tv = regime_inputs.get('inflation_beta', TrackedValue(1.0, InputSource.DEFAULT))
-        index_lag_drag_tv = regime_inputs.get('index_lag_drag', TrackedValue(0.001, InputSource.DEFAULT))
-        liquidity_technical_tv = regime_inputs.get('liquidity_technical', TrackedValue(0.0, InputSource.DEFAULT))
+        current_real_yield_tv = _input(regime_inputs, 'current_real_yield', INFLATION_LINKED_INPUT_FALLBACKS)
+        duration_tv = _input(regime_inputs, 'duration', INFLATION_LINKED_INPUT_FALLBACKS)
+        current_rtp_tv = _input(regime_inputs, 'current_real_term_premium', INFLATION_LINKED_INPUT_FALLBACKS)
+        fair_rtp_tv = _input(regime_inputs, 'fair_real_term_premium', INFLATION_LINKED_INPUT_FALLBACKS)
+        inflation_beta_tv = _input(regime_inputs, 'inflation_beta', INFLATION_LINKED_INPUT_FALLBACKS)
+        index_lag_drag_tv = _input(regime_inputs, 'index_lag_drag', INFLATION_LINKED_INPUT_FALLBACKS)
+        liquidity_technical_tv = _input(regime_inputs, 'liquidity_technical', INFLATION_LINKED_INPUT_FALLBACKS)
 
         duration = duration_tv.value
         current_rtp = current_rtp_tv.value
@@ -624,6 +688,19 @@ class InflationLinkedBondModel(BondModel):
         expected_return_real = real_carry + real_roll_return + real_valuation_return + liquidity_technical_tv.value
         expected_return_nominal = expected_return_real + inflation_indexation - index_lag_drag_tv.value
 
+        if not self.overrides.tracking:
+            return BondForecast(
+                expected_return_nominal=expected_return_nominal,
+                expected_return_real=expected_return_real,
+                yield_component=real_carry,
+                roll_return=real_roll_return,
+                valuation_return=real_valuation_return,
+                credit_loss=0.0,
+                inflation=inflation_forecast,
+                components={},
+                sources={},
+            )
+
         components = {
             'real': {
                 'current_real_yield': current_real_yield_tv.value,
@@ -2,10 +2,84 @@
 FX forecasting model using Research Affiliates' PPP-based methodology.
 
 This module provides FX forecasts for translating asset returns between
-different base currencies (USD/EUR).
+different base currencies (USD/EUR), either pair by pair or as one matrix
+of expected changes between every pair of currencies.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Sequence, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..config import CURRENCY_TO_MACRO_REGION, FX_CURRENCIES
+from ..utils import kernels
+
+
+def _scalar(value: Any) -> Any:
+    """Unwrap numpy scalars to Python floats; dual numbers pass through."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+@dataclass
+class FXMatrix:
+    """
+    Expected annual FX changes between every pair of currencies.
+
+    Entry [i, j] of each matrix refers to home currency ``currencies[i]``
+    against foreign currency ``currencies[j]`` (positive = home
+    depreciation), so every matrix is antisymmetric with a zero diagonal.
+    Arrays have object dtype when the macro forecasts carry dual numbers.
+    """
+    currencies: Tuple[str, ...]
+    fx_change: np.ndarray
+    carry: np.ndarray
+    ppp: np.ndarray
+    tbill: np.ndarray
+    inflation: np.ndarray
+
+    def index(self, currency: str) -> int:
+        """Row/column of a currency."""
+        try:
+            return self.currencies.index(currency)
+        except ValueError:
+            raise ValueError(f"Unknown currency {currency!r}; expected one of {list(self.currencies)}") from None
+
+    def pair(self, home_currency: str, foreign_currency: str) -> Dict[str, Any]:
+        """
+        FX forecast for one pair, in the format of FXModel.forecast_fx_change.
+
+        Parameters
+        ----------
+        home_currency : str
+            Home (base) currency, e.g. 'eur'.
+        foreign_currency : str
+            Foreign (asset local) currency, e.g. 'jpy'.
+
+        Returns
+        -------
+        dict
+            'fx_change', 'carry_component', 'ppp_component', 'home_tbill',
+            'foreign_tbill', 'home_inflation' and 'foreign_inflation'.
+        """
+        i, j = self.index(home_currency), self.index(foreign_currency)
+        return {
+            'fx_change': _scalar(self.fx_change[i, j]),
+            'carry_component': _scalar(self.carry[i, j]),
+            'ppp_component': _scalar(self.ppp[i, j]),
+            'home_tbill': _scalar(self.tbill[i]),
+            'foreign_tbill': _scalar(self.tbill[j]),
+            'home_inflation': _scalar(self.inflation[i]),
+            'foreign_inflation': _scalar(self.inflation[j]),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-list representation (for JSON output)."""
+        return {
+            'currencies': list(self.currencies),
+            'fx_change': self.fx_change.tolist(),
+            'carry_component': self.carry.tolist(),
+            'ppp_component': self.ppp.tolist(),
+        }
 
 
 class FXModel:
@@ -90,10 +164,7 @@ class FXModel:
         ppp_component = home_inflation - foreign_inflation
 
         # Total FX change (weighted average)
-        fx_change = (
-            self.CARRY_WEIGHT * carry_component +
-            self.PPP_WEIGHT * ppp_component
-        )
+        fx_change = kernels.weighted_blend(carry_component, ppp_component, self.CARRY_WEIGHT, self.PPP_WEIGHT)
 
         return {
             'fx_change': fx_change,
@@ -131,14 +202,6 @@ class FXModel:
             - 'needs_adjustment': Whether adjustment was needed
             - 'components': Detailed FX forecast components (if adjustment needed)
         """
-        # Currency to macro region mapping
-        currency_to_region = {
-            'usd': 'us',
-            'eur': 'eurozone',
-            'jpy': 'japan',
-            'em': 'em',
-        }
-
         # No adjustment needed if asset is in base currency
         if home_currency == asset_local_currency:
             return {
@@ -148,8 +211,8 @@ class FXModel:
             }
 
         # Get regions
-        home_region = currency_to_region.get(home_currency, 'us')
-        foreign_region = currency_to_region.get(asset_local_currency, 'us')
+        home_region = CURRENCY_TO_MACRO_REGION.get(home_currency, 'us')
+        foreign_region = CURRENCY_TO_MACRO_REGION.get(asset_local_currency, 'us')
 
         # Calculate FX forecast
         fx_forecast = self.forecast_fx_change(
@@ -163,3 +226,48 @@ class FXModel:
             'needs_adjustment': True,
             'components': fx_forecast,
         }
+
+    def forecast_fx_matrix(
+        self,
+        macro_forecasts: Dict[str, Any],
+        currencies: Sequence[str] = FX_CURRENCIES,
+    ) -> FXMatrix:
+        """
+        Forecast expected FX changes between every pair of currencies at once.
+
+        Applies the forecast_fx_change formula to all pairs by broadcasting
+        the regional T-Bill and inflation vectors:
+
+        FX[i, j] = 30% × (T-Bill[i] - T-Bill[j])
+                 + 70% × (Inflation[i] - Inflation[j])
+
+        Parameters
+        ----------
+        macro_forecasts : dict
+            Macro forecasts by region containing 'tbill_rate' and 'inflation'.
+        currencies : sequence of str, optional
+            Currencies to include (default: every currency in
+            CURRENCY_TO_MACRO_REGION).
+
+        Returns
+        -------
+        FXMatrix
+            Antisymmetric FX change, carry and PPP matrices.
+        """
+        currencies = tuple(currencies)
+        regions = [CURRENCY_TO_MACRO_REGION.get(ccy, 'us') for ccy in currencies]
+        tbill = np.array([macro_forecasts.get(r, {}).get('tbill_rate', 0.0) for r in regions])
+        inflation = np.array([macro_forecasts.get(r, {}).get('inflation', 0.0) for r in regions])
+
+        carry = tbill[:, None] - tbill[None, :]
+        ppp = inflation[:, None] - inflation[None, :]
+        fx_change = kernels.weighted_blend(carry, ppp, self.CARRY_WEIGHT, self.PPP_WEIGHT)
+
+        return FXMatrix(
+            currencies=currencies,
+            fx_change=fx_change,
+            carry=carry,
+            ppp=ppp,
+            tbill=tbill,
+            inflation=inflation,
+        )
@@ -15,6 +15,30 @@ from enum import Enum
 
 from ..inputs.overrides import OverrideManager, TrackedValue, InputSource, extract_values
 from ..config import AssetClass, Region, EQUITY_PARAMS
+from ..utils import kernels
+from ..context import EvaluationContext
+
+
+# Fallbacks for inputs missing from the asset data (RA and GK), shared with
+# the batch engine so both resolve the same values
+EQUITY_INPUT_FALLBACKS = {
+    'dividend_yield': 0.02,
+    'real_eps_growth': 0.015,
+    'regional_eps_growth': 0.015,
+    'current_caey': 0.04,
+    'fair_caey': 0.05,
+    'reversion_speed': 1.0,
+    'net_buyback_yield': 0.0,
+    'revenue_gdp_wedge': 0.0,
+    'margin_change': 0.0,
+    'current_pe': 20.0,
+    'target_pe': 20.0,
+}
+
+
+def _input(inputs: Dict[str, TrackedValue], key: str) -> TrackedValue:
+    """Resolved input, or its EQUITY_INPUT_FALLBACKS value."""
+    return inputs.get(key, TrackedValue(EQUITY_INPUT_FALLBACKS[key], InputSource.DEFAULT))
 
 
 class EquityRegion(Enum):
@@ -66,7 +90,7 @@ class EquityModel:
     DM_REGIONS = [EquityRegion.US, EquityRegion.EUROPE, EquityRegion.JAPAN]
     EM_REGIONS = [EquityRegion.EM]
 
-    def __init__(self, override_manager: OverrideManager):
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
         """
         Initialize equity model.
 
@@ -74,14 +98,21 @@ class EquityModel:
         ----------
         override_manager : OverrideManager
             Manager for handling input overrides.
+        context : EvaluationContext, optional
+            Shared memo for resolved inputs. Without one, inputs are
+            resolved on every call.
         """
         self.overrides = override_manager
+        self.context = context if context is not None else EvaluationContext(memoize=False)
         self._params = EQUITY_PARAMS.copy()
 
     def get_inputs(self, region: EquityRegion) -> Dict[str, TrackedValue]:
         """Get inputs for a specific equity region."""
         asset_class = self.REGION_TO_ASSET[region]
-        return self.overrides.get_asset_inputs(asset_class)
+        return self.context.get(
+            'asset_inputs', asset_class,
+            lambda: self.overrides.get_asset_inputs(asset_class),
+        )
 
     def forecast_dividend_yield(self, region: EquityRegion) -> Dict[str, TrackedValue]:
         """
@@ -100,7 +131,7 @@ class EquityModel:
             Dividend yield components.
         """
         inputs = self.get_inputs(region)
-        dividend_yield = inputs.get('dividend_yield', TrackedValue(0.02, InputSource.DEFAULT))
+        dividend_yield = _input(inputs, 'dividend_yield')
 
         return {
             'dividend_yield': dividend_yield,
@@ -131,18 +162,17 @@ class EquityModel:
         inputs = self.get_inputs(region)
 
         # Country-specific EPS growth
-        country_eps = inputs.get('real_eps_growth', TrackedValue(0.015, InputSource.DEFAULT))
+        country_eps = _input(inputs, 'real_eps_growth')
 
         # Regional average EPS growth
-        regional_eps = inputs.get('regional_eps_growth', TrackedValue(0.015, InputSource.DEFAULT))
+        regional_eps = _input(inputs, 'regional_eps_growth')
 
         # Weighted average (50/50 by default)
         country_weight = self._params.get('country_weight', 0.5)
         regional_weight = self._params.get('regional_weight', 0.5)
 
-        blended_eps = (
-            country_weight * country_eps.value +
-            regional_weight * regional_eps.value
+        blended_eps = kernels.weighted_blend(
+            country_eps.value, regional_eps.value, country_weight, regional_weight
         )
 
         # Cap at global GDP growth if provided
@@ -195,13 +225,13 @@ class EquityModel:
         inputs = self.get_inputs(region)
 
         # Current CAEY (inverse of CAPE)
-        current_caey = inputs.get('current_caey', TrackedValue(0.04, InputSource.DEFAULT))
+        current_caey = _input(inputs, 'current_caey')
 
         # Fair CAEY (long-term average)
-        fair_caey = inputs.get('fair_caey', TrackedValue(0.05, InputSource.DEFAULT))
+        fair_caey = _input(inputs, 'fair_caey')
 
         # Reversion speed (lambda): 1.0 = full reversion, 0.0 = no reversion
-        reversion_speed = inputs.get('reversion_speed', TrackedValue(1.0, InputSource.DEFAULT))
+        reversion_speed = _input(inputs, 'reversion_speed')
 
         # Full reversion period (typically 20 years)
         full_reversion_years = self._params.get('valuation_reversion_years', 20)
@@ -215,23 +245,13 @@ class EquityModel:
 
         if current_caey.value > 0 and reversion_speed.value > 0:
             # Annual percentage change in CAEY (dampened by reversion_speed)
-            caey_annual_change = (fair_caey.value / current_caey.value) ** (reversion_speed.value / full_reversion_years) - 1
-
-            # Valuation return = negative of CAEY change
-            # Higher CAEY = lower prices = negative valuation return
-            valuation_annual = -caey_annual_change
-
-            # Average over forecast horizon
-            # Sum of annual valuation effects, accounting for compounding
-            cumulative_valuation = 0.0
-            caey = current_caey.value
-            for year in range(forecast_horizon):
-                caey_next = caey * (1 + caey_annual_change)
-                year_valuation = caey / caey_next - 1  # Price change
-                cumulative_valuation += year_valuation
-                caey = caey_next
-
-            avg_valuation = cumulative_valuation / forecast_horizon
+            caey_annual_change = kernels.caey_annual_change(
+                current_caey.value, fair_caey.value, reversion_speed.value, full_reversion_years
+            )
+
+            # Average over forecast horizon. Higher CAEY = lower prices; with
+            # constant CAEY growth every year's price change is the same
+            avg_valuation = kernels.caey_average_valuation(caey_annual_change)
         else:
             avg_valuation = 0.0
             caey_annual_change = 0.0
@@ -289,18 +309,20 @@ class EquityModel:
         # Nominal return (add inflation)
         expected_return_nominal = expected_return_real + inflation_forecast
 
-        # Combine components
-        components = {
-            'dividend': extract_values(div_result),
-            'eps': extract_values(eps_result),
-            'valuation': extract_values(val_result),
-        }
-
-        # Track sources
+        components = {}
         sources = {}
-        for prefix, result in [('dividend', div_result), ('eps', eps_result), ('valuation', val_result)]:
-            for key, tv in result.items():
-                sources[f"{prefix}.{key}"] = tv.source.value
+        if self.overrides.tracking:
+            # Combine components
+            components = {
+                'dividend': extract_values(div_result),
+                'eps': extract_values(eps_result),
+                'valuation': extract_values(val_result),
+            }
+
+            # Track sources
+            for prefix, result in [('dividend', div_result), ('eps', eps_result), ('valuation', val_result)]:
+                for key, tv in result.items():
+                    sources[f"{prefix}.{key}"] = tv.source.value
 
         return EquityForecast(
             expected_return_nominal=expected_return_nominal,
@@ -385,7 +407,7 @@ def compute_regional_average_eps(
 
     for region in regions:
         inputs = equity_model.get_inputs(region)
-        eps = inputs.get('real_eps_growth', TrackedValue(0.015, InputSource.DEFAULT)).value
+        eps = _input(inputs, 'real_eps_growth').value
         weight = weights.get(region.value, 0) / total_weight
         avg_eps += weight * eps
 
@@ -442,20 +464,24 @@ class EquityModelGK:
         EquityRegion.EM: AssetClass.EQUITY_EM,
     }
 
-    def __init__(self, override_manager: OverrideManager):
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
         self.overrides = override_manager
+        self.context = context if context is not None else EvaluationContext(memoize=False)
 
     def get_inputs(self, region: EquityRegion) -> Dict[str, TrackedValue]:
         """Get GK inputs for a specific equity region."""
         asset_class = self.REGION_TO_ASSET[region]
-        return self.overrides.get_asset_inputs(asset_class)
+        return self.context.get(
+            'asset_inputs', asset_class,
+            lambda: self.overrides.get_asset_inputs(asset_class),
+        )
 
     # ----- Component methods -----
 
     def forecast_dividend_yield(self, region: EquityRegion) -> Dict[str, TrackedValue]:
         """Current trailing dividend yield (no mean reversion)."""
         inputs = self.get_inputs(region)
-        dividend_yield = inputs.get('dividend_yield', TrackedValue(0.02, InputSource.DEFAULT))
+        dividend_yield = _input(inputs, 'dividend_yield')
         return {
             'dividend_yield': dividend_yield,
         }
@@ -467,9 +493,7 @@ class EquityModelGK:
         Positive for US (~1.5%), negative for EM (~-1.5%).
         """
         inputs = self.get_inputs(region)
-        net_buyback_yield = inputs.get(
-            'net_buyback_yield', TrackedValue(0.0, InputSource.DEFAULT)
-        )
+        net_buyback_yield = _input(inputs, 'net_buyback_yield')
         return {
             'net_buyback_yield': net_buyback_yield,
         }
@@ -491,9 +515,7 @@ class EquityModelGK:
         """
         inputs = self.get_inputs(region)
 
-        wedge = inputs.get(
-            'revenue_gdp_wedge', TrackedValue(0.0, InputSource.DEFAULT)
-        )
+        wedge = _input(inputs, 'revenue_gdp_wedge')
 
         # Check if revenue_growth was directly overridden by the user
         revenue_growth_input = inputs.get('revenue_growth')
@@ -529,9 +551,7 @@ class EquityModelGK:
         Negative = margin compression (e.g., US from peak).
         """
         inputs = self.get_inputs(region)
-        margin_change = inputs.get(
-            'margin_change', TrackedValue(0.0, InputSource.DEFAULT)
-        )
+        margin_change = _input(inputs, 'margin_change')
         return {
             'margin_change': margin_change,
         }
@@ -552,13 +572,13 @@ class EquityModelGK:
         """
         inputs = self.get_inputs(region)
 
-        current_pe = inputs.get('current_pe', TrackedValue(20.0, InputSource.DEFAULT))
-        target_pe = inputs.get('target_pe', TrackedValue(20.0, InputSource.DEFAULT))
+        current_pe = _input(inputs, 'current_pe')
+        target_pe = _input(inputs, 'target_pe')
 
         if current_pe.value > 0 and target_pe.value > 0:
             # Annualized P/E change
-            valuation_annual = (
-                (target_pe.value / current_pe.value) ** (1.0 / forecast_horizon) - 1
+            valuation_annual = kernels.pe_valuation_change(
+                current_pe.value, target_pe.value, forecast_horizon
             )
         else:
             valuation_annual = 0.0
@@ -631,26 +651,28 @@ class EquityModelGK:
         # Back-compute real return for display consistency
         expected_return_real = expected_return_nominal - macro_inflation
 
-        # Combine components
-        components = {
-            'dividend': extract_values(div_result),
-            'buyback': extract_values(buyback_result),
-            'revenue': extract_values(rev_result),
-            'margin': extract_values(margin_result),
-            'valuation': extract_values(val_result),
-        }
-
-        # Track sources
+        components = {}
         sources = {}
-        for prefix, result in [
-            ('dividend', div_result),
-            ('buyback', buyback_result),
-            ('revenue', rev_result),
-            ('margin', margin_result),
-            ('valuation', val_result),
-        ]:
-            for key, tv in result.items():
-                sources[f"{prefix}.{key}"] = tv.source.value
+        if self.overrides.tracking:
+            # Combine components
+            components = {
+                'dividend': extract_values(div_result),
+                'buyback': extract_values(buyback_result),
+                'revenue': extract_values(rev_result),
+                'margin': extract_values(margin_result),
+                'valuation': extract_values(val_result),
+            }
+
+            # Track sources
+            for prefix, result in [
+                ('dividend', div_result),
+                ('buyback', buyback_result),
+                ('revenue', rev_result),
+                ('margin', margin_result),
+                ('valuation', val_result),
+            ]:
+                for key, tv in result.items():
+                    sources[f"{prefix}.{key}"] = tv.source.value
 
         return EquityForecastGK(
             expected_return_nominal=expected_return_nominal,
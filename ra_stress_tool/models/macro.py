@@ -9,6 +9,57 @@ from dataclasses import dataclass
 
 from ..inputs.overrides import OverrideManager, TrackedValue, InputSource, extract_values
 from ..utils.ewma import sigmoid_my_ratio
+from ..utils import kernels
+from ..context import EvaluationContext
+
+
+# Fallbacks for building-block inputs missing from a region's market data,
+# shared with the batch engine so both resolve the same values
+MACRO_INPUT_FALLBACKS = {
+    'population_growth': 0.004,
+    'productivity_growth': 0.012,
+    'my_ratio': 2.0,
+    'current_headline_inflation': 0.025,
+    'current_tbill': 0.04,
+}
+
+
+def _input(inputs: Dict[str, TrackedValue], key: str) -> TrackedValue:
+    """Resolved input, or its MACRO_INPUT_FALLBACKS value."""
+    return inputs.get(key, TrackedValue(MACRO_INPUT_FALLBACKS[key], InputSource.DEFAULT))
+
+
+# Region-level defaults for inputs that are not part of DEFAULT_MARKET_DATA
+# but can still be overridden (macro.<region>.<key>).
+RGDP_ADJUSTMENT_DEFAULTS = {
+    'us': -0.003,
+    'eurozone': -0.003,
+    'japan': -0.003,
+}
+RGDP_ADJUSTMENT_FALLBACK = -0.005
+
+LONG_TERM_INFLATION_DEFAULTS = {
+    'us': 0.022,        # 2.2% (Fed target + small buffer)
+    'eurozone': 0.020,  # 2.0% (ECB target)
+    'japan': 0.015,     # 1.5%
+    'em': 0.035,        # 3.5% (higher for EM)
+}
+LONG_TERM_INFLATION_FALLBACK = 0.025
+
+COUNTRY_FACTOR_DEFAULTS = {
+    'us': 0.0,
+    'eurozone': -0.002,
+    'japan': -0.005,
+    'em': 0.005,
+}
+
+# Approximate GDP weights for the global RGDP aggregate
+GLOBAL_GDP_WEIGHTS = {
+    'us': 0.26,
+    'eurozone': 0.15,
+    'japan': 0.05,
+    'em': 0.40,  # Includes China, India, etc.
+}
 
 
 @dataclass
@@ -38,7 +89,7 @@ class MacroModel:
     All intermediate values can be overridden.
     """
 
-    def __init__(self, override_manager: OverrideManager):
+    def __init__(self, override_manager: OverrideManager, context: Optional[EvaluationContext] = None):
         """
         Initialize the macro model.
 
@@ -46,8 +97,19 @@ class MacroModel:
         ----------
         override_manager : OverrideManager
             Manager for handling input overrides.
+        context : EvaluationContext, optional
+            Shared memo for resolved inputs. Without one, inputs are
+            resolved on every call.
         """
         self.overrides = override_manager
+        self.context = context if context is not None else EvaluationContext(memoize=False)
+
+    def get_inputs(self, region: str) -> Dict[str, TrackedValue]:
+        """Get macro inputs for a region."""
+        return self.context.get(
+            'macro_inputs', region,
+            lambda: self.overrides.get_macro_inputs(region),
+        )
 
     def forecast_rgdp_growth(self, region: str) -> Dict[str, TrackedValue]:
         """
@@ -68,7 +130,7 @@ class MacroModel:
         dict
             Forecast components as TrackedValue objects.
         """
-        inputs = self.overrides.get_macro_inputs(region)
+        inputs = self.get_inputs(region)
 
         # Check for direct override of rgdp_growth
         direct_override = self.overrides.get_value('macro', region, 'rgdp_growth')
@@ -83,9 +145,9 @@ class MacroModel:
             }
 
         # Get component inputs
-        population_growth = inputs.get('population_growth', TrackedValue(0.004, InputSource.DEFAULT))
-        productivity_growth = inputs.get('productivity_growth', TrackedValue(0.012, InputSource.DEFAULT))
-        my_ratio = inputs.get('my_ratio', TrackedValue(2.0, InputSource.DEFAULT))
+        population_growth = _input(inputs, 'population_growth')
+        productivity_growth = _input(inputs, 'productivity_growth')
+        my_ratio = _input(inputs, 'my_ratio')
 
         # Calculate demographic effect using MY ratio
         demographic_effect = sigmoid_my_ratio(my_ratio.value)
@@ -98,7 +160,10 @@ class MacroModel:
             adjustment_source = InputSource.OVERRIDE
         else:
             # Default adjustment based on typical values
-            adjustment = -0.003 if region.lower() in ['us', 'eurozone', 'japan'] else -0.005
+            adjustment = self.overrides.track(
+                RGDP_ADJUSTMENT_DEFAULTS.get(region.lower(), RGDP_ADJUSTMENT_FALLBACK),
+                'macro', region, 'rgdp_adjustment',
+            )
             adjustment_source = InputSource.DEFAULT
 
         # Calculate output per capita growth
@@ -132,7 +197,7 @@ class MacroModel:
         dict
             Forecast components as TrackedValue objects.
         """
-        inputs = self.overrides.get_macro_inputs(region)
+        inputs = self.get_inputs(region)
         inflation_params = self.overrides.get_inflation_params()
 
         # Check for direct override
@@ -140,13 +205,12 @@ class MacroModel:
         if direct_override.source == InputSource.OVERRIDE:
             return {
                 'inflation_forecast': direct_override,
-                'current_headline_inflation': inputs.get('current_headline_inflation',
-                                                         TrackedValue(0.025, InputSource.DEFAULT)),
+                'current_headline_inflation': _input(inputs, 'current_headline_inflation'),
                 'long_term_inflation': TrackedValue(direct_override.value, InputSource.COMPUTED),
             }
 
         # Get inputs
-        current_headline = inputs.get('current_headline_inflation', TrackedValue(0.025, InputSource.DEFAULT))
+        current_headline = _input(inputs, 'current_headline_inflation')
 
         # Long-term inflation (typically inflation target or EWMA of core)
         long_term_override = self.overrides.get_value('macro', region, 'long_term_inflation')
@@ -155,13 +219,10 @@ class MacroModel:
             long_term_source = InputSource.OVERRIDE
         else:
             # Default long-term inflation by region
-            long_term_defaults = {
-                'us': 0.022,        # 2.2% (Fed target + small buffer)
-                'eurozone': 0.020,  # 2.0% (ECB target)
-                'japan': 0.015,     # 1.5%
-                'em': 0.035,        # 3.5% (higher for EM)
-            }
-            long_term_inflation = long_term_defaults.get(region.lower(), 0.025)
+            long_term_inflation = self.overrides.track(
+                LONG_TERM_INFLATION_DEFAULTS.get(region.lower(), LONG_TERM_INFLATION_FALLBACK),
+                'macro', region, 'long_term_inflation',
+            )
             long_term_source = InputSource.DEFAULT
 
         # Adjustment (typically small negative for skewness)
@@ -169,17 +230,15 @@ class MacroModel:
         if adjustment_override.source == InputSource.OVERRIDE:
             adjustment = adjustment_override.value
         else:
-            adjustment = 0.0  # Default no adjustment
+            adjustment = self.overrides.track(0.0, 'macro', region, 'inflation_adjustment')  # Default no adjustment
 
         # Calculate forecast
         current_weight = inflation_params['current_weight']
         long_term_weight = inflation_params['long_term_weight']
 
-        inflation_forecast = (
-            current_weight * current_headline.value +
-            long_term_weight * long_term_inflation +
-            adjustment
-        )
+        inflation_forecast = kernels.weighted_blend(
+            current_headline.value, long_term_inflation, current_weight, long_term_weight
+        ) + adjustment
 
         return {
             'inflation_forecast': TrackedValue(inflation_forecast, InputSource.COMPUTED),
@@ -212,7 +271,7 @@ class MacroModel:
         dict
             Forecast components as TrackedValue objects.
         """
-        inputs = self.overrides.get_macro_inputs(region)
+        inputs = self.get_inputs(region)
         tbill_params = self.overrides.get_tbill_params()
 
         # Check for direct override
@@ -220,11 +279,11 @@ class MacroModel:
         if direct_override.source == InputSource.OVERRIDE:
             return {
                 'tbill_forecast': direct_override,
-                'current_tbill': inputs.get('current_tbill', TrackedValue(0.04, InputSource.DEFAULT)),
+                'current_tbill': _input(inputs, 'current_tbill'),
             }
 
         # Get current T-Bill
-        current_tbill = inputs.get('current_tbill', TrackedValue(0.04, InputSource.DEFAULT))
+        current_tbill = _input(inputs, 'current_tbill')
 
         # Get RGDP forecast if not provided
         if rgdp_forecast is None:
@@ -243,13 +302,10 @@ class MacroModel:
             country_factor_source = InputSource.OVERRIDE
         else:
             # Default country factors
-            country_factors = {
-                'us': 0.0,
-                'eurozone': -0.002,
-                'japan': -0.005,
-                'em': 0.005,
-            }
-            country_factor = country_factors.get(region.lower(), 0.0)
+            country_factor = self.overrides.track(
+                COUNTRY_FACTOR_DEFAULTS.get(region.lower(), 0.0),
+                'macro', region, 'country_factor',
+            )
             country_factor_source = InputSource.DEFAULT
 
         # Calculate long-term T-Bill rate
@@ -263,9 +319,8 @@ class MacroModel:
         current_weight = tbill_params['current_weight']
         long_term_weight = tbill_params['long_term_weight']
 
-        tbill_forecast = (
-            current_weight * current_tbill.value +
-            long_term_weight * long_term_tbill
+        tbill_forecast = kernels.weighted_blend(
+            current_tbill.value, long_term_tbill, current_weight, long_term_weight
         )
 
         return {
@@ -307,18 +362,20 @@ class MacroModel:
         tbill_rate = tbill_result['tbill_forecast'].value
         nominal_gdp = rgdp_growth + inflation
 
-        # Combine all components
-        components = {
-            'rgdp': extract_values(rgdp_result),
-            'inflation': extract_values(inflation_result),
-            'tbill': extract_values(tbill_result),
-        }
-
-        # Track sources
+        components = {}
         sources = {}
-        for prefix, result in [('rgdp', rgdp_result), ('inflation', inflation_result), ('tbill', tbill_result)]:
-            for key, tv in result.items():
-                sources[f"{prefix}.{key}"] = tv.source.value
+        if self.overrides.tracking:
+            # Combine all components
+            components = {
+                'rgdp': extract_values(rgdp_result),
+                'inflation': extract_values(inflation_result),
+                'tbill': extract_values(tbill_result),
+            }
+
+            # Track sources
+            for prefix, result in [('rgdp', rgdp_result), ('inflation', inflation_result), ('tbill', tbill_result)]:
+                for key, tv in result.items():
+                    sources[f"{prefix}.{key}"] = tv.source.value
 
         return MacroForecast(
             rgdp_growth=rgdp_growth,
@@ -330,14 +387,14 @@ class MacroModel:
         )
 
 
-def compute_global_rgdp_growth(macro_model: MacroModel, weights: Optional[Dict[str, float]] = None) -> float:
+def weighted_global_rgdp_growth(regional_rgdp: Dict[str, float], weights: Optional[Dict[str, float]] = None) -> float:
     """
-    Compute GDP-weighted global RGDP growth forecast.
+    GDP-weight already computed regional RGDP forecasts into a global figure.
 
     Parameters
     ----------
-    macro_model : MacroModel
-        The macro model instance.
+    regional_rgdp : dict
+        RGDP growth forecasts by region.
     weights : dict, optional
         GDP weights by region. Defaults to approximate 2024 weights.
 
@@ -347,22 +404,42 @@ def compute_global_rgdp_growth(macro_model: MacroModel, weights: Optional[Dict[s
         Global RGDP growth forecast.
     """
     if weights is None:
-        # Approximate GDP weights
-        weights = {
-            'us': 0.26,
-            'eurozone': 0.15,
-            'japan': 0.05,
-            'em': 0.40,  # Includes China, India, etc.
-        }
+        weights = GLOBAL_GDP_WEIGHTS
 
     total_weight = sum(weights.values())
     global_growth = 0.0
 
     for region, weight in weights.items():
+        if region in regional_rgdp:
+            global_growth += (weight / total_weight) * regional_rgdp[region]
+
+    return global_growth
+
+
+def compute_global_rgdp_growth(macro_model: MacroModel, weights: Optional[Dict[str, float]] = None) -> float:
+    """
+    Compute GDP-weighted global RGDP growth forecast.
+
+    Parameters
+    ----------
+    macro_model : MacroModel
+        The macro model instance.
+    weights : dict, optional
+        GDP weights by region. Defaults to approximate 2024 weights.
+
+    Returns
+    -------
+    float
+        Global RGDP growth forecast.
+    """
+    if weights is None:
+        weights = GLOBAL_GDP_WEIGHTS
+
+    regional_rgdp = {}
+    for region in weights:
         try:
-            forecast = macro_model.compute_full_forecast(region)
-            global_growth += (weight / total_weight) * forecast.rgdp_growth
+            regional_rgdp[region] = macro_model.compute_full_forecast(region).rgdp_growth
         except ValueError:
             continue  # Skip unknown regions
 
-    return global_growth
+    return weighted_global_rgdp_growth(regional_rgdp, weights)
@@ -30,6 +30,15 @@ class AssetClassResult:
     macro_dependencies: Dict[str, MacroDependency] = field(default_factory=dict)
 
 
+@dataclass
+class RecomputeReport:
+    """Summary of an incremental recomputation after an override patch."""
+    recomputed_assets: List[str]    # Asset keys whose results were rebuilt
+    changed_assets: List[str]       # Subset whose result actually differs
+    macro_regions: List[str]        # Macro regions that were re-forecast
+    full_recompute: bool = False    # True when the patch could not be scoped
+
+
 @dataclass
 class CMEResults:
     """Complete CME results container."""
@@ -39,6 +48,8 @@ class CMEResults:
     overrides_applied: Dict[str, Any]
     base_currency: str = 'usd'
     fx_forecasts: Dict[str, Dict[str, float]] = None
+    # {asset: {'expected_return_nominal' | 'expected_return_real': {input_path: derivative}}}
+    sensitivities: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None
 
     def __post_init__(self):
         if self.fx_forecasts is None:
@@ -206,7 +217,7 @@ def results_to_dict(results: CMEResults) -> Dict[str, Any]:
     dict
         Dictionary representation.
     """
-    return {
+    out = {
         'scenario_name': results.scenario_name,
         'results': {
             name: {
@@ -231,6 +242,9 @@ def results_to_dict(results: CMEResults) -> Dict[str, Any]:
         'macro_assumptions': results.macro_assumptions,
         'overrides_applied': results.overrides_applied,
     }
+    if results.sensitivities is not None:
+        out['sensitivities'] = results.sensitivities
+    return out
 
 
 def results_to_json(results: CMEResults, indent: int = 2) -> str:
@@ -312,3 +326,61 @@ def format_input_sources(results: CMEResults) -> str:
             lines.append(f"  [{source}] {input_name}: {value}")
 
     return "\n".join(lines)
+
+
+def format_monte_carlo_table(
+    results,
+    quantiles=(0.05, 0.25, 0.5, 0.75, 0.95),
+    measure: str = 'nominal',
+) -> str:
+    """
+    Format Monte Carlo return distributions as a text table.
+
+    Parameters
+    ----------
+    results : MonteCarloResults
+        Output of MonteCarloEngine.run.
+    quantiles : sequence of float
+        Quantiles to show as columns.
+    measure : str
+        'nominal' or 'real'.
+
+    Returns
+    -------
+    str
+        Formatted table string.
+    """
+    summary = results.summary(quantiles, measure)
+    labels = [f"p{q * 100:g}" for q in quantiles]
+    width = 25 + 10 * (len(labels) + 2)
+
+    lines = []
+    lines.append("=" * width)
+    lines.append(
+        f"Monte Carlo {measure} returns: {results.n_draws:,} draws "
+        f"(seed={results.seed}, base={results.base_currency.upper()})"
+    )
+    lines.append("=" * width)
+    lines.append("")
+
+    header = f"{'Asset Class':<25}" + "".join(f"{h:<10}" for h in ['Mean', 'Std'] + labels)
+    lines.append(header)
+    lines.append("-" * width)
+
+    for asset, stats in summary.items():
+        row = f"{asset:<25}"
+        row += f"{format_percentage(stats['mean']):<10}{format_percentage(stats['std']):<10}"
+        row += "".join(f"{format_percentage(stats[label]):<10}" for label in labels)
+        lines.append(row)
+
+    lines.append("")
+    lines.append("Sampled Inputs:")
+    for path, sketch in results.inputs.items():
+        lines.append(
+            f"  {path}: mean {format_percentage(sketch.mean)}, std {format_percentage(sketch.std)}"
+        )
+
+    lines.append("")
+    lines.append("=" * width)
+
+    return "\n".join(lines)
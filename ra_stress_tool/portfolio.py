@@ -0,0 +1,523 @@
+"""
+Portfolio aggregation and the efficient frontier.
+
+RiskModel combines the expected volatilities and pairwise correlations in
+config (EXPECTED_VOLATILITY, EXPECTED_CORRELATION) into a covariance
+matrix. Both can be overridden per scenario through a 'risk' entry in the
+usual overrides dictionary:
+
+    {'risk': {'volatility': {'equity_us': 0.17},
+              'correlation': {'equity_us': {'equity_europe': 0.9}}}}
+
+portfolio_stats gives expected return and volatility for any number of
+weight vectors at once. efficient_frontier traces the long-only (or
+bounded) minimum-variance frontier. Rather than one quadratic program per
+target return, the whole family is solved parametrically with Markowitz's
+critical line algorithm: starting from the highest-return portfolio, the
+solution is followed down to the minimum-variance portfolio through the
+corner portfolios where an asset enters or leaves its bounds. Between
+corners the optimal weights are linear in the target return, so all
+frontier points are then read off the corners in one vectorized step. The
+cost is one rank-one update of a small linear system per corner (about one
+corner per asset), however many points are requested, and every point is
+an exact optimum.
+
+Example
+-------
+>>> results = CMEEngine().compute_all_returns()
+>>> risk = RiskModel.from_config()
+>>> mu = np.array([results.results[a].expected_return_nominal for a in risk.assets])
+>>> frontier = efficient_frontier(mu, risk.covariance, n_points=100, assets=risk.assets)
+>>> frontier.volatilities[0]   # minimum-variance portfolio
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .config import AssetClass, EXPECTED_CORRELATION, EXPECTED_VOLATILITY
+
+
+RISK_OVERRIDE_KEY = 'risk'
+RISK_OVERRIDE_SECTIONS = ('volatility', 'correlation')
+
+DEFAULT_FRONTIER_POINTS = 100
+
+# Tolerance for slopes and bound violations in the critical line algorithm
+CLA_TOLERANCE = 1e-12
+# Equal expected returns are separated by up to this fraction of the return
+# range; corners within CLA_MERGE (same units) of the top return are merged
+CLA_TIE_BREAK = 1e-9
+CLA_MERGE = 1e-7
+# Free-set inverse updates between full refactorizations
+CLA_REFACTOR_EVERY = 50
+# Smallest covariance eigenvalue over fully invested directions, relative to
+# the largest eigenvalue, below which the frontier is rejected as singular
+CLA_MIN_EIGENVALUE_RATIO = 1e-8
+# Bound and budget tolerance of the frontier weights that are returned
+CLA_FEASIBILITY_TOLERANCE = 1e-8
+
+# Asset states in the critical line algorithm
+_LOWER, _FREE, _UPPER = -1, 0, 1
+
+Bounds = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass
+class RiskModel:
+    """
+    Volatilities and correlations of a set of assets.
+
+    Parameters
+    ----------
+    assets : tuple of str
+        Asset names (asset classes or any sub-assets).
+    volatilities : np.ndarray
+        Annualized volatility per asset.
+    correlation : np.ndarray
+        Correlation matrix (symmetric, unit diagonal, positive semidefinite).
+    """
+    assets: Tuple[str, ...]
+    volatilities: np.ndarray
+    correlation: np.ndarray
+
+    def __post_init__(self):
+        self.assets = tuple(self.assets)
+        self.volatilities = np.asarray(self.volatilities, dtype=float)
+        self.correlation = np.asarray(self.correlation, dtype=float)
+        n = len(self.assets)
+        if self.volatilities.shape != (n,) or self.correlation.shape != (n, n):
+            raise ValueError(f"Expected {n} volatilities and a {n}x{n} correlation matrix")
+        if np.any(self.volatilities < 0):
+            raise ValueError("Volatilities must be non-negative")
+        if not np.allclose(self.correlation, self.correlation.T, atol=1e-12):
+            raise ValueError("Correlation matrix must be symmetric")
+        if not np.allclose(np.diag(self.correlation), 1.0) or np.any(np.abs(self.correlation) > 1 + 1e-12):
+            raise ValueError("Correlations must lie in [-1, 1] with a unit diagonal")
+        if n and np.linalg.eigvalsh(self.correlation).min() < -1e-10:
+            raise ValueError("Correlation matrix is not positive semidefinite")
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Covariance matrix, vol_i * vol_j * corr_ij."""
+        return self.correlation * np.outer(self.volatilities, self.volatilities)
+
+    @classmethod
+    def from_config(cls, overrides: Optional[Dict[str, Any]] = None) -> "RiskModel":
+        """
+        Risk model of the ten asset classes from config plus 'risk' overrides.
+
+        Parameters
+        ----------
+        overrides : dict, optional
+            Scenario overrides; only ``overrides['risk']`` is read, with
+            'volatility' {asset: vol} and 'correlation' {asset: {asset: rho}}.
+
+        Returns
+        -------
+        RiskModel
+
+        Raises
+        ------
+        ValueError
+            On an unknown key under 'risk', an unknown asset class or an
+            invalid matrix.
+        """
+        assets = tuple(ac.value for ac in AssetClass)
+        index = {asset: i for i, asset in enumerate(assets)}
+        volatilities = np.array([EXPECTED_VOLATILITY[AssetClass(a)] for a in assets])
+        correlation = np.eye(len(assets))
+        for (a, b), rho in EXPECTED_CORRELATION.items():
+            correlation[index[a.value], index[b.value]] = correlation[index[b.value], index[a.value]] = rho
+
+        risk = (overrides or {}).get(RISK_OVERRIDE_KEY) or {}
+        if not isinstance(risk, dict):
+            raise ValueError(f"'{RISK_OVERRIDE_KEY}' overrides must be an object")
+        unknown = [key for key in risk if key not in RISK_OVERRIDE_SECTIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown risk override(s): {', '.join(repr(k) for k in unknown)}; "
+                f"expected {list(RISK_OVERRIDE_SECTIONS)}"
+            )
+        for asset, vol in (risk.get('volatility') or {}).items():
+            if asset not in index:
+                raise ValueError(f"Unknown asset class in risk overrides: {asset!r}")
+            volatilities[index[asset]] = vol
+        for a, row in (risk.get('correlation') or {}).items():
+            for b, rho in row.items():
+                if a not in index or b not in index:
+                    raise ValueError(f"Unknown asset class in risk overrides: {a!r}/{b!r}")
+                if a == b and rho != 1:
+                    raise ValueError(f"Correlation of {a} with itself must be 1")
+                correlation[index[a], index[b]] = correlation[index[b], index[a]] = rho
+        return cls(assets, volatilities, correlation)
+
+
+def portfolio_stats(weights, expected_returns, covariance) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expected return and volatility of one or many portfolios.
+
+    Parameters
+    ----------
+    weights : array-like
+        Shape (n_assets,) or (n_portfolios, n_assets).
+    expected_returns : array-like
+        Shape (n_assets,).
+    covariance : array-like
+        Shape (n_assets, n_assets).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        Expected returns and volatilities, one per portfolio (0-d for a
+        single weight vector).
+    """
+    w = np.asarray(weights, dtype=float)
+    mu = np.asarray(expected_returns, dtype=float)
+    cov = np.asarray(covariance, dtype=float)
+    returns = w @ mu
+    variance = np.einsum('...i,ij,...j->...', w, cov, w)
+    return returns, np.sqrt(np.maximum(variance, 0.0))
+
+
+@dataclass
+class Frontier:
+    """
+    Efficient frontier points, from the minimum-variance portfolio upward.
+
+    ``weights`` has shape (n_points, n_assets); returns and volatilities
+    are computed from the reported weights. ``corners`` is the number of
+    corner portfolios the frontier was interpolated from.
+    """
+    assets: Tuple[str, ...]
+    returns: np.ndarray
+    volatilities: np.ndarray
+    weights: np.ndarray
+    corners: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'assets': list(self.assets),
+            'returns': self.returns.tolist(),
+            'volatilities': self.volatilities.tolist(),
+            'weights': self.weights.tolist(),
+            'corners': self.corners,
+        }
+
+
+def _bounds_array(bounds: Bounds, n: int, name: str) -> np.ndarray:
+    arr = np.broadcast_to(np.asarray(bounds, dtype=float), (n,)).copy()
+    if np.any(np.isnan(arr)):
+        raise ValueError(f"{name} bounds must not be NaN")
+    return arr
+
+
+def _check_nonsingular(cov: np.ndarray):
+    """
+    Reject a covariance that is (nearly) singular on fully invested portfolios.
+
+    The critical line solves KKT systems [[0, 1'], [1, C_FF]], which are
+    singular when some combination of assets with weights summing to zero
+    has zero variance: perfectly correlated assets of equal volatility,
+    duplicated assets, or any rank deficiency beyond a single riskless
+    asset. The frontier is then not unique, so it is not solved.
+    """
+    n = cov.shape[0]
+    if n < 2:
+        return
+    # Orthonormal basis of the directions d with sum(d) = 0
+    basis = np.linalg.svd(np.ones((1, n)))[2][1:].T
+    smallest = np.linalg.eigvalsh(basis.T @ cov @ basis).min()
+    largest = np.linalg.eigvalsh(cov).max()
+    if not smallest > CLA_MIN_EIGENVALUE_RATIO * largest:
+        raise ValueError(
+            "Covariance matrix is singular or nearly so for fully invested portfolios "
+            "(e.g. perfectly correlated assets with equal volatility, or duplicated assets); "
+            "the efficient frontier is not unique"
+        )
+
+
+class _FreeSet:
+    """
+    Free assets of the critical line and the inverse of their KKT matrix.
+
+    The matrix is [[0, 1'], [1, C_FF]] (budget row first). Assets enter and
+    leave one at a time, so the inverse is updated by bordering and its
+    Schur complement in O(k^2) rather than refactored at every corner; it
+    is recomputed from scratch every CLA_REFACTOR_EVERY updates, or when an
+    update would be ill-conditioned.
+    """
+
+    def __init__(self, cov: np.ndarray, assets: Sequence[int]):
+        self.cov = cov
+        self.assets: List[int] = list(assets)
+        self._refactor()
+
+    def _refactor(self):
+        a = self.assets
+        kkt = np.zeros((len(a) + 1, len(a) + 1))
+        kkt[0, 1:] = kkt[1:, 0] = 1.0
+        kkt[1:, 1:] = self.cov[np.ix_(a, a)]
+        try:
+            self.inv = np.linalg.inv(kkt)
+        except np.linalg.LinAlgError:
+            self.inv = np.linalg.pinv(kkt)
+        self.updates = 0
+
+    def add(self, i: int):
+        border = np.concatenate([[1.0], self.cov[i, self.assets]])
+        nb = self.inv @ border
+        schur = self.cov[i, i] - border @ nb
+        self.assets.append(i)
+        if self.updates >= CLA_REFACTOR_EVERY or abs(schur) <= 1e-10 * max(self.cov[i, i], 1e-300):
+            self._refactor()
+            return
+        k = nb.shape[0]
+        inv = np.empty((k + 1, k + 1))
+        inv[:k, :k] = self.inv + np.outer(nb, nb) / schur
+        inv[:k, k] = inv[k, :k] = -nb / schur
+        inv[k, k] = 1.0 / schur
+        self.inv = inv
+        self.updates += 1
+
+    def remove(self, i: int):
+        j = self.assets.index(i) + 1
+        del self.assets[j - 1]
+        pivot = self.inv[j, j]
+        if self.updates >= CLA_REFACTOR_EVERY or abs(pivot) <= 1e-300:
+            self._refactor()
+            return
+        keep = np.r_[0:j, j + 1:self.inv.shape[0]]
+        self.inv = self.inv[np.ix_(keep, keep)] - np.outer(self.inv[keep, j], self.inv[j, keep]) / pivot
+        self.updates += 1
+
+    def solve(self, mu: np.ndarray, cov_wb: np.ndarray, bound_sum: float):
+        """
+        Optimal free weights as a function of the risk tolerance lambda.
+
+        Minimizing 1/2 w'Cw - lambda mu'w with the budget constraint and
+        the bound assets held fixed (``cov_wb`` = C w_bound) gives
+        w_F = p + lambda q and budget multiplier gamma = g_p + lambda g_q.
+        Returns (p, q, g_p, g_q).
+        """
+        a = self.assets
+        rhs = np.zeros((len(a) + 1, 2))
+        rhs[0, 0] = 1.0 - bound_sum
+        rhs[1:, 0] = -cov_wb[a]
+        rhs[1:, 1] = mu[a]
+        sol = self.inv @ rhs
+        return sol[1:, 0], sol[1:, 1], sol[0, 0], sol[0, 1]
+
+
+def _critical_line(mu: np.ndarray, cov: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Corner portfolios of the bounded frontier (critical line algorithm).
+
+    Returns the corners from the highest-return portfolio down to the
+    minimum-variance portfolio, shape (n_corners, n_assets).
+    """
+    n = mu.shape[0]
+    tol = CLA_TOLERANCE
+    movable = upper > lower
+
+    # Highest-return portfolio: fill the best assets up from their lower bounds
+    w = lower.copy()
+    status = np.full(n, _LOWER)
+    budget = 1.0 - w.sum()
+    marginal = None
+    for i in np.argsort(-mu, kind='stable'):
+        if budget <= tol:
+            break
+        step = min(upper[i] - w[i], budget)
+        if step > 0:
+            w[i] += step
+            budget -= step
+            status[i] = _UPPER
+            marginal = i
+    if marginal is None:
+        # The lower bounds sum to one: a single feasible portfolio
+        return w[None, :]
+    status[marginal] = _FREE
+
+    free = _FreeSet(cov, [marginal])
+    w_bound = np.where(status == _UPPER, upper, np.where(status == _LOWER, lower, 0.0))
+    cov_wb = cov @ w_bound
+    corners = []
+    lam = np.inf
+    last = -1
+    for _ in range(4 * n + 20):
+        if not free.assets:
+            raise RuntimeError("Critical line algorithm left no free asset (degenerate inputs)")
+        p, q, g_p, g_q = free.solve(mu, cov_wb, w_bound.sum())
+        fi = np.asarray(free.assets)
+        bi = np.flatnonzero(status != _FREE)
+
+        # Gradient of the bound assets, u + lambda v; it must stay >= 0 at a
+        # lower bound and <= 0 at an upper bound
+        cov_bf = cov[np.ix_(bi, fi)]
+        u = cov_bf @ p + cov_wb[bi] + g_p
+        v = cov_bf @ q - mu[bi] + g_q
+        at_lower = status[bi] == _LOWER
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Free assets reaching a bound as lambda decreases
+            hit_lower = np.where(q > tol, (lower[fi] - p) / q, np.where(p < lower[fi] - tol, lam, -np.inf))
+            hit_upper = np.where(q < -tol, (upper[fi] - p) / q, np.where(p > upper[fi] + tol, lam, -np.inf))
+            # Bound assets whose gradient changes sign
+            release = np.where(
+                at_lower,
+                np.where(v > tol, -u / v, np.where(u < -tol, lam, -np.inf)),
+                np.where(v < -tol, -u / v, np.where(u > tol, lam, -np.inf)),
+            )
+        release[~movable[bi]] = -np.inf
+        candidates = np.concatenate([hit_lower, hit_upper, release])
+        assets = np.concatenate([fi, fi, bi])
+        new_status = np.concatenate([
+            np.full(fi.size, _LOWER), np.full(fi.size, _UPPER), np.full(bi.size, _FREE),
+        ])
+        # Events at the current lambda (up to rounding) happen now; the asset
+        # that just changed state does not flip straight back
+        if np.isfinite(lam):
+            now = (candidates > lam) & (candidates <= lam + 1e-9 * max(lam, 1e-12))
+            candidates[now] = lam
+        candidates[(assets == last) & (candidates >= lam)] = -np.inf
+        candidates[candidates > lam] = -np.inf
+        j = int(np.argmax(candidates)) if candidates.size else -1
+        lam_next = candidates[j] if j >= 0 else -np.inf
+
+        if lam_next <= 0:
+            # No further event before lambda = 0: minimum-variance portfolio
+            corner = w_bound.copy()
+            corner[fi] = p
+            corners.append(corner)
+            return np.array(corners)
+        if np.isfinite(lam_next):
+            if np.isinf(lam):
+                # Top of the frontier (q vanishes at lambda = inf)
+                corner = w_bound.copy()
+                corner[fi] = p
+                corners.append(corner)
+            corner = w_bound.copy()
+            corner[fi] = p + lam_next * q
+            corners.append(corner)
+
+        i = assets[j]
+        if new_status[j] == _FREE:
+            cov_wb -= cov[:, i] * w_bound[i]
+            w_bound[i] = 0.0
+            free.add(i)
+        else:
+            free.remove(i)
+            w_bound[i] = lower[i] if new_status[j] == _LOWER else upper[i]
+            cov_wb += cov[:, i] * w_bound[i]
+        if free.updates == 0:
+            cov_wb = cov @ w_bound
+        status[i] = new_status[j]
+        last = i
+        lam = lam_next
+    raise RuntimeError("Critical line algorithm did not terminate")
+
+
+def efficient_frontier(
+    expected_returns,
+    covariance,
+    n_points: int = DEFAULT_FRONTIER_POINTS,
+    lower: Bounds = 0.0,
+    upper: Bounds = 1.0,
+    assets: Optional[Sequence[str]] = None,
+) -> Frontier:
+    """
+    Minimum-variance frontier of fully invested portfolios within bounds.
+
+    Points are evenly spaced in expected return from the minimum-variance
+    portfolio to the highest attainable return.
+
+    Parameters
+    ----------
+    expected_returns : array-like
+        Shape (n_assets,).
+    covariance : array-like
+        Shape (n_assets, n_assets), positive semidefinite.
+    n_points : int
+        Number of frontier points (>= 2).
+    lower, upper : float or array-like
+        Per-asset weight bounds; the defaults give a long-only frontier.
+    assets : sequence of str, optional
+        Asset names for the result (default 'asset_0', 'asset_1', ...).
+
+    Returns
+    -------
+    Frontier
+
+    Raises
+    ------
+    ValueError
+        On inconsistent shapes or bounds, or a covariance that is singular
+        on fully invested portfolios (see _check_nonsingular).
+    RuntimeError
+        If the solution violates the bounds or the budget by more than
+        CLA_FEASIBILITY_TOLERANCE (numerically degenerate inputs).
+    """
+    mu = np.asarray(expected_returns, dtype=float)
+    cov = np.asarray(covariance, dtype=float)
+    n = mu.shape[0]
+    if cov.shape != (n, n):
+        raise ValueError(f"Covariance must be {n}x{n}")
+    if n_points < 2:
+        raise ValueError("At least 2 frontier points are required")
+    lo = _bounds_array(lower, n, 'Lower')
+    hi = _bounds_array(upper, n, 'Upper')
+    if np.any(lo > hi) or lo.sum() > 1 + 1e-12 or hi.sum() < 1 - 1e-12:
+        raise ValueError("Weight bounds admit no fully invested portfolio")
+    names = tuple(assets) if assets is not None else tuple(f'asset_{i}' for i in range(n))
+    if len(names) != n:
+        raise ValueError(f"Expected {n} asset names")
+    _check_nonsingular(cov)
+
+    # Ties in expected return leave the top of the frontier undetermined for
+    # the critical line; a negligible tie-break makes the path unique
+    spread = float(np.ptp(mu)) or 1.0
+    mu_path = mu
+    if n > 1 and np.diff(np.sort(mu)).min() <= CLA_TIE_BREAK * spread:
+        mu_path = mu - CLA_TIE_BREAK * spread * np.arange(n) / n
+
+    # Corners in ascending return; the weights are piecewise linear in return
+    corners = _critical_line(mu_path, cov, lo, hi)[::-1]
+    corner_returns = corners @ mu_path
+    # Corners that differ from the top only through the tie-break are the
+    # same portfolio in effect: end the frontier at the lowest-variance one
+    top = np.flatnonzero(corner_returns >= corner_returns[-1] - CLA_MERGE * spread)[0]
+    corners, corner_returns = corners[:top + 1], corner_returns[:top + 1]
+
+    targets = np.linspace(corner_returns[0], corner_returns[-1], n_points)
+    if len(corners) == 1:
+        weights = np.repeat(corners, n_points, axis=0)
+    else:
+        # Segment (corner i, corner i + 1] holding each target; on repeated
+        # corner returns this picks the first, lowest-variance corner
+        segment = np.clip(np.searchsorted(corner_returns, targets) - 1, 0, len(corners) - 2)
+        span = corner_returns[segment + 1] - corner_returns[segment]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            frac = np.where(span > 0, (targets - corner_returns[segment]) / span, 0.0)
+        frac = np.clip(frac, 0.0, 1.0)[:, None]
+        weights = (1 - frac) * corners[segment] + frac * corners[segment + 1]
+
+    # Exact in exact arithmetic; never return weights that lost feasibility
+    tol = CLA_FEASIBILITY_TOLERANCE
+    feasible = (
+        np.all(weights >= lo - tol) and np.all(weights <= hi + tol)
+        and np.all(np.abs(weights.sum(axis=1) - 1) <= tol)
+    )
+    if not feasible:
+        raise RuntimeError("Efficient frontier weights violate the bounds or the budget (degenerate inputs)")
+
+    returns, volatilities = portfolio_stats(weights, mu, cov)
+    return Frontier(
+        assets=names,
+        returns=returns,
+        volatilities=volatilities,
+        weights=weights,
+        corners=len(corners),
+    )
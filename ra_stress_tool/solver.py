@@ -0,0 +1,286 @@
+"""
+Reverse stress testing for the RA CME Stress Testing Tool.
+
+Answers questions of the form "what US CAEY makes US equity return 3%?":
+given a target (asset, nominal or real, value) and one or more free override
+paths with bounds, find the override values that hit the target.
+
+The search is grid-then-refine on the vectorized BatchCMEEngine. Every grid
+pass is a single batch evaluation, and inputs that are not free are resolved
+once per solver, so a solve costs a handful of batch calls (milliseconds).
+
+With several free paths the inputs move together, each linearly across its
+own bounds (x_i = lower_i + t * (upper_i - lower_i)), so the search is still
+one-dimensional in t.
+
+Example
+-------
+>>> solver = ReverseStressSolver()
+>>> result = solver.solve('equity_us', 0.03, [('equity_us.current_caey', 0.01, 0.10)])
+>>> result.values['equity_us.current_caey']
+"""
+
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .batch import BatchCMEEngine, ASSETS
+from .inputs.overrides import validate_override_paths
+
+
+MEASURES = {
+    'nominal': 'expected_return_nominal',
+    'real': 'expected_return_real',
+}
+
+DEFAULT_GRID_SIZE = 33
+
+
+@dataclass
+class FreeInput:
+    """Override path the solver may move, with its search bounds."""
+    path: str
+    lower: float
+    upper: float
+
+    def __post_init__(self):
+        if len(self.path.split('.')) < 2:
+            raise ValueError(f"Invalid override path: {self.path!r}")
+        if not self.upper > self.lower:
+            raise ValueError(f"Bounds for {self.path} need upper > lower")
+
+
+@dataclass
+class SolveResult:
+    """
+    Outcome of a reverse stress test.
+
+    ``values`` holds the solving override values (or, when the target is
+    not attainable within the bounds, the values that come closest).
+    ``other_solutions`` lists further roots found inside the bounds.
+    """
+    asset: str
+    measure: str
+    target: float
+    values: Dict[str, float]
+    achieved: float
+    converged: bool
+    evaluations: int
+    message: str = ''
+    other_solutions: List[Dict[str, float]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'asset': self.asset,
+            'measure': self.measure,
+            'target': self.target,
+            'values': self.values,
+            'achieved': self.achieved,
+            'converged': self.converged,
+            'evaluations': self.evaluations,
+            'message': self.message,
+            'other_solutions': self.other_solutions,
+        }
+
+
+class ReverseStressSolver:
+    """
+    Finds override values that make an asset return hit a target.
+
+    Parameters
+    ----------
+    base_overrides : dict, optional
+        Overrides held fixed during the search.
+    base_currency : str, optional
+        Base currency ('usd' or 'eur').
+    equity_model_type : str, optional
+        Equity model: 'ra' or 'gk'.
+    """
+
+    def __init__(
+        self,
+        base_overrides: Optional[Dict[str, Any]] = None,
+        base_currency: str = 'usd',
+        equity_model_type: str = 'ra',
+    ):
+        self.base_overrides = base_overrides
+        self.base_currency = base_currency
+        self.equity_model_type = equity_model_type
+        # One batch engine per set of free paths, reused across solves
+        self._engines: Dict[Tuple[str, ...], BatchCMEEngine] = {}
+
+    def _engine(self, paths: Tuple[str, ...]) -> BatchCMEEngine:
+        engine = self._engines.get(paths)
+        if engine is None:
+            engine = BatchCMEEngine(
+                paths,
+                base_overrides=self.base_overrides,
+                base_currency=self.base_currency,
+                equity_model_type=self.equity_model_type,
+            )
+            self._engines[paths] = engine
+        return engine
+
+    def solve(
+        self,
+        asset: str,
+        target: float,
+        free_inputs: Sequence[Union[FreeInput, Tuple[str, float, float], Dict[str, Any]]],
+        measure: str = 'nominal',
+        grid_size: int = DEFAULT_GRID_SIZE,
+        xtol: float = 1e-10,
+        max_iter: int = 50,
+    ) -> SolveResult:
+        """
+        Solve for the override values that hit ``target``.
+
+        Parameters
+        ----------
+        asset : str
+            Asset class key, e.g. 'equity_us'.
+        target : float
+            Target return (decimal).
+        free_inputs : sequence
+            FreeInput, (path, lower, upper) tuples or
+            {'path', 'lower', 'upper'} dicts.
+        measure : str
+            'nominal' or 'real'.
+        grid_size : int
+            Points per grid pass.
+        xtol : float
+            Stop once every free input is bracketed to within xtol.
+        max_iter : int
+            Maximum refinement passes.
+
+        Returns
+        -------
+        SolveResult
+            Solving values, achieved return and convergence details.
+
+        Raises
+        ------
+        ValueError
+            On an unknown asset, measure or free input path, or bad bounds.
+        """
+        if asset not in ASSETS:
+            raise ValueError(f"Unknown asset class '{asset}'. Use one of {list(ASSETS)}")
+        if measure not in MEASURES:
+            raise ValueError(f"measure must be one of {list(MEASURES)}")
+        free = [_as_free_input(f) for f in free_inputs]
+        if not free:
+            raise ValueError("At least one free input is required")
+        if grid_size < 3:
+            raise ValueError("grid_size must be at least 3")
+
+        paths = tuple(f.path for f in free)
+        # A mistyped path would otherwise look like an input with no effect
+        validate_override_paths(paths, self.equity_model_type)
+        engine = self._engine(paths)
+        lower = np.array([f.lower for f in free])
+        span = np.array([f.upper for f in free]) - lower
+        component = MEASURES[measure]
+        evaluations = 0
+
+        def objective(t: np.ndarray) -> np.ndarray:
+            nonlocal evaluations
+            evaluations += t.size
+            values = lower + t.reshape(-1, 1) * span
+            return engine.compute(values).get(asset, component) - target
+
+        def values_at(t: float) -> Dict[str, float]:
+            return {p: float(lo + t * s) for p, lo, s in zip(paths, lower, span)}
+
+        # Coarse pass over the whole box
+        t = np.linspace(0.0, 1.0, grid_size)
+        f = objective(t)
+        brackets = _sign_changes(t, f)
+
+        if not brackets:
+            best = int(np.nanargmin(np.abs(f)))
+            return SolveResult(
+                asset=asset,
+                measure=measure,
+                target=target,
+                values=values_at(t[best]),
+                achieved=float(f[best] + target),
+                converged=False,
+                evaluations=evaluations,
+                message=f"Target not attainable within bounds; closest {measure} return is {f[best] + target:.4%}",
+            )
+
+        # Refine every bracket at once: one batch call per pass
+        t_tol = xtol / span.max()
+        for _ in range(max_iter):
+            open_brackets = [(lo, hi) for lo, hi in brackets if hi - lo > t_tol]
+            if not open_brackets:
+                break
+            grids = [np.linspace(lo, hi, grid_size) for lo, hi in open_brackets]
+            f_all = objective(np.concatenate(grids)).reshape(len(grids), grid_size)
+            refined = [(lo, hi) for lo, hi in brackets if hi - lo <= t_tol]
+            for grid, f_grid in zip(grids, f_all):
+                # A bracket can only split into several if the grid catches
+                # extra roots; keep the first so the count stays bounded
+                refined.append((_sign_changes(grid, f_grid) or [(grid[0], grid[-1])])[0])
+            brackets = sorted(refined)
+
+        # Secant step inside each final bracket
+        roots = []
+        for lo, hi in brackets:
+            if hi > lo:
+                f_lo, f_hi = objective(np.array([lo, hi]))
+                root = lo if f_lo == f_hi else lo - f_lo * (hi - lo) / (f_hi - f_lo)
+                roots.append(min(max(root, lo), hi))
+            else:
+                roots.append(lo)
+        achieved = objective(np.array(roots)) + target
+
+        return SolveResult(
+            asset=asset,
+            measure=measure,
+            target=target,
+            values=values_at(roots[0]),
+            achieved=float(achieved[0]),
+            converged=True,
+            evaluations=evaluations,
+            message='' if len(roots) == 1 else f"{len(roots)} solutions within bounds; returning the lowest",
+            other_solutions=[values_at(r) for r in roots[1:]],
+        )
+
+
+def _as_free_input(spec: Union[FreeInput, Tuple[str, float, float], Dict[str, Any]]) -> FreeInput:
+    if isinstance(spec, FreeInput):
+        return spec
+    if isinstance(spec, dict):
+        return FreeInput(spec['path'], float(spec['lower']), float(spec['upper']))
+    path, lower, upper = spec
+    return FreeInput(path, float(lower), float(upper))
+
+
+def _sign_changes(t: np.ndarray, f: np.ndarray) -> List[Tuple[float, float]]:
+    """Brackets [t_i, t_i+1] over which f changes sign (exact zeros give [t_i, t_i])."""
+    brackets = [(float(x), float(x)) for x in t[f == 0]]
+    crossing = np.flatnonzero(np.sign(f[:-1]) * np.sign(f[1:]) < 0)
+    brackets += [(float(t[i]), float(t[i + 1])) for i in crossing]
+    return sorted(brackets)
+
+
+def solve_for_target(
+    asset: str,
+    target: float,
+    free_inputs: Sequence[Union[FreeInput, Tuple[str, float, float], Dict[str, Any]]],
+    measure: str = 'nominal',
+    base_overrides: Optional[Dict[str, Any]] = None,
+    base_currency: str = 'usd',
+    equity_model_type: str = 'ra',
+) -> SolveResult:
+    """
+    One-off reverse stress test (see ReverseStressSolver.solve).
+
+    Example
+    -------
+    >>> solve_for_target('bonds_em', 0.0, [('bonds_em.default_rate', 0.0, 0.2)], measure='real')
+    """
+    solver = ReverseStressSolver(base_overrides, base_currency, equity_model_type)
+    return solver.solve(asset, target, free_inputs, measure=measure)
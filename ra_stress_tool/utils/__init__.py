@@ -2,6 +2,11 @@
 Utility functions for the RA stress testing tool.
 """
 
-from .ewma import ewma, ewma_from_series, compute_trend_growth
+from .ewma import ewma, ewma_from_series, RollingEWMA, compute_trend_growth, rolling_trend_growth
+from .sketch import QuantileSketch
+from .dual import Dual
 
-__all__ = ['ewma', 'ewma_from_series', 'compute_trend_growth']
+__all__ = [
+    'ewma', 'ewma_from_series', 'RollingEWMA', 'compute_trend_growth', 'rolling_trend_growth',
+    'QuantileSketch', 'Dual',
+]
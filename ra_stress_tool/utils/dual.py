@@ -0,0 +1,199 @@
+"""
+Forward-mode automatic differentiation with sparse dual numbers.
+
+A Dual carries a primal value and the gradient of that value with respect to
+named model inputs (override paths such as 'macro.us.current_tbill'). The
+model code is plain arithmetic on floats, so seeding each input as a Dual
+and running the unchanged formulas yields every d(output)/d(input) in the
+same pass. Gradients are stored as dicts, so each intermediate only carries
+the inputs it actually depends on.
+
+Comparisons use the primal value, which makes ``max``/``min`` floors and caps
+select the active branch (the derivative through an inactive branch is 0).
+"""
+
+import dataclasses
+import math
+from typing import Any, Dict, Mapping
+
+
+def _combine(a: Mapping[str, float], ca: float, b: Mapping[str, float], cb: float) -> Dict[str, float]:
+    """Return ca * a + cb * b for sparse gradients."""
+    out = {k: ca * v for k, v in a.items()} if ca != 1.0 else dict(a)
+    for k, v in b.items():
+        out[k] = out.get(k, 0.0) + cb * v
+    return out
+
+
+def _scale(a: Mapping[str, float], c: float) -> Dict[str, float]:
+    return {k: c * v for k, v in a.items()}
+
+
+class Dual:
+    """
+    Number with a sparse gradient.
+
+    Parameters
+    ----------
+    primal : float
+        Value.
+    grad : dict, optional
+        {input_path: derivative}.
+    """
+
+    __slots__ = ('primal', 'grad')
+
+    def __init__(self, primal: float, grad: Mapping[str, float] = None):
+        self.primal = float(primal)
+        self.grad = dict(grad) if grad else {}
+
+    @classmethod
+    def seed(cls, primal: float, path: str) -> "Dual":
+        """An independent input: d(primal)/d(path) = 1."""
+        return cls(primal, {path: 1.0})
+
+    # -- arithmetic ----------------------------------------------------
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.primal + other.primal, _combine(self.grad, 1.0, other.grad, 1.0))
+        return Dual(self.primal + other, self.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.primal - other.primal, _combine(self.grad, 1.0, other.grad, -1.0))
+        return Dual(self.primal - other, self.grad)
+
+    def __rsub__(self, other):
+        return Dual(other - self.primal, _scale(self.grad, -1.0))
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(
+                self.primal * other.primal,
+                _combine(self.grad, other.primal, other.grad, self.primal),
+            )
+        return Dual(self.primal * other, _scale(self.grad, other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            value = self.primal / other.primal
+            inv = 1.0 / other.primal
+            return Dual(value, _combine(self.grad, inv, other.grad, -value * inv))
+        return Dual(self.primal / other, _scale(self.grad, 1.0 / other))
+
+    def __rtruediv__(self, other):
+        value = other / self.primal
+        return Dual(value, _scale(self.grad, -value / self.primal))
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            value = self.primal ** other.primal
+            d_base = other.primal * self.primal ** (other.primal - 1) if self.primal else 0.0
+            d_exp = value * math.log(self.primal) if self.primal > 0 else 0.0
+            return Dual(value, _combine(self.grad, d_base, other.grad, d_exp))
+        value = self.primal ** other
+        d_base = other * self.primal ** (other - 1) if other else 0.0
+        return Dual(value, _scale(self.grad, d_base))
+
+    def __rpow__(self, other):
+        value = other ** self.primal
+        d_exp = value * math.log(other) if other > 0 else 0.0
+        return Dual(value, _scale(self.grad, d_exp))
+
+    def __neg__(self):
+        return Dual(-self.primal, _scale(self.grad, -1.0))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return -self if self.primal < 0 else self
+
+    # -- comparisons / conversions (by primal value) ---------------------
+
+    def __eq__(self, other):
+        return self.primal == (other.primal if isinstance(other, Dual) else other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __lt__(self, other):
+        return self.primal < (other.primal if isinstance(other, Dual) else other)
+
+    def __le__(self, other):
+        return self.primal <= (other.primal if isinstance(other, Dual) else other)
+
+    def __gt__(self, other):
+        return self.primal > (other.primal if isinstance(other, Dual) else other)
+
+    def __ge__(self, other):
+        return self.primal >= (other.primal if isinstance(other, Dual) else other)
+
+    def __hash__(self):
+        return hash(self.primal)
+
+    def __bool__(self):
+        return self.primal != 0.0
+
+    def __float__(self):
+        return self.primal
+
+    def __round__(self, ndigits=None):
+        return round(self.primal, ndigits)
+
+    def __format__(self, spec):
+        return format(self.primal, spec)
+
+    def __repr__(self):
+        return f"Dual({self.primal!r}, {self.grad!r})"
+
+
+def exp(x):
+    """math.exp that propagates Dual gradients."""
+    if isinstance(x, Dual):
+        value = math.exp(x.primal)
+        return Dual(value, _scale(x.grad, value))
+    return math.exp(x)
+
+
+def log(x):
+    """math.log that propagates Dual gradients."""
+    if isinstance(x, Dual):
+        return Dual(math.log(x.primal), _scale(x.grad, 1.0 / x.primal))
+    return math.log(x)
+
+
+def primal(x: Any) -> Any:
+    """Value of a Dual, or x unchanged."""
+    return x.primal if isinstance(x, Dual) else x
+
+
+def gradient(x: Any) -> Dict[str, float]:
+    """Gradient of a Dual ({} for plain numbers)."""
+    return dict(x.grad) if isinstance(x, Dual) else {}
+
+
+def strip_duals(obj: Any) -> Any:
+    """
+    Copy of obj with every Dual inside dicts, lists, tuples and dataclass
+    instances replaced by its primal value. The input is not modified.
+    """
+    if isinstance(obj, Dual):
+        return obj.primal
+    if isinstance(obj, dict):
+        return {k: strip_duals(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [strip_duals(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(strip_duals(v) for v in obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.replace(obj, **{
+            f.name: strip_duals(getattr(obj, f.name))
+            for f in dataclasses.fields(obj) if f.init
+        })
+    return obj
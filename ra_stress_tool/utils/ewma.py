@@ -5,12 +5,61 @@ These utilities implement the EWMA methodology used by Research Affiliates
 for computing fair values and long-term averages.
 """
 
-from typing import List, Optional
-import math
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from . import dual
+
+
+PERIODS_PER_YEAR = {
+    'monthly': 12,
+    'quarterly': 4,
+    'annual': 1
+}
+
+# Largest exponent (base 2) of the per-block rescaling weights in
+# _exponential_filter; keeps decay ** -k well inside the float range
+_MAX_BLOCK_EXPONENT = 600.0
+_MAX_BLOCK_LENGTH = 1 << 16
+
+# rolling_trend_growth chunk length, in trend windows
+_TREND_CHUNK_WINDOWS = 16
+
+
+def _periods_per_year(frequency: str, default: int = 12) -> int:
+    return PERIODS_PER_YEAR.get(frequency, default)
+
+
+def decay_factor(half_life_years: float, frequency: str = 'monthly') -> float:
+    """
+    Per-period EWMA decay factor, lambda = 0.5^(1/half_life_in_periods).
+
+    Parameters
+    ----------
+    half_life_years : float
+        Number of years for the weight to decay by 50%.
+    frequency : str
+        Data frequency: 'monthly', 'quarterly', or 'annual'.
+
+    Returns
+    -------
+    float
+        Weight of a point relative to the next (more recent) one.
+    """
+    half_life_periods = half_life_years * _periods_per_year(frequency)
+    return 0.5 ** (1 / half_life_periods)
+
+
+def _window_periods(window_years: Optional[int], frequency: str) -> Optional[int]:
+    if window_years is None:
+        return None
+    return window_years * _periods_per_year(frequency)
 
 
 def ewma(
-    data: List[float],
+    data: Sequence[float],
     half_life_years: float,
     window_years: Optional[int] = None,
     frequency: str = 'monthly'
@@ -20,7 +69,7 @@ def ewma(
 
     Parameters
     ----------
-    data : List[float]
+    data : sequence of float or np.ndarray
         Time series data, ordered from oldest to newest.
     half_life_years : float
         Number of years for the weight to decay by 50%.
@@ -34,55 +83,73 @@ def ewma(
     float
         The EWMA value.
     """
-    # Determine periods per year based on frequency
-    periods_per_year = {
-        'monthly': 12,
-        'quarterly': 4,
-        'annual': 1
-    }.get(frequency, 12)
-
-    # Calculate decay factor (lambda)
-    # lambda = 0.5^(1/half_life_in_periods)
-    half_life_periods = half_life_years * periods_per_year
-    lambda_decay = 0.5 ** (1 / half_life_periods)
+    lambda_decay = decay_factor(half_life_years, frequency)
+    values = np.asarray(data, dtype=float)
 
     # Limit data to window if specified
-    if window_years is not None:
-        window_periods = window_years * periods_per_year
-        data = data[-window_periods:] if len(data) > window_periods else data
+    window_periods = _window_periods(window_years, frequency)
+    if window_periods is not None and len(values) > window_periods:
+        values = values[-window_periods:]
 
-    if not data:
+    if len(values) == 0:
         raise ValueError("No data provided for EWMA calculation")
 
-    # Calculate weights (more recent = higher weight)
-    n = len(data)
-    weights = [lambda_decay ** (n - 1 - i) for i in range(n)]
+    # Weights (more recent = higher weight), normalized to sum to one
+    n = len(values)
+    weights = lambda_decay ** np.arange(n - 1, -1, -1, dtype=float)
+    return float(weights @ values / weights.sum())
 
-    # Normalize weights
-    total_weight = sum(weights)
-    weights = [w / total_weight for w in weights]
 
-    # Calculate weighted average
-    result = sum(d * w for d, w in zip(data, weights))
+def _exponential_filter(u: np.ndarray, lambda_decay: float) -> np.ndarray:
+    """
+    Solve y[i] = lambda * y[i-1] + u[i] (y[-1] = 0) for the whole array.
 
-    return result
+    Within a block, y = lambda^i * cumsum(u * lambda^-i); the running value
+    is carried from block to block. Blocks are short enough that the
+    rescaling weights never overflow, so the cost is O(n) NumPy work plus
+    one Python step per block.
+    """
+    n = len(u)
+    y = np.empty(n)
+    if n == 0:
+        return y
+    block = int(min(n, _MAX_BLOCK_LENGTH, max(1.0, _MAX_BLOCK_EXPONENT / -np.log2(lambda_decay))))
+    k = np.arange(block, dtype=float)
+    up = lambda_decay ** -k
+    down = lambda_decay ** k
+    carry_decay = lambda_decay * down
+    carry = 0.0
+    for start in range(0, n, block):
+        m = min(block, n - start)
+        segment = np.cumsum(u[start:start + m] * up[:m]) * down[:m]
+        segment += carry * carry_decay[:m]
+        y[start:start + m] = segment
+        carry = segment[-1]
+    return y
 
 
 def ewma_from_series(
-    data: List[float],
+    data: Sequence[float],
     half_life_years: float,
     window_years: Optional[int] = None,
     frequency: str = 'monthly'
-) -> List[float]:
+) -> np.ndarray:
     """
     Calculate rolling EWMA for an entire series.
 
-    Returns a list of EWMA values, one for each point in the series
+    Returns an array of EWMA values, one for each point in the series
     (using all available data up to that point, respecting the window).
+    Element i equals ``ewma(data[:i + 1], ...)``, but the whole series is
+    computed in O(n) with the recursion
+
+        S[i] = lambda * S[i-1] + x[i] - lambda^W * x[i-W]
+
+    for the weighted sum, divided by the closed-form weight total
+    (1 - lambda^m) / (1 - lambda) of the m = min(i + 1, W) points in the window.
 
     Parameters
     ----------
-    data : List[float]
+    data : sequence of float or np.ndarray
         Time series data, ordered from oldest to newest.
     half_life_years : float
         Number of years for the weight to decay by 50%.
@@ -93,18 +160,117 @@ def ewma_from_series(
 
     Returns
     -------
-    List[float]
+    np.ndarray
         Rolling EWMA values.
     """
-    result = []
-    for i in range(1, len(data) + 1):
-        ewma_val = ewma(data[:i], half_life_years, window_years, frequency)
-        result.append(ewma_val)
-    return result
+    lambda_decay = decay_factor(half_life_years, frequency)
+    values = np.asarray(data, dtype=float)
+    n = len(values)
+
+    u = values.copy()
+    counts = np.arange(1, n + 1, dtype=float)
+    window_periods = _window_periods(window_years, frequency)
+    if window_periods is not None:
+        # Drop the point leaving the window as each new one arrives
+        if window_periods < n:
+            u[window_periods:] -= lambda_decay ** window_periods * values[:n - window_periods]
+        np.minimum(counts, window_periods, out=counts)
+
+    weighted_sum = _exponential_filter(u, lambda_decay)
+    total_weight = (1 - lambda_decay ** counts) / (1 - lambda_decay)
+    return weighted_sum / total_weight
+
+
+class RollingEWMA:
+    """
+    Streaming windowed EWMA, updated in O(1) per new observation.
+
+    Keeps the decayed weighted sum and the last ``window`` points, so
+    appending a point never rescans the history. After the same points,
+    ``value`` equals ``ewma(points, ...)``.
+
+    Parameters
+    ----------
+    half_life_years : float
+        Number of years for the weight to decay by 50%.
+    window_years : int, optional
+        Number of years of data to use. If None, uses all data.
+    frequency : str
+        Data frequency: 'monthly', 'quarterly', or 'annual'.
+
+    Example
+    -------
+    >>> rolling = RollingEWMA(half_life_years=20, window_years=50)
+    >>> rolling.extend(history)
+    >>> rolling.update(latest_month)
+    """
+
+    def __init__(
+        self,
+        half_life_years: float,
+        window_years: Optional[int] = None,
+        frequency: str = 'monthly'
+    ):
+        self.half_life_years = half_life_years
+        self.window_years = window_years
+        self.frequency = frequency
+        self.decay = decay_factor(half_life_years, frequency)
+        self.window = _window_periods(window_years, frequency)
+        self._weighted_sum = 0.0
+        self._count = 0
+        self._buffer: Deque[float] = deque()
+
+    def update(self, value: float) -> float:
+        """Add the newest observation and return the updated EWMA."""
+        value = float(value)
+        self._weighted_sum = self.decay * self._weighted_sum + value
+        if self.window is not None:
+            self._buffer.append(value)
+            if len(self._buffer) > self.window:
+                self._weighted_sum -= self.decay ** self.window * self._buffer.popleft()
+        self._count += 1
+        return self.value
+
+    def extend(self, values: Sequence[float]) -> np.ndarray:
+        """Add observations oldest to newest; returns the EWMA after each."""
+        return np.array([self.update(v) for v in values])
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable state; restore with RollingEWMA.from_state."""
+        return {
+            'half_life_years': self.half_life_years,
+            'window_years': self.window_years,
+            'frequency': self.frequency,
+            'weighted_sum': self._weighted_sum,
+            'count': self._count,
+            'buffer': list(self._buffer),
+        }
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "RollingEWMA":
+        """Rebuild a RollingEWMA saved with to_state()."""
+        rolling = cls(state['half_life_years'], state['window_years'], state['frequency'])
+        rolling._weighted_sum = float(state['weighted_sum'])
+        rolling._count = int(state['count'])
+        rolling._buffer.extend(float(v) for v in state['buffer'])
+        return rolling
+
+    @property
+    def count(self) -> int:
+        """Number of observations currently weighted (capped at the window)."""
+        return self._count if self.window is None else min(self._count, self.window)
+
+    @property
+    def value(self) -> float:
+        """Current EWMA."""
+        if self._count == 0:
+            raise ValueError("No data provided for EWMA calculation")
+        total_weight = (1 - self.decay ** self.count) / (1 - self.decay)
+        return self._weighted_sum / total_weight
 
 
 def compute_trend_growth(
-    data: List[float],
+    data: Sequence[float],
     window_years: int = 50,
     frequency: str = 'annual'
 ) -> float:
@@ -116,7 +282,7 @@ def compute_trend_growth(
 
     Parameters
     ----------
-    data : List[float]
+    data : sequence of float or np.ndarray
         Time series data (levels, not returns), oldest to newest.
     window_years : int
         Years of data to use for trend calculation.
@@ -128,47 +294,122 @@ def compute_trend_growth(
     float
         Annualized trend growth rate.
     """
-    periods_per_year = {
-        'monthly': 12,
-        'quarterly': 4,
-        'annual': 1
-    }.get(frequency, 1)
+    periods_per_year = _periods_per_year(frequency, default=1)
 
     window_periods = window_years * periods_per_year
-    data = data[-window_periods:] if len(data) > window_periods else data
+    values = np.asarray(data, dtype=float)
+    if len(values) > window_periods:
+        values = values[-window_periods:]
 
-    if len(data) < 2:
+    if len(values) < 2:
         raise ValueError("Need at least 2 data points for trend calculation")
 
     # Convert to log values
-    log_data = [math.log(d) for d in data if d > 0]
+    log_data = np.log(values[values > 0])
 
     if len(log_data) < 2:
         raise ValueError("Insufficient positive values for trend calculation")
 
     # Simple linear regression on log values
-    n = len(log_data)
-    x = list(range(n))
-
-    x_mean = sum(x) / n
-    y_mean = sum(log_data) / n
-
-    numerator = sum((xi - x_mean) * (yi - y_mean) for xi, yi in zip(x, log_data))
-    denominator = sum((xi - x_mean) ** 2 for xi in x)
+    x = np.arange(len(log_data), dtype=float)
+    x -= x.mean()
+    denominator = x @ x
 
     if denominator == 0:
         return 0.0
 
     # Slope is growth rate per period
-    slope = numerator / denominator
+    slope = x @ (log_data - log_data.mean()) / denominator
 
     # Annualize
-    annual_growth = slope * periods_per_year
+    return float(slope * periods_per_year)
 
-    return annual_growth
 
+def _trailing_slopes(log_data: np.ndarray, valid: np.ndarray, window_periods: int) -> np.ndarray:
+    """Per-period OLS slope of log_data over each trailing window (NaN if invalid)."""
+    n = len(log_data)
+    t = np.arange(n, dtype=float)
+
+    # Remove the segment's own trend first: window slopes are unchanged up to
+    # adding it back, and the running sums of small residuals stay accurate
+    if valid.sum() >= 2:
+        tv, yv = t[valid], log_data[valid]
+        tc = tv - tv.mean()
+        base_slope = tc @ (yv - yv.mean()) / (tc @ tc)
+        base_intercept = yv.mean() - base_slope * tv.mean()
+    else:
+        base_slope = base_intercept = 0.0
+    residual = np.where(valid, log_data - base_intercept - base_slope * t, 0.0)
+
+    def window_sums(x: np.ndarray) -> np.ndarray:
+        cumulative = np.concatenate(([0.0], np.cumsum(x)))
+        end = np.arange(1, n + 1)
+        return cumulative[end] - cumulative[np.maximum(end - window_periods, 0)]
+
+    sum_y = window_sums(residual)
+    sum_ty = window_sums(t * residual)
+    invalid_points = window_sums((~valid).astype(float))
+
+    # Local x = 0..m-1 in each window: sum((x - x_mean) * y) and m(m^2-1)/12
+    m = np.minimum(np.arange(1, n + 1), window_periods).astype(float)
+    start = t + 1 - m
+    covariance = sum_ty - (start + (m - 1) / 2) * sum_y
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = covariance / (m * (m * m - 1) / 12) + base_slope
+    return np.where((m >= 2) & (invalid_points == 0), slope, np.nan)
+
+
+def rolling_trend_growth(
+    data: Sequence[float],
+    window_years: int = 50,
+    frequency: str = 'annual'
+) -> np.ndarray:
+    """
+    Log-linear trend growth rate at every point of a series.
+
+    Element i is the annualized slope of log levels over the trailing
+    window ending at i (``compute_trend_growth(data[:i + 1], ...)``), from
+    rolling sums in O(n). It is NaN for the first point and for windows
+    that contain a non-positive level.
 
-def sigmoid_my_ratio(my_ratio: float, midpoint: float = 2.0, steepness: float = 2.0) -> float:
+    Parameters
+    ----------
+    data : sequence of float or np.ndarray
+        Time series data (levels, not returns), oldest to newest.
+    window_years : int
+        Years of data in each trend window.
+    frequency : str
+        Data frequency.
+
+    Returns
+    -------
+    np.ndarray
+        Annualized trend growth rates.
+    """
+    periods_per_year = _periods_per_year(frequency, default=1)
+    window_periods = window_years * periods_per_year
+    values = np.asarray(data, dtype=float)
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n < 2 or window_periods < 2:
+        return result
+
+    valid = values > 0
+    log_data = np.zeros(n)
+    log_data[valid] = np.log(values[valid])
+
+    # Long series are evaluated in overlapping chunks so the running sums
+    # (and the time index multiplying them) stay small
+    chunk = _TREND_CHUNK_WINDOWS * window_periods
+    for chunk_start in range(0, n, chunk):
+        lo = max(0, chunk_start - window_periods + 1)
+        hi = min(n, chunk_start + chunk)
+        slopes = _trailing_slopes(log_data[lo:hi], valid[lo:hi], window_periods)
+        result[chunk_start:hi] = slopes[chunk_start - lo:]
+    return result * periods_per_year
+
+
+def sigmoid_my_ratio(my_ratio: Any, midpoint: float = 2.0, steepness: float = 2.0) -> Any:
     """
     Sigmoid function for Middle/Young ratio demographic effect.
 
@@ -176,8 +417,9 @@ def sigmoid_my_ratio(my_ratio: float, midpoint: float = 2.0, steepness: float =
 
     Parameters
     ----------
-    my_ratio : float
-        Middle-aged to Young population ratio.
+    my_ratio : float, Dual or np.ndarray
+        Middle-aged to Young population ratio (an array evaluates every
+        element, as in the batch engine).
     midpoint : float
         MY ratio at which effect is zero.
     steepness : float
@@ -185,12 +427,15 @@ def sigmoid_my_ratio(my_ratio: float, midpoint: float = 2.0, steepness: float =
 
     Returns
     -------
-    float
+    float, Dual or np.ndarray
         Demographic effect on growth (can be positive or negative).
     """
     # Centered sigmoid: positive when MY < midpoint, negative when MY > midpoint
     z = steepness * (midpoint - my_ratio)
-    sigmoid = 1 / (1 + math.exp(-z))
+    if isinstance(my_ratio, np.ndarray):
+        sigmoid = 1 / (1 + np.exp(-z))
+    else:
+        sigmoid = 1 / (1 + dual.exp(-z))  # dual-aware so sensitivities flow through
 
     # Scale to reasonable range (-1% to +1% effect)
     effect = (sigmoid - 0.5) * 0.02
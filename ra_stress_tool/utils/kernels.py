@@ -0,0 +1,134 @@
+"""
+Shared kernels for the building-block formulas.
+
+The valuation kernels replace year-by-year loops with their
+geometric-series closed forms; the rest are the one-line bond, credit and
+blending formulas. They take Python floats, NumPy arrays (any broadcastable
+mix, e.g. an array of horizons) or utils.dual.Dual numbers, so the scalar
+models, the batch engine, sweeps and Monte Carlo all share the same
+arithmetic.
+
+Guards such as "only when the current CAEY is positive" stay with the
+caller; the kernels are the formulas only.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+# Monthly term premium reversion rate used by bond valuation returns
+MONTHLY_TP_REVERSION = 0.03
+
+
+def average_mean_reverting_value(current, fair, speed, years):
+    """
+    Average of a value decaying from ``current`` toward ``fair``.
+
+    Closed form of averaging ``value_k = fair + (current - fair) * (1 - speed)^k``
+    over k = 0 .. years-1:
+
+        fair + (current - fair) * (1 - (1 - speed)^years) / (speed * years)
+
+    Parameters
+    ----------
+    current, fair : float or array-like
+        Starting and fair value.
+    speed : float or array-like
+        Annual reversion speed (0 to 1). Zero means no reversion.
+    years : int or array-like
+        Horizon(s) in years (>= 1).
+
+    Returns
+    -------
+    float or np.ndarray
+        Average value over the horizon.
+    """
+    if np.ndim(speed) == 0:
+        if speed == 0:
+            return current + 0.0 * years
+        return fair + (current - fair) * (1 - (1 - speed) ** years) / (speed * years)
+
+    speed = np.asarray(speed, dtype=float)
+    moving = speed != 0
+    safe_speed = np.where(moving, speed, 1.0)
+    factor = (1 - (1 - safe_speed) ** years) / (safe_speed * years)
+    return np.where(moving, fair + (current - fair) * factor, current + 0.0 * years)
+
+
+@lru_cache(maxsize=128)
+def _reversion_fraction_scalar(horizon: float, monthly_rate: float) -> float:
+    return min(1 - (1 - monthly_rate) ** (horizon * 12), 1.0)
+
+
+def reversion_fraction(horizon, monthly_rate: float = MONTHLY_TP_REVERSION):
+    """
+    Share of a term premium gap closed over ``horizon`` years of monthly
+    reversion: ``min(1 - (1 - monthly_rate)^(12 * horizon), 1)``.
+
+    Scalar horizons are memoized; arrays are evaluated elementwise.
+    """
+    if np.ndim(horizon) == 0:
+        return _reversion_fraction_scalar(float(horizon), monthly_rate)
+    return np.minimum(1 - (1 - monthly_rate) ** (np.asarray(horizon, dtype=float) * 12), 1.0)
+
+
+def caey_annual_change(current_caey, fair_caey, reversion_speed, full_reversion_years):
+    """
+    Annual CAEY growth rate when reverting toward fair value over
+    ``full_reversion_years`` (dampened by ``reversion_speed``):
+    ``(fair / current)^(speed / years) - 1``.
+    """
+    return (fair_caey / current_caey) ** (reversion_speed / full_reversion_years) - 1
+
+
+def caey_average_valuation(annual_change):
+    """
+    Average yearly price change from CAEY compounding at ``annual_change``.
+
+    P = E / CAEY, so each year's price change is CAEY_t / CAEY_t+1 - 1 =
+    1 / (1 + g) - 1. It is the same every year, so the average over any
+    horizon is that single value (the year loop collapses).
+    """
+    return 1 / (1 + annual_change) - 1
+
+
+def pe_valuation_change(current_pe, target_pe, horizon):
+    """Annualized P/E re-rating: ``(target / current)^(1 / horizon) - 1``."""
+    return (target_pe / current_pe) ** (1.0 / horizon) - 1
+
+
+def weighted_blend(a, b, weight_a, weight_b):
+    """
+    Two-input weighted blend ``weight_a * a + weight_b * b``.
+
+    Used for the 30/70 current vs. long-term macro forecasts, the
+    country/regional EPS blend and the carry/PPP FX forecast.
+    """
+    return weight_a * a + weight_b * b
+
+
+def credit_loss(default_rate, recovery_rate):
+    """Annual credit loss: ``default_rate * (1 - recovery_rate)``."""
+    return default_rate * (1 - recovery_rate)
+
+
+def roll_return(term_premium, duration, maturity_years):
+    """
+    Roll-down return on a constant-slope curve:
+    ``term_premium / maturity_years * duration``.
+    """
+    return term_premium / maturity_years * duration
+
+
+def reversion_change(current, fair, fraction):
+    """Expected move of ``current`` toward ``fair``: ``(fair - current) * fraction``."""
+    return (fair - current) * fraction
+
+
+def valuation_return(duration, change, horizon):
+    """
+    Annualized price return from a yield or spread change spread over the
+    horizon: ``-duration * change / horizon``.
+    """
+    return -duration * change / horizon
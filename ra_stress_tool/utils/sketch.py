@@ -0,0 +1,157 @@
+"""
+Streaming quantile sketch for large simulated return distributions.
+
+QuantileSketch is a merging t-digest: values are absorbed in chunks and
+compressed into about ``compression / 2`` weighted centroids, packed densely
+in the tails and coarsely around the median, so tail quantiles stay
+accurate while memory is independent of the number of values seen.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Constant-memory quantile estimator (t-digest with the k1 scale function).
+
+    Parameters
+    ----------
+    compression : float
+        Accuracy/size trade-off (delta). The digest keeps about
+        ``compression / 2`` centroids; 100-300 is typical.
+    """
+
+    def __init__(self, compression: float = 200.0):
+        if compression < 10:
+            raise ValueError("compression must be at least 10")
+        self.compression = float(compression)
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def n_centroids(self) -> int:
+        return self._means.size
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else float('nan')
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of everything added."""
+        return float(np.sqrt(self._m2 / (self.count - 1))) if self.count > 1 else float('nan')
+
+    def update(self, values) -> None:
+        """
+        Add a chunk of values (NaNs are ignored).
+
+        Parameters
+        ----------
+        values : array-like
+            New observations.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        # Chan et al. parallel update of the running mean / variance
+        n_new = values.size
+        new_mean = float(values.mean())
+        new_m2 = float(((values - new_mean) ** 2).sum())
+        total = self.count + n_new
+        delta = new_mean - self._mean
+        self._m2 += new_m2 + delta * delta * self.count * n_new / total
+        self._mean += delta * n_new / total
+        self.count = total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        self._merge(np.concatenate([self._means, values]),
+                    np.concatenate([self._weights, np.ones(n_new)]))
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch into this one (e.g. from a parallel worker)."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self._mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._merge(np.concatenate([self._means, other._means]),
+                    np.concatenate([self._weights, other._weights]))
+
+    def _merge(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind='mergesort')
+        means = means[order]
+        weights = weights[order]
+        total = weights.sum()
+
+        # k1 scale: k(q) = delta / (2 pi) * asin(2q - 1). Points whose left
+        # cumulative quantile falls in the same unit k-interval collapse
+        # into one centroid, which bounds the count at ~delta / 2.
+        q_left = (np.cumsum(weights) - weights) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)
+        bucket = np.floor(k).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+
+        merged_weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / merged_weights
+        self._weights = merged_weights
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a single quantile.
+
+        Parameters
+        ----------
+        q : float
+            Probability in [0, 1].
+
+        Returns
+        -------
+        float
+            Interpolated quantile estimate (NaN if empty).
+        """
+        return float(self.quantiles([q])[0])
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Estimate several quantiles at once."""
+        qs = np.asarray(qs, dtype=float)
+        if np.any((qs < 0) | (qs > 1)):
+            raise ValueError("Quantiles must be in [0, 1]")
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+
+        # Centroid means sit at their cumulative mid-weight; the exact
+        # min/max anchor the ends of the interpolation
+        total = self._weights.sum()
+        mids = (np.cumsum(self._weights) - self._weights / 2) / total
+        xp = np.r_[0.0, mids, 1.0]
+        fp = np.r_[self.min, self._means, self.max]
+        return np.interp(qs, xp, fp)
+
+    def summary(self, qs: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> Dict[str, float]:
+        """Mean, std, min, max and the requested quantiles as a flat dict."""
+        out = {
+            'mean': float(self.mean),
+            'std': float(self.std),
+            'min': float(self.min) if self.count else float('nan'),
+            'max': float(self.max) if self.count else float('nan'),
+        }
+        for q, value in zip(qs, self.quantiles(qs)):
+            out[f"p{q * 100:g}"] = float(value)
+        return out
@@ -0,0 +1,10 @@
+"""
+Equivalence tests for the RA CME Stress Testing Tool.
+
+Every fast path is checked against the straightforward computation it
+replaces. Timings live in benchmarks/.
+
+Run from the repository root:
+
+    python -m pytest -q
+"""
@@ -0,0 +1,70 @@
+"""Backtest panel evaluation vs. one CMEEngine per date, and its statistics."""
+
+import json
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.backtest import (
+    BacktestRunner,
+    forward_annualized_returns,
+    month_range,
+    panel_from_store,
+)
+from ra_stress_tool.batch import ASSETS
+from ra_stress_tool.history import TimeSeriesStore
+from ra_stress_tool.main import CMEEngine
+
+from .test_batch_engine import nested
+
+
+TOLERANCE = 1e-12
+PATHS = ['macro.us.current_tbill', 'equity_us.current_caey', 'bonds_hy.credit_spread']
+PANEL = np.array([
+    [0.050, 0.045, 0.040],
+    [0.048, np.nan, 0.042],
+    [np.nan, 0.043, np.nan],
+    [0.047, 0.044, 0.045],
+])
+
+
+def test_rows_match_scalar_engine_with_missing_cells_as_defaults():
+    dates = month_range('2020-01', '2020-04')
+    results = BacktestRunner(base_overrides={'equity_us': {'current_caey': 0.03}}).run(dates, PATHS, PANEL)
+    for i, row in enumerate(PANEL):
+        present = ~np.isnan(row)
+        overrides = nested([p for p, ok in zip(PATHS, present) if ok], row[present])
+        overrides.setdefault('equity_us', {}).setdefault('current_caey', 0.03)
+        scalar = CMEEngine(overrides).compute_all_returns().results
+        for a, asset in enumerate(ASSETS):
+            assert results.forecast[i, a] == pytest.approx(scalar[asset].expected_return_nominal, abs=TOLERANCE)
+
+
+def test_error_stats_and_saved_files(tmp_path):
+    dates = month_range('2020-01', '2020-04')
+    realized = {'equity_us': [0.05, 0.06, np.nan, 0.04]}
+    results = BacktestRunner().run(dates, PATHS, PANEL, realized=realized)
+
+    errors = np.array(realized['equity_us'])[[0, 1, 3]] - results.forecast[[0, 1, 3], ASSETS.index('equity_us')]
+    stats = results.error_stats()
+    assert stats['equity_us']['n'] == 3
+    assert stats['equity_us']['bias'] == pytest.approx(errors.mean(), abs=TOLERANCE)
+    assert stats['equity_us']['rmse'] == pytest.approx(np.sqrt((errors ** 2).mean()), abs=TOLERANCE)
+    assert stats['bonds_hy']['n'] == 0 and stats['bonds_hy']['rmse'] is None
+
+    written = results.save(str(tmp_path))
+    with open(written['stats']) as f:
+        assert json.load(f)['assets'] == stats
+    np.testing.assert_array_equal(np.load(written['npz'])['forecasts'], results.forecasts.values)
+
+
+def test_forward_returns_and_store_alignment(tmp_path):
+    levels = 100 * 1.05 ** (np.arange(36) / 12)
+    forward = forward_annualized_returns(levels, horizon_years=2)
+    np.testing.assert_allclose(forward[:12], 0.05, rtol=1e-12)
+    assert np.isnan(forward[12:]).all()
+
+    store = TimeSeriesStore(str(tmp_path))
+    store.write('equity_us.caey', [0.04, 0.05], start='2020-04', frequency='quarterly')
+    panel = panel_from_store(store, {'equity_us.current_caey': 'equity_us.caey'}, month_range('2020-03', '2020-10'))
+    np.testing.assert_array_equal(panel[:, 0], [np.nan, 0.04, 0.04, 0.04, 0.05, 0.05, 0.05, np.nan])
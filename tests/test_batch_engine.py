@@ -0,0 +1,133 @@
+"""BatchCMEEngine vs. one scalar CMEEngine per scenario."""
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.batch import BatchCMEEngine, compute_scenarios
+from ra_stress_tool.config import BOND_PARAMS
+from ra_stress_tool.inputs.defaults import invalidate_defaults_snapshot
+from ra_stress_tool.main import CMEEngine
+
+
+TOLERANCE = 1e-12
+N_RANDOM = 25
+
+# Override paths sampled together, with (low, high) bounds
+SWEEP = {
+    'macro.us.current_tbill': (0.0, 0.06),
+    'macro.us.current_headline_inflation': (0.0, 0.08),
+    'macro.us.my_ratio': (1.0, 3.0),
+    'macro.eurozone.current_tbill': (-0.005, 0.04),
+    'macro.eurozone.population_growth': (-0.005, 0.01),
+    'macro.japan.productivity_growth': (0.0, 0.02),
+    'macro.em.current_headline_inflation': (0.01, 0.08),
+    'bonds_global.current_term_premium': (-0.01, 0.03),
+    'bonds_hy.default_rate': (0.01, 0.10),
+    'bonds_hy.credit_spread': (0.02, 0.08),
+    'bonds_em.current_yield': (0.04, 0.09),
+    'equity_us.current_caey': (0.02, 0.06),
+    'equity_europe.current_caey': (0.03, 0.08),
+    'equity_japan.current_pe': (10.0, 25.0),
+    'equity_em.dividend_yield': (0.01, 0.05),
+    'absolute_return.trading_alpha': (0.0, 0.02),
+    'inflation_linked.usd.current_real_yield': (0.0, 0.03),
+    'inflation_linked.eur.current_real_yield': (-0.01, 0.02),
+}
+
+# Scenarios whose override presence switches model branches
+PRESENCE_SCENARIOS = [
+    {},
+    {'macro': {'us': {'rgdp_growth': 0.01, 'inflation_forecast': 0.05}}},
+    {'macro': {'eurozone': {'tbill_forecast': -0.002}, 'japan': {'long_term_inflation': 0.01}}},
+    {'bonds_global': {'current_yield': 0.055}},
+    {'bonds_em': {'current_yield': 0.08, 'current_term_premium': 0.01}},
+    {'equity_us': {'revenue_growth': 0.07, 'current_caey': -0.01}},
+    {'macro': {'em': {'country_factor': 0.01, 'rgdp_adjustment': 0.002}}},
+]
+
+CONFIGURATIONS = [(base, model) for base in ('usd', 'eur') for model in ('ra', 'gk')]
+
+
+def nested(paths, row):
+    overrides = {}
+    for path, value in zip(paths, row):
+        *parents, key = path.split('.')
+        node = overrides
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[key] = float(value)
+    return overrides
+
+
+def assert_matches_scalar(batch, row, overrides, base_currency, model):
+    scalar = CMEEngine(overrides, base_currency=base_currency, equity_model_type=model).compute_all_returns()
+    got_row = batch.scenario(row)
+    for asset, result in scalar.results.items():
+        expected = dict(result.components)
+        expected['expected_return_nominal'] = result.expected_return_nominal
+        expected['expected_return_real'] = result.expected_return_real
+        got = got_row[asset]
+        assert set(expected) <= set(got), (asset, set(expected) - set(got))
+        for component, value in expected.items():
+            assert got[component] == pytest.approx(value, abs=TOLERANCE), (asset, component)
+
+
+@pytest.mark.parametrize("base_currency,model", CONFIGURATIONS)
+def test_random_scenarios_match_scalar_engine(base_currency, model):
+    rng = np.random.default_rng(7)
+    paths = list(SWEEP)
+    low = np.array([SWEEP[p][0] for p in paths])
+    high = np.array([SWEEP[p][1] for p in paths])
+    values = rng.uniform(low, high, size=(N_RANDOM, len(paths)))
+
+    batch = BatchCMEEngine(paths, base_currency=base_currency, equity_model_type=model).compute(values)
+    for i in range(N_RANDOM):
+        assert_matches_scalar(batch, i, nested(paths, values[i]), base_currency, model)
+
+
+@pytest.mark.parametrize("base_currency,model", CONFIGURATIONS)
+def test_branch_switching_scenarios_match_scalar_engine(base_currency, model):
+    batch = compute_scenarios(PRESENCE_SCENARIOS, base_currency=base_currency, equity_model_type=model)
+    for i, overrides in enumerate(PRESENCE_SCENARIOS):
+        assert_matches_scalar(batch, i, overrides, base_currency, model)
+
+
+def test_base_overrides_match_scalar_engine():
+    base = {'macro': {'us': {'inflation_forecast': 0.035}}, 'equity_us': {'fair_caey': 0.05}}
+    paths = ['macro.japan.current_tbill', 'bonds_global.current_yield']
+    values = np.array([[0.001, 0.04], [0.02, 0.05]])
+    batch = BatchCMEEngine(paths, base_overrides=base).compute(values)
+    for i, row in enumerate(values):
+        overrides = nested(paths, row)
+        overrides['macro']['us'] = dict(base['macro']['us'])
+        overrides['equity_us'] = dict(base['equity_us'])
+        assert_matches_scalar(batch, i, overrides, 'usd', 'ra')
+
+
+def test_unknown_column_path_is_rejected():
+    with pytest.raises(ValueError, match="macro.us.bogus"):
+        BatchCMEEngine(['macro.us.bogus', 'equity_us.current_caey'])
+
+
+@pytest.fixture
+def fresh_defaults():
+    invalidate_defaults_snapshot()
+    yield
+    invalidate_defaults_snapshot()
+
+
+@pytest.mark.parametrize("key,value,asset", [
+    ('roll_maturity_years', 8.0, 'bonds_global'),
+    ('credit_spread_reversion', 0.8, 'bonds_hy'),
+    ('em_hard_currency_spread', 0.035, 'bonds_em'),
+])
+def test_shared_bond_parameters_move_both_engines(monkeypatch, fresh_defaults, key, value, asset):
+    before = CMEEngine().compute_all_returns().results[asset].expected_return_nominal
+
+    monkeypatch.setitem(BOND_PARAMS, key, value)
+    invalidate_defaults_snapshot()
+
+    scalar = CMEEngine().compute_all_returns().results[asset].expected_return_nominal
+    batch = BatchCMEEngine([]).compute(np.empty((1, 0))).get(asset)[0]
+    assert scalar != pytest.approx(before, abs=1e-6)
+    assert batch == pytest.approx(scalar, abs=TOLERANCE)
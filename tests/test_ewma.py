@@ -0,0 +1,45 @@
+"""O(n) rolling EWMA and trend growth vs. one evaluation per prefix."""
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.utils.ewma import (
+    RollingEWMA,
+    compute_trend_growth,
+    ewma,
+    ewma_from_series,
+    rolling_trend_growth,
+)
+
+
+TOLERANCE = 1e-10
+
+
+@pytest.fixture
+def levels():
+    rng = np.random.default_rng(21)
+    return 100 * np.exp(np.cumsum(rng.normal(0.005, 0.04, 600)))
+
+
+@pytest.mark.parametrize("window_years", [None, 10])
+def test_rolling_ewma_matches_prefix_ewma(levels, window_years):
+    expected = [ewma(levels[:i + 1], 5, window_years) for i in range(len(levels))]
+    np.testing.assert_allclose(ewma_from_series(levels, 5, window_years), expected, rtol=TOLERANCE)
+
+    streaming = RollingEWMA(5, window_years)
+    np.testing.assert_allclose(streaming.extend(levels), expected, rtol=TOLERANCE)
+    assert streaming.count == (len(levels) if window_years is None else 120)
+
+
+def test_rolling_trend_growth_matches_prefix_regression(levels):
+    rolling = rolling_trend_growth(levels, window_years=20, frequency='monthly')
+    assert np.isnan(rolling[0])
+    expected = [compute_trend_growth(levels[:i + 1], 20, 'monthly') for i in range(1, len(levels))]
+    np.testing.assert_allclose(rolling[1:], expected, rtol=1e-8, atol=TOLERANCE)
+
+
+def test_window_with_non_positive_level_is_nan():
+    data = np.array([1.0, 1.1, -1.0, 1.3, 1.4, 1.5, 1.6])
+    rolling = rolling_trend_growth(data, window_years=3)
+    assert np.isnan(rolling[2:5]).all()
+    assert rolling[6] == pytest.approx(compute_trend_growth(data[4:7], 3), abs=TOLERANCE)
@@ -0,0 +1,67 @@
+"""ComputeExecutor admission control and the 503 it surfaces through the API."""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api.executor import ComputeExecutor
+from api.main import app
+from api.routes import calculate
+
+
+def test_admits_workers_plus_queue_then_rejects():
+    executor = ComputeExecutor(max_workers=1, max_queue=1, retry_after=7)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert executor.stats()['pending'] == 2
+
+        with pytest.raises(HTTPException) as excinfo:
+            await executor.run(release.wait, 5)
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.headers == {'Retry-After': '7'}
+
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        release.set()
+        executor.shutdown()
+
+    stats = executor.stats()
+    assert (stats['pending'], stats['completed'], stats['rejected']) == (0, 2, 1)
+
+
+def test_failed_work_releases_its_slot():
+    executor = ComputeExecutor(max_workers=1, max_queue=0)
+
+    async def scenario():
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+        assert await executor.run(lambda: 42) == 42
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    assert executor.stats()['pending'] == 0
+
+
+def test_saturated_executor_returns_503(monkeypatch):
+    saturated = ComputeExecutor(max_workers=1, max_queue=0, retry_after=3)
+    saturated._pending = saturated.capacity
+    monkeypatch.setattr(calculate, 'compute_executor', saturated)
+    calculate._result_cache.clear()
+
+    with TestClient(app) as client:
+        response = client.post('/api/calculate/full', json={'overrides': {'equity_us': {'current_caey': 0.031}}})
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '3'
@@ -0,0 +1,45 @@
+"""FX matrix vs. pairwise FX forecasts, and all-bases vs. one engine per base."""
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.config import BaseCurrency, CURRENCY_TO_MACRO_REGION
+from ra_stress_tool.main import CMEEngine, DETAIL_LEVELS
+
+
+SCENARIOS = [
+    {},
+    {'macro': {'japan': {'current_tbill': 0.02}, 'eurozone': {'inflation_forecast': 0.03}}},
+    {'macro': {'em': {'current_headline_inflation': 0.08}}, 'equity_us': {'current_caey': 0.05}},
+]
+
+
+@pytest.mark.parametrize("overrides", SCENARIOS, ids=str)
+def test_fx_matrix_is_antisymmetric(overrides):
+    matrix = CMEEngine(overrides).compute_fx_matrix()
+    for m in (matrix.fx_change, matrix.carry, matrix.ppp):
+        assert np.array_equal(m, -m.T)
+        assert not np.diag(m).any()
+
+
+@pytest.mark.parametrize("overrides", SCENARIOS, ids=str)
+def test_fx_matrix_matches_pairwise_forecasts(overrides):
+    engine = CMEEngine(overrides)
+    matrix = engine.compute_fx_matrix()
+    macro = engine.compute_macro_forecasts()
+    for home in matrix.currencies:
+        for foreign in matrix.currencies:
+            expected = engine.fx_model.forecast_fx_change(
+                CURRENCY_TO_MACRO_REGION[home], CURRENCY_TO_MACRO_REGION[foreign], macro,
+            )
+            assert matrix.pair(home, foreign) == expected, (home, foreign)
+
+
+@pytest.mark.parametrize("detail", DETAIL_LEVELS)
+@pytest.mark.parametrize("model", ['ra', 'gk'])
+@pytest.mark.parametrize("overrides", SCENARIOS, ids=str)
+def test_all_base_currencies_match_separate_engines(overrides, model, detail):
+    combined = CMEEngine(overrides, equity_model_type=model, detail=detail).compute_all_base_currencies()
+    for base in BaseCurrency:
+        separate = CMEEngine(overrides, base.value, model, detail=detail).compute_all_returns()
+        assert combined[base.value] == separate, base.value
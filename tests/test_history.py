@@ -0,0 +1,60 @@
+"""History store and incremental fair values vs. a full EWMA over the history."""
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.config import EWMA_PARAMS
+from ra_stress_tool.history import FairValuePipeline, TimeSeriesStore
+from ra_stress_tool.utils.ewma import ewma
+
+
+TOLERANCE = 1e-12
+
+
+def full_ewma(history, param):
+    params = EWMA_PARAMS[param]
+    return ewma(history, params.half_life_years, params.window_years)
+
+
+@pytest.fixture
+def store(tmp_path):
+    rng = np.random.default_rng(22)
+    store = TimeSeriesStore(str(tmp_path / 'history'))
+    store.write('equity_us.caey', 0.04 + rng.normal(0, 0.005, 600), start='1975-01')
+    store.write('macro.us.headline_inflation', 0.025 + rng.normal(0, 0.01, 300), start='2000-01')
+    return store
+
+
+def test_store_round_trip_and_append(store):
+    info = store.info('equity_us.caey')
+    assert (info.start, info.length, info.end, info.revision) == ('1975-01', 600, '2024-12', 0)
+
+    before = np.array(store.read('equity_us.caey'))
+    store.append('equity_us.caey', [0.03, 0.031])
+    after = store.read('equity_us.caey')
+    assert store.info('equity_us.caey').end == '2025-02'
+    np.testing.assert_array_equal(after[:600], before)
+    np.testing.assert_array_equal(after[600:], [0.03, 0.031])
+
+
+def test_appends_feed_only_new_points(store):
+    pipeline = FairValuePipeline(store)
+    pipeline.update()
+    store.append('equity_us.caey', [0.03, 0.031, 0.029])
+    values = pipeline.update()
+
+    assert pipeline.last_update_points == {'equity_us.fair_caey': 3, 'macro.us.long_term_inflation': 0}
+    history = store.read('equity_us.caey')
+    assert values['equity_us.fair_caey'] == pytest.approx(full_ewma(history, 'caey_fair_value'), abs=TOLERANCE)
+    assert values == pytest.approx(FairValuePipeline(store).rebuild(), abs=TOLERANCE)
+
+
+def test_rewritten_series_is_rebuilt(store):
+    pipeline = FairValuePipeline(store)
+    pipeline.update()
+    store.write('macro.us.headline_inflation', np.full(240, 0.02), start='2005-01')
+    values = pipeline.update()
+
+    assert pipeline.last_update_points['macro.us.long_term_inflation'] == 120
+    assert values['macro.us.long_term_inflation'] == pytest.approx(0.02, abs=TOLERANCE)
+    assert pipeline.fair_values()['macro']['us'] == {'long_term_inflation': values['macro.us.long_term_inflation']}
@@ -0,0 +1,111 @@
+"""Incremental override patches vs. a freshly built CMEEngine."""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from ra_stress_tool.inputs.overrides import validate_overrides
+from ra_stress_tool.main import CMEEngine, DETAIL_LEVELS
+
+
+EDITS = [
+    {'equity_us': {'current_caey': 0.045}},
+    {'equity_japan': {'dividend_yield': 0.025}},
+    {'bonds_hy': {'default_rate': 0.06}},
+    {'bonds_global': {'current_yield': 0.045}},
+    {'inflation_linked': {'usd': {'current_real_yield': 0.02}}},
+    {'inflation_linked': {'eur': {'current_real_yield': 0.001}}},
+    {'absolute_return': {'trading_alpha': 0.012}},
+    {'macro': {'eurozone': {'inflation_forecast': 0.03}}},
+    {'macro': {'em': {'current_headline_inflation': 0.05}}},
+    {'macro': {'us': {'current_tbill': 0.045}}},
+    {'macro': {'japan': {'my_ratio': 2.4}}},
+]
+
+
+def merge(base, update):
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+@pytest.mark.parametrize("base_currency", ['usd', 'eur'])
+@pytest.mark.parametrize("edit", EDITS, ids=str)
+def test_single_patch_matches_fresh_engine(edit, base_currency):
+    engine = CMEEngine({}, base_currency=base_currency)
+    engine.compute_all_returns()
+    report = engine.apply_override_patch(copy.deepcopy(edit))
+
+    expected = CMEEngine(copy.deepcopy(edit), base_currency=base_currency).compute_all_returns()
+    assert engine.compute_all_returns().results == expected.results
+    assert set(report.changed_assets) <= set(report.recomputed_assets)
+    changed = {key for key, r in expected.results.items()
+               if r != CMEEngine({}, base_currency=base_currency).compute_all_returns().results[key]}
+    assert changed <= set(report.recomputed_assets)
+
+
+@pytest.mark.parametrize("detail", DETAIL_LEVELS)
+@pytest.mark.parametrize("base_currency", ['usd', 'eur'])
+def test_patch_sequence_matches_fresh_engine(base_currency, detail):
+    engine = CMEEngine({}, base_currency=base_currency, detail=detail)
+    engine.compute_all_returns()
+    overrides = {}
+    for step, edit in enumerate(EDITS, 1):
+        # Alternate eager and lazy recomputation
+        engine.apply_override_patch(copy.deepcopy(edit), recompute=bool(step % 2))
+        merge(overrides, copy.deepcopy(edit))
+        fresh = CMEEngine(copy.deepcopy(overrides), base_currency=base_currency, detail=detail)
+        assert engine.compute_all_returns() == fresh.compute_all_returns(), edit
+
+
+def test_clear_overrides_matches_defaults():
+    engine = CMEEngine({'macro': {'us': {'current_tbill': 0.06}}})
+    engine.compute_all_returns()
+    engine.clear_overrides()
+    assert engine.compute_all_returns() == CMEEngine().compute_all_returns()
+
+
+@pytest.mark.parametrize("clear", [
+    {'macro': {'japan': {'my_ratio': None}}},
+    {'macro': {'japan': None}},
+    {'macro': None},
+], ids=str)
+def test_null_removes_override_and_restores_baseline(clear):
+    engine = CMEEngine({'equity_us': {'current_caey': 0.04}})
+    baseline = engine.compute_all_returns()
+    engine.apply_override_patch({'macro': {'japan': {'my_ratio': 2.4}}})
+    assert engine.compute_all_returns() != baseline
+
+    report = engine.apply_override_patch(clear)
+    assert engine.compute_all_returns() == baseline
+    assert 'equity_japan' in report.changed_assets
+    assert not engine.override_manager.has_override('macro.japan.my_ratio')
+    assert not engine.override_manager.has_override('macro')
+    assert engine.override_manager.has_override('equity_us.current_caey')
+
+
+def test_validate_overrides_accepts_null_on_known_paths():
+    validate_overrides({'macro': {'japan': {'my_ratio': None}}, 'equity_us': None})
+    with pytest.raises(ValueError, match="macro.japan.bogus"):
+        validate_overrides({'macro': {'japan': {'bogus': None}}})
+
+
+def test_session_patch_with_null_returns_to_baseline():
+    with TestClient(app) as client:
+        created = client.post('/api/calculate/session', json={'overrides': {}}).json()
+        url = f"/api/calculate/session/{created['session_id']}"
+        changed = client.patch(url, json={'overrides': {'macro': {'japan': {'my_ratio': 2.4}}}}).json()
+        cleared = client.patch(url, json={'overrides': {'macro': {'japan': {'my_ratio': None}}}})
+        client.delete(url)
+
+    assert cleared.status_code == 200
+    body = cleared.json()
+    assert 'equity_japan' in body['changed_assets']
+    assert set(body['changed_assets']) == set(changed['changed_assets'])
+    for asset, result in body['results'].items():
+        assert result == created['results'][asset]
@@ -0,0 +1,98 @@
+"""Closed-form valuation kernels vs. the year-by-year loops they replaced."""
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.utils import kernels
+from ra_stress_tool.utils.dual import Dual
+
+
+TOLERANCE = 1e-12
+HORIZONS = np.arange(1, 31)
+
+
+def loop_average_mean_reverting_value(current, fair, speed, years):
+    total = 0.0
+    value = current
+    for _ in range(years):
+        total += value
+        value = value + speed * (fair - value)
+    return total / years
+
+
+def loop_reversion_fraction(horizon):
+    return min(1 - (1 - kernels.MONTHLY_TP_REVERSION) ** (horizon * 12), 1.0)
+
+
+def loop_caey_valuation(current_caey, fair_caey, speed, full_years, horizon):
+    change = (fair_caey / current_caey) ** (speed / full_years) - 1
+    cumulative = 0.0
+    caey = current_caey
+    for _ in range(horizon):
+        caey_next = caey * (1 + change)
+        cumulative += caey / caey_next - 1
+        caey = caey_next
+    return cumulative / horizon
+
+
+@pytest.fixture(scope="module")
+def samples():
+    rng = np.random.default_rng(0)
+    n = 500
+    return {
+        'current': rng.uniform(-0.01, 0.04, n),
+        'fair': rng.uniform(0.0, 0.03, n),
+        'speed': rng.choice([0.0, 0.015, 0.05, 0.3, 1.0], n),
+        'horizon': rng.integers(1, 31, n),
+        'caey': rng.uniform(0.015, 0.08, n),
+        'fair_caey': rng.uniform(0.03, 0.07, n),
+        'lam': rng.uniform(0.1, 1.0, n),
+    }
+
+
+def test_average_mean_reverting_value_scalar(samples):
+    s = samples
+    for c, f, v, h in zip(s['current'], s['fair'], s['speed'], s['horizon']):
+        got = kernels.average_mean_reverting_value(c, f, v, int(h))
+        assert got == pytest.approx(loop_average_mean_reverting_value(c, f, v, int(h)), abs=TOLERANCE)
+
+
+def test_average_mean_reverting_value_arrays(samples):
+    s = samples
+    got = kernels.average_mean_reverting_value(s['current'], s['fair'], s['speed'], s['horizon'])
+    expected = [
+        loop_average_mean_reverting_value(c, f, v, int(h))
+        for c, f, v, h in zip(s['current'], s['fair'], s['speed'], s['horizon'])
+    ]
+    np.testing.assert_allclose(got, expected, rtol=0, atol=TOLERANCE)
+
+
+def test_average_mean_reverting_value_horizons():
+    got = kernels.average_mean_reverting_value(0.01, 0.015, 0.05, HORIZONS)
+    expected = [loop_average_mean_reverting_value(0.01, 0.015, 0.05, int(h)) for h in HORIZONS]
+    np.testing.assert_allclose(got, expected, rtol=0, atol=TOLERANCE)
+
+
+def test_reversion_fraction():
+    expected = [loop_reversion_fraction(int(h)) for h in HORIZONS]
+    assert [kernels.reversion_fraction(int(h)) for h in HORIZONS] == pytest.approx(expected, abs=TOLERANCE)
+    np.testing.assert_allclose(kernels.reversion_fraction(HORIZONS), expected, rtol=0, atol=TOLERANCE)
+
+
+def test_caey_average_valuation(samples):
+    s = samples
+    for c, f, lam, h in zip(s['caey'], s['fair_caey'], s['lam'], s['horizon']):
+        got = kernels.caey_average_valuation(kernels.caey_annual_change(c, f, lam, 20))
+        assert got == pytest.approx(loop_caey_valuation(c, f, lam, 20, int(h)), abs=TOLERANCE)
+
+
+def test_pe_valuation_change_horizons():
+    got = kernels.pe_valuation_change(25.0, 20.0, HORIZONS)
+    np.testing.assert_allclose(got, [(20.0 / 25.0) ** (1.0 / h) - 1 for h in HORIZONS], rtol=0, atol=TOLERANCE)
+
+
+def test_kernels_propagate_duals():
+    d = kernels.average_mean_reverting_value(Dual.seed(0.01, 'current'), 0.015, 0.05, 10)
+    assert d.primal == pytest.approx(loop_average_mean_reverting_value(0.01, 0.015, 0.05, 10), abs=TOLERANCE)
+    # The average is linear in current: d/dcurrent = (1 - (1 - s)^n) / (s * n)
+    assert d.grad['current'] == pytest.approx((1 - (1 - 0.05) ** 10) / (0.05 * 10), abs=TOLERANCE)
@@ -0,0 +1,101 @@
+"""Efficient frontier (critical line) vs. closed-form and brute-force optima."""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from ra_stress_tool import portfolio
+from ra_stress_tool.portfolio import RiskModel, efficient_frontier, portfolio_stats
+
+
+TOLERANCE = 1e-10
+
+
+@pytest.fixture
+def universe():
+    rng = np.random.default_rng(24)
+    factors = rng.normal(size=(4, 4))
+    correlation = factors @ factors.T + np.eye(4)
+    scale = np.sqrt(np.diag(correlation))
+    risk = RiskModel(('a', 'b', 'c', 'd'), [0.05, 0.10, 0.15, 0.20], correlation / np.outer(scale, scale))
+    return np.array([0.02, 0.04, 0.06, 0.08]), risk.covariance
+
+
+def test_frontier_inside_bounds_matches_closed_form(universe):
+    mu, cov = universe
+    frontier = efficient_frontier(mu, cov, n_points=20, lower=-5.0, upper=5.0)
+    inside = np.all(np.abs(frontier.weights) < 5.0, axis=1)
+    assert inside.sum() >= 5
+
+    # Two-fund solution: w = C^-1 [1 mu] A^-1 [1, target], A = [1 mu]' C^-1 [1 mu]
+    basis = np.column_stack([np.ones(4), mu])
+    inv_basis = np.linalg.solve(cov, basis)
+    a_inv = np.linalg.inv(basis.T @ inv_basis)
+    for weights, target in zip(frontier.weights[inside], frontier.returns[inside]):
+        expected = inv_basis @ a_inv @ np.array([1.0, target])
+        np.testing.assert_allclose(weights, expected, atol=1e-9)
+
+
+def test_long_only_frontier_is_feasible_and_not_dominated(universe):
+    mu, cov = universe
+    frontier = efficient_frontier(mu, cov, n_points=2001)
+    assert np.all(frontier.weights >= -TOLERANCE) and np.all(frontier.weights <= 1 + TOLERANCE)
+    np.testing.assert_allclose(frontier.weights.sum(axis=1), 1.0, atol=TOLERANCE)
+    assert np.all(np.diff(frontier.returns) > 0)
+    assert frontier.returns[-1] == pytest.approx(mu.max(), abs=TOLERANCE)
+
+    # No random long-only portfolio beats the frontier at its return (up to
+    # the chord error of interpolating volatility between dense points)
+    rng = np.random.default_rng(0)
+    returns, volatilities = portfolio_stats(rng.dirichlet(np.ones(4), 20_000), mu, cov)
+    frontier_vol = np.interp(returns, frontier.returns, frontier.volatilities)
+    reachable = returns >= frontier.returns[0]
+    assert np.all(volatilities[reachable] >= frontier_vol[reachable] - 1e-6)
+    assert volatilities.min() >= frontier.volatilities[0]
+
+
+def test_frontier_endpoint_respects_bounds():
+    with TestClient(app) as client:
+        response = client.post('/api/portfolio/frontier', json={
+            'n_points': 10, 'max_weight': 0.4, 'bounds': {'liquidity': [0.0, 0.05]},
+        })
+    assert response.status_code == 200
+    body = response.json()
+    weights = np.array(body['weights'])
+    liquidity = body['assets'].index('liquidity')
+    assert weights.shape == (10, len(body['assets']))
+    assert np.all(weights <= 0.4 + TOLERANCE) and np.all(weights[:, liquidity] <= 0.05 + TOLERANCE)
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0, atol=TOLERANCE)
+
+
+PERFECTLY_CORRELATED = [[1.0, 1.0, 0.3], [1.0, 1.0, 0.3], [0.3, 0.3, 1.0]]
+
+
+def test_singular_covariance_is_rejected():
+    risk = RiskModel(('a', 'b', 'c'), [0.16, 0.16, 0.20], PERFECTLY_CORRELATED)
+    with pytest.raises(ValueError, match="singular"):
+        efficient_frontier([0.05, 0.06, 0.07], risk.covariance)
+
+    with TestClient(app) as client:
+        response = client.post('/api/portfolio/frontier', json={'universe': {
+            'assets': ['a', 'b', 'c'], 'expected_returns': [0.05, 0.06, 0.07],
+            'volatilities': [0.16, 0.16, 0.20], 'correlation': PERFECTLY_CORRELATED,
+        }})
+    assert response.status_code == 400
+    assert 'singular' in response.json()['detail']
+
+
+def test_perfect_correlation_with_distinct_volatilities_is_solved():
+    # rho = 1 alone leaves no zero-variance fully invested combination here
+    risk = RiskModel(('a', 'b', 'c'), [0.16, 0.18, 0.20], PERFECTLY_CORRELATED)
+    frontier = efficient_frontier([0.05, 0.06, 0.07], risk.covariance, n_points=20, upper=0.5)
+    assert np.all(frontier.weights >= -TOLERANCE) and np.all(frontier.weights <= 0.5 + TOLERANCE)
+    np.testing.assert_allclose(frontier.weights.sum(axis=1), 1.0, atol=TOLERANCE)
+
+
+def test_infeasible_solution_raises_instead_of_returning(universe, monkeypatch):
+    mu, cov = universe
+    monkeypatch.setattr(portfolio, '_critical_line', lambda *args: np.array([[1.76, -0.76, 0.0, 0.0]]))
+    with pytest.raises(RuntimeError, match="bounds"):
+        efficient_frontier(mu, cov)
@@ -0,0 +1,78 @@
+"""Calculation result cache: canonical scenario keys, versioning and LRU/TTL."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routes import calculate, defaults
+from api.defaults_sync import DefaultsVersionChannel
+from api.routes.calculate import ResultCache, scenario_key
+
+
+@pytest.fixture
+def client():
+    calculate._result_cache.clear()
+    with TestClient(app) as client:
+        yield client
+    calculate._result_cache.clear()
+
+
+@pytest.fixture
+def bump_version(monkeypatch, tmp_path):
+    """Simulate an admin write, publishing to a private version file."""
+    channel = DefaultsVersionChannel(str(tmp_path / 'defaults.version'))
+    monkeypatch.setattr(defaults, '_version_channel', channel)
+    return lambda: defaults.invalidate_defaults_cache(defaults._defaults_version + 1)
+
+
+def test_equivalent_overrides_share_a_key():
+    a = scenario_key({'macro': {'us': {'current_tbill': 4}}, 'equity_us': {}}, 'usd', 'ra')
+    b = scenario_key({'macro': {'us': {'current_tbill': 4.0}}}, 'USD', 'RA')
+    assert a == b
+    assert scenario_key(None, 'usd', 'ra') == scenario_key({'bonds_hy': {}}, 'usd', 'ra')
+
+
+def test_key_separates_scenarios():
+    base = scenario_key({}, 'usd', 'ra')
+    assert base != scenario_key({'macro': {'us': {'current_tbill': 0.04}}}, 'usd', 'ra')
+    assert base != scenario_key({}, 'eur', 'ra')
+    assert base != scenario_key({}, 'usd', 'gk')
+
+
+def test_defaults_invalidation_changes_the_key(bump_version):
+    before = scenario_key({}, 'usd', 'ra')
+    bump_version()
+    assert scenario_key({}, 'usd', 'ra') != before
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    cache = ResultCache(max_entries=2, ttl_seconds=10.0)
+    now = [100.0]
+    monkeypatch.setattr(calculate.time, 'monotonic', lambda: now[0])
+
+    cache.put('a', {'v': 1})
+    cache.put('b', {'v': 2})
+    assert cache.get('a') == {'v': 1}
+    cache.put('c', {'v': 3})  # evicts 'b', the least recently used
+    assert cache.get('b') is None
+    assert cache.stats()['evictions'] == 1
+
+    now[0] += 11.0
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_second_request_is_served_from_cache(client, bump_version):
+    body = {'overrides': {'macro': {'us': {'current_tbill': 0.05}}}, 'scenario_name': 'First'}
+    first = client.post('/api/calculate/full', json=body)
+    assert first.status_code == 200
+    assert first.headers['X-Cache'] == 'MISS'
+
+    body['scenario_name'] = 'Second'
+    second = client.post('/api/calculate/full', json=body)
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.json()['scenario_name'] == 'Second'
+    assert second.json()['results'] == first.json()['results']
+
+    bump_version()
+    assert client.post('/api/calculate/full', json=body).headers['X-Cache'] == 'MISS'
@@ -0,0 +1,83 @@
+"""Dual-number sensitivities vs. central finite differences."""
+
+import pytest
+
+from ra_stress_tool.inputs.defaults import DefaultInputs
+from ra_stress_tool.main import CMEEngine
+
+
+TOLERANCE = 1e-6
+STEP = 1e-6
+
+
+def nested(path, value):
+    *parents, key = path.split('.')
+    overrides = node = {}
+    for part in parents:
+        node = node.setdefault(part, {})
+    node[key] = value
+    return overrides
+
+
+def numeric_paths(node, prefix=''):
+    """Override paths of every numeric leaf under a defaults sub-tree."""
+    for key, value in node.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from numeric_paths(value, path + '.')
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path
+
+
+def default_value(defaults, path):
+    """Default input behind an override path, or None if it is not numeric."""
+    parts = path.split('.')
+    node = defaults['macro'] if parts[0] == 'macro' else defaults['assets']
+    for part in parts[1:] if parts[0] == 'macro' else parts:
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    if isinstance(node, bool) or not isinstance(node, (int, float)):
+        return None
+    return float(node)
+
+
+def nominal_returns(overrides, model):
+    results = CMEEngine(overrides, equity_model_type=model).compute_all_returns().results
+    return {key: r.expected_return_nominal for key, r in results.items()}
+
+
+@pytest.mark.parametrize("model", ['ra', 'gk'])
+def test_gradients_match_finite_differences(model):
+    defaults = DefaultInputs(model).get_all_defaults()
+    base = nominal_returns({}, model)
+    sensitivities = CMEEngine(equity_model_type=model).compute_all_returns(with_sensitivities=True).sensitivities
+
+    checked = 0
+    paths = list(numeric_paths(defaults['macro'], 'macro.')) + list(numeric_paths(defaults['assets']))
+    for path in sorted(paths):
+        x = default_value(defaults, path)
+        if x is None:
+            continue
+        # Overrides such as bonds_*.current_yield switch model branches when
+        # present, so the derivative at the default is not an FD quotient
+        if nominal_returns(nested(path, x), model) != base:
+            continue
+        h = STEP * max(1.0, abs(x))
+        up = nominal_returns(nested(path, x + h), model)
+        down = nominal_returns(nested(path, x - h), model)
+        for asset in base:
+            fd = (up[asset] - down[asset]) / (2 * h)
+            dual = sensitivities[asset]['expected_return_nominal'].get(path, 0.0)
+            assert dual == pytest.approx(fd, abs=TOLERANCE), (path, asset)
+        checked += 1
+    assert checked > 50
+
+
+def test_sensitivities_leave_returns_unchanged():
+    plain = CMEEngine().compute_all_returns()
+    tracked = CMEEngine().compute_all_returns(with_sensitivities=True)
+    assert plain.sensitivities is None
+    for key, result in plain.results.items():
+        assert tracked.results[key].expected_return_nominal == result.expected_return_nominal
+        assert tracked.results[key].expected_return_real == result.expected_return_real
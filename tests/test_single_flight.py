@@ -0,0 +1,87 @@
+"""Request coalescing: concurrent identical calculations share one computation."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from api.main import app
+from api.routes import calculate
+from api.routes.calculate import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    calculate._result_cache.clear()
+    yield
+    calculate._result_cache.clear()
+
+
+def test_concurrent_callers_share_one_computation():
+    flight = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'value': 42}
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do('key', compute) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert [r for r, _ in results] == [{'value': 42}] * 5
+    assert sorted(coalesced for _, coalesced in results) == [False] + [True] * 4
+    assert flight.stats() == {'in_flight': 0, 'leaders': 1, 'coalesced': 4, 'coalesce_rate': 0.8}
+
+
+def test_errors_are_shared_and_keys_are_independent():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise ValueError("bad scenario")
+
+    async def ok():
+        return 'ok'
+
+    async def scenario():
+        return await asyncio.gather(
+            flight.do('a', fail), flight.do('a', fail), flight.do('b', ok), return_exceptions=True,
+        )
+
+    first, second, other = asyncio.run(scenario())
+    assert isinstance(first, ValueError) and second is first
+    assert other == ('ok', False)
+    assert flight.stats()['leaders'] == 2
+
+
+def test_identical_full_requests_compute_once(monkeypatch):
+    computed = []
+    original = calculate._compute_full_payload
+
+    def slow_payload(*args):
+        computed.append(1)
+        time.sleep(0.2)
+        return original(*args)
+
+    monkeypatch.setattr(calculate, '_compute_full_payload', slow_payload)
+    monkeypatch.setattr(calculate, '_single_flight', SingleFlight())
+    body = {'overrides': {'macro': {'japan': {'current_tbill': 0.0123}}}}
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            return await asyncio.gather(*(
+                client.post('/api/calculate/full', json={**body, 'scenario_name': f'run {i}'})
+                for i in range(4)
+            ))
+
+    responses = asyncio.run(scenario())
+
+    assert len(computed) == 1
+    assert sorted(r.headers['X-Cache'] for r in responses) == ['COALESCED'] * 3 + ['MISS']
+    assert [r.json()['scenario_name'] for r in responses] == [f'run {i}' for i in range(4)]
+    assert len({str(r.json()['results']) for r in responses}) == 1
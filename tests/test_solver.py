@@ -0,0 +1,56 @@
+"""Reverse stress-test solver: solutions reproduce the target in CMEEngine."""
+
+import pytest
+
+from ra_stress_tool.main import CMEEngine
+from ra_stress_tool.solver import ReverseStressSolver, solve_for_target
+
+from .test_batch_engine import nested
+
+
+def scalar_return(values, asset, measure='nominal'):
+    result = CMEEngine(nested(list(values), list(values.values()))).compute_all_returns().results[asset]
+    return result.expected_return_nominal if measure == 'nominal' else result.expected_return_real
+
+
+@pytest.mark.parametrize("asset,target,free,measure", [
+    ('equity_us', 0.03, [('equity_us.current_caey', 0.01, 0.08)], 'nominal'),
+    ('bonds_em', 0.0, [('bonds_em.default_rate', 0.0, 0.5)], 'real'),
+    ('equity_us', 0.05, [('equity_us.current_caey', 0.01, 0.08),
+                         ('macro.us.current_headline_inflation', 0.0, 0.06)], 'nominal'),
+])
+def test_solution_hits_target_in_scalar_engine(asset, target, free, measure):
+    result = solve_for_target(asset, target, free, measure=measure)
+    assert result.converged
+    assert result.achieved == pytest.approx(target, abs=1e-10)
+    for path, lower, upper in free:
+        assert lower <= result.values[path] <= upper
+    assert scalar_return(result.values, asset, measure) == pytest.approx(target, abs=1e-10)
+
+
+def test_unattainable_target_returns_closest_bound():
+    result = solve_for_target('equity_us', 0.5, [('equity_us.current_caey', 0.01, 0.08)])
+    assert not result.converged
+    assert result.values == {'equity_us.current_caey': 0.08}
+    assert result.achieved == pytest.approx(scalar_return(result.values, 'equity_us'), abs=1e-12)
+
+
+def test_solver_reuses_engine_across_targets():
+    solver = ReverseStressSolver()
+    free = [('equity_us.current_caey', 0.01, 0.08)]
+    low, high = (solver.solve('equity_us', t, free) for t in (0.02, 0.06))
+    assert len(solver._engines) == 1
+    assert low.values['equity_us.current_caey'] < high.values['equity_us.current_caey']
+
+
+@pytest.mark.parametrize("kwargs,match", [
+    ({'asset': 'equity_mars'}, 'Unknown asset'),
+    ({'measure': 'excess'}, 'measure'),
+    ({'free_inputs': []}, 'free input'),
+    ({'free_inputs': [('equity_us.bogus', 0.0, 1.0)]}, 'equity_us.bogus'),
+])
+def test_invalid_requests_raise(kwargs, match):
+    args = {'asset': 'equity_us', 'target': 0.03, 'free_inputs': [('equity_us.current_caey', 0.01, 0.08)]}
+    args.update(kwargs)
+    with pytest.raises(ValueError, match=match):
+        ReverseStressSolver().solve(**args)
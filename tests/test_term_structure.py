@@ -0,0 +1,36 @@
+"""Term structure (array of horizons) vs. one evaluation per horizon."""
+
+import numpy as np
+import pytest
+
+from ra_stress_tool.batch import BatchCMEEngine
+from ra_stress_tool.main import CMEEngine
+
+
+TOLERANCE = 1e-15
+OVERRIDES = {'equity_us': {'current_caey': 0.035}, 'bonds_global': {'current_term_premium': -0.004}}
+
+
+@pytest.mark.parametrize("model", ['ra', 'gk'])
+def test_ten_year_slice_matches_compute_all_returns(model):
+    engine = CMEEngine(OVERRIDES, equity_model_type=model)
+    structure = engine.compute_term_structure()
+    index = structure.horizons.index(10)
+    for key, result in engine.compute_all_returns().results.items():
+        assert structure.nominal[key][index] == result.expected_return_nominal, key
+        assert structure.real[key][index] == result.expected_return_real, key
+
+
+@pytest.mark.parametrize("model", ['ra', 'gk'])
+def test_every_horizon_matches_single_horizon_run(model):
+    batch = BatchCMEEngine([], base_overrides=OVERRIDES, equity_model_type=model)
+    structure = batch.term_structure()
+    for i, horizon in enumerate(structure.horizons):
+        single = batch.compute(np.empty((1, 0)), horizon=horizon)
+        for asset, series in structure.nominal.items():
+            assert series[i] == pytest.approx(single.get(asset)[0], abs=TOLERANCE), (asset, horizon)
+
+
+def test_fractional_horizon_is_rejected():
+    with pytest.raises(ValueError, match="whole number"):
+        BatchCMEEngine([]).compute(np.empty((1, 0)), horizon=2.5)
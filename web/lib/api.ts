@@ -4,6 +4,11 @@
 
 import type {
   CalculateResponse,
+  SessionResponse,
+  OverridePatch,
+  OverridePatchResponse,
+  BatchScenario,
+  BatchResultLine,
   MacroPreviewResponse,
   Overrides,
   BaseCurrency,
@@ -64,6 +69,83 @@ export async function calculateFull(
   });
 }
 
+/**
+ * Run a full calculation and keep a live session for incremental updates
+ */
+export async function createCalculationSession(
+  overrides?: Overrides,
+  baseCurrency: BaseCurrency = 'usd',
+  scenarioName: string = 'Current Scenario',
+  equityModel: string = 'ra'
+): Promise<SessionResponse> {
+  return fetchAPI('/api/calculate/session', {
+    method: 'POST',
+    body: JSON.stringify({
+      overrides,
+      base_currency: baseCurrency,
+      scenario_name: scenarioName,
+      equity_model: equityModel,
+    }),
+  });
+}
+
+/**
+ * Merge an override patch into a live session.
+ * A null value removes that override, restoring its default.
+ * Only the asset classes listed in changed_assets are returned.
+ */
+export async function patchCalculationSession(
+  sessionId: string,
+  overrides: OverridePatch
+): Promise<OverridePatchResponse> {
+  return fetchAPI(`/api/calculate/session/${sessionId}`, {
+    method: 'PATCH',
+    body: JSON.stringify({ overrides }),
+  });
+}
+
+/**
+ * Release a live calculation session
+ */
+export async function deleteCalculationSession(sessionId: string): Promise<{ deleted: string }> {
+  return fetchAPI(`/api/calculate/session/${sessionId}`, { method: 'DELETE' });
+}
+
+/**
+ * Stream results for many scenarios; yields one line per scenario in input order
+ */
+export async function* streamCalculationBatch(
+  scenarios: BatchScenario[],
+  output: 'headline' | 'full' = 'headline'
+): AsyncGenerator<BatchResultLine> {
+  const response = await fetch(`${API_BASE}/api/calculate/batch?output=${output}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/x-ndjson' },
+    body: scenarios.map((s) => JSON.stringify(s)).join('\n'),
+  });
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
+    throw new Error(error.detail || `API error: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (line) yield JSON.parse(line) as BatchResultLine;
+    }
+  }
+  if (buffer.trim()) yield JSON.parse(buffer) as BatchResultLine;
+}
+
 /**
  * Calculate macro preview from building blocks
  */
@@ -80,6 +162,206 @@ export async function calculateMacroPreview(
   });
 }
 
+// ============================================
+// Monte Carlo
+// ============================================
+
+export interface InputDistribution {
+  path: string;
+  dist: 'normal' | 'lognormal' | 'uniform';
+  mean?: number;
+  std?: number;
+  low?: number;
+  high?: number;
+  lower?: number;
+  upper?: number;
+}
+
+export interface MonteCarloParams {
+  distributions: InputDistribution[];
+  correlation?: number[][];
+  n_draws?: number;
+  seed?: number;
+  quantiles?: number[];
+  overrides?: Overrides;
+  base_currency?: BaseCurrency;
+  equity_model?: string;
+}
+
+// Keys: mean, std, min, max, p1, p5, ... (one per requested quantile)
+export type DistributionSummary = Record<string, number>;
+
+export interface MonteCarloResult {
+  n_draws: number;
+  seed: number;
+  base_currency: string;
+  equity_model: string;
+  paths: string[];
+  quantiles: number[];
+  nominal: Record<string, DistributionSummary>;
+  real: Record<string, DistributionSummary>;
+  inputs: Record<string, DistributionSummary>;
+}
+
+export interface MonteCarloJobStatus {
+  status: 'running' | 'completed' | 'failed';
+  progress: { draws_done: number; draws_total: number };
+  started_at: string;
+  result?: MonteCarloResult;
+  error?: string;
+}
+
+export async function startMonteCarlo(params: MonteCarloParams): Promise<{ job_id: string }> {
+  return fetchAPI('/api/calculate/monte-carlo', {
+    method: 'POST',
+    body: JSON.stringify(params),
+  });
+}
+
+export async function getMonteCarloStatus(jobId: string): Promise<MonteCarloJobStatus> {
+  return fetchAPI(`/api/calculate/monte-carlo/${jobId}`);
+}
+
+// ---- Reverse stress test ----
+
+export interface FreeInput {
+  path: string;
+  lower: number;
+  upper: number;
+}
+
+export interface SolveParams {
+  asset: string;
+  target: number;
+  measure?: 'nominal' | 'real';
+  free_inputs: FreeInput[];
+  overrides?: Overrides;
+  base_currency?: BaseCurrency;
+  equity_model?: string;
+}
+
+export interface SolveResult {
+  asset: string;
+  measure: 'nominal' | 'real';
+  target: number;
+  values: Record<string, number>;
+  achieved: number;
+  converged: boolean;
+  evaluations: number;
+  message: string;
+  other_solutions: Record<string, number>[];
+}
+
+export async function solveTarget(params: SolveParams): Promise<SolveResult> {
+  return fetchAPI('/api/calculate/solve', {
+    method: 'POST',
+    body: JSON.stringify(params),
+  });
+}
+
+// ---- Term structure ----
+
+export interface TermStructure {
+  scenario_name: string;
+  base_currency: string;
+  horizons: number[];
+  nominal: Record<string, number[]>;
+  real: Record<string, number[]>;
+}
+
+/**
+ * Expected returns for every horizon from 1 to maxHorizon years.
+ */
+export async function getTermStructure(
+  overrides?: Overrides,
+  baseCurrency: BaseCurrency = 'usd',
+  equityModel: string = 'ra',
+  maxHorizon: number = 30
+): Promise<TermStructure> {
+  return fetchAPI(`/api/calculate/term-structure?max_horizon=${maxHorizon}`, {
+    method: 'POST',
+    body: JSON.stringify({
+      overrides,
+      base_currency: baseCurrency,
+      equity_model: equityModel,
+    }),
+  });
+}
+
+// ---- 2-D parameter sweep ----
+
+export interface SweepAxis {
+  path: string;
+  start: number;
+  stop: number;
+  steps: number;
+}
+
+export interface SweepParams {
+  x: SweepAxis;
+  y: SweepAxis;
+  assets?: string[];
+  measure?: 'nominal' | 'real';
+  dtype?: 'float32' | 'float64';
+  overrides?: Overrides;
+  base_currency?: BaseCurrency;
+  equity_model?: string;
+}
+
+export interface SweepResult {
+  x: { path: string; values: number[] };
+  y: { path: string; values: number[] };
+  assets: string[];
+  measure: 'nominal' | 'real';
+  shape: [number, number, number]; // [assets, y.steps, x.steps]
+  // Row-major grid: grid[(a * ny + iy) * nx + ix]
+  grid: Float32Array | Float64Array;
+}
+
+interface SweepResponse extends Omit<SweepResult, 'grid'> {
+  dtype: 'float32' | 'float64';
+  data: string; // base64, little-endian
+}
+
+/**
+ * Evaluate a grid of two override paths. The server returns the grid as a
+ * base64 typed-array buffer; it is decoded here without per-cell parsing.
+ */
+export async function runSweep(params: SweepParams): Promise<SweepResult> {
+  const { dtype, data, ...rest } = await fetchAPI<SweepResponse>('/api/calculate/sweep', {
+    method: 'POST',
+    body: JSON.stringify(params),
+  });
+  const binary = atob(data);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  const grid = dtype === 'float64' ? new Float64Array(bytes.buffer) : new Float32Array(bytes.buffer);
+  return { ...rest, grid };
+}
+
+/**
+ * Flatten one asset's sweep into {x, y, value} points for a Recharts heatmap.
+ */
+export function sweepPoints(
+  result: SweepResult,
+  asset: string
+): { x: number; y: number; value: number }[] {
+  const a = result.assets.indexOf(asset);
+  if (a < 0) return [];
+  const [, ny, nx] = result.shape;
+  const points = [];
+  for (let iy = 0; iy < ny; iy++) {
+    for (let ix = 0; ix < nx; ix++) {
+      points.push({
+        x: result.x.values[ix],
+        y: result.y.values[iy],
+        value: result.grid[(a * ny + iy) * nx + ix],
+      });
+    }
+  }
+  return points;
+}
+
 // ---- Admin Endpoints ----
 
 export interface ResearchComparison {
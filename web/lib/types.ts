@@ -147,6 +147,47 @@ export interface CalculateResponse {
   }> | null;
 }
 
+// Live calculation session (incremental recalculation)
+export interface SessionResponse extends CalculateResponse {
+  session_id: string;
+}
+
+// Incremental override patch for a live session: null removes an override
+// and restores its default (a single input or a whole group, e.g. macro.japan)
+export type OverridePatch<T = Overrides> = {
+  [K in keyof T]?: (NonNullable<T[K]> extends object ? OverridePatch<NonNullable<T[K]>> : T[K]) | null;
+};
+
+// Incremental override patch response from API
+export interface OverridePatchResponse {
+  session_id: string;
+  recomputed_assets: AssetClass[];
+  changed_assets: AssetClass[];
+  full_recompute: boolean;
+  results: Partial<Record<AssetClass, AssetResult>>;  // changed assets only
+  macro_forecasts: CalculateResponse['macro_forecasts'];
+  fx_forecasts?: CalculateResponse['fx_forecasts'];
+}
+
+// Scenario sent to the streaming batch endpoint
+export interface BatchScenario {
+  overrides?: Overrides;
+  base_currency?: BaseCurrency;
+  scenario_name?: string;
+  equity_model?: string;
+}
+
+// One NDJSON line from /api/calculate/batch (headline or full output)
+export interface BatchResultLine {
+  index: number;
+  scenario_name?: string;
+  base_currency?: string;
+  results?: Partial<Record<AssetClass, Pick<AssetResult, 'expected_return_nominal' | 'expected_return_real'> | AssetResult>>;
+  macro_forecasts?: CalculateResponse['macro_forecasts'];
+  fx_forecasts?: CalculateResponse['fx_forecasts'];
+  error?: string;
+}
+
 // Macro preview response from API
 export interface MacroPreviewResponse {
   rgdp_growth: number;